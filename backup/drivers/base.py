@@ -20,6 +20,8 @@ import subprocess
 from oslo_config import cfg
 from oslo_log import log as logging
 
+from backup.utils import prefetch
+
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
 
@@ -42,6 +44,9 @@ class BaseRunner(object):
         self.storage = kwargs.pop('storage', None)
         self.location = kwargs.pop('location', '')
         self.checksum = kwargs.pop('checksum', '')
+        self.restore_cache = kwargs.pop('restore_cache', None)
+        self.prefetch_dir = kwargs.pop('prefetch_dir', None)
+        self.prefetch_size = kwargs.pop('prefetch_size', 0)
         self._gzip = False
 
         if 'restore_location' not in kwargs:
@@ -198,20 +203,30 @@ class BaseRunner(object):
         """Hook that is called after the restore command."""
         pass
 
-    def unpack(self, location, checksum, command):
-        stream = self.storage.load(location, checksum)
+    def _write_stream(self, stream, pipe):
+        """Write a backup stream to a process, returning its length."""
+        if hasattr(stream, 'copy_to'):
+            # Local files are copied to the pipe by the kernel.
+            pipe.flush()
+            return stream.copy_to(pipe.fileno())
+        content_length = 0
+        for chunk in stream:
+            pipe.write(chunk)  # write data to mbstream
+            content_length += len(chunk)
+        return content_length
+
+    def unpack(self, location, checksum, command, stream=None):
+        if stream is None:
+            stream = self.storage.load(location, checksum)
 
         LOG.info('Running restore from stream, command: %s', command)
-        content_length = 0
         if not re.match(r'.*.gz', location) or not self._gzip:
             LOG.info('gz processor without gz file or with gzip disabled')
             self.process = subprocess.Popen(command.split(), shell=False,
                                             stdin=subprocess.PIPE,
                                             stdout=subprocess.PIPE,
                                             stderr=subprocess.PIPE)
-            for chunk in stream:
-                self.process.stdin.write(chunk)  # write data to mbstream
-                content_length += len(chunk)
+            content_length = self._write_stream(stream, self.process.stdin)
             stdout, stderr = self.process.communicate()
         else:
             LOG.info('gz processor with gz file')
@@ -223,9 +238,7 @@ class BaseRunner(object):
                                             stdin=gunzip.stdout,
                                             stdout=subprocess.PIPE,
                                             stderr=subprocess.PIPE)
-            for chunk in stream:
-                gunzip.stdin.write(chunk)  # write data to mbstream
-                content_length += len(chunk)
+            content_length = self._write_stream(stream, gunzip.stdin)
             gunzip.stdin.close()
             gunzip.stdout.close()
             stdout, stderr = self.process.communicate()
@@ -242,6 +255,42 @@ class BaseRunner(object):
 
         return content_length
 
+    def get_restore_chain(self, location, checksum):
+        """Get the backups to apply for an incremental restore.
+
+        The parents are followed from the backup to restore back to the
+        full backup, or to the closest backup in the restore cache.
+
+        :returns: the checksum of the cached backup to start from, or
+                  None, and the (location, checksum, metadata) of the
+                  backups to apply, in order.
+        """
+        chain = []
+        cached = None
+        while location:
+            if self.restore_cache and self.restore_cache.has(checksum):
+                cached = checksum
+                break
+            metadata = self.storage.load_metadata(location, checksum)
+            chain.append((location, checksum, metadata))
+            location = metadata.get('parent_location')
+            checksum = metadata.get('parent_checksum')
+        chain.reverse()
+        return cached, chain
+
+    def prefetch_chain(self, chain):
+        """Get a ChainPrefetcher for the backups of a restore chain.
+
+        The backups are staged next to the data directory by default, on the
+        same volume. The prefetch thread gets a storage of its own, the
+        storage drivers take their settings from the configuration.
+        """
+        directory = self.prefetch_dir or os.path.join(
+            os.path.dirname(self.datadir), 'restore_prefetch')
+        return prefetch.ChainPrefetcher(
+            self.storage, chain, directory, self.prefetch_size,
+            storage_factory=type(self.storage))
+
     def run_restore(self):
         return self.unpack(self.location, self.checksum, self.restore_command)
 
@@ -102,46 +102,59 @@ class MySQLBaseRunner(base.BaseRunner):
                  prepare_cmd, stdout, stderr)
 
     def incremental_restore(self, location, checksum):
-        """Recursively apply backups from all parents.
+        """Apply the full backup, then each incremental backup in turn.
 
-        If we are the parent then we restore to the restore_location and
-        we apply the logs to the restore_location only.
+        The full backup is restored to the restore_location and we apply
+        the logs to the restore_location only.
 
-        Otherwise if we are an incremental we restore to a subfolder to
-        prevent stomping on the full restore data. Then we run apply log
-        with the '--incremental-dir' flag
+        Each incremental is restored to a subfolder to prevent stomping on
+        the full restore data. Then we run apply log with the
+        '--incremental-dir' flag.
+
+        With a restore cache, the restore starts from the closest parent
+        found in the cache, and the result is cached for the restores of
+        the later incremental backups. With a prefetch size, the next
+        backups are downloaded while the current one is applied.
 
         :param location: The source backup location.
         :param checksum: Checksum of the source backup for validation.
         """
-        metadata = self.storage.load_metadata(location, checksum)
-        incremental_dir = None
-
-        if 'parent_location' in metadata:
-            LOG.info("Restoring parent: %(parent_location)s, "
-                     "checksum: %(parent_checksum)s.", metadata)
-
-            parent_location = metadata['parent_location']
-            parent_checksum = metadata['parent_checksum']
-            # Restore parents recursively so backup are applied sequentially
-            self.incremental_restore(parent_location, parent_checksum)
-            # for *this* backup set the incremental_dir
-            # just use the checksum for the incremental path as it is
-            # sufficiently unique /var/lib/mysql/<checksum>
-            incremental_dir = os.path.join('/var/lib/mysql', checksum)
-            os.makedirs(incremental_dir)
-            command = self.incremental_restore_cmd(incremental_dir)
-        else:
-            # The parent (full backup) use the same command from InnobackupEx
-            # super class and do not set an incremental_dir.
-            LOG.info("Restoring back to full backup.")
-            command = self.restore_command
-
-        LOG.debug("command: %s", command)
-
-        self.restore_content_length += self.unpack(location, checksum, command)
-        self.incremental_prepare(incremental_dir)
-
-        # Delete after restoring this part of backup
-        if incremental_dir:
-            shutil.rmtree(incremental_dir)
+        cached, chain = self.get_restore_chain(location, checksum)
+        if cached:
+            self.restore_cache.restore(cached,
+                                       {'data': self.restore_location})
+
+        with self.prefetch_chain(chain) as prefetcher:
+            for index, backup in enumerate(chain):
+                backup_location, backup_checksum, metadata = backup
+                incremental_dir = None
+                if 'parent_location' in metadata:
+                    LOG.info("Restoring incremental backup %s.",
+                             backup_location)
+                    # just use the checksum for the incremental path as it is
+                    # sufficiently unique /var/lib/mysql/<checksum>
+                    incremental_dir = os.path.join('/var/lib/mysql',
+                                                   backup_checksum)
+                    os.makedirs(incremental_dir)
+                    command = self.incremental_restore_cmd(incremental_dir)
+                else:
+                    # The parent (full backup) use the same command from
+                    # InnobackupEx super class and do not set an
+                    # incremental_dir.
+                    LOG.info("Restoring back to full backup.")
+                    command = self.restore_command
+
+                LOG.debug("command: %s", command)
+
+                self.restore_content_length += self.unpack(
+                    backup_location, backup_checksum, command,
+                    stream=prefetcher.load(index))
+                self.incremental_prepare(incremental_dir)
+
+                # Delete after restoring this part of backup
+                if incremental_dir:
+                    shutil.rmtree(incremental_dir)
+
+        if self.restore_cache and chain:
+            self.restore_cache.store(checksum,
+                                     {'data': self.restore_location})
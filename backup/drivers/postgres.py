@@ -283,25 +283,36 @@ class PgBasebackupIncremental(PgBasebackup):
 
         For the child backups, restore the wal files to wal archive dir.
         For the base backup, restore to datadir.
-        """
-        metadata = self.storage.load_metadata(location, checksum)
-        if 'parent_location' in metadata:
-            LOG.info("Restoring parent: %(parent_location)s, "
-                     "checksum: %(parent_checksum)s.", metadata)
-
-            parent_location = metadata['parent_location']
-            parent_checksum = metadata['parent_checksum']
-
-            # Restore parents recursively so backup are applied sequentially
-            self.incremental_restore(parent_location, parent_checksum)
 
-            command = self.incremental_restore_cmd(incr=True)
-        else:
-            # For the parent base backup, revert to the default restore cmd
-            LOG.info("Restoring back to full backup.")
-            command = self.incremental_restore_cmd(incr=False)
-
-        self.restore_content_length += self.unpack(location, checksum, command)
+        With a restore cache, the restore starts from the closest parent
+        found in the cache, and the result is cached for the restores of
+        the later incremental backups. With a prefetch size, the next
+        backups are downloaded while the current one is applied.
+        """
+        cached, chain = self.get_restore_chain(location, checksum)
+        targets = {'data': self.datadir, 'wal': self.wal_archive_dir}
+        if cached:
+            self.restore_cache.restore(cached, targets)
+
+        with self.prefetch_chain(chain) as prefetcher:
+            for index, backup in enumerate(chain):
+                backup_location, backup_checksum, metadata = backup
+                if 'parent_location' in metadata:
+                    LOG.info("Restoring incremental backup %s.",
+                             backup_location)
+                    command = self.incremental_restore_cmd(incr=True)
+                else:
+                    # For the parent base backup, revert to the default restore
+                    # cmd
+                    LOG.info("Restoring back to full backup.")
+                    command = self.incremental_restore_cmd(incr=False)
+
+                self.restore_content_length += self.unpack(
+                    backup_location, backup_checksum, command,
+                    stream=prefetcher.load(index))
+
+        if self.restore_cache and chain:
+            self.restore_cache.store(checksum, targets)
 
     def run_restore(self):
         """Run incremental restore."""
@@ -32,7 +32,7 @@ cli_opts = [
     cfg.StrOpt(
         'storage-driver',
         default='swift',
-        choices=['swift']
+        choices=['swift', 'local', 's3']
     ),
     cfg.StrOpt(
         'driver',
@@ -80,6 +80,63 @@ cli_opts = [
              'checksum or not. '
     ),
     cfg.StrOpt('pg-wal-archive-dir'),
+    cfg.StrOpt(
+        'restore-cache-dir',
+        help='Directory to keep the prepared restores of incremental '
+             'backups in, so that restoring a later backup of the same '
+             'chain only applies the new increments. Disabled if not set.'
+    ),
+    cfg.IntOpt(
+        'restore-cache-entries',
+        default=2,
+        min=1,
+        help='Number of prepared restores kept in the restore cache.'
+    ),
+    cfg.IntOpt(
+        'restore-prefetch-size',
+        default=0,
+        min=0,
+        help='Maximum size (in bytes) of the incremental backups downloaded '
+             'ahead of their restore, while the previous backups of the '
+             'chain are applied. Disabled if 0.'
+    ),
+    cfg.StrOpt(
+        'restore-prefetch-dir',
+        help='Directory to download the incremental backups to ahead of '
+             'their restore. Defaults to a directory next to the data '
+             'directory.'
+    ),
+    cfg.StrOpt(
+        'local-dir',
+        default='/var/lib/trove/backups',
+        help='Directory, e.g. an NFS mount, to save the backups to with the '
+             'local storage driver.'
+    ),
+    cfg.IntOpt(
+        'local-chunk-size',
+        default=8 * 1024 ** 2,
+        min=2 ** 16,
+        help='Size (in bytes) of the writes and copies of the local storage '
+             'driver.'
+    ),
+    cfg.StrOpt('s3-endpoint-url'),
+    cfg.StrOpt('s3-region'),
+    cfg.StrOpt('s3-access-key'),
+    cfg.StrOpt('s3-secret-key', secret=True),
+    cfg.IntOpt(
+        's3-part-size',
+        default=64 * 1024 ** 2,
+        min=5 * 1024 ** 2,
+        help='Size (in bytes) of the parts of the multipart uploads of the '
+             's3 storage driver.'
+    ),
+    cfg.IntOpt(
+        's3-upload-workers',
+        default=4,
+        min=1,
+        help='Number of parts the s3 storage driver uploads at the same '
+             'time.'
+    ),
 ]
 
 driver_mapping = {
@@ -94,6 +151,8 @@ driver_mapping = {
 }
 storage_mapping = {
     'swift': 'backup.storage.swift.SwiftStorage',
+    'local': 'backup.storage.local.LocalStorage',
+    's3': 'backup.storage.s3.S3Storage',
 }
 
 
@@ -121,18 +180,23 @@ def stream_backup_to_storage(runner_cls, storage):
 
     extra_params.update(parent_metadata)
 
+    stats = importutils.import_class(
+        'backup.utils.throughput.PipelineStats')()
     try:
         with runner_cls(filename=CONF.backup_id, **extra_params) as bkup:
             checksum, location = storage.save(
                 bkup,
                 metadata=CONF.swift_extra_metadata,
-                container=CONF.swift_container
+                container=CONF.swift_container,
+                stats=stats
             )
         LOG.info('Backup successfully, checksum: %s, location: %s',
                  checksum, location)
     except Exception as err:
         LOG.exception('Failed to call stream_backup_to_storage, error: %s',
                       err)
+    finally:
+        stats.log_summary()
 
 
 def stream_restore_from_storage(runner_cls, storage):
@@ -146,6 +210,13 @@ def stream_restore_from_storage(runner_cls, storage):
 
     if storage.is_incremental_backup(CONF.restore_from):
         params['lsn'] = storage.get_backup_lsn(CONF.restore_from)
+        if CONF.restore_cache_dir:
+            cache_cls = importutils.import_class(
+                'backup.utils.restore_cache.RestoreCache')
+            params['restore_cache'] = cache_cls(CONF.restore_cache_dir,
+                                                CONF.restore_cache_entries)
+        params['prefetch_size'] = CONF.restore_prefetch_size
+        params['prefetch_dir'] = CONF.restore_prefetch_dir
 
     try:
         runner = runner_cls(**params)
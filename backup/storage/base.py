@@ -46,3 +46,39 @@ class Storage(object):
     @abc.abstractmethod
     def get_backup_lsn(self, location):
         """Get the backup LSN."""
+
+
+class MetadataFileStorage(Storage):
+    """Base class for drivers keeping the metadata in a file of its own.
+
+    The checksum and the metadata of a backup are saved as JSON next to
+    the backup data, in '<backup>.metadata', since they are only known
+    once the whole backup is written.
+    """
+
+    @abc.abstractmethod
+    def read_info(self, location):
+        """Load the checksum and metadata saved for a backup.
+
+        Should return a dict with the 'checksum' and the 'metadata'.
+        """
+
+    def verify_checksum(self, location, checksum):
+        info = self.read_info(location)
+        if checksum and info['checksum'] != checksum:
+            msg = ('Checksum validation failure, actual: %s, expected: %s' %
+                   (info['checksum'], checksum))
+            raise Exception(msg)
+        return info
+
+    def load_metadata(self, parent_location, parent_checksum):
+        if not parent_location:
+            return {}
+        return self.verify_checksum(parent_location,
+                                    parent_checksum)['metadata']
+
+    def is_incremental_backup(self, location):
+        return 'parent_location' in self.read_info(location)['metadata']
+
+    def get_backup_lsn(self, location):
+        return self.read_info(location)['metadata'].get('lsn')
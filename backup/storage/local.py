@@ -0,0 +1,125 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import json
+import os
+import stat
+import time
+
+from oslo_config import cfg
+from oslo_log import log as logging
+
+from backup.storage import base
+from backup.utils import throughput
+
+LOG = logging.getLogger(__name__)
+CONF = cfg.CONF
+
+READ_SIZE = 2 ** 16
+
+
+class LocalFile(object):
+    """A backup file to restore.
+
+    Iterating gives the content in chunks. copy_to copies it to a file
+    descriptor in the kernel instead, without going through the process.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __iter__(self):
+        with open(self.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(READ_SIZE), b''):
+                yield chunk
+
+    def copy_to(self, fd):
+        """Copy the file to a pipe or a file, returning the bytes copied."""
+        copy = os.sendfile
+        if (hasattr(os, 'copy_file_range') and
+                stat.S_ISREG(os.fstat(fd).st_mode)):
+            copy = os.copy_file_range
+        copied = 0
+        with open(self.path, 'rb') as f:
+            while True:
+                if copy is os.sendfile:
+                    sent = os.sendfile(fd, f.fileno(), copied,
+                                       CONF.local_chunk_size)
+                else:
+                    sent = os.copy_file_range(f.fileno(), fd,
+                                              CONF.local_chunk_size, copied)
+                if not sent:
+                    return copied
+                copied += sent
+
+
+class LocalStorage(base.MetadataFileStorage):
+    """Backups kept as files in a local directory, or an NFS mount.
+
+    The backup of a container is saved to <local_dir>/<container>/<name>.
+    Its location is the path of the file and its checksum the MD5 of the
+    content, as for a backup saved to swift in one segment.
+    """
+
+    def __init__(self):
+        self.directory = CONF.local_dir
+
+    def read_info(self, location):
+        with open('%s.metadata' % location) as f:
+            return json.load(f)
+
+    def save(self, stream, metadata=None, container='database_backups',
+             stats=None):
+        """Write the stream to a file in large sequential writes.
+
+        The file is written under a temporary name and renamed once
+        synced, so a backup is never seen partly written.
+        """
+        stats = stats or throughput.PipelineStats()
+        directory = os.path.join(self.directory, container)
+        os.makedirs(directory, exist_ok=True)
+        location = os.path.join(directory, stream.manifest)
+        partial = '%s.part' % location
+        LOG.info('Saving backup to %s.', location)
+
+        checksum = hashlib.md5(usedforsecurity=False)
+        size = 0
+        with open(partial, 'wb', buffering=0) as f:
+            while True:
+                chunk = stats.read('runner', stream.read,
+                                   CONF.local_chunk_size)
+                if not chunk:
+                    break
+                checksum.update(chunk)
+                size += len(chunk)
+                stats.write('upload', f.write, chunk)
+            start = time.monotonic()
+            os.fsync(f.fileno())
+            stats.record('upload', 'write', 0, time.monotonic() - start)
+
+        if metadata is None:
+            metadata = {}
+        metadata.update(stream.get_metadata())
+        info = {'checksum': checksum.hexdigest(), 'metadata': metadata}
+        with open('%s.metadata' % location, 'w') as f:
+            json.dump(info, f)
+        os.rename(partial, location)
+        stats.log()
+        LOG.info('Saved %d bytes to %s.', size, location)
+
+        return info['checksum'], location
+
+    def load(self, location, backup_checksum):
+        """Get the backup file, once its checksum is verified."""
+        self.verify_checksum(location, backup_checksum)
+        return LocalFile(location)
@@ -0,0 +1,175 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from concurrent import futures
+import hashlib
+import json
+import time
+from urllib import parse
+
+from oslo_config import cfg
+from oslo_log import log as logging
+
+from backup.storage import base
+from backup.utils import throughput
+
+LOG = logging.getLogger(__name__)
+CONF = cfg.CONF
+
+
+def _get_client():
+    import boto3
+
+    return boto3.client(
+        's3',
+        endpoint_url=CONF.s3_endpoint_url,
+        region_name=CONF.s3_region,
+        aws_access_key_id=CONF.s3_access_key,
+        aws_secret_access_key=CONF.s3_secret_key)
+
+
+class S3Storage(base.MetadataFileStorage):
+    """Backups kept in an S3 compatible object storage.
+
+    The backup of a container is saved to the object <name> of the bucket
+    <container> with a multipart upload, s3_upload_workers parts of
+    s3_part_size being uploaded at the same time. Its location is
+    s3://<container>/<name> and its checksum the same as for a backup
+    saved to swift, the part checksums taking the place of the segment
+    checksums.
+    """
+
+    def __init__(self, client=None):
+        self.client = client or _get_client()
+
+    def _explode_location(self, location):
+        url = parse.urlparse(location)
+        return url.netloc, url.path.lstrip('/')
+
+    def read_info(self, location):
+        bucket, key = self._explode_location(location)
+        body = self.client.get_object(Bucket=bucket,
+                                      Key='%s.metadata' % key)['Body']
+        return json.loads(body.read())
+
+    def _upload_part(self, bucket, key, upload_id, number, data, checksum):
+        etag = self.client.upload_part(
+            Bucket=bucket, Key=key, UploadId=upload_id, PartNumber=number,
+            Body=data)['ETag']
+        if etag.strip('"') != checksum:
+            msg = ('Failed to upload part %(number)d to S3. ETAG: %(tag)s '
+                   'Part MD5: %(checksum)s.' %
+                   {'number': number, 'tag': etag, 'checksum': checksum})
+            raise Exception(msg)
+
+    def _read_part(self, stream, stats):
+        """Read a part of s3_part_size from the stream."""
+        chunks = []
+        length = 0
+        while length < CONF.s3_part_size:
+            chunk = stats.read('runner', stream.read,
+                               min(CONF.s3_part_size - length, 2 ** 20))
+            if not chunk:
+                break
+            chunks.append(chunk)
+            length += len(chunk)
+        return b''.join(chunks)
+
+    def save(self, stream, metadata=None, container='database_backups',
+             stats=None):
+        """Upload the stream in parts, several at a time.
+
+        The stream is read while the previous parts are uploaded. At most
+        s3_upload_workers parts are held in memory waiting for their
+        upload.
+        """
+        stats = stats or throughput.PipelineStats()
+        key = stream.manifest
+        location = 's3://%s/%s' % (container, key)
+        LOG.info('Uploading to %s.', location)
+
+        # Create the bucket if it doesn't already exist
+        try:
+            self.client.create_bucket(Bucket=container)
+        except self.client.exceptions.BucketAlreadyOwnedByYou:
+            pass
+
+        upload_id = self.client.create_multipart_upload(
+            Bucket=container, Key=key)['UploadId']
+        part_checksums = []
+        pending = set()
+        try:
+            with futures.ThreadPoolExecutor(
+                    max_workers=CONF.s3_upload_workers) as executor:
+                while True:
+                    data = self._read_part(stream, stats)
+                    if not data and part_checksums:
+                        break
+                    checksum = hashlib.md5(data,
+                                           usedforsecurity=False).hexdigest()
+                    part_checksums.append(checksum)
+                    if len(pending) >= CONF.s3_upload_workers:
+                        start = time.monotonic()
+                        done, pending = futures.wait(
+                            pending, return_when=futures.FIRST_COMPLETED)
+                        stats.record('upload', 'write', 0,
+                                     time.monotonic() - start)
+                        for future in done:
+                            future.result()
+                    pending.add(executor.submit(
+                        self._upload_part, container, key, upload_id,
+                        len(part_checksums), data, checksum))
+                    stats.record('upload', 'write', len(data), 0)
+                    if len(data) < CONF.s3_part_size:
+                        break
+                start = time.monotonic()
+                for future in futures.as_completed(pending):
+                    future.result()
+                stats.record('upload', 'write', 0, time.monotonic() - start)
+        except Exception:
+            LOG.exception('Failed to upload to %s, aborting the upload.',
+                          location)
+            self.client.abort_multipart_upload(Bucket=container, Key=key,
+                                               UploadId=upload_id)
+            raise
+
+        parts = [{'ETag': '"%s"' % checksum, 'PartNumber': number}
+                 for number, checksum in enumerate(part_checksums, 1)]
+        self.client.complete_multipart_upload(
+            Bucket=container, Key=key, UploadId=upload_id,
+            MultipartUpload={'Parts': parts})
+        LOG.debug('File uploaded in %d parts.', len(parts))
+
+        if len(part_checksums) > 1:
+            final_checksum = hashlib.md5(
+                ''.join(part_checksums).encode(),
+                usedforsecurity=False).hexdigest()
+        else:
+            final_checksum = part_checksums[0]
+
+        if metadata is None:
+            metadata = {}
+        metadata.update(stream.get_metadata())
+        self.client.put_object(
+            Bucket=container, Key='%s.metadata' % key,
+            Body=json.dumps({'checksum': final_checksum,
+                             'metadata': metadata}).encode())
+        stats.log()
+
+        return final_checksum, location
+
+    def load(self, location, backup_checksum):
+        """Get the object from the location."""
+        self.verify_checksum(location, backup_checksum)
+        bucket, key = self._explode_location(location)
+        body = self.client.get_object(Bucket=bucket, Key=key)['Body']
+        return body.iter_chunks(2 ** 16)
@@ -16,6 +16,7 @@ import hashlib
 import io
 import json
 import tempfile
+import time
 
 from keystoneauth1.identity import v3
 from keystoneauth1 import session
@@ -25,6 +26,7 @@ import swiftclient
 from swiftclient import exceptions as swift_exc
 
 from backup.storage import base
+from backup.utils import throughput
 
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
@@ -73,10 +75,16 @@ class StreamReader(object):
     """Wrap the stream from the backup process and chunk it into segments.
     This class now buffers each segment to a temporary file, making it seekable
     for retry mechanisms, like the one in swiftclient.
+
+    The reads from the backup process and the reads and writes of the
+    segment buffer are recorded in stats, as the 'runner' and 'staging'
+    stages.
     """
 
-    def __init__(self, stream, container, filename, max_file_size):
+    def __init__(self, stream, container, filename, max_file_size,
+                 stats=None):
         self.stream = stream
+        self.stats = stats or throughput.PipelineStats()
         self.container = container
         self.filename = filename
         self.max_file_size = max_file_size
@@ -150,7 +158,8 @@ class StreamReader(object):
                     break
 
                 # Read from the original, unseekable stream
-                chunk = self.stream.read(chunk_size)
+                chunk = self.stats.read('runner', self.stream.read,
+                                        chunk_size)
 
                 if not chunk:
                     # Original stream exhausted. Mark overall end of file.
@@ -161,7 +170,8 @@ class StreamReader(object):
                              self.segment)
                     break
 
-                self._current_segment_buffer.write(chunk)
+                self.stats.write('staging', self._current_segment_buffer.write,
+                                 chunk)
                 self._current_segment_checksum.update(chunk)
                 self._current_segment_length += len(chunk)
 
@@ -172,7 +182,8 @@ class StreamReader(object):
             self._current_segment_buffer.seek(0)
             self._buffer_read_offset = 0
         # Phase 2: Serve data from the buffered temporary file
-        data = self._current_segment_buffer.read(chunk_size)
+        data = self.stats.read('staging', self._current_segment_buffer.read,
+                               chunk_size)
         self._buffer_read_offset += len(data)
         # start new segment if the orignal stream is not exhausted
         if not data and not self.end_of_file:
@@ -249,12 +260,14 @@ class SwiftStorage(base.Storage):
             insecure=CONF.swift_api_insecure
         )
 
-    def save(self, stream, metadata=None, container='database_backups'):
+    def save(self, stream, metadata=None, container='database_backups',
+             stats=None):
         """Persist data from the stream to swift.
 
         * Read data from stream, upload to swift
         * Update the new object metadata, stream provides method to get
           metadata.
+        * Record the throughput of each stage in stats, a PipelineStats.
 
         :returns the new object checkshum and swift full URL.
         """
@@ -276,8 +289,9 @@ class SwiftStorage(base.Storage):
         # Swift Checksum is the checksum of the concatenated segment checksums
         swift_checksum = hashlib.md5(usedforsecurity=False)
         # Wrap the output of the backup process to segment it for swift
+        stats = stats or throughput.PipelineStats()
         stream_reader = StreamReader(stream, container, filename,
-                                     2 * (1024 ** 3))
+                                     2 * (1024 ** 3), stats=stats)
 
         url = self.client.url
         # Full location where the backup manifest is stored
@@ -297,6 +311,8 @@ class SwiftStorage(base.Storage):
             # self.client.put_object now receives a seekable stream_reader,
             # allowing swiftclient's internal retries to work on the current
             # segment.
+            blocked = stats.blocked_seconds()
+            start = time.monotonic()
             try:
                 etag = self.client.put_object(container,
                                               segment_name,
@@ -305,6 +321,12 @@ class SwiftStorage(base.Storage):
                 LOG.error('Swift client error uploading segment %s: %s',
                           segment_name, str(e))
                 raise
+            # The upload reads the segment from the stream reader, the time
+            # spent there is already counted by the other stages.
+            stats.record('upload', 'write', stream_reader.segment_length,
+                         time.monotonic() - start -
+                         (stats.blocked_seconds() - blocked))
+            stats.log()
             # After put_object returns, the segment_checksum and segment_length
             # properties of stream_reader refer to the segment that was just
             # uploaded.
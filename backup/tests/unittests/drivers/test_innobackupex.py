@@ -13,7 +13,7 @@
 
 
 import unittest
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import ANY, call, MagicMock, patch, PropertyMock
 
 from oslo_config import cfg
 from oslo_log import log as logging
@@ -139,6 +139,64 @@ class TestInnoBackupExIncremental(unittest.TestCase):
         # assertions
         self.assertEqual(ret, length)
 
+    def _chain_storage(self):
+        # full <- inc1 <- inc2
+        metadata = {
+            'inc2': {'parent_location': 'inc1', 'parent_checksum': 'c1'},
+            'inc1': {'parent_location': 'full', 'parent_checksum': 'c0'},
+            'full': {},
+        }
+        storage = MagicMock()
+        storage.load_metadata.side_effect = (
+            lambda location, checksum: metadata[location])
+        return storage
+
+    @patch('backup.drivers.mysql_base.shutil.rmtree')
+    @patch('backup.drivers.mysql_base.os.makedirs')
+    def test_incremental_restore(self, mock_makedirs, mock_rmtree):
+        # prepare the test
+        runner = self.runner_cls(storage=self._chain_storage(),
+                                 **self.params)
+        runner.unpack = MagicMock(return_value=10)
+        runner.incremental_prepare = MagicMock()
+
+        # call the method
+        runner.incremental_restore('inc2', 'c2')
+
+        # assertions
+        self.assertEqual(['full', 'inc1', 'inc2'],
+                         [c[0][0] for c in runner.unpack.call_args_list])
+        runner.incremental_prepare.assert_has_calls([
+            call(None), call('/var/lib/mysql/c1'),
+            call('/var/lib/mysql/c2')])
+        self.assertEqual(30, runner.restore_content_length)
+
+    @patch('backup.drivers.mysql_base.shutil.rmtree')
+    @patch('backup.drivers.mysql_base.os.makedirs')
+    def test_incremental_restore_from_cache(self, mock_makedirs,
+                                            mock_rmtree):
+        # prepare the test
+        cache = MagicMock()
+        cache.has.side_effect = lambda checksum: checksum == 'c1'
+        storage = self._chain_storage()
+        runner = self.runner_cls(storage=storage, restore_cache=cache,
+                                 **self.params)
+        runner.unpack = MagicMock(return_value=10)
+        runner.incremental_prepare = MagicMock()
+
+        # call the method
+        runner.incremental_restore('inc2', 'c2')
+
+        # assertions
+        storage.load_metadata.assert_called_once_with('inc2', 'c2')
+        cache.restore.assert_called_once_with(
+            'c1', {'data': runner.restore_location})
+        runner.unpack.assert_called_once_with(
+            'inc2', 'c2', runner.incremental_restore_cmd('/var/lib/mysql/c2'),
+            stream=ANY)
+        cache.store.assert_called_once_with(
+            'c2', {'data': runner.restore_location})
+
 
 if __name__ == '__main__':
     unittest.main()
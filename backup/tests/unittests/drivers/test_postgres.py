@@ -15,7 +15,7 @@
 import os
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import ANY, call, MagicMock
 
 from oslo_config import cfg
 from oslo_log import log as logging
@@ -349,6 +349,33 @@ class TestPgBasebackupIncremental(unittest.TestCase):
         # assertions
         self.assertEqual(ret, length)
 
+    def test_incremental_restore_from_cache(self):
+        # prepare the test
+        metadata = {
+            'inc2': {'parent_location': 'inc1', 'parent_checksum': 'c1'},
+            'inc1': {'parent_location': 'full', 'parent_checksum': 'c0'},
+        }
+        cache = MagicMock()
+        cache.has.side_effect = lambda checksum: checksum == 'c0'
+        runner = self.runner_cls(restore_cache=cache, **self.params)
+        runner.storage = MagicMock()
+        runner.storage.load_metadata.side_effect = (
+            lambda location, checksum: metadata[location])
+        runner.unpack = MagicMock(return_value=10)
+        targets = {'data': runner.datadir, 'wal': runner.wal_archive_dir}
+
+        # call the method
+        runner.incremental_restore('inc2', 'c2')
+
+        # assertions
+        cache.restore.assert_called_once_with('c0', targets)
+        command = runner.incremental_restore_cmd(incr=True)
+        runner.unpack.assert_has_calls([
+            call('inc1', 'c1', command, stream=ANY),
+            call('inc2', 'c2', command, stream=ANY)])
+        self.assertEqual(2, runner.unpack.call_count)
+        cache.store.assert_called_once_with('c2', targets)
+
     def test_run_restore(self):
         # prepare the test
         runner = self.runner_cls(**self.params)
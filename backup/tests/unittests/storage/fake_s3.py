@@ -0,0 +1,89 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import io
+import threading
+import time
+import uuid
+
+
+class BucketAlreadyOwnedByYou(Exception):
+    pass
+
+
+class FakeBody(io.BytesIO):
+
+    def iter_chunks(self, chunk_size=1024):
+        return iter(lambda: self.read(chunk_size), b'')
+
+
+class FakeS3Client(object):
+    """An in-memory stand-in for the boto3 S3 client.
+
+    Each part upload takes latency seconds. fail_part makes the upload of
+    that part number fail.
+    """
+
+    class exceptions(object):
+        BucketAlreadyOwnedByYou = BucketAlreadyOwnedByYou
+
+    def __init__(self, latency=0, fail_part=None):
+        self.latency = latency
+        self.fail_part = fail_part
+        self.buckets = {}
+        self.uploads = {}
+        self.aborted = []
+        self.uploading = 0
+        self.max_uploading = 0
+        self._lock = threading.Lock()
+
+    def create_bucket(self, Bucket):
+        if Bucket in self.buckets:
+            raise BucketAlreadyOwnedByYou()
+        self.buckets[Bucket] = {}
+
+    def create_multipart_upload(self, Bucket, Key):
+        upload_id = uuid.uuid4().hex
+        self.uploads[upload_id] = {}
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        with self._lock:
+            self.uploading += 1
+            self.max_uploading = max(self.max_uploading, self.uploading)
+        try:
+            time.sleep(self.latency)
+            if PartNumber == self.fail_part:
+                raise Exception('Service unavailable')
+            self.uploads[UploadId][PartNumber] = Body
+        finally:
+            with self._lock:
+                self.uploading -= 1
+        return {'ETag': '"%s"' % hashlib.md5(
+            Body, usedforsecurity=False).hexdigest()}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId,
+                                  MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b''.join(
+            parts[part['PartNumber']] for part in MultipartUpload['Parts'])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(Key)
+
+    def put_object(self, Bucket, Key, Body):
+        self.buckets[Bucket][Key] = Body
+
+    def get_object(self, Bucket, Key):
+        return {'Body': FakeBody(self.buckets[Bucket][Key])}
@@ -0,0 +1,111 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import os
+import shutil
+import tempfile
+
+from oslo_config import cfg
+
+import backup.main
+from backup.storage import local
+from backup.tests.unittests.storage.test_swift import DataStream
+from trove.tests.unittests import trove_testtools
+
+
+class TestLocalStorage(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestLocalStorage, self).setUp()
+        cfg.CONF.unregister_opts(backup.main.cli_opts)
+        cfg.CONF.register_cli_opts(backup.main.cli_opts)
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
+        self.patch_conf_property('local_dir', self.tmpdir)
+        self.patch_conf_property('local_chunk_size', 4096)
+        self.data = os.urandom(10000)
+        self.storage = local.LocalStorage()
+
+    def test_save_load(self):
+        checksum, location = self.storage.save(
+            DataStream(self.data), metadata={'datastore': 'mysql'},
+            container='backups')
+
+        self.assertEqual(
+            hashlib.md5(self.data, usedforsecurity=False).hexdigest(),
+            checksum)
+        self.assertEqual(os.path.join(self.tmpdir, 'backups', 'backup.gz'),
+                         location)
+        self.assertEqual(['backup.gz', 'backup.gz.metadata'],
+                         sorted(os.listdir(os.path.dirname(location))))
+        self.assertEqual(self.data,
+                         b''.join(self.storage.load(location, checksum)))
+        self.assertEqual({'datastore': 'mysql'},
+                         self.storage.load_metadata(location, checksum))
+        self.assertFalse(self.storage.is_incremental_backup(location))
+
+    def test_incremental(self):
+        parent_checksum, parent_location = self.storage.save(
+            DataStream(self.data), container='full')
+        checksum, location = self.storage.save(
+            DataStream(self.data),
+            metadata={'parent_location': parent_location,
+                      'parent_checksum': parent_checksum,
+                      'lsn': '1234'},
+            container='incremental')
+
+        self.assertTrue(self.storage.is_incremental_backup(location))
+        self.assertEqual('1234', self.storage.get_backup_lsn(location))
+        self.assertEqual(
+            parent_location,
+            self.storage.load_metadata(location,
+                                       checksum)['parent_location'])
+
+    def test_checksum_mismatch(self):
+        checksum, location = self.storage.save(DataStream(self.data))
+
+        self.assertRaisesRegex(Exception, 'Checksum validation failure',
+                               self.storage.load, location, 'different')
+
+    def test_copy_to(self):
+        checksum, location = self.storage.save(DataStream(self.data))
+        backup_file = self.storage.load(location, checksum)
+        target = os.path.join(self.tmpdir, 'copy')
+
+        # A regular file is copied with copy_file_range.
+        with open(target, 'wb') as f:
+            self.assertEqual(len(self.data), backup_file.copy_to(f.fileno()))
+        with open(target, 'rb') as f:
+            self.assertEqual(self.data, f.read())
+
+        # A pipe with sendfile.
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        with os.fdopen(write_fd, 'wb') as pipe:
+            self.assertEqual(len(self.data),
+                             backup_file.copy_to(pipe.fileno()))
+        with os.fdopen(os.dup(read_fd), 'rb') as pipe:
+            self.assertEqual(self.data, pipe.read())
+
+    def test_unpack(self):
+        checksum, location = self.storage.save(DataStream(self.data))
+        target = os.path.join(self.tmpdir, 'restored')
+        runner = DataStream(b'')
+        runner.storage = self.storage
+
+        length = runner.unpack(location, checksum,
+                               'dd of=%s status=none' % target)
+
+        self.assertEqual(len(self.data), length)
+        with open(target, 'rb') as f:
+            self.assertEqual(self.data, f.read())
@@ -0,0 +1,81 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import hashlib
+import os
+
+from oslo_config import cfg
+
+import backup.main
+from backup.storage import s3
+from backup.tests.unittests.storage import fake_s3
+from backup.tests.unittests.storage.test_swift import DataStream
+from backup.utils import throughput
+from trove.tests.unittests import trove_testtools
+
+
+def md5(data):
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
+class TestS3Storage(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestS3Storage, self).setUp()
+        cfg.CONF.unregister_opts(backup.main.cli_opts)
+        cfg.CONF.register_cli_opts(backup.main.cli_opts)
+        self.patch_conf_property('s3_part_size', 1000)
+        self.patch_conf_property('s3_upload_workers', 3)
+        self.data = os.urandom(4500)
+
+    def test_save_load(self):
+        client = fake_s3.FakeS3Client(latency=0.05)
+        storage = s3.S3Storage(client=client)
+        stats = throughput.PipelineStats()
+
+        checksum, location = storage.save(
+            DataStream(self.data), metadata={'lsn': '1234'},
+            container='backups', stats=stats)
+
+        parts = [md5(self.data[index:index + 1000])
+                 for index in range(0, 4500, 1000)]
+        self.assertEqual(md5(''.join(parts).encode()), checksum)
+        self.assertEqual('s3://backups/backup.gz', location)
+        self.assertEqual(3, client.max_uploading)
+        self.assertEqual(self.data, b''.join(storage.load(location,
+                                                          checksum)))
+        self.assertEqual({'lsn': '1234'},
+                         storage.load_metadata(location, checksum))
+        self.assertEqual('1234', storage.get_backup_lsn(location))
+        self.assertFalse(storage.is_incremental_backup(location))
+        self.assertEqual(4500,
+                         stats.summary()['stages']['upload']['bytes_written'])
+
+    def test_save_single_part(self):
+        client = fake_s3.FakeS3Client()
+        storage = s3.S3Storage(client=client)
+
+        checksum, location = storage.save(DataStream(self.data[:1000]))
+        storage.save(DataStream(self.data[:1000]))
+
+        self.assertEqual(md5(self.data[:1000]), checksum)
+        self.assertRaisesRegex(Exception, 'Checksum validation failure',
+                               storage.load, location, 'different')
+
+    def test_save_failure(self):
+        client = fake_s3.FakeS3Client(fail_part=2)
+        storage = s3.S3Storage(client=client)
+
+        self.assertRaisesRegex(Exception, 'Service unavailable',
+                               storage.save, DataStream(self.data))
+        self.assertEqual(['backup.gz'], client.aborted)
+        self.assertEqual({}, client.buckets['database_backups'])
@@ -12,12 +12,16 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import hashlib
+import io
+
 from oslo_config import cfg
 from unittest import mock
 
 from backup.drivers import base as drivers_base
 import backup.main
 from backup.storage import swift
+from backup.utils import throughput
 from trove.tests.unittests import trove_testtools
 
 
@@ -31,6 +35,16 @@ class MockStream(drivers_base.BaseRunner):
         return None
 
 
+class DataStream(MockStream):
+
+    def __init__(self, data):
+        super(DataStream, self).__init__()
+        self.data = io.BytesIO(data)
+
+    def read(self, chunk_size):
+        return self.data.read(chunk_size)
+
+
 class TestSwift(trove_testtools.TestCase):
 
     def setUp(self):
@@ -128,3 +142,33 @@ class TestSwift(trove_testtools.TestCase):
         mock_legacy_client.put_container.assert_called_with(
             swift_container_name)
         mock_legacy_client.put_object.assert_called()
+
+    @mock.patch('backup.storage.swift.swiftclient.Connection')
+    def test_save_stats(self, mock_connection):
+        mock_client = mock.MagicMock()
+        mock_client.url = self.object_url
+        mock_connection.return_value = mock_client
+        etag = hashlib.md5(b'x' * 100000, usedforsecurity=False).hexdigest()
+
+        def put_object(container, name, contents, **kwargs):
+            if hasattr(contents, 'read'):
+                for chunk in iter(contents.read, b''):
+                    pass
+            return etag
+
+        mock_client.put_object.side_effect = put_object
+        mock_client.head_object.return_value = {'etag': '"%s"' % etag}
+        stats = throughput.PipelineStats()
+
+        storage = swift.SwiftStorage()
+        checksum, location = storage.save(DataStream(b'x' * 100000),
+                                          stats=stats)
+
+        self.assertEqual(etag, checksum)
+        summary = stats.summary()
+        self.assertEqual(100000, summary['stages']['runner']['bytes_read'])
+        self.assertEqual(100000,
+                         summary['stages']['staging']['bytes_written'])
+        self.assertEqual(100000, summary['stages']['staging']['bytes_read'])
+        self.assertEqual(100000,
+                         summary['stages']['upload']['bytes_written'])
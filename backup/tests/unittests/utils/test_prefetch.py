@@ -0,0 +1,185 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from backup.storage import base
+from backup.utils import prefetch
+
+
+class FakeStorage(base.Storage):
+    """Backups kept in memory, made of 10 byte chunks.
+
+    The first download of the backups in fail breaks after one chunk.
+    """
+
+    def __init__(self, backups, fail=()):
+        self.backups = backups
+        self.fail = set(fail)
+        self.loads = []
+
+    def save(self, stream, metadata=None, **kwargs):
+        raise NotImplementedError()
+
+    def load(self, location, backup_checksum, **kwargs):
+        self.loads.append(location)
+        for index in range(0, len(self.backups[location]), 10):
+            if index and location in self.fail:
+                self.fail.remove(location)
+                raise Exception('Connection reset')
+            yield self.backups[location][index:index + 10]
+
+    def get_backup_lsn(self, location):
+        return None
+
+
+class TestChainPrefetcher(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
+        self.directory = os.path.join(self.tmpdir, 'prefetch')
+        self.backups = {'full': b'f' * 50, 'inc1': b'1' * 30,
+                        'inc2': b'2' * 30, 'inc3': b'3' * 20}
+        self.chain = [(location, 'checksum', {})
+                      for location in ('full', 'inc1', 'inc2', 'inc3')]
+
+    def _wait(self, prefetcher, index):
+        with prefetcher._cond:
+            self.assertTrue(prefetcher._cond.wait_for(
+                lambda: prefetcher.states[index] != prefetch.PENDING,
+                timeout=10))
+        return prefetcher.states[index]
+
+    def _restore(self, prefetcher):
+        return [b''.join(prefetcher.load(index))
+                for index in range(len(self.chain))]
+
+    def test_prefetch(self):
+        # prepare the test
+        storage = FakeStorage(self.backups)
+
+        # call the method
+        with prefetch.ChainPrefetcher(storage, self.chain, self.directory,
+                                      max_bytes=100) as prefetcher:
+            states = [self._wait(prefetcher, index) for index in range(4)]
+            data = self._restore(prefetcher)
+
+        # assertions
+        self.assertEqual([prefetch.DIRECT] + [prefetch.STAGED] * 3, states)
+        self.assertEqual([self.backups[location[0]]
+                          for location in self.chain], data)
+        self.assertEqual(['inc1', 'inc2', 'inc3', 'full'], storage.loads)
+        self.assertEqual(0, prefetcher.staged_bytes)
+        self.assertFalse(os.path.exists(self.directory))
+
+    def test_prefetch_storage(self):
+        # prepare the test
+        storage = FakeStorage(self.backups)
+        prefetch_storages = []
+
+        def storage_factory():
+            prefetch_storages.append(FakeStorage(self.backups))
+            return prefetch_storages[-1]
+
+        # call the method
+        with prefetch.ChainPrefetcher(
+                storage, self.chain, self.directory, max_bytes=100,
+                storage_factory=storage_factory) as prefetcher:
+            states = [self._wait(prefetcher, index) for index in range(4)]
+            data = self._restore(prefetcher)
+
+        # assertions
+        self.assertEqual([prefetch.DIRECT] + [prefetch.STAGED] * 3, states)
+        self.assertEqual([self.backups[location[0]]
+                          for location in self.chain], data)
+        self.assertEqual(['full'], storage.loads)
+        self.assertEqual(1, len(prefetch_storages))
+        self.assertEqual(['inc1', 'inc2', 'inc3'],
+                         prefetch_storages[0].loads)
+
+    def test_staging_size(self):
+        # prepare the test
+        storage = FakeStorage(self.backups)
+
+        # call the method
+        with prefetch.ChainPrefetcher(storage, self.chain, self.directory,
+                                      max_bytes=35) as prefetcher:
+            self.assertEqual(prefetch.STAGED, self._wait(prefetcher, 1))
+            b''.join(prefetcher.load(0))
+
+            # inc2 waits for inc1 to be restored.
+            self.assertEqual(prefetch.PENDING, prefetcher.states[2])
+            self.assertEqual(30, prefetcher.staged_bytes)
+            self.assertEqual(self.backups['inc1'],
+                             b''.join(prefetcher.load(1)))
+
+            self.assertEqual(prefetch.STAGED, self._wait(prefetcher, 2))
+            self.assertEqual(self.backups['inc2'],
+                             b''.join(prefetcher.load(2)))
+            self.assertEqual(self.backups['inc3'],
+                             b''.join(prefetcher.load(3)))
+
+        # assertions
+        self.assertEqual(sorted(self.backups), sorted(storage.loads))
+
+    def test_backup_too_large(self):
+        # prepare the test
+        storage = FakeStorage(self.backups)
+
+        # call the method
+        with prefetch.ChainPrefetcher(storage, self.chain, self.directory,
+                                      max_bytes=25) as prefetcher:
+            states = [self._wait(prefetcher, index) for index in range(4)]
+            data = self._restore(prefetcher)
+
+        # assertions
+        self.assertEqual([prefetch.DIRECT] * 3 + [prefetch.STAGED], states)
+        self.assertEqual([self.backups[location[0]]
+                          for location in self.chain], data)
+        self.assertEqual(2, storage.loads.count('inc1'))
+        self.assertEqual(1, storage.loads.count('inc3'))
+
+    def test_download_failure(self):
+        # prepare the test
+        storage = FakeStorage(self.backups, fail=('inc2',))
+
+        # call the method
+        with prefetch.ChainPrefetcher(storage, self.chain, self.directory,
+                                      max_bytes=100) as prefetcher:
+            states = [self._wait(prefetcher, index) for index in range(4)]
+            data = self._restore(prefetcher)
+
+        # assertions
+        self.assertEqual(prefetch.DIRECT, states[2])
+        self.assertEqual(prefetch.STAGED, states[3])
+        self.assertEqual([self.backups[location[0]]
+                          for location in self.chain], data)
+        self.assertEqual(2, storage.loads.count('inc2'))
+        self.assertEqual(0, prefetcher.staged_bytes)
+
+    def test_disabled(self):
+        # prepare the test
+        storage = FakeStorage(self.backups)
+
+        # call the method
+        with prefetch.ChainPrefetcher(storage, self.chain, self.directory,
+                                      max_bytes=0) as prefetcher:
+            data = self._restore(prefetcher)
+
+        # assertions
+        self.assertEqual([self.backups[location[0]]
+                          for location in self.chain], data)
+        self.assertEqual(['full', 'inc1', 'inc2', 'inc3'], storage.loads)
+        self.assertFalse(os.path.exists(self.directory))
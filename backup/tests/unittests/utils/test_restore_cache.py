@@ -0,0 +1,82 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from backup.utils import restore_cache
+
+
+class TestRestoreCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir, ignore_errors=True)
+        self.cache = restore_cache.RestoreCache(
+            os.path.join(self.tmpdir, 'cache'), max_entries=2)
+
+    def _make_dir(self, name, content):
+        path = os.path.join(self.tmpdir, name)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, 'ibdata1'), 'w') as f:
+            f.write(content)
+        return path
+
+    def _read(self, path):
+        with open(os.path.join(path, 'ibdata1')) as f:
+            return f.read()
+
+    def test_store_and_restore(self):
+        # prepare the test
+        source = self._make_dir('source', 'prepared')
+        target = self._make_dir('target', 'stale')
+
+        # call the method
+        self.cache.store('c1', {'data': source})
+        self.cache.restore('c1', {'data': target})
+
+        # assertions
+        self.assertTrue(self.cache.has('c1'))
+        self.assertFalse(self.cache.has('c2'))
+        self.assertFalse(self.cache.has(None))
+        self.assertEqual('prepared', self._read(target))
+
+    def test_store_failure(self):
+        # prepare the test
+        source = self._make_dir('source', 'prepared')
+
+        # call the method
+        with patch.object(restore_cache.os, 'rename',
+                          side_effect=OSError('disk full')):
+            self.cache.store('c1', {'data': source})
+
+        # assertions
+        self.assertFalse(self.cache.has('c1'))
+        self.assertEqual([], os.listdir(self.cache.directory))
+
+    def test_evict(self):
+        # prepare the test
+        source = self._make_dir('source', 'prepared')
+        self.cache.store('c1', {'data': source})
+        self.cache.store('c2', {'data': source})
+        os.utime(os.path.join(self.cache.directory, 'c1'), (0, 0))
+        os.utime(os.path.join(self.cache.directory, 'c2'), (1, 1))
+
+        # call the method
+        self.cache.store('c3', {'data': source})
+
+        # assertions
+        self.assertFalse(self.cache.has('c1'))
+        self.assertTrue(self.cache.has('c2'))
+        self.assertTrue(self.cache.has('c3'))
@@ -0,0 +1,68 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+from backup.utils import throughput
+
+
+class TestPipelineStats(unittest.TestCase):
+    def test_read_write(self):
+        # prepare the test
+        stats = throughput.PipelineStats()
+        source = io.BytesIO(b'x' * 100)
+        target = io.BytesIO()
+
+        # call the method
+        data = stats.read('runner', source.read, 60)
+        stats.write('staging', target.write, data)
+        stats.read('runner', source.read, 60)
+
+        # assertions
+        self.assertEqual(b'x' * 60, target.getvalue())
+        self.assertEqual(100, stats.stages['runner']['bytes_read'])
+        self.assertEqual(0, stats.stages['runner']['bytes_written'])
+        self.assertEqual(60, stats.stages['staging']['bytes_written'])
+
+    def test_summary(self):
+        # prepare the test
+        stats = throughput.PipelineStats()
+        stats.record('runner', 'read', 100, 0.5)
+        stats.record('staging', 'write', 100, 0.1)
+        stats.record('upload', 'write', 100, 2.0)
+        stats.record('runner', 'read', 100, 0.25)
+
+        # call the method
+        summary = stats.summary()
+
+        # assertions
+        self.assertEqual('upload', summary['bottleneck'])
+        self.assertEqual({'bytes_read': 200, 'read_seconds': 0.75,
+                          'bytes_written': 0, 'write_seconds': 0},
+                         summary['stages']['runner'])
+        self.assertEqual(2.85, round(stats.blocked_seconds(), 3))
+
+    @patch.object(throughput, 'LOG')
+    def test_log_summary(self, mock_log):
+        # prepare the test
+        stats = throughput.PipelineStats()
+        stats.record('upload', 'write', 100, 2.0)
+
+        # call the method
+        stats.log_summary()
+
+        # assertions
+        summary = json.loads(mock_log.info.call_args[0][1])
+        self.assertEqual(100, summary['stages']['upload']['bytes_written'])
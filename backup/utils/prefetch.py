@@ -0,0 +1,169 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import os
+import shutil
+import threading
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+CHUNK_SIZE = 2 ** 16
+
+PENDING = 'pending'
+STAGED = 'staged'
+DIRECT = 'direct'
+
+
+class ChainPrefetcher(object):
+    """Download the backups of a chain ahead of their restore.
+
+    While a backup of the chain is being restored, a thread downloads the
+    following ones to files in a staging directory, so that the network and
+    the disk are busy at the same time. The staged files take at most
+    max_bytes: the thread waits for the restored backups to free space, and
+    a backup too large for the staging area on its own is left to be
+    streamed from the storage when its turn comes, as without prefetching.
+
+    The first backup is always streamed from the storage. Without max_bytes
+    nothing is prefetched.
+
+    The storage clients are not thread-safe, so the thread downloads with
+    its own storage, made by storage_factory.
+    """
+
+    def __init__(self, storage, chain, directory=None, max_bytes=0,
+                 storage_factory=None):
+        """:param chain: the (location, checksum) of the backups, in order.
+        :param storage_factory: makes the storage of the prefetch thread,
+                                it shares the given one if not set.
+        """
+        self.storage = storage
+        self.storage_factory = storage_factory
+        self._prefetch_storage = None
+        self.chain = [(location, checksum)
+                      for location, checksum, *_ in chain]
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.states = [DIRECT] + [PENDING] * (len(self.chain) - 1)
+        self.sizes = [0] * len(self.chain)
+        self.staged_bytes = 0
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _path(self, index):
+        return os.path.join(self.directory, '%d.part' % index)
+
+    def start(self):
+        if not self.max_bytes or len(self.chain) < 2:
+            self.states = [DIRECT] * len(self.chain)
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name='restore-prefetch')
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _run(self):
+        for index in range(1, len(self.chain)):
+            try:
+                state = self._download(index)
+            except Exception:
+                LOG.exception('Failed to prefetch backup %s, it will be '
+                              'streamed from the storage.',
+                              self.chain[index][0])
+                state = DIRECT
+            with self._cond:
+                if state != STAGED:
+                    self._release(index)
+                self.states[index] = state
+                self._cond.notify_all()
+                if self._stopped:
+                    return
+
+    def _download(self, index):
+        location, checksum = self.chain[index]
+        if self._prefetch_storage is None:
+            self._prefetch_storage = (self.storage_factory()
+                                      if self.storage_factory
+                                      else self.storage)
+        LOG.info('Prefetching backup %s.', location)
+        with open(self._path(index), 'wb') as f:
+            for chunk in self._prefetch_storage.load(location, checksum):
+                with self._cond:
+                    if not self._reserve(index, len(chunk)):
+                        LOG.info('Backup %s does not fit in the %d bytes '
+                                 'of the prefetch staging area.',
+                                 location, self.max_bytes)
+                        return DIRECT
+                f.write(chunk)
+        LOG.info('Prefetched backup %s, %d bytes.', location,
+                 self.sizes[index])
+        return STAGED
+
+    def _reserve(self, index, length):
+        """Wait until the staging area has room for a chunk of a backup.
+
+        Called with the condition held. The space of the backups staged
+        before this one is freed once they are restored; when they are all
+        gone and there is still no room, the backup does not fit.
+        """
+        while self.staged_bytes + length > self.max_bytes:
+            if self._stopped or self.sizes[index] == self.staged_bytes:
+                return False
+            self._cond.wait()
+        self.sizes[index] += length
+        self.staged_bytes += length
+        return True
+
+    def _release(self, index):
+        self.staged_bytes -= self.sizes[index]
+        self.sizes[index] = 0
+        if os.path.exists(self._path(index)):
+            os.remove(self._path(index))
+        self._cond.notify_all()
+
+    def load(self, index):
+        """Get the stream of a backup, once its prefetch is done."""
+        with self._cond:
+            while self.states[index] == PENDING:
+                self._cond.wait()
+            state = self.states[index]
+        location, checksum = self.chain[index]
+        if state == DIRECT:
+            return self.storage.load(location, checksum)
+        return self._read_staged(index)
+
+    def _read_staged(self, index):
+        try:
+            with open(self._path(index), 'rb') as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                    yield chunk
+        finally:
+            with self._cond:
+                self._release(index)
@@ -0,0 +1,89 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import os
+import shutil
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+
+class RestoreCache(object):
+    """Prepared restores of incremental backups, kept in a local directory.
+
+    An entry holds the directories a runner restored a backup chain into,
+    e.g. the prepared data directory, right after the last increment was
+    applied. It is keyed by the checksum of that increment, which is
+    unique to the chain as the parent of a backup never changes. Restoring
+    a later increment of the same chain starts from the entry instead of
+    downloading and applying the whole chain again.
+
+    Only the most recently used entries are kept.
+    """
+
+    def __init__(self, directory, max_entries=2):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, checksum):
+        return os.path.join(self.directory, checksum)
+
+    def has(self, checksum):
+        return bool(checksum) and os.path.isdir(self._path(checksum))
+
+    def restore(self, checksum, targets):
+        """Copy an entry into the target directories.
+
+        :param targets: a dict of target directory by name, the same names
+                        the entry was stored with.
+        """
+        path = self._path(checksum)
+        LOG.info('Restoring from the restore cache entry %s.', path)
+        for name, target in targets.items():
+            shutil.copytree(os.path.join(path, name), target,
+                            symlinks=True, dirs_exist_ok=True)
+        # The modification time orders the entries for eviction.
+        os.utime(path)
+
+    def store(self, checksum, sources):
+        """Copy the source directories into a new entry.
+
+        :param sources: a dict of source directory by name.
+        """
+        if not checksum:
+            return
+        path = self._path(checksum)
+        staging = os.path.join(self.directory,
+                               '.%s.%d' % (checksum, os.getpid()))
+        LOG.info('Saving the restore cache entry %s.', path)
+        try:
+            for name, source in sources.items():
+                shutil.copytree(source, os.path.join(staging, name),
+                                symlinks=True)
+            shutil.rmtree(path, ignore_errors=True)
+            # A partly copied entry is never visible under its checksum.
+            os.rename(staging, path)
+        except Exception:
+            LOG.exception('Failed to save the restore cache entry %s.', path)
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        self.evict()
+
+    def evict(self):
+        entries = [os.path.join(self.directory, name)
+                   for name in os.listdir(self.directory)
+                   if not name.startswith('.')]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for path in entries[self.max_entries:]:
+            LOG.info('Evicting the restore cache entry %s.', path)
+            shutil.rmtree(path, ignore_errors=True)
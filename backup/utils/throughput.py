@@ -0,0 +1,93 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+import json
+import threading
+import time
+
+from oslo_log import log as logging
+
+LOG = logging.getLogger(__name__)
+
+FIELDS = ('bytes_read', 'read_seconds', 'bytes_written', 'write_seconds')
+
+
+class PipelineStats(object):
+    """Bytes moved by each stage of a backup pipeline.
+
+    For each stage, e.g. the pipe of the backup process, the staging buffer
+    of the segments or the upload to the storage, the bytes read and
+    written are counted along with the time spent blocked reading and
+    writing them. The stage blocked the longest is the bottleneck of the
+    pipeline.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, direction, length, seconds):
+        """Count the bytes a stage read or wrote and the time it took.
+
+        :param direction: 'read' or 'write'.
+        """
+        with self._lock:
+            counters = self.stages.setdefault(stage, dict.fromkeys(FIELDS, 0))
+            counters['bytes_%s' % ('read' if direction == 'read'
+                                   else 'written')] += length
+            counters['%s_seconds' % direction] += seconds
+
+    def read(self, stage, func, *args):
+        """Call a read function of a stage, returning the data read."""
+        start = time.monotonic()
+        data = func(*args)
+        self.record(stage, 'read', len(data), time.monotonic() - start)
+        return data
+
+    def write(self, stage, func, data):
+        """Call a write function of a stage with the data to write."""
+        start = time.monotonic()
+        result = func(data)
+        self.record(stage, 'write', len(data), time.monotonic() - start)
+        return result
+
+    def blocked_seconds(self):
+        """The time spent blocked by all the stages so far."""
+        with self._lock:
+            return sum(counters['read_seconds'] + counters['write_seconds']
+                       for counters in self.stages.values())
+
+    def summary(self):
+        elapsed = time.monotonic() - self.started
+        with self._lock:
+            stages = {name: dict(counters)
+                      for name, counters in self.stages.items()}
+        bottleneck = None
+        if stages:
+            bottleneck = max(stages, key=lambda name: (
+                stages[name]['read_seconds'] + stages[name]['write_seconds']))
+        for counters in stages.values():
+            for field in ('read_seconds', 'write_seconds'):
+                counters[field] = round(counters[field], 3)
+        return {'elapsed_seconds': round(elapsed, 3), 'stages': stages,
+                'bottleneck': bottleneck}
+
+    def log(self, message='Backup pipeline progress'):
+        """Log the counters as key=value pairs, one line per stage."""
+        for name, counters in self.summary()['stages'].items():
+            LOG.info('%s: stage=%s %s', message, name,
+                     ' '.join('%s=%s' % (field, counters[field])
+                              for field in FIELDS))
+
+    def log_summary(self):
+        LOG.info('Backup pipeline summary: %s',
+                 json.dumps(self.summary(), sort_keys=True))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Time the deletion of all the backups of a project.
+
+The backups are static large objects of 5 segments, in a fake object store
+answering each request after 5ms. Compares deleting the backups one at a
+time, like the delete_backup task, with BulkBackupDelete, with and without
+the bulk middleware. The fake store removes the segments of a manifest
+deleted with multipart-manifest=delete in the same 5ms, which favours
+deleting one backup at a time.
+
+Usage: python tools/benchmarks/bench_backup_delete.py [backups]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from trove.backup.models import DBBackup
+from trove.backup.state import BackupState
+from trove.common import cfg
+from trove.db import get_db_api
+from trove.db.sqlalchemy import session
+from trove.taskmanager.models import BackupTasks
+from trove.taskmanager.models import BulkBackupDelete
+from trove.tests.fakes.swift import FakeSwiftStore
+
+CONF = cfg.CONF
+
+
+def delete_each(backup_ids):
+    for backup_id in backup_ids:
+        BackupTasks.delete_backup(None, backup_id)
+
+
+def delete_bulk(backup_ids):
+    BulkBackupDelete(None).run(backup_ids)
+
+
+def run(func, backups, bulk_delete):
+    store = FakeSwiftStore(bulk_delete=bulk_delete, latency=0.005)
+    backup_ids = []
+    for index in range(backups):
+        backup = DBBackup.create(
+            tenant_id='project', name='backup-%d' % index, deleted=False,
+            state=BackupState.COMPLETED, storage_driver='swift')
+        name = '%s.xbstream.gz' % backup.id
+        backup.location = 'http://swift/v1/database_backups/' + name
+        backup.save()
+        store.add_object('database_backups', name,
+                         ['database_backups_segments/%s/%03d' % (name, part)
+                          for part in range(5)])
+        backup_ids.append(backup.id)
+
+    with mock.patch('trove.common.clients.create_swift_client',
+                    return_value=store):
+        start = time.perf_counter()
+        func(backup_ids)
+        elapsed = time.perf_counter() - start
+    assert not store.objects
+    return elapsed, store.requests
+
+
+def main(backups=200):
+    directory = tempfile.mkdtemp()
+    CONF.set_override('connection', 'sqlite:///%s' %
+                      os.path.join(directory, 'trove.sqlite'), 'database')
+    get_db_api().db_sync(CONF)
+    session.configure_db()
+
+    for name, func, bulk_delete in (('one at a time', delete_each, 0),
+                                    ('bulk, per object', delete_bulk, 0),
+                                    ('bulk, bulk-delete', delete_bulk, 1000)):
+        elapsed, requests = run(func, backups, bulk_delete)
+        print('%-18s %d backups, %5d requests, %6.2f s, %7.1f backups/s'
+              % (name, backups, requests, elapsed, backups / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
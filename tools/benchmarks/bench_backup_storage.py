@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Compare saving a backup to an S3 stand-in taking a fixed time per part
+upload with more or less concurrent uploads, and to a local directory.
+Then restore it from the local directory, through the process or with
+sendfile.
+
+Usage: python tools/benchmarks/bench_backup_storage.py [megabytes]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from oslo_config import cfg
+
+from backup import main as backup_main
+from backup.storage import local
+from backup.storage import s3
+from backup.tests.unittests.storage import fake_s3
+
+CONF = cfg.CONF
+PART_LATENCY = 0.1
+
+
+class SyntheticStream(object):
+    manifest = 'backup.xbstream'
+
+    def __init__(self, size):
+        self.remaining = size
+        self.block = os.urandom(2 ** 20)
+
+    def read(self, chunk_size):
+        length = min(chunk_size, self.remaining, len(self.block))
+        self.remaining -= length
+        return self.block[:length]
+
+    def get_metadata(self):
+        return {}
+
+
+def restore(backup_file, sendfile):
+    process = subprocess.Popen(['cat'], stdin=subprocess.PIPE,
+                               stdout=subprocess.DEVNULL)
+    start = time.perf_counter()
+    if sendfile:
+        backup_file.copy_to(process.stdin.fileno())
+    else:
+        for chunk in backup_file:
+            process.stdin.write(chunk)
+    process.stdin.close()
+    process.wait()
+    return time.perf_counter() - start
+
+
+def main(megabytes=512):
+    CONF.register_cli_opts(backup_main.cli_opts)
+    CONF([], project='trove-backup')
+    size = megabytes * 2 ** 20
+    directory = tempfile.mkdtemp()
+    CONF.set_override('local_dir', directory)
+    CONF.set_override('s3_part_size', 8 * 2 ** 20)
+    try:
+        for workers in (1, 4, 8):
+            CONF.set_override('s3_upload_workers', workers)
+            storage = s3.S3Storage(
+                client=fake_s3.FakeS3Client(latency=PART_LATENCY))
+            start = time.perf_counter()
+            storage.save(SyntheticStream(size))
+            print('s3, %d upload workers: %.2f s'
+                  % (workers, time.perf_counter() - start))
+
+        storage = local.LocalStorage()
+        start = time.perf_counter()
+        checksum, location = storage.save(SyntheticStream(size))
+        print('local save: %.2f s' % (time.perf_counter() - start))
+        backup_file = storage.load(location, checksum)
+        for name, sendfile in (('through the process', False),
+                               ('with sendfile', True)):
+            print('local restore %s: %.2f s'
+                  % (name, restore(backup_file, sendfile)))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark bulk creation of MySQL databases and users. Statements are
+sent to a fake client which simulates a fixed round-trip latency.
+
+Usage: python tools/benchmarks/bench_bulk_create.py [schemas] [latency_ms]
+"""
+
+import sys
+import time
+from unittest import mock
+
+from trove.guestagent.datastore.mysql import service
+from trove.guestagent.utils import mysql as mysql_util
+
+
+class FakeSqlClient(object):
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.statements = 0
+
+    def __call__(self, engine, use_flush=False):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, t, **kwargs):
+        self.statements += 1
+        time.sleep(self.latency)
+
+
+def main(schemas=1000, latency_ms=1):
+    client = FakeSqlClient(latency_ms / 1000.0)
+    admin = service.MySqlAdmin(mock.MagicMock())
+    databases = [{'_name': 'db%04d' % i} for i in range(schemas)]
+    users = [{'_name': 'user%04d' % i, '_host': '%', '_password': 'secret',
+              '_databases': [{'_name': 'db%04d' % i},
+                             {'_name': 'shared'}]}
+             for i in range(schemas)]
+
+    with mock.patch.object(mysql_util, 'SqlClient', client):
+        for name, func, items in (
+                ('create_databases', admin.create_databases, databases),
+                ('create_users', admin.create_users, users)):
+            client.statements = 0
+            start = time.perf_counter()
+            func(items)
+            elapsed = time.perf_counter() - start
+            print('%s(%d): %d statements, %.2f s'
+                  % (name, len(items), client.statements, elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
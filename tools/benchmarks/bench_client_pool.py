@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the latency of API requests calling other services, creating the
+service clients for every request and reusing them from the client pool.
+
+Each request creates a Swift, a Neutron and a Cinder client with the token
+of the request, finding their endpoints in the service catalog of the
+request, and makes one call with each to a local HTTPS server standing in
+for the services. The requests use 10 tokens in turn.
+
+Usage: python tools/benchmarks/bench_client_pool.py [requests]
+"""
+
+from http import server
+import logging
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import urllib3
+
+from trove.common import cfg
+from trove.common import clients
+from trove.common import context
+
+CONF = cfg.CONF
+
+
+class Handler(server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def _reply(self):
+        body = b'{"networks": [], "volumes": []}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_GET = do_HEAD = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+def api_request(ctx):
+    clients.swift_client(ctx).head_account()
+    clients.neutron_client(ctx).list_networks()
+    clients.cinder_client(ctx).volumes.list()
+
+
+def service_catalog(url):
+    catalog = []
+    for service_type, path in (('object-store', 'v1/AUTH_project'),
+                               ('network', ''), ('volumev3', 'v3/project'),
+                               ('compute', 'v2.1'), ('image', ''),
+                               ('identity', 'v3')):
+        catalog.append({'type': service_type, 'name': service_type,
+                        'endpoints': [
+                            {'region': region, 'publicURL': url + path}
+                            for region in ('RegionOne', 'RegionTwo',
+                                           'RegionThree')]})
+    return catalog
+
+
+def start_server():
+    directory = tempfile.mkdtemp()
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.check_call(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes',
+         '-subj', '/CN=127.0.0.1', '-days', '1', '-keyout', key,
+         '-out', cert], stderr=subprocess.DEVNULL)
+    httpd = server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    tls = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    tls.load_cert_chain(cert, key)
+    httpd.socket = tls.wrap_socket(httpd.socket, server_side=True)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, 'https://127.0.0.1:%d/' % httpd.server_port
+
+
+def run(name, requests, url):
+    contexts = [context.TroveContext(project_id='project',
+                                     user_id='user',
+                                     auth_token='token-%d' % index,
+                                     service_catalog=service_catalog(url))
+                for index in range(10)]
+    clients.CLIENT_POOL.clear()
+    times = []
+    for index in range(requests):
+        start = time.perf_counter()
+        api_request(contexts[index % len(contexts)])
+        times.append(time.perf_counter() - start)
+    times.sort()
+    print('%-8s %d requests, mean %.3f ms, p99 %.3f ms, clients created %s'
+          % (name, requests, sum(times) / len(times) * 1000,
+             times[int(len(times) * 0.99)] * 1000,
+             sum(clients.CLIENT_POOL.created.values())))
+
+
+def main(requests=200):
+    # neutronclient logs a deprecation warning for every client created
+    logging.getLogger('neutronclient').setLevel(logging.ERROR)
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    httpd, url = start_server()
+    for service in ('swift', 'neutron', 'cinder'):
+        CONF.set_override('%s_api_insecure' % service, True)
+    CONF.set_override('cinder_service_type', 'volumev3')
+
+    # Warm up the imports of the client libraries
+    run('warm-up', 10, url)
+    for name, ttl in (('no pool', 0), ('pooled', 300)):
+        CONF.set_override('client_pool_ttl', ttl)
+        run(name, requests, url)
+    httpd.shutdown()
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
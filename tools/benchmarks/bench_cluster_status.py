@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Count the database queries made while waiting for a cluster to build.
+
+The members of the cluster become ready after a random number of polling
+intervals. Compares fetching the status of every member on its own with
+the single query per interval of ClusterTasks._all_instances_ready.
+
+Usage: python tools/benchmarks/bench_cluster_status.py [members]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from unittest import mock
+
+from sqlalchemy import event
+
+from trove.common import cfg
+from trove.common import polling
+from trove.common import utils
+from trove.db import get_db_api
+from trove.db.sqlalchemy import session
+from trove.instance.models import DBInstance
+from trove.instance.models import InstanceServiceStatus
+from trove.instance.service_status import ServiceStatuses
+from trove.instance.tasks import InstanceTasks
+from trove.taskmanager.models import ClusterTasks
+
+CONF = cfg.CONF
+
+
+def poll_each(instance_ids):
+    """The status check of the members, one query per member and status."""
+    def _all_have_status(ids):
+        for instance_id in ids:
+            status = InstanceServiceStatus.find_by(
+                instance_id=instance_id).get_status()
+            DBInstance.find_by(id=instance_id).get_task_status()
+            if status != ServiceStatuses.INSTANCE_READY:
+                return False
+        return True
+
+    utils.poll_until(lambda: instance_ids, _all_have_status, sleep_time=1)
+    for instance_id in instance_ids:
+        InstanceServiceStatus.find_by(instance_id=instance_id).get_status()
+        DBInstance.find_by(id=instance_id).get_task_status()
+
+
+def single_query(instance_ids):
+    ClusterTasks(mock.Mock(), mock.Mock(), datastore=mock.Mock(),
+                 datastore_version=mock.Mock())._all_instances_ready(
+        instance_ids, 'cluster')
+
+
+def run(func, members, seed=0):
+    rng = random.Random(seed)
+    instance_ids = []
+    ready_after = {}
+    for index in range(members):
+        instance = DBInstance.create(name='member-%d' % index, flavor_id=1,
+                                     tenant_id='tenant', cluster_id='cluster',
+                                     task_status=InstanceTasks.BUILDING)
+        InstanceServiceStatus.create(instance_id=instance.id,
+                                     status=ServiceStatuses.NEW)
+        instance_ids.append(instance.id)
+        ready_after[instance.id] = rng.randint(1, 20)
+
+    queries = []
+    ticks = []
+
+    def count(conn, cursor, statement, *args):
+        # The statements run by tick() are not part of the wait.
+        if not ticking:
+            queries.append(statement)
+
+    def tick(seconds):
+        # Members become ready while the taskmanager sleeps.
+        ticking.append(seconds)
+        ticks.append(seconds)
+        for instance_id in instance_ids:
+            if ready_after[instance_id] == len(ticks):
+                status = InstanceServiceStatus.find_by(
+                    instance_id=instance_id)
+                status.set_status(ServiceStatuses.INSTANCE_READY)
+                status.save()
+        ticking.pop()
+
+    ticking = []
+
+    engine = session.get_engine()
+    with mock.patch.object(polling, 'time', mock.Mock(
+            sleep=tick, monotonic=polling.time.monotonic)):
+        event.listen(engine, 'before_cursor_execute', count)
+        try:
+            func(instance_ids)
+        finally:
+            event.remove(engine, 'before_cursor_execute', count)
+    return len(queries)
+
+
+def main(members=30):
+    directory = tempfile.mkdtemp()
+    CONF.set_override('connection', 'sqlite:///%s' %
+                      os.path.join(directory, 'trove.sqlite'), 'database')
+    CONF.set_override('usage_sleep_time', 1)
+    get_db_api().db_sync(CONF)
+    session.configure_db()
+
+    for name, func in (('query per member', poll_each),
+                       ('single query', single_query)):
+        queries = run(func, members)
+        print('%-20s %6d queries, %6.2f per member'
+              % (name, queries, queries / float(members)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
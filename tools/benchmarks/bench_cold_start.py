@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark the cold start (import) time of the Trove services.
+
+Every run imports the startup modules of a service in a fresh interpreter,
+see trove.cmd.startup_profile.STARTUP_MODULES.
+
+Usage: python tools/benchmarks/bench_cold_start.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+from trove.cmd.startup_profile import STARTUP_MODULES
+
+
+def main(runs=5):
+    for binary, modules in sorted(STARTUP_MODULES.items()):
+        code = ('import importlib\nfor name in %r:\n'
+                '    importlib.import_module(name)\n' % (modules,))
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, '-c', code], check=True,
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL)
+            timings.append(time.perf_counter() - start)
+        print('trove-%-12s min %.3f s, median %.3f s over %d runs'
+              % (binary, min(timings), statistics.median(timings), runs))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark ConfigurationManager with a large number of override revisions.
+
+Usage: python tools/benchmarks/bench_configuration.py [revisions]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from trove.common.stream_codecs import IniCodec
+from trove.guestagent.common import configuration
+from trove.guestagent.common import operating_system
+
+
+def main(revisions=300):
+    root_dir = tempfile.mkdtemp()
+    try:
+        base_config_path = os.path.join(root_dir, 'my.cnf')
+        revision_dir = os.path.join(root_dir, 'conf.d')
+        os.mkdir(revision_dir)
+        with open(base_config_path, 'w') as fp:
+            fp.write('[mysqld]\n' + ''.join(
+                'base_opt_%d = %d\n' % (i, i) for i in range(200)))
+
+        with mock.patch.object(operating_system, 'chown'), \
+                mock.patch.object(operating_system, 'chmod'), \
+                mock.patch.object(operating_system, 'ensure_directory'):
+            manager = configuration.ConfigurationManager(
+                base_config_path, 'mysql', 'mysql', IniCodec(),
+                override_strategy=configuration.ImportOverrideStrategy(
+                    revision_dir, 'cnf'))
+
+            start = time.perf_counter()
+            for i in range(revisions):
+                manager.apply_user_override(
+                    {'mysqld': {'opt_%d' % i: i}}, change_id='c%d' % i)
+            elapsed = time.perf_counter() - start
+            print('apply_user_override x %d: %.3f s (%.2f ms/apply)'
+                  % (revisions, elapsed, elapsed * 1000 / revisions))
+
+            start = time.perf_counter()
+            for i in range(revisions):
+                manager.get_value('opt_%d' % i, section='mysqld')
+            elapsed = time.perf_counter() - start
+            print('get_value x %d: %.3f s (%.3f ms/lookup)'
+                  % (revisions, elapsed, elapsed * 1000 / revisions))
+    finally:
+        shutil.rmtree(root_dir)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Count the database queries of the datastore lookups made by API calls.
+
+Each lookup resolves a datastore and version by name and loads the
+capabilities of the version, with and without the datastore catalog.
+
+Usage: python tools/benchmarks/bench_datastore_catalog.py [lookups]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event
+
+from trove.common import cfg
+from trove.datastore import models
+from trove.db import get_db_api
+from trove.db.sqlalchemy import session
+
+CONF = cfg.CONF
+
+
+def populate():
+    for name in ('mysql', 'postgresql', 'mariadb'):
+        models.update_datastore(name, None)
+        for version in ('5.7', '8.0'):
+            models.update_datastore_version(name, version, name, 'image',
+                                            '', '', True)
+        models.update_datastore(name, '8.0')
+    for index in range(10):
+        capability = models.Capability.create('capability-%d' % index, '',
+                                              index % 2 == 0)
+        models.CapabilityOverride.create(
+            capability, models.get_datastore_version('mysql')[1].id,
+            enabled=True)
+
+
+def main(lookups=1000):
+    directory = tempfile.mkdtemp()
+    CONF.set_override('connection', 'sqlite:///%s' %
+                      os.path.join(directory, 'trove.sqlite'), 'database')
+    get_db_api().db_sync(CONF)
+    session.configure_db()
+    populate()
+
+    queries = []
+    event.listen(session.get_engine(), 'before_cursor_execute',
+                 lambda *args: queries.append(args[2]))
+    for ttl in (0, 60):
+        CONF.set_override('datastore_cache_ttl', ttl)
+        models.catalog = models.DatastoreCatalog()
+        del queries[:]
+        start = time.perf_counter()
+        for _ in range(lookups):
+            datastore, version = models.get_datastore_version('mysql', '8.0')
+            'capability-0' in version.capabilities
+        elapsed = time.perf_counter() - start
+        print('datastore_cache_ttl=%-3d %6d queries, %5.2f per lookup, '
+              '%6.1f ms, %s' % (ttl, len(queries), len(queries) /
+                                float(lookups), elapsed * 1000,
+                                models.catalog.stats()))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
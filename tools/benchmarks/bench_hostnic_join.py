@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Measure the latency of the Join requests of the docker-hostnic network
+driver, checking the schema, reading the config files and opening a
+netlink socket for every request, and with the validator and the state
+kept in memory.
+
+The host nic is the loopback interface, looked up by its MAC address over
+real netlink.
+
+Usage: python tools/benchmarks/bench_hostnic_join.py [joins]
+"""
+
+import functools
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+import jsonschema
+from pyroute2 import IPRoute
+
+from trove.cmd import network_driver
+from trove.common import schemata
+
+NETWORK_ID = 'a' * 64
+
+
+class FileConfig(network_driver.hostnic_config):
+    """The hostnic config read from the file for every request."""
+
+    def get_config(self, key):
+        with open(self.config_file) as cfg:
+            return json.loads(cfg.read()).get(key, "")
+
+
+class SocketPerLookup(object):
+    """A new netlink socket and a dump of the links for every request."""
+
+    def get_ifname(self, mac):
+        ipr = IPRoute()
+        ifaces = ipr.get_links(address=mac)
+        return ifaces[0].get_attr('IFLA_IFNAME')
+
+
+class FileRead(network_driver.json_file):
+    """The eth1 config read from the file for every request."""
+
+    def get_data(self):
+        with open(self.path) as fd:
+            return json.load(fd)
+
+
+def run(client, joins):
+    body = {'NetworkID': NETWORK_ID, 'EndpointID': 'b' * 64,
+            'SandboxKey': '/var/run/docker/netns/1234567890ab'}
+    latencies = []
+    for _ in range(joins):
+        start = time.perf_counter()
+        response = client.post('/NetworkDriver.Join', json=body)
+        latencies.append(time.perf_counter() - start)
+        assert response.get_json()['InterfaceName']['SrcName'] == 'lo'
+    latencies.sort()
+    return (sum(latencies) / joins * 1000,
+            latencies[int(joins * 0.99) - 1] * 1000)
+
+
+def main(joins=2000):
+    directory = tempfile.mkdtemp()
+    config_file = os.path.join(directory, 'hostnic.json')
+    with open(config_file, 'w') as f:
+        json.dump({NETWORK_ID: {'mac_address': '00:00:00:00:00:00'}}, f)
+    eth1_file = os.path.join(directory, 'eth1.json')
+    with open(eth1_file, 'w') as f:
+        json.dump({'ipv4_gateway': '10.0.0.1',
+                   'ipv4_host_routes': [{'destination': '10.1.0.0/16',
+                                         'nexthop': '10.0.0.2'}]}, f)
+
+    client = network_driver.app.test_client()
+    try:
+        for name, validate, config, nics, eth1 in (
+                ('per request',
+                 functools.partial(jsonschema.validate,
+                                   schema=schemata.NETWORK_JOIN_SCHEMA),
+                 FileConfig(config_file), SocketPerLookup(),
+                 FileRead(eth1_file)),
+                ('in memory', network_driver.validate_network_join,
+                 network_driver.hostnic_config(config_file),
+                 network_driver.hostnic_links(),
+                 network_driver.json_file(eth1_file))):
+            with mock.patch.multiple(network_driver,
+                                     validate_network_join=validate,
+                                     driver_config=config,
+                                     hostnic_nics=nics,
+                                     eth1_config_file=eth1):
+                mean, p99 = run(client, joins)
+            print('%-12s %d joins, mean %.3f ms, p99 %.3f ms'
+                  % (name, joins, mean, p99))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
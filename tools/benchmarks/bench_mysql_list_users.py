@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark MySQL user listing against an SQLite stand-in for the MySQL
+system tables (or a real server given its SQLAlchemy URL).
+
+Usage: python tools/benchmarks/bench_mysql_list_users.py [users] [url]
+"""
+
+import sys
+import time
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy import pool
+from sqlalchemy.sql.expression import text
+
+from trove.guestagent.datastore.mysql import service
+from trove.guestagent.utils import mysql as mysql_util
+
+
+def create_sqlite_engine(users):
+    engine = sqlalchemy.create_engine('sqlite://', poolclass=pool.StaticPool)
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_con, con_record):
+        dbapi_con.create_function('CONCAT', -1, lambda *args: ''.join(args))
+        dbapi_con.execute("ATTACH DATABASE ':memory:' AS mysql")
+        dbapi_con.execute("ATTACH DATABASE ':memory:' AS information_schema")
+        dbapi_con.execute("CREATE TABLE mysql.user (User, Host)")
+        dbapi_con.execute(
+            "CREATE TABLE information_schema.SCHEMA_PRIVILEGES "
+            "(grantee, table_schema, privilege_type)")
+        dbapi_con.executemany("INSERT INTO mysql.user VALUES (?, '%')",
+                              [('user%05d' % i,) for i in range(users)])
+        dbapi_con.executemany(
+            "INSERT INTO information_schema.SCHEMA_PRIVILEGES "
+            "VALUES (?, ?, 'SELECT')",
+            [("'user%05d'@'%%'" % i, 'db%d' % (i % 50))
+             for i in range(users)])
+
+    return engine
+
+
+def main(users=2000, url=None):
+    if url:
+        engine = sqlalchemy.create_engine(url)
+        flush = mysql_util.FLUSH
+    else:
+        engine = create_sqlite_engine(users)
+        flush = text('SELECT 1')
+
+    statements = []
+    event.listen(engine, 'before_cursor_execute',
+                 lambda *args: statements.append(args[2]))
+    app = mock.MagicMock()
+    app.get_engine.return_value = engine
+    admin = service.MySqlAdmin(app)
+
+    with mock.patch.object(mysql_util, 'FLUSH', flush):
+        for limit in (None, 100):
+            del statements[:]
+            start = time.perf_counter()
+            listed, _ = admin.list_users(limit=limit)
+            elapsed = time.perf_counter() - start
+            print('list_users(limit=%s): %d users, %d statements, %.1f ms'
+                  % (limit, len(listed), len(statements), elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main(*[int(sys.argv[1])] if len(sys.argv) > 1 else [],
+         **({'url': sys.argv[2]} if len(sys.argv) > 2 else {}))
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Count the status queries made by concurrent waits on the same resources.
+
+Starts waiters threads spread over resources, each resource becoming
+ready after a random delay, and compares polling per waiter with sharing
+the polling loop of the waits on the same resource.
+
+Usage: python tools/benchmarks/bench_polling.py [waiters] [resources]
+"""
+
+import collections
+import random
+import sys
+import threading
+import time
+
+from trove.common import polling
+from trove.common import utils
+
+
+def run(waiters, resources, shared):
+    random.seed(0)
+    ready_at = [time.monotonic() + random.uniform(0.05, 0.5)
+                for _ in range(resources)]
+    calls = collections.Counter()
+
+    def wait(index):
+        resource = index % resources
+
+        def retriever():
+            calls[resource] += 1
+            return time.monotonic() >= ready_at[resource]
+
+        utils.poll_until(retriever, sleep_time=0.01, time_out=10,
+                         key=('resource', resource) if shared else None,
+                         name='shared' if shared else 'per waiter')
+
+    threads = [threading.Thread(target=wait, args=(index,))
+               for index in range(waiters)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(calls.values()), time.monotonic() - start
+
+
+def main(waiters=200, resources=10):
+    for shared in (False, True):
+        calls, elapsed = run(waiters, resources, shared)
+        print('%-12s %6d status queries in %.2f s'
+              % ('shared' if shared else 'per waiter', calls, elapsed))
+    for site, stats in sorted(polling.get_stats().items()):
+        print('%-12s %s' % (site, stats['polls']))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
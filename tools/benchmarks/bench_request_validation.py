@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark API request validation against every schema in apischema.
+
+Each schema is validated with an empty request body, which exercises the
+validator setup and the error path, once with a validator built for every
+request and once with the validators cached by the API controllers.
+
+Usage: python tools/benchmarks/bench_request_validation.py [rounds]
+"""
+
+import sys
+import time
+
+import jsonschema
+
+from trove.common import apischema
+from trove.common import wsgi
+
+
+def _collect_schemas():
+    class Controller(wsgi.Controller):
+        pass
+
+    for name in sorted(dir(apischema)):
+        value = getattr(apischema, name)
+        if isinstance(value, dict) and 'type' not in value:
+            Controller.schemas = value
+            Controller.compile_validators()
+    return [schema for schema, _ in wsgi._SCHEMA_VALIDATORS.values()]
+
+
+def main(rounds=200):
+    schemas = _collect_schemas()
+    requests = rounds * len(schemas)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for schema in schemas:
+            validator = jsonschema.Draft4Validator(schema)
+            if not validator.is_valid({}):
+                list(validator.iter_errors({}))
+    elapsed = time.perf_counter() - start
+    print('validator per request: %d requests, %.1f us/request'
+          % (requests, elapsed * 1000000 / requests))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for schema in schemas:
+            list(wsgi.Controller.get_validator(schema).iter_errors({}))
+    elapsed = time.perf_counter() - start
+    print('cached validator:      %d requests, %.1f us/request'
+          % (requests, elapsed * 1000000 / requests))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
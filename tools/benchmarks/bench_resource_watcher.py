@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Count the Nova/Cinder API calls made per provisioned instance.
+
+Simulates instances whose volume and server become ready after a random
+number of polling intervals, and compares polling every resource on its
+own with the shared resource watcher.
+
+Usage: python tools/benchmarks/bench_resource_watcher.py [instances]
+"""
+
+import random
+import sys
+from unittest import mock
+
+from trove.taskmanager import resource_watcher
+
+
+class FakeResource(object):
+
+    def __init__(self, id, ready_after):
+        self.id = id
+        self.ready_after = ready_after
+        self.status = 'BUILD'
+
+
+class FakeCloud(object):
+    """Resources get ready after a number of polling intervals."""
+
+    def __init__(self, resources):
+        self.resources = {resource.id: resource for resource in resources}
+        self.round = 0
+        self.calls = 0
+
+    def tick(self):
+        self.round += 1
+        for resource in self.resources.values():
+            if self.round >= resource.ready_after:
+                resource.status = 'ACTIVE'
+
+    def get(self, resource_id):
+        self.calls += 1
+        return self.resources[resource_id]
+
+    def list(self):
+        self.calls += 1
+        return list(self.resources.values())
+
+
+def _make_cloud(instances, seed):
+    rng = random.Random(seed)
+    return FakeCloud([FakeResource('%s-%d' % (kind, index),
+                                   rng.randint(3, 15))
+                      for index in range(instances)
+                      for kind in ('volume', 'server')])
+
+
+def _is_active(resource):
+    return resource.status == 'ACTIVE'
+
+
+def poll_each(instances, seed=0):
+    cloud = _make_cloud(instances, seed)
+    pending = set(cloud.resources)
+    while pending:
+        for resource_id in list(pending):
+            if _is_active(cloud.get(resource_id)):
+                pending.discard(resource_id)
+        cloud.tick()
+    return cloud.calls
+
+
+def shared_watcher(instances, seed=0):
+    cloud = _make_cloud(instances, seed)
+    client = mock.Mock()
+    for attr in ('servers', 'volumes'):
+        getattr(client, attr).get.side_effect = cloud.get
+        getattr(client, attr).list.side_effect = cloud.list
+
+    watcher = resource_watcher.ResourceWatcher()
+    with mock.patch.object(watcher, '_run'):
+        waits = [watcher.watch(resource_id.split('-')[0], client,
+                               resource_id, _is_active)
+                 for resource_id in cloud.resources]
+        while not all(wait.done() for wait in waits):
+            watcher.poll()
+            cloud.tick()
+    return cloud.calls
+
+
+def main(instances=100):
+    for name, func in (('poll each resource', poll_each),
+                       ('shared watcher', shared_watcher)):
+        calls = func(instances)
+        print('%-20s %6d API calls, %6.2f per instance'
+              % (name, calls, calls / float(instances)))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
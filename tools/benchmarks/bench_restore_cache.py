@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Compare restoring each backup of an incremental chain in turn, with and
+without the restore cache.
+
+Fetching the metadata and unpacking a backup take a fixed time, like a
+download from object storage would.
+
+Usage: python tools/benchmarks/bench_restore_cache.py [increments]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from oslo_config import cfg
+from oslo_utils import importutils
+
+from backup import main as backup_main
+from backup.utils import restore_cache
+
+CONF = cfg.CONF
+LATENCY = 0.02
+
+
+class FakeStorage(object):
+    def __init__(self, increments):
+        self.requests = 0
+        self.metadata = {'backup-0': {}}
+        for index in range(1, increments + 1):
+            self.metadata['backup-%d' % index] = {
+                'parent_location': 'backup-%d' % (index - 1),
+                'parent_checksum': 'checksum-%d' % (index - 1)}
+
+    def load_metadata(self, location, checksum):
+        self.requests += 1
+        time.sleep(LATENCY)
+        return self.metadata[location]
+
+
+def run(runner_cls, increments, cache_dir=None):
+    storage = FakeStorage(increments)
+    workdir = tempfile.mkdtemp()
+    unpacked = []
+
+    def unpack(location, checksum, command):
+        time.sleep(LATENCY)
+        unpacked.append(location)
+        with open(os.path.join(workdir, 'data', location), 'w') as f:
+            f.write(checksum)
+        return 1
+
+    start = time.perf_counter()
+    for index in range(increments + 1):
+        shutil.rmtree(workdir)
+        for name in ('data', 'wal'):
+            os.makedirs(os.path.join(workdir, name))
+        cache = None
+        if cache_dir:
+            cache = restore_cache.RestoreCache(cache_dir)
+        runner = runner_cls(
+            storage=storage, restore_cache=cache, lsn='0/0',
+            wal_archive_dir=os.path.join(workdir, 'wal'))
+        runner.datadir = os.path.join(workdir, 'data')
+        runner.unpack = unpack
+        runner.incremental_restore('backup-%d' % index,
+                                   'checksum-%d' % index)
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(workdir)
+    return storage.requests, len(unpacked), elapsed
+
+
+def main(increments=20):
+    CONF.register_cli_opts(backup_main.cli_opts)
+    CONF([], project='trove-backup')
+    # The runners read the options when their module is imported.
+    runner_cls = importutils.import_class(
+        backup_main.driver_mapping['pg_basebackup_inc'])
+    cache_dir = tempfile.mkdtemp()
+    try:
+        for name, directory in (('no cache', None), ('cache', cache_dir)):
+            requests, unpacked, elapsed = run(runner_cls, increments,
+                                              directory)
+            print('%-10s %d restores, %4d metadata requests, %4d backups '
+                  'unpacked, %.2f s' % (name, increments + 1, requests,
+                                        unpacked, elapsed))
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Compare restoring an incremental backup chain with and without prefetching
+the next backups.
+
+Downloading a chunk of a backup and applying it take a fixed time, like
+object storage and the restore command would.
+
+Usage: python tools/benchmarks/bench_restore_prefetch.py [increments]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from oslo_config import cfg
+from oslo_utils import importutils
+
+from backup import main as backup_main
+
+CONF = cfg.CONF
+CHUNK = b'x' * 2 ** 16
+CHUNKS = 20
+LATENCY = 0.002
+
+
+class FakeStorage(object):
+    def __init__(self, increments):
+        self.metadata = {'backup-0': {}}
+        for index in range(1, increments + 1):
+            self.metadata['backup-%d' % index] = {
+                'parent_location': 'backup-%d' % (index - 1),
+                'parent_checksum': 'checksum-%d' % (index - 1)}
+
+    def load_metadata(self, location, checksum):
+        return self.metadata[location]
+
+    def load(self, location, checksum):
+        for _ in range(CHUNKS):
+            time.sleep(LATENCY)
+            yield CHUNK
+
+
+def unpack(location, checksum, command, stream):
+    length = 0
+    for chunk in stream:
+        time.sleep(LATENCY)
+        length += len(chunk)
+    return length
+
+
+def run(runner_cls, increments, prefetch_size):
+    workdir = tempfile.mkdtemp()
+    runner = runner_cls(
+        storage=FakeStorage(increments), lsn='0/0',
+        prefetch_dir=os.path.join(workdir, 'prefetch'),
+        prefetch_size=prefetch_size, wal_archive_dir=workdir)
+    runner.unpack = unpack
+    start = time.perf_counter()
+    runner.incremental_restore('backup-%d' % increments,
+                               'checksum-%d' % increments)
+    elapsed = time.perf_counter() - start
+    shutil.rmtree(workdir)
+    return runner.restore_content_length, elapsed
+
+
+def main(increments=20):
+    CONF.register_cli_opts(backup_main.cli_opts)
+    CONF([], project='trove-backup')
+    # The runners read the options when their module is imported.
+    runner_cls = importutils.import_class(
+        backup_main.driver_mapping['pg_basebackup_inc'])
+    backup_size = len(CHUNK) * CHUNKS
+    for prefetch_size in (0, 2 * backup_size, 8 * backup_size):
+        length, elapsed = run(runner_cls, increments, prefetch_size)
+        print('prefetch size %5.1f MB: %d backups, %.0f MB restored, '
+              '%.2f s' % (prefetch_size / 1e6, increments + 1,
+                          length / 1e6, elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark the encrypting RPC serializers in messages per second.
+
+Usage: python tools/benchmarks/bench_rpc_serializer.py [messages] [size]
+"""
+
+import sys
+import time
+from unittest import mock
+
+from trove.common import cfg
+from trove.common.rpc import conductor_guest_serializer as gsz
+from trove.common.rpc import conductor_host_serializer as hsz
+from trove.common.rpc import secure_serializer as ssz
+
+KEY = 'mo79Y86Bp3bzQDWR31ihhVGfLBmeac'
+
+
+def _report(name, messages, elapsed):
+    print('%-32s %10.0f msg/s' % (name, messages / elapsed))
+
+
+def main(messages=20000, size=512):
+    cfg.CONF([], project='trove')
+    cfg.CONF.set_override('guest_id', 'a3af1652-686a-4574-a916-2ef7e85136e5')
+    entity = {'payload': 'x' * size, 'sent': time.time(),
+              'instance_id': 'a3af1652-686a-4574-a916-2ef7e85136e5'}
+    context = {'user': 'admin', 'project_id': 'tenant', 'is_admin': True}
+
+    secure = ssz.SecureSerializer(None, KEY)
+    start = time.perf_counter()
+    for _ in range(messages):
+        secure.deserialize_entity(context,
+                                  secure.serialize_entity(context, entity))
+    _report('SecureSerializer entity', messages,
+            time.perf_counter() - start)
+
+    guest = gsz.ConductorGuestSerializer(None, KEY)
+    host = hsz.ConductorHostSerializer(None, None)
+    with mock.patch.object(hsz, 'get_instance_encryption_key',
+                           return_value=KEY):
+        start = time.perf_counter()
+        for _ in range(messages):
+            host.deserialize_entity(context,
+                                    guest.serialize_entity(context, entity))
+        _report('Conductor guest -> host entity', messages,
+                time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(messages):
+            host.deserialize_context(guest.serialize_context(context))
+        _report('Conductor guest -> host context', messages,
+                time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Benchmark the configuration codecs on the shipped my.cnf and
+postgresql.conf templates.
+
+Usage: python tools/benchmarks/bench_stream_codecs.py [iterations]
+"""
+
+import sys
+import timeit
+import types
+
+from trove.common import configurations
+from trove.common import stream_codecs
+from trove.common import utils
+
+
+def render(path):
+    template = utils.build_jinja_environment().get_template(path)
+    version = types.SimpleNamespace(major=8, minor=0)
+    return template.render(
+        flavor={'ram': 4096}, server_id=1,
+        datastore=types.SimpleNamespace(semantic_version=version))
+
+
+def main(iterations=500):
+    samples = [
+        ('my.cnf', configurations.MySQLConfParser.CODEC,
+         render('mysql/config.template')),
+        ('my.cnf', stream_codecs.IniCodec(),
+         render('mysql/config.template')),
+        ('postgresql.conf', configurations.PostgresqlConfParser.CODEC,
+         render('postgresql/config.template')),
+    ]
+
+    for name, codec, stream in samples:
+        data = codec.deserialize(stream)
+        if codec.deserialize(codec.serialize(data)) != data:
+            raise RuntimeError('%s does not round-trip' % name)
+
+        for operation, func in (
+                ('deserialize', lambda: codec.deserialize(stream)),
+                ('serialize', lambda: codec.serialize(data))):
+            elapsed = timeit.timeit(func, number=iterations)
+            print('%-16s %-16s %-12s %8.1f us/op' % (
+                name, type(codec).__name__, operation,
+                elapsed * 1e6 / iterations))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
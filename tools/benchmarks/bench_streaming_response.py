@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+#
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""
+Compare the peak memory of serializing a large backup listing whole and
+streaming it item by item.
+
+Usage: python tools/benchmarks/bench_streaming_response.py [items]
+"""
+
+import datetime
+import sys
+import time
+import tracemalloc
+
+from trove.common import wsgi
+
+
+def backups(count):
+    """Backup views, built one at a time like a list view does."""
+    created = datetime.datetime(2024, 1, 1)
+    for index in range(count):
+        yield {'id': '%032x' % index, 'name': 'backup-%d' % index,
+               'description': 'Daily backup of instance %d' % index,
+               'locationRef': 'https://object-storage.example.com/v1/'
+                              'database_backups/%032x.xbstream.gz.enc'
+                              % index,
+               'instance_id': '%032x' % (index // 10), 'created': created,
+               'updated': created, 'size': 0.12, 'status': 'COMPLETED',
+               'parent_id': None, 'project_id': 'project-%d' % (index % 50),
+               'datastore': {'type': 'mysql', 'version': '8.0',
+                             'version_id': '%032x' % 1}}
+
+
+def whole(count):
+    result = wsgi.Result({'backups': list(backups(count))})
+    response = wsgi.TroveResponseSerializer().serialize(result,
+                                                        'application/json')
+    return len(response.body)
+
+
+def streamed(count):
+    result = wsgi.StreamingResult('backups', backups(count))
+    response = wsgi.TroveResponseSerializer().serialize(result,
+                                                        'application/json')
+    # Like the WSGI server, write the chunks out as they come.
+    return sum(len(chunk) for chunk in response.app_iter)
+
+
+def main(count=50000):
+    for name, func in (('whole', whole), ('streamed', streamed)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        size = func(count)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print('%-10s %d items, %.1f MB body, peak memory %7.1f MB, %.2f s'
+              % (name, count, size / 1e6, peak / 1e6, elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -16,7 +16,6 @@
 from oslo_log import log as logging
 from requests.exceptions import ConnectionError
 from sqlalchemy import desc
-from swiftclient.client import ClientException
 
 from trove.backup.state import BackupState
 from trove.common import cfg
@@ -340,13 +339,11 @@ class Backup(object):
 
         def _delete_resources():
             backup = cls.get_by_id(context, backup_id)
-            if backup.is_running:
-                delta = (timeutils.utcnow_aware() - backup.created).days
-                if delta < CONF.running_backups_expires:
-                    msg = _(
-                        "Backup %s cannot be deleted"
-                        " because it is running.")
-                    raise exception.UnprocessableEntity(msg % backup_id)
+            if cls._is_running(backup):
+                msg = _(
+                    "Backup %s cannot be deleted"
+                    " because it is running.")
+                raise exception.UnprocessableEntity(msg % backup_id)
             if backup.storage_driver == "swift":
                 cls.verify_swift_auth_token(context)
             api.API(context).delete_backup(backup_id)
@@ -355,8 +352,55 @@ class Backup(object):
                                {'backups': -1},
                                _delete_resources)
 
+    @classmethod
+    def delete_all(cls, context, project_id, instance_id=None):
+        """
+        delete all the backups of a project, or of one of its instances,
+        with a single taskmanager job. Running backups are left alone.
+        :param cls:
+        :param context: context containing the token
+        :param project_id: the project owning the backups
+        :param instance_id: only delete the backups of this instance
+        :return: the ids of the backups being deleted
+        """
+        with DBBackup.query() as query:
+            query = query.filter_by(tenant_id=project_id, deleted=False)
+            if instance_id:
+                query = query.filter_by(instance_id=instance_id)
+            backups = query.all()
+        backups = [backup for backup in backups
+                   if not cls._is_running(backup)]
+        if not backups:
+            return []
+
+        backup_ids = [backup.id for backup in backups]
+
+        def _delete_resources():
+            if any(backup.storage_driver == "swift" for backup in backups):
+                cls.verify_swift_auth_token(context)
+            api.API(context).delete_backups(backup_ids)
+
+        run_with_quotas(project_id, {'backups': -len(backup_ids)},
+                        _delete_resources)
+        return backup_ids
+
+    @staticmethod
+    def _is_running(backup):
+        """Whether a backup is running and has not hung for long enough to
+        be deleted.
+        """
+        if not backup.is_running:
+            return False
+        now = timeutils.utcnow_aware()
+        if backup.created.tzinfo is None:
+            # Loaded from the database, in UTC.
+            now = now.replace(tzinfo=None)
+        return (now - backup.created).days < CONF.running_backups_expires
+
     @classmethod
     def verify_swift_auth_token(cls, context):
+        from swiftclient.client import ClientException
+
         try:
             client = clients.create_swift_client(context)
             client.get_account()
@@ -481,6 +525,8 @@ class DBBackup(DatabaseModelBase):
         return False
 
     def check_swift_object_exist(self, context, verify_checksum=False):
+        from swiftclient.client import ClientException
+
         try:
             parts = self.location.split('/')
             obj = parts[-1]
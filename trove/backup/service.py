@@ -63,7 +63,7 @@ class BackupController(wsgi.Controller):
         view = views.BackupViews(backups)
         paged = pagination.SimplePaginatedDataView(req.url, 'backups', view,
                                                    marker)
-        return wsgi.Result(paged.data(), 200)
+        return wsgi.StreamingResult('backups', view.items(), paged.links())
 
     def show(self, req, tenant_id, id):
         """Return a single backup."""
@@ -49,12 +49,12 @@ class BackupViews(object):
     def __init__(self, backups):
         self.backups = backups
 
-    def data(self):
-        backups = []
-
+    def items(self):
         for b in self.backups:
-            backups.append(BackupView(b).data()["backup"])
-        return {"backups": backups}
+            yield BackupView(b).data()["backup"]
+
+    def data(self):
+        return {"backups": list(self.items())}
 
 
 class BackupStrategyView(object):
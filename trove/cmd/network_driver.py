@@ -13,11 +13,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import atexit
 import json
 import jsonschema
 import netaddr
 import os
 import sys
+import threading
 import traceback
 
 import flask
@@ -25,6 +27,7 @@ from flask import Flask
 import gunicorn.app.base
 from oslo_log import log as logging
 from pyroute2 import IPRoute
+from pyroute2.netlink.exceptions import NetlinkError
 from werkzeug import exceptions as w_exceptions
 
 from trove.common import constants
@@ -34,39 +37,165 @@ LOG = logging.getLogger(__name__)
 
 
 class hostnic_config(object):
-    """this class records network id and its host nic"""
-    CONFIG_FILE = "/etc/docker/hostnic.json"
+    """this class records network id and its host nic
 
-    def __init__(self) -> None:
-        if not os.path.exists(self.CONFIG_FILE):
-            with open(self.CONFIG_FILE, 'w+') as f:
-                f.write(json.dumps({}))
+    The records are kept in memory. A change is written back to the config
+    file shortly after, together with the other changes made meanwhile, by
+    writing a temporary file renamed over the config file.
+    """
+    CONFIG_FILE = "/etc/docker/hostnic.json"
+    WRITE_DELAY = 0.5
+
+    def __init__(self, config_file=None) -> None:
+        self.config_file = config_file or self.CONFIG_FILE
+        self._data = None
+        self._timer = None
+        self._lock = threading.RLock()
+
+    def _load(self) -> dict:
+        if self._data is None:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r') as cfg:
+                    self._data = json.loads(cfg.read())
+            else:
+                self._data = {}
+                self._schedule_write()
+        return self._data
+
+    def _schedule_write(self):
+        if self._timer is None:
+            self._timer = threading.Timer(self.WRITE_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Write the records to the config file if they changed."""
+        with self._lock:
+            if self._timer is None:
+                return
+            self._timer.cancel()
+            self._timer = None
+            tmp_file = '%s.tmp' % self.config_file
+            with open(tmp_file, 'w') as cfg:
+                cfg.write(json.dumps(self._data))
+                cfg.flush()
+                os.fsync(cfg.fileno())
+            os.replace(tmp_file, self.config_file)
 
     def get_data(self) -> dict:
-        with open(self.CONFIG_FILE, 'r') as cfg:
-            data = json.loads(cfg.read())
-        return data
+        with self._lock:
+            return dict(self._load())
 
     def write_config(self, key: str, value: str):
-        data = self.get_data()
-        data[key] = value
-        with open(self.CONFIG_FILE, 'w+') as cfg:
-            cfg.write(json.dumps(data))
+        with self._lock:
+            self._load()[key] = value
+            self._schedule_write()
 
     def get_config(self, key: str):
-        data = self.get_data()
-        return data.get(key, "")
+        with self._lock:
+            return self._load().get(key, "")
 
     def delete_config(self, key: str):
-        data = self.get_data()
-        if not data.get(key):
-            return
-        data.pop(key)
-        with open(self.CONFIG_FILE, 'w+') as cfg:
-            cfg.write(json.dumps(data))
+        with self._lock:
+            data = self._load()
+            if not data.get(key):
+                return
+            data.pop(key)
+            self._schedule_write()
+
+
+class hostnic_links(object):
+    """Looks up the host nics by MAC address.
+
+    The netlink socket is opened once. The index of the nic found for a MAC
+    address is remembered, so the next lookups only get that link and check
+    its address, instead of dumping all the links.
+    """
+
+    def __init__(self) -> None:
+        self._ipr = None
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ipr(self):
+        if self._ipr is None:
+            self._ipr = IPRoute()
+        return self._ipr
+
+    def _get_cached(self, mac: str):
+        index = self._indexes.get(mac)
+        if index is None:
+            return None
+        try:
+            link = self.ipr.link('get', index=index)[0]
+        except NetlinkError:
+            return None
+        if link.get_attr('IFLA_ADDRESS') != mac:
+            return None
+        return link.get_attr('IFLA_IFNAME')
+
+    def get_ifname(self, mac: str) -> str:
+        mac = mac.lower()
+        with self._lock:
+            try:
+                ifname = self._get_cached(mac)
+                if ifname:
+                    return ifname
+                iface = self.ipr.get_links(address=mac)[0]
+            except OSError:
+                # Open a new socket next time if this one is broken.
+                self.close()
+                raise
+            self._indexes[mac] = iface['index']
+            return iface.get_attr('IFLA_IFNAME')
+
+    def close(self):
+        if self._ipr is not None:
+            self._ipr.close()
+            self._ipr = None
+
+
+class json_file(object):
+    """A JSON file, read again only when it changes."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._stat = None
+        self._data = None
+
+    def get_data(self) -> dict:
+        stat = os.stat(self.path)
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if key != self._stat:
+            with open(self.path) as fd:
+                self._data = json.load(fd)
+            self._stat = key
+        return self._data
+
+
+def _validator(schema):
+    """Build the validator of a schema once, it is slow to check."""
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+
+    def validate(instance):
+        error = jsonschema.exceptions.best_match(
+            validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    return validate
+
 
+validate_network_create = _validator(schemata.NETWORK_CREATE_SCHEMA)
+validate_network_join = _validator(schemata.NETWORK_JOIN_SCHEMA)
 
 driver_config = hostnic_config()
+atexit.register(driver_config.flush)
+hostnic_nics = hostnic_links()
+eth1_config_file = json_file(constants.ETH1_CONFIG_PATH)
 
 
 def make_json_app(import_name, **kwargs):
@@ -177,7 +306,7 @@ def network_driver_create_network():
       https://github.com/docker/libnetwork/blob/master/docs/remote.md#create-network  # noqa
     """
     json_data = flask.request.get_json(force=True)
-    jsonschema.validate(json_data, schemata.NETWORK_CREATE_SCHEMA)
+    validate_network_create(json_data)
     hostnic_mac = \
         json_data['Options']['com.docker.network.generic']['hostnic_mac']
     if driver_config.get_config(json_data['NetworkID']):
@@ -203,14 +332,11 @@ def network_driver_delete_network():
 @app.route('/NetworkDriver.Join', methods=['POST'])
 def network_driver_join():
     json_data = flask.request.get_json(force=True)
-    jsonschema.validate(json_data, schemata.NETWORK_JOIN_SCHEMA)
+    validate_network_join(json_data)
     netid = json_data['NetworkID']
     hostnic_mac = driver_config.get_config(netid).get('mac_address')
-    ipr = IPRoute()
-    ifaces = ipr.get_links(address=hostnic_mac)
-    ifname = ifaces[0].get_attr('IFLA_IFNAME')
-    with open(constants.ETH1_CONFIG_PATH) as fd:
-        eth1_config = json.load(fd)
+    ifname = hostnic_nics.get_ifname(hostnic_mac)
+    eth1_config = eth1_config_file.get_data()
     join_response = {
         "InterfaceName": {
             "SrcName": ifname,
@@ -0,0 +1,103 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Report the import cost of the modules loaded by the Trove services."""
+
+import argparse
+import collections
+import subprocess
+import sys
+
+# The modules each service imports before it starts serving requests.
+STARTUP_MODULES = {
+    'api': ['trove.cmd.api', 'trove.common.wsgi', 'trove.instance.models',
+            'trove.common.api'],
+    'conductor': ['trove.cmd.conductor', 'trove.conductor.manager',
+                  'trove.common.rpc.conductor_host_serializer',
+                  'trove.common.rpc.service'],
+    'taskmanager': ['trove.cmd.taskmanager', 'trove.taskmanager.manager',
+                    'trove.common.rpc.service'],
+}
+
+ImportCost = collections.namedtuple(
+    'ImportCost', ['module', 'self_us', 'cumulative_us', 'level'])
+
+
+def parse_importtime(output):
+    """Parse the report written to stderr by 'python -X importtime'."""
+    costs = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Skip the header line.
+            continue
+        # Nested imports are indented by two spaces per level.
+        name = fields[2].rstrip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        costs.append(ImportCost(name.strip(), int(fields[0]),
+                                int(fields[1]), level))
+    return costs
+
+
+def profile_imports(modules, python=sys.executable):
+    """Import modules in a fresh interpreter and return their import costs.
+
+    :returns: the total import time in microseconds and the list of
+              ImportCost, one per imported module.
+    """
+    code = 'import importlib\nfor name in %r:\n' \
+           '    importlib.import_module(name)\n' % (list(modules),)
+    result = subprocess.run([python, '-X', 'importtime', '-c', code],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            universal_newlines=True, check=True)
+    costs = parse_importtime(result.stderr)
+    # Only the top level imports add up to the total time.
+    total = sum(cost.cumulative_us for cost in costs if cost.level == 0)
+    return total, costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('binaries', nargs='*', metavar='binary',
+                        help='Services to profile (%s), all of them by '
+                             'default.' % ', '.join(sorted(STARTUP_MODULES)))
+    parser.add_argument('--top', type=int, default=20,
+                        help='Number of modules to list per service.')
+    parser.add_argument('--sort', choices=['self', 'cumulative'],
+                        default='self',
+                        help='Sort the modules by their own import time or '
+                             'by the time including their dependencies.')
+    args = parser.parse_args()
+    unknown = set(args.binaries) - set(STARTUP_MODULES)
+    if unknown:
+        parser.error('unknown service(s): %s' % ', '.join(sorted(unknown)))
+
+    for binary in args.binaries or sorted(STARTUP_MODULES):
+        total, costs = profile_imports(STARTUP_MODULES[binary])
+        key = 'self_us' if args.sort == 'self' else 'cumulative_us'
+        costs.sort(key=lambda cost: getattr(cost, key), reverse=True)
+
+        print('trove-%s: %d modules imported in %.3f s'
+              % (binary, len(costs), total / 1000000.0))
+        print('%12s %12s  %s' % ('self (ms)', 'cumul. (ms)', 'module'))
+        for cost in costs[:args.top]:
+            print('%12.1f %12.1f  %s' % (cost.self_us / 1000.0,
+                                         cost.cumulative_us / 1000.0,
+                                         cost.module))
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
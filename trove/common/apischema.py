@@ -553,6 +553,26 @@ mgmt_cluster = {
     }
 }
 
+mgmt_backup = {
+    "action": {
+        "name": "mgmt_backup:action",
+        "type": "object",
+        "required": ["delete"],
+        "additionalProperties": False,
+        "properties": {
+            "delete": {
+                "type": "object",
+                "required": ["project_id"],
+                "additionalProperties": False,
+                "properties": {
+                    "project_id": non_empty_string,
+                    "instance_id": uuid
+                }
+            }
+        }
+    }
+}
+
 mgmt_instance = {
     "action": {
         'migrate': {
@@ -447,13 +447,42 @@ class DictSerializer(ActionDispatcher):
 class JSONDictSerializer(DictSerializer):
     """Default JSON request body serialization."""
 
+    # Size of the pieces written by serialize_items.
+    chunk_size = 64 * 1024
+
+    @staticmethod
+    def sanitizer(obj):
+        if isinstance(obj, datetime.datetime):
+            _dtime = obj - datetime.timedelta(microseconds=obj.microsecond)
+            return _dtime.isoformat()
+        return obj
+
     def default(self, data):
-        def sanitizer(obj):
-            if isinstance(obj, datetime.datetime):
-                _dtime = obj - datetime.timedelta(microseconds=obj.microsecond)
-                return _dtime.isoformat()
-            return obj
-        return jsonutils.dump_as_bytes(data, default=sanitizer)
+        return jsonutils.dump_as_bytes(data, default=self.sanitizer)
+
+    def serialize_items(self, collection_type, items, extra=None):
+        """Serialize {collection_type: [items...], **extra} incrementally.
+
+        Yields the document in chunks of about chunk_size bytes, consuming
+        the items one at a time.
+        """
+        chunk = [b'{' + self.default(collection_type) + b': [']
+        size = len(chunk[0])
+        for index, item in enumerate(items):
+            piece = self.default(item)
+            chunk.append(b', ' + piece if index else piece)
+            size += len(piece)
+            if size >= self.chunk_size:
+                yield b''.join(chunk)
+                chunk = []
+                size = 0
+
+        chunk.append(b']')
+        for key, value in (extra or {}).items():
+            chunk.append(b', ' + self.default(key) + b': ' +
+                         self.default(value))
+        chunk.append(b'}')
+        yield b''.join(chunk)
 
 
 class XMLDictSerializer(DictSerializer):
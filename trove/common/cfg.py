@@ -186,6 +186,14 @@ common_opts = [
                help='Page size for listing backups.'),
     cfg.IntOpt('running_backups_expires', default=3,
                help='Number of days after hanging backups can be deleted.'),
+    cfg.IntOpt('backup_delete_workers', default=10, min=1,
+               help='Maximum number of requests the taskmanager sends to '
+                    'the backup storage at the same time when deleting '
+                    'backups in bulk.'),
+    cfg.IntOpt('backup_delete_batch_size', default=100, min=1,
+               help='Number of backups deleted together when deleting '
+                    'backups in bulk. The database is updated and the '
+                    'progress logged once per batch.'),
     cfg.IntOpt('configurations_page_size', default=20,
                help='Page size for listing configurations.'),
     cfg.IntOpt('modules_page_size', default=20,
@@ -269,6 +277,12 @@ common_opts = [
                help='The default datastore id or name to use if one is not '
                'provided by the user. If the default value is None, the field '
                'becomes required in the instance create request.'),
+    cfg.IntOpt('datastore_cache_ttl', default=60, min=0,
+               help='Time (in seconds) the datastores, datastore versions '
+                    'and capabilities stay in the in-process cache of the '
+                    'Trove services. Changes made by another process, e.g. '
+                    'trove-manage, show up after at most that long. 0 '
+                    'disables the cache.'),
     cfg.StrOpt('datastore_manager', default=None,
                help='Manager class in the Guest Agent, set up by the '
                     'Taskmanager on instance provision.'),
@@ -321,6 +335,22 @@ common_opts = [
                'be the number of CPUs available.'),
     cfg.IntOpt('usage_sleep_time', default=5,
                help='Time to sleep during the check for an active Guest.'),
+    cfg.BoolOpt('resource_watcher_enabled', default=False,
+                help='Wait for Nova servers and Cinder volumes and snapshots '
+                     'through a shared watcher in the taskmanager, which '
+                     'checks all the resources being waited for with one '
+                     'list call per interval instead of one call per '
+                     'resource.'),
+    cfg.IntOpt('resource_watcher_interval', default=2, min=1,
+               help='Time (in seconds) between two status checks of the '
+                    'resource watcher.'),
+    cfg.BoolOpt('resource_watcher_notifications', default=False,
+                help='Check the resources being waited for as soon as a '
+                     'Nova or Cinder notification about them is received. '
+                     'Requires resource_watcher_enabled.'),
+    cfg.StrOpt('resource_watcher_notification_topic', default='notifications',
+               help='Topic on which Nova and Cinder send their '
+                    'notifications.'),
     cfg.StrOpt('region', default='LOCAL_DEV',
                help='The region this service is located.'),
     cfg.StrOpt('backup_runner',
@@ -379,6 +409,21 @@ common_opts = [
     cfg.IntOpt('backup_segment_max_size', default=2 * (1024 ** 3),
                help='Maximum size (in bytes) of each segment of the backup '
                'file.'),
+    cfg.StrOpt('backup_restore_cache_dir', default='',
+               help='Directory on the guest instance to keep the prepared '
+                    'restores of incremental backups in. Restoring a later '
+                    'incremental backup of the same chain, e.g. to rebuild '
+                    'a replica, then only downloads and applies the new '
+                    'increments. The cache is disabled if empty.'),
+    cfg.IntOpt('backup_restore_cache_entries', default=2, min=1,
+               help='Number of prepared restores kept in '
+                    'backup_restore_cache_dir.'),
+    cfg.IntOpt('backup_restore_prefetch_size', default=0, min=0,
+               help='Maximum size (in bytes) of the incremental backups '
+                    'downloaded ahead of their restore on the guest '
+                    'instance, while the previous backups of the chain are '
+                    'applied. The backups are staged on the data volume. '
+                    'Prefetching is disabled if 0.'),
     cfg.StrOpt('remote_dns_client',
                default='trove.common.clients.dns_client',
                help='Client to send DNS calls to.'),
@@ -403,12 +448,28 @@ common_opts = [
     cfg.StrOpt('remote_glance_client',
                default='trove.common.clients_admin.glance_client_trove_admin',
                help='Client to send Glance calls to.'),
+    cfg.IntOpt('client_pool_ttl', default=300, min=0,
+               help='Time (in seconds) a Nova, Cinder, Neutron, Swift, '
+                    'Glance or Barbican client created with the token of a '
+                    'request is reused by the following requests carrying '
+                    'the same token, and never past the expiry of the '
+                    'token. Swift clients are only reused by the thread '
+                    'that created them. 0 disables the reuse. The clients '
+                    'using the Trove service credentials are always '
+                    'reused.'),
+    cfg.IntOpt('client_pool_size', default=1000, min=1,
+               help='Maximum number of service clients kept in memory by '
+                    'each Trove process.'),
     cfg.StrOpt('exists_notification_transformer',
                help='Transformer for exists notifications.'),
     cfg.IntOpt('exists_notification_interval', default=3600,
                help='Seconds to wait between pushing events.'),
     cfg.IntOpt('quota_notification_interval',
                help='Seconds to wait between pushing events.'),
+    cfg.IntOpt('polling_stats_interval',
+               help='Seconds between logging the wait time and poll count '
+                    'statistics of each place the taskmanager polls from. '
+                    'Disabled if not set.'),
     cfg.DictOpt('notification_service_id',
                 default={'mysql': '2f3ff068-2bfb-4f70-9a9d-a6bb65bc084b',
                          'percona': 'fd1723f5-68d2-409c-994f-a4a197892a17',
@@ -493,6 +554,17 @@ common_opts = [
     cfg.IntOpt('restore_usage_timeout', default=60 * 60,
                help='Maximum time (in seconds) to wait for a Guest instance '
                     'restored from a backup to become active.'),
+    cfg.IntOpt('instance_build_timeout', default=0, min=0,
+               help='Maximum time (in seconds) to build an instance, from '
+                    'the creation of its server and volume until its Guest '
+                    'is active. It bounds all the waits of the build, '
+                    'including the wait for the Guest set by usage_timeout '
+                    'or restore_usage_timeout. The replicas created '
+                    'together share it. 0 means no limit.'),
+    cfg.IntOpt('cluster_max_parallel_operations', default=10,
+               help='Maximum number of cluster members the taskmanager '
+                    'works on at the same time when creating or resizing a '
+                    'cluster. 1 handles the members one by one.'),
     cfg.IntOpt('cluster_usage_timeout', default=36000,
                help='Maximum time (in seconds) to wait for a cluster to '
                     'become active.'),
@@ -507,6 +579,20 @@ common_opts = [
     cfg.IntOpt('module_reapply_min_batch_delay', default=2,
                help='The minimum delay (in seconds) between subsequent '
                     'module batch reapply executions.'),
+    cfg.IntOpt('module_swift_threshold', default=0,
+               help='Size in bytes from which the contents of tenant '
+                    'modules are sent to the guests through Swift instead '
+                    'of RPC. 0 disables it. Admin modules are always sent '
+                    'through RPC.'),
+    cfg.StrOpt('module_swift_container', default='database_modules',
+               help='Name of the container that stores the contents of '
+                    'the modules sent through Swift.'),
+    cfg.IntOpt('module_swift_object_ttl', default=60 * 60 * 24, min=0,
+               help='Time (in seconds) after which the module contents '
+                    'sent through Swift are deleted. The guests keep the '
+                    'contents they downloaded. 0 keeps them, the '
+                    'module_swift_container containers of the projects '
+                    'must then be cleaned up by the operator.'),
     cfg.StrOpt('guest_log_container_name',
                default='database_logs',
                help='Name of container that stores guest log components.'),
@@ -524,6 +610,16 @@ common_opts = [
                help='Key (OpenSSL aes_cbc) to encrypt instance keys in DB.'),
     cfg.StrOpt('instance_rpc_encr_key',
                help='Key (OpenSSL aes_cbc) for instance RPC encryption.'),
+    cfg.IntOpt('instance_rpc_encr_key_cache_size', default=10000, min=1,
+               help='Maximum number of instance RPC encryption keys kept in '
+                    'memory by the conductor.'),
+    cfg.IntOpt('instance_rpc_encr_key_cache_ttl', default=0, min=0,
+               help='Time (in seconds) an instance RPC encryption key stays '
+                    'in the conductor cache. 0 means the keys never '
+                    'expire.'),
+    cfg.BoolOpt('instance_rpc_encr_key_cache_warm_up', default=False,
+                help='Load the instance RPC encryption keys with a single '
+                     'query when the conductor starts.'),
     cfg.StrOpt('database_service_uid', default='1001',
                help='The UID(GID) of database service user.'),
     cfg.ListOpt('reserved_network_cidrs', default=[],
@@ -1126,6 +1222,16 @@ postgresql_opts = [
                      'if trove_security_groups_support is True).'),
     cfg.PortOpt('postgresql_port', default=5432,
                 help='The TCP port the server listens on.'),
+    cfg.IntOpt('connection_pool_size', default=5, min=0,
+               help='Maximum number of idle connections per database user '
+                    'kept open by the guest agent for reuse. Only the '
+                    'connections to the maintenance database are reused. '
+                    'Set to 0 to open a new connection for every '
+                    'statement.'),
+    cfg.IntOpt('connection_pool_max_connections', default=10, min=0,
+               help='Maximum number of idle connections kept open by the '
+                    'guest agent for reuse, across all the connection '
+                    'pools.'),
     cfg.StrOpt('backup_strategy', default='pg_basebackup',
                help='Default strategy to perform backups.'),
     cfg.StrOpt(
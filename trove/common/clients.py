@@ -13,24 +13,31 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import functools
+import hashlib
+import threading
+import time
+
+from oslo_log import log as logging
 from oslo_utils.importutils import import_class
+from oslo_utils import timeutils
 
 from trove.common import cfg
 from trove.common import exception
 from trove.common.strategies.cluster import strategy
 
-from barbicanclient import client as BarbicanClient
-from cinderclient.v3 import client as CinderClient
-import glanceclient
-from keystoneauth1.identity import v3
-from keystoneauth1 import session as ka_session
-from keystoneauth1 import token_endpoint
-from keystoneclient.service_catalog import ServiceCatalog
-from neutronclient.v2_0 import client as NeutronClient
-from novaclient.client import Client
-from swiftclient.client import Connection
-
 CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+# Seconds before the expiry of its token when a client stops being reused.
+TOKEN_EXPIRY_MARGIN = 60
+# Connections kept open to each host by the shared HTTP session.
+HTTP_POOL_MAXSIZE = 32
+_HTTP_SESSION = None
+
+# NOTE: The client libraries are imported by the functions creating the
+# clients, so that the services only pay for the ones they actually use.
 
 
 def normalize_url(url):
@@ -54,6 +61,8 @@ def get_endpoint(service_catalog, service_type=None,
 
     Some parts copied from glance/common/auth.py.
     """
+    from keystoneclient.service_catalog import ServiceCatalog
+
     endpoint_region = endpoint_region or CONF.service_credentials.region_name
 
     if not service_catalog:
@@ -75,6 +84,160 @@ def get_endpoint(service_catalog, service_type=None,
     return urls[0]
 
 
+class ClientPool(object):
+    """Service clients reused across requests.
+
+    Creating a client parses the service catalog and sets up the HTTP
+    connections of the client. The pool keeps the clients it creates,
+    keyed by (project, region, service, credentials), so the requests of a
+    project carrying the same token get the same client. The credentials
+    are a hash of the token, never the token itself.
+
+    An entry stays in the pool for at most client_pool_ttl seconds, and
+    never past the expiry of its token. The least recently used entries
+    are evicted beyond client_pool_size.
+    """
+
+    def __init__(self):
+        self._clients = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __len__(self):
+        return len(self._clients)
+
+    def get(self, key, create, ttl=None):
+        """Get the client of a key, creating it if needed.
+
+        :param key: (project, region, service, credentials).
+        :param create: called without arguments to create the client.
+        :param ttl: seconds the client may be reused, forever if None. The
+                    client is not pooled if 0.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry is not None:
+                client, expires = entry
+                if expires is None or expires > now:
+                    self._clients.move_to_end(key)
+                    self.hits += 1
+                    return client
+                del self._clients[key]
+            self.misses += 1
+
+        client = create()
+        service = key[2]
+        with self._lock:
+            self.created[service] += 1
+            if ttl is None or ttl > 0:
+                self._clients[key] = (
+                    client, None if ttl is None else now + ttl)
+                while len(self._clients) > CONF.client_pool_size:
+                    self._clients.popitem(last=False)
+                    self.evictions += 1
+        LOG.debug("Created %(service)s client for project %(project)s in "
+                  "region %(region)s, client pool stats: %(stats)s",
+                  {'service': service, 'project': key[0],
+                   'region': key[1], 'stats': self.stats()})
+        return client
+
+    def clear(self):
+        """Drop the clients and reset the counters."""
+        with self._lock:
+            self._clients.clear()
+            self.created = collections.Counter()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        return {'size': len(self._clients), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions,
+                'created': dict(self.created)}
+
+
+CLIENT_POOL = ClientPool()
+
+
+def get_http_session():
+    """Get the HTTP session shared by the keystone sessions of the clients.
+
+    The connections to the services are kept open across the clients.
+    """
+    import requests
+
+    global _HTTP_SESSION
+
+    if not _HTTP_SESSION:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=HTTP_POOL_MAXSIZE)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _HTTP_SESSION = session
+
+    return _HTTP_SESSION
+
+
+def token_session(url, token, insecure=False):
+    """Get a keystone session sending the token to the endpoint url."""
+    from keystoneauth1 import session as ka_session
+    from keystoneauth1 import token_endpoint
+
+    return ka_session.Session(auth=token_endpoint.Token(url, token),
+                              verify=not insecure,
+                              session=get_http_session())
+
+
+def token_ttl(context):
+    """Seconds a client created with the token of the context may be used.
+
+    At most client_pool_ttl, ending TOKEN_EXPIRY_MARGIN seconds before the
+    token expires when its expiry is known.
+    """
+    ttl = CONF.client_pool_ttl
+    expires = getattr(context, 'auth_token_expires', None)
+    if ttl and isinstance(expires, str):
+        remaining = (timeutils.normalize_time(timeutils.parse_isotime(
+            expires)) - timeutils.utcnow()).total_seconds()
+        ttl = max(0, min(ttl, int(remaining - TOKEN_EXPIRY_MARGIN)))
+    return ttl
+
+
+def pooled_client(service, admin=False, per_thread=False):
+    """Reuse the clients created by the decorated function.
+
+    The decorated function takes the context and the region name, and
+    creates a client with the token of the context, or with the trove
+    service credentials if admin. The admin clients authenticate on their
+    own and are kept until evicted. The clients that are not thread-safe
+    are pooled per_thread, each thread reuses its own.
+    """
+    def decorator(create):
+        @functools.wraps(create)
+        def wrapper(context, region_name=None, **kwargs):
+            region = region_name or CONF.service_credentials.region_name
+            if admin:
+                key = (CONF.service_credentials.project_name, region,
+                       service, None)
+                ttl = None
+            else:
+                credentials = hashlib.sha256(repr(
+                    (context.auth_token, sorted(kwargs.items()))).encode())
+                key = (context.project_id, region, service,
+                       credentials.hexdigest())
+                ttl = token_ttl(context)
+            if per_thread:
+                key += (threading.get_ident(),)
+            return CLIENT_POOL.get(
+                key, functools.partial(create, context,
+                                       region_name=region_name, **kwargs),
+                ttl=ttl)
+        return wrapper
+    return decorator
+
+
 def dns_client(context):
     from trove.dns.manager import DnsManager
     return DnsManager()
@@ -89,7 +252,10 @@ def guest_client(context, id, manager=None):
     return clazz(context, id)
 
 
+@pooled_client('nova')
 def nova_client(context, region_name=None, password=None):
+    from novaclient.client import Client
+
     if CONF.nova_compute_url:
         url = '%(nova_url)s%(tenant)s' % {
             'nova_url': normalize_url(CONF.nova_compute_url),
@@ -129,7 +295,10 @@ def create_admin_nova_client(context):
     return client
 
 
+@pooled_client('cinder')
 def cinder_client(context, region_name=None):
+    from cinderclient.v3 import client as CinderClient
+
     if CONF.cinder_url:
         url = '%(cinder_url)s%(tenant)s' % {
             'cinder_url': normalize_url(CONF.cinder_url),
@@ -143,16 +312,20 @@ def cinder_client(context, region_name=None):
             endpoint_type=CONF.cinder_endpoint_type
         )
 
-    client = CinderClient.Client(context.user_id, context.auth_token,
-                                 project_id=context.project_id,
-                                 auth_url=CONF.service_credentials.auth_url,
-                                 insecure=CONF.cinder_api_insecure)
-    client.client.auth_token = context.auth_token
-    client.client.management_url = url
+    session = token_session(url, context.auth_token,
+                            insecure=CONF.cinder_api_insecure)
+    client = CinderClient.Client(session=session,
+                                 service_type=CONF.cinder_service_type,
+                                 os_endpoint=url)
     return client
 
 
+# The swiftclient Connection is not thread-safe, the callers running
+# requests in several threads expect a connection of their own.
+@pooled_client('swift', per_thread=True)
 def swift_client(context, region_name=None):
+    from swiftclient.client import Connection
+
     if CONF.swift_url:
         # swift_url has a different format so doesn't need to be normalized
         url = '%(swift_url)s%(tenant)s' % {'swift_url': CONF.swift_url,
@@ -171,7 +344,10 @@ def swift_client(context, region_name=None):
     return client
 
 
+@pooled_client('neutron')
 def neutron_client(context, region_name=None):
+    from neutronclient.v2_0 import client as NeutronClient
+
     if CONF.neutron_url:
         # neutron endpoint url / publicURL does not include tenant segment
         url = CONF.neutron_url
@@ -182,13 +358,19 @@ def neutron_client(context, region_name=None):
                            endpoint_region=region,
                            endpoint_type=CONF.neutron_endpoint_type)
 
-    client = NeutronClient.Client(token=context.auth_token,
-                                  endpoint_url=url,
-                                  insecure=CONF.neutron_api_insecure)
+    session = token_session(url, context.auth_token,
+                            insecure=CONF.neutron_api_insecure)
+    client = NeutronClient.Client(session=session,
+                                  service_type=CONF.neutron_service_type,
+                                  endpoint_override=url)
     return client
 
 
+@pooled_client('glance')
 def glance_client(context, region_name=None):
+    import glanceclient
+    from keystoneauth1.identity import v3
+    from keystoneauth1 import session as ka_session
 
     # We should allow glance to get the endpoint from the service
     # catalog, but to do so we would need to be able to specify
@@ -208,7 +390,7 @@ def glance_client(context, region_name=None):
         )
 
     auth = v3.Token(CONF.service_credentials.auth_url, context.auth_token)
-    session = ka_session.Session(auth=auth)
+    session = ka_session.Session(auth=auth, session=get_http_session())
 
     return glanceclient.Client(
         CONF.glance_client_version, endpoint=endpoint_url,
@@ -216,7 +398,10 @@ def glance_client(context, region_name=None):
     )
 
 
+@pooled_client('barbican')
 def barbican_client(context, region_name=None):
+    from barbicanclient import client as BarbicanClient
+
     if CONF.barbican_url:
         endpoint_url = CONF.barbican_url
     else:
@@ -228,8 +413,7 @@ def barbican_client(context, region_name=None):
             endpoint_type=CONF.barbican_endpoint_type
         )
 
-    auth = token_endpoint.Token(endpoint_url, context.auth_token)
-    session = ka_session.Session(auth=auth)
+    session = token_session(endpoint_url, context.auth_token)
 
     return BarbicanClient.Client(
         'v1',
@@ -13,28 +13,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from cinderclient import client as CinderClient
-import glanceclient
-from keystoneauth1 import loading
-from keystoneauth1 import session
-from neutronclient.v2_0 import client as NeutronClient
-from novaclient.client import Client as NovaClient
 from oslo_log import log as logging
-import swiftclient
 
 from trove.common import cfg
+from trove.common.clients import get_http_session
 from trove.common.clients import normalize_url
+from trove.common.clients import pooled_client
 
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
 _SESSION = None
-ADMIN_NEUTRON_CLIENT = None
-ADMIN_NOVA_CLIENT = None
-ADMIN_CINDER_CLIENT = None
 
 
 def get_keystone_session():
     """Get trove service credential auth session."""
+    from keystoneauth1 import loading
+    from keystoneauth1 import session
+
     global _SESSION
 
     if not _SESSION:
@@ -49,11 +44,13 @@ def get_keystone_session():
         insecure = getattr(CONF.keystone_authtoken, 'insecure', False)
         cafile = getattr(CONF.keystone_authtoken, 'cafile', None)
         verify = False if insecure else (cafile or True)
-        _SESSION = session.Session(auth=auth, verify=verify)
+        _SESSION = session.Session(auth=auth, verify=verify,
+                                   session=get_http_session())
 
     return _SESSION
 
 
+@pooled_client('nova', admin=True)
 def nova_client_trove_admin(context, region_name=None, password=None):
     """
     Returns a nova client object with the trove admin credentials
@@ -62,14 +59,10 @@ def nova_client_trove_admin(context, region_name=None, password=None):
     :return novaclient: novaclient with trove admin credentials
     :rtype: novaclient.client.Client
     """
-    global ADMIN_NOVA_CLIENT
-
-    if ADMIN_NOVA_CLIENT:
-        LOG.debug('Re-use admin nova client')
-        return ADMIN_NOVA_CLIENT
+    from novaclient.client import Client as NovaClient
 
     ks_session = get_keystone_session()
-    ADMIN_NOVA_CLIENT = NovaClient(
+    client = NovaClient(
         CONF.nova_client_version,
         session=ks_session,
         service_type=CONF.nova_compute_service_type,
@@ -78,13 +71,14 @@ def nova_client_trove_admin(context, region_name=None, password=None):
         endpoint_type=CONF.nova_compute_endpoint_type)
 
     if CONF.nova_compute_url and CONF.service_credentials.project_id:
-        ADMIN_NOVA_CLIENT.client.endpoint_override = "%s/%s/" % (
+        client.client.endpoint_override = "%s/%s/" % (
             normalize_url(CONF.nova_compute_url),
             CONF.service_credentials.project_id)
 
-    return ADMIN_NOVA_CLIENT
+    return client
 
 
+@pooled_client('cinder', admin=True)
 def cinder_client_trove_admin(context, region_name=None):
     """
     Returns a cinder client object with the trove admin credentials
@@ -92,14 +86,10 @@ def cinder_client_trove_admin(context, region_name=None):
     :type context: trove.common.context.TroveContext
     :return cinderclient: cinderclient with trove admin credentials
     """
-    global ADMIN_CINDER_CLIENT
-
-    if ADMIN_CINDER_CLIENT:
-        LOG.debug('Re-use admin cinder client')
-        return ADMIN_CINDER_CLIENT
+    from cinderclient import client as CinderClient
 
     ks_session = get_keystone_session()
-    ADMIN_CINDER_CLIENT = CinderClient.Client(
+    client = CinderClient.Client(
         CONF.cinder_client_version,
         session=ks_session,
         service_type=CONF.cinder_service_type,
@@ -109,13 +99,14 @@ def cinder_client_trove_admin(context, region_name=None):
         additional_headers={'OpenStack-API-Version': 'volumev3 latest'})
 
     if CONF.cinder_url and CONF.service_credentials.project_id:
-        ADMIN_CINDER_CLIENT.client.management_url = "%s/%s/" % (
+        client.client.management_url = "%s/%s/" % (
             normalize_url(CONF.cinder_url),
             CONF.service_credentials.project_id)
 
-    return ADMIN_CINDER_CLIENT
+    return client
 
 
+@pooled_client('neutron', admin=True)
 def neutron_client_trove_admin(context, region_name=None):
     """
     Returns a neutron client object with the trove admin credentials
@@ -123,14 +114,10 @@ def neutron_client_trove_admin(context, region_name=None):
     :type context: trove.common.context.TroveContext
     :return neutronclient: neutronclient with trove admin credentials
     """
-    global ADMIN_NEUTRON_CLIENT
-
-    if ADMIN_NEUTRON_CLIENT:
-        LOG.debug('Re-use admin neutron client')
-        return ADMIN_NEUTRON_CLIENT
+    from neutronclient.v2_0 import client as NeutronClient
 
     ks_session = get_keystone_session()
-    ADMIN_NEUTRON_CLIENT = NeutronClient.Client(
+    client = NeutronClient.Client(
         session=ks_session,
         service_type=CONF.neutron_service_type,
         region_name=region_name or CONF.service_credentials.region_name,
@@ -138,12 +125,15 @@ def neutron_client_trove_admin(context, region_name=None):
         endpoint_type=CONF.neutron_endpoint_type)
 
     if CONF.neutron_url:
-        ADMIN_NEUTRON_CLIENT.management_url = CONF.neutron_url
+        client.management_url = CONF.neutron_url
 
-    return ADMIN_NEUTRON_CLIENT
+    return client
 
 
+@pooled_client('swift', admin=True, per_thread=True)
 def swift_client_trove_admin(context, region_name=None):
+    import swiftclient
+
     ks_session = get_keystone_session()
     client = swiftclient.Connection(
         session=ks_session,
@@ -158,7 +148,10 @@ def swift_client_trove_admin(context, region_name=None):
     return client
 
 
+@pooled_client('glance', admin=True)
 def glance_client_trove_admin(context, region_name=None):
+    import glanceclient
+
     ks_session = get_keystone_session()
     client = glanceclient.Client(
         version=CONF.glance_client_version,
@@ -16,8 +16,10 @@
 
 # Encryption/decryption handling
 
+import functools
 import hashlib
 import os
+from oslo_serialization import base64
 from oslo_utils import encodeutils
 import random
 import string
@@ -26,7 +28,6 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import algorithms
 from cryptography.hazmat.primitives.ciphers import Cipher
 from cryptography.hazmat.primitives.ciphers import modes
-from trove.common import stream_codecs
 
 
 IV_BYTE_COUNT = 16
@@ -38,10 +39,26 @@ def _get_cipher(key, iv):
     if not _CRYPT_BACKEND:
         _CRYPT_BACKEND = default_backend()
 
-    return Cipher(algorithms.AES(key), modes.CBC(iv),
+    return Cipher(_get_algorithm(key), modes.CBC(iv),
                   backend=_CRYPT_BACKEND)
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_algorithm(key):
+    return algorithms.AES(key)
+
+
+@functools.lru_cache(maxsize=1024)
+def _derive_key(key):
+    """Derive the AES key from a (text or bytes) secret.
+
+    The same few secrets are used for every RPC message, so the derived
+    keys are cached instead of hashing the secret for each message.
+    """
+    key = encodeutils.to_utf8(key)
+    return encodeutils.safe_encode(hashlib.md5(key).hexdigest())
+
+
 def _encrypt(key, iv, data):
     encryptor = _get_cipher(key, iv).encryptor()
     return encryptor.update(data) + encryptor.finalize()
@@ -54,19 +71,23 @@ def _decrypt(key, iv, data):
 
 def encode_data(data):
     # NOTE(zhaochao) No need to encoding string object any more,
-    # as Base64Codec is now using oslo_serialization.base64 which
-    # could take care of this.
-    return stream_codecs.Base64Codec().serialize(data)
+    # as oslo_serialization.base64 could take care of this. It is used
+    # directly as stream_codecs imports this module through utils.
+    return base64.encode_as_text(data)
 
 
 def decode_data(data):
-    return stream_codecs.Base64Codec().deserialize(data)
+    return base64.decode_as_bytes(data)
 
 
 # Pad the data string to an multiple of pad_size
 def pad_for_encryption(data, pad_size=IV_BYTE_COUNT):
+    return data + _padding(data, pad_size)
+
+
+def _padding(data, pad_size=IV_BYTE_COUNT):
     pad_count = pad_size - (len(data) % pad_size)
-    return data + bytes((pad_count,)) * pad_count
+    return bytes((pad_count,)) * pad_count
 
 
 # Unpad the data string by stripping off excess characters
@@ -76,23 +97,32 @@ def unpad_after_decryption(data):
 
 def encrypt_data(data, key, iv_byte_count=IV_BYTE_COUNT):
     data = encodeutils.to_utf8(data)
-    key = encodeutils.to_utf8(key)
-    md5_key = encodeutils.safe_encode(hashlib.md5(key).hexdigest())
     iv = os.urandom(iv_byte_count)
-    iv = iv[:iv_byte_count]
-    data = pad_for_encryption(data, iv_byte_count)
-    encrypted = _encrypt(md5_key, bytes(iv), data)
-    return iv + encrypted
+    # The padding is fed to the encryptor separately so that the payload
+    # is not copied just to append a few bytes to it.
+    encryptor = _get_cipher(_derive_key(key), iv).encryptor()
+    return b''.join((iv, encryptor.update(data),
+                     encryptor.update(_padding(data, iv_byte_count)),
+                     encryptor.finalize()))
 
 
 def decrypt_data(data, key, iv_byte_count=IV_BYTE_COUNT):
-    key = encodeutils.to_utf8(key)
-    md5_key = encodeutils.safe_encode(hashlib.md5(key).hexdigest())
-    iv = data[:iv_byte_count]
-    decrypted = _decrypt(md5_key, bytes(iv), bytes(data[iv_byte_count:]))
+    view = memoryview(data)
+    iv = bytes(view[:iv_byte_count])
+    decrypted = _decrypt(_derive_key(key), iv, view[iv_byte_count:])
     return unpad_after_decryption(decrypted)
 
 
+def encrypt_and_encode(data, key):
+    """Encrypt data and return it as base64 text, ready to be sent."""
+    return encode_data(encrypt_data(data, key))
+
+
+def decode_and_decrypt(data, key):
+    """Reverse encrypt_and_encode, returning the decrypted bytes."""
+    return decrypt_data(decode_data(data), key)
+
+
 def generate_random_key(length=32, chars=None):
     chars = chars if chars else (string.ascii_uppercase +
                                  string.ascii_lowercase + string.digits)
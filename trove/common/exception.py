@@ -491,6 +491,18 @@ class DatabaseForUserNotInDatabaseListError(TroveError):
                 "included in the initial databases list.")
 
 
+class UserCreationError(TroveError):
+    message = _("Failed to create or grant access to the following users: "
+                "%(failures)s.")
+
+    def __init__(self, failures=None, **kwargs):
+        """:param failures: the errors of the users, by name."""
+        if isinstance(failures, dict):
+            failures = '; '.join('%s (%s)' % (name, '; '.join(errors))
+                                 for name, errors in failures.items())
+        super(UserCreationError, self).__init__(failures=failures, **kwargs)
+
+
 class DatabaseInitialDatabaseDuplicateError(TroveError):
     message = _("Two or more databases share the same name in the initial "
                 "databases list. Please correct the names or remove the "
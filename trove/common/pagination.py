@@ -107,16 +107,22 @@ class SimplePaginatedDataView(object):
         self.view = view
         self.marker = url_quote(marker)
 
-    def data(self):
+    def links(self):
         if not self.marker:
-            return self.view.data()
+            return []
 
         app_url = AppUrl(self.url)
         next_url = str(app_url.change_query_params(marker=self.marker))
         next_link = {'rel': 'next',
                      'href': next_url}
+        return [next_link]
+
+    def data(self):
+        if not self.marker:
+            return self.view.data()
+
         view_data = {self.name: self.view.data()[self.name],
-                     'links': [next_link]}
+                     'links': self.links()}
         return view_data
 
 
@@ -0,0 +1,256 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Polling with jittered backoff, shared waits, deadlines and statistics.
+
+utils.poll_until is built on top of this module. Waits are recorded per
+call site, so that get_stats() tells how long every place in the code
+waits for and how many times it polls.
+"""
+
+import bisect
+import contextlib
+import random
+import sys
+import threading
+import time
+
+from oslo_log import log as logging
+
+from trove.common import exception
+
+LOG = logging.getLogger(__name__)
+
+MAX_INTERVAL = 30
+BACKOFF_FACTOR = 2
+# Every interval is drawn uniformly within +/- JITTER of its nominal value.
+JITTER = 0.2
+
+# Upper bounds of the histogram buckets, the last bucket is unbounded.
+WAIT_BUCKETS = (0.1, 1, 5, 10, 30, 60, 300, 600, 1800)
+POLL_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+
+class _Histogram(object):
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+
+    def add(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+
+    def to_dict(self):
+        labels = ['<=%s' % bound for bound in self.bounds]
+        labels.append('>%s' % self.bounds[-1])
+        return dict(zip(labels, self.counts))
+
+
+class CallSiteStats(object):
+    """Wait times and poll counts of the waits of one call site."""
+
+    def __init__(self):
+        self.count = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.total_wait = 0.0
+        self.total_polls = 0
+        self.wait_time = _Histogram(WAIT_BUCKETS)
+        self.polls = _Histogram(POLL_BUCKETS)
+
+    def add(self, wait_time, polls, outcome):
+        self.count += 1
+        self.total_wait += wait_time
+        self.total_polls += polls
+        self.wait_time.add(wait_time)
+        self.polls.add(polls)
+        if outcome == 'timeout':
+            self.timeouts += 1
+        elif outcome == 'error':
+            self.errors += 1
+
+    def to_dict(self):
+        return {'count': self.count, 'timeouts': self.timeouts,
+                'errors': self.errors, 'total_wait': self.total_wait,
+                'total_polls': self.total_polls,
+                'wait_time': self.wait_time.to_dict(),
+                'polls': self.polls.to_dict()}
+
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def _record(name, wait_time, polls, outcome):
+    with _stats_lock:
+        stats = _stats.get(name)
+        if stats is None:
+            stats = _stats[name] = CallSiteStats()
+        stats.add(wait_time, polls, outcome)
+
+
+def get_stats():
+    """Return the statistics of the waits, by call site."""
+    with _stats_lock:
+        return {name: stats.to_dict() for name, stats in _stats.items()}
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def call_site(depth=1):
+    """Return 'module:function:line' of a caller of the calling function.
+
+    depth=1 is the direct caller of the function calling call_site.
+    """
+    frame = sys._getframe(depth + 1)
+    return '%s:%s:%d' % (frame.f_globals.get('__name__'),
+                         frame.f_code.co_name, frame.f_lineno)
+
+
+# Deadlines set by the callers up the stack, see deadline().
+_local = threading.local()
+
+
+def current_deadline():
+    """Return the closest deadline (time.monotonic() based) or None."""
+    deadlines = getattr(_local, 'deadlines', None)
+    return deadlines[-1] if deadlines else None
+
+
+@contextlib.contextmanager
+def deadline(time_out):
+    """Bound all the waits in the block to time_out seconds from now.
+
+    Deadlines nest, an inner block can only shorten the outer deadline.
+    A time_out of 0 sets no deadline.
+    """
+    if not time_out:
+        yield
+        return
+    deadlines = getattr(_local, 'deadlines', None)
+    if deadlines is None:
+        deadlines = _local.deadlines = []
+    end = time.monotonic() + time_out
+    outer = current_deadline()
+    deadlines.append(min(end, outer) if outer is not None else end)
+    try:
+        yield
+    finally:
+        deadlines.pop()
+
+
+def backoff_intervals(sleep_time, max_interval=MAX_INTERVAL,
+                      factor=BACKOFF_FACTOR, jitter=JITTER, rng=random):
+    """Yield jittered, exponentially growing intervals capped at a max."""
+    interval = sleep_time
+    while True:
+        yield interval * rng.uniform(1 - jitter, 1 + jitter)
+        interval = min(interval * factor, max_interval)
+
+
+class _SharedWait(object):
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 1
+
+
+_shared = {}
+_shared_lock = threading.Lock()
+
+
+def poll(retriever, condition=lambda value: value, sleep_time=3,
+         time_out=0, initial_delay=0, key=None, name=None,
+         max_interval=MAX_INTERVAL):
+    """Retrieve an object until it passes condition, then return it.
+
+    :param time_out: raise PollTimeOut after that many seconds, 0 means
+                     no limit other than the enclosing deadline().
+    :param key: concurrent waits with the same key share a single polling
+                loop, so they must use equivalent retrievers and
+                conditions, e.g. key=('volume', volume_id, 'available').
+    :param name: the call site the wait is recorded for.
+    """
+    name = name or call_site(1)
+    end = time.monotonic() + time_out if time_out else None
+    outer = current_deadline()
+    if outer is not None:
+        end = outer if end is None else min(end, outer)
+
+    if key is None:
+        return _poll(retriever, condition, sleep_time, end, initial_delay,
+                     name, max_interval)
+
+    with _shared_lock:
+        shared = _shared.get(key)
+        if shared is None:
+            shared = _shared[key] = _SharedWait()
+            leader = True
+        else:
+            shared.waiters += 1
+            leader = False
+
+    if leader:
+        try:
+            shared.result = _poll(retriever, condition, sleep_time, end,
+                                  initial_delay, name, max_interval)
+        except Exception as e:
+            shared.error = e
+        finally:
+            with _shared_lock:
+                del _shared[key]
+            shared.done.set()
+    else:
+        LOG.debug("Joining the wait for %s.", key)
+        start = time.monotonic()
+        timeout = max(end - start, 0) if end is not None else None
+        if not shared.done.wait(timeout):
+            _record(name, time.monotonic() - start, 0, 'timeout')
+            raise exception.PollTimeOut()
+        _record(name, time.monotonic() - start, 0,
+                'error' if shared.error else 'success')
+
+    if shared.error is not None:
+        raise shared.error
+    return shared.result
+
+
+def _poll(retriever, condition, sleep_time, end, initial_delay, name,
+          max_interval):
+    start = time.monotonic()
+    polls = 0
+    outcome = 'error'
+    try:
+        if initial_delay:
+            time.sleep(initial_delay)
+        for interval in backoff_intervals(sleep_time,
+                                          max_interval=max_interval):
+            polls += 1
+            obj = retriever()
+            if condition(obj):
+                outcome = 'success'
+                return obj
+
+            if end is not None:
+                remaining = end - time.monotonic()
+                if remaining <= 0:
+                    outcome = 'timeout'
+                    raise exception.PollTimeOut()
+                interval = min(interval, remaining)
+            time.sleep(interval)
+    finally:
+        _record(name, time.monotonic() - start, polls, outcome)
@@ -31,12 +31,11 @@ class ConductorGuestSerializer(serializer.TroveSerializer):
         if self._key is None:
             return entity
 
-        value = crypto.encode_data(
-            crypto.encrypt_data(
-                jsonutils.dumps(entity), self._key))
+        value = crypto.encrypt_and_encode(jsonutils.dumps(entity), self._key)
 
-        return jsonutils.dumps({'entity': value, 'csz-instance-id':
-                                CONF.guest_id})
+        # The envelope is serialized along with the rest of the message, so
+        # there is no need to dump it to a JSON string of its own.
+        return {'entity': value, 'csz-instance-id': CONF.guest_id}
 
     def _deserialize_entity(self, ctxt, entity):
         msg = (_("_deserialize_entity not implemented in "
@@ -49,9 +48,7 @@ class ConductorGuestSerializer(serializer.TroveSerializer):
 
         cstr = jsonutils.dumps(ctxt)
 
-        return {'context':
-                crypto.encode_data(
-                    crypto.encrypt_data(cstr, self._key)),
+        return {'context': crypto.encrypt_and_encode(cstr, self._key),
                 'csz-instance-id': CONF.guest_id}
 
     def _deserialize_context(self, ctxt):
@@ -36,19 +36,20 @@ class ConductorHostSerializer(serializer.TroveSerializer):
         instance_key = get_instance_encryption_key(ctxt.instance_id)
 
         estr = jsonutils.dumps(entity)
-        return cu.encode_data(cu.encrypt_data(estr, instance_key))
+        return cu.encrypt_and_encode(estr, instance_key)
 
     def _deserialize_entity(self, ctxt, entity):
         try:
-            entity = jsonutils.loads(entity)
+            # Older guests send the envelope as a JSON string.
+            if not isinstance(entity, dict):
+                entity = jsonutils.loads(entity)
             instance_id = entity['csz-instance-id']
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, KeyError):
             return entity
 
         instance_key = get_instance_encryption_key(instance_id)
 
-        estr = cu.decrypt_data(cu.decode_data(entity['entity']),
-                               instance_key)
+        estr = cu.decode_and_decrypt(entity['entity'], instance_key)
         entity = jsonutils.loads(estr)
 
         return entity
@@ -63,8 +64,7 @@ class ConductorHostSerializer(serializer.TroveSerializer):
         instance_key = get_instance_encryption_key(ctxt.instance_id)
 
         cstr = jsonutils.dumps(ctxt)
-        return {'context': cu.encode_data(cu.encrypt_data(cstr,
-                                                          instance_key))}
+        return {'context': cu.encrypt_and_encode(cstr, instance_key)}
 
     def _deserialize_context(self, ctxt):
         try:
@@ -73,8 +73,7 @@ class ConductorHostSerializer(serializer.TroveSerializer):
             if instance_id is not None:
                 instance_key = get_instance_encryption_key(instance_id)
 
-                cstr = cu.decrypt_data(cu.decode_data(ctxt['context']),
-                                       instance_key)
+                cstr = cu.decode_and_decrypt(ctxt['context'], instance_key)
                 ctxt = jsonutils.loads(cstr)
         except (ValueError, TypeError):
             return ctxt
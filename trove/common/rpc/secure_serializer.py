@@ -28,12 +28,12 @@ class SecureSerializer(serializer.TroveSerializer):
             return entity
 
         estr = jsonutils.dumps(entity)
-        return cu.encode_data(cu.encrypt_data(estr, self._key))
+        return cu.encrypt_and_encode(estr, self._key)
 
     def _deserialize_entity(self, ctxt, entity):
         try:
             if self._key is not None:
-                estr = cu.decrypt_data(cu.decode_data(entity), self._key)
+                estr = cu.decode_and_decrypt(entity, self._key)
                 entity = jsonutils.loads(estr)
         except (ValueError, TypeError):
             return entity
@@ -45,13 +45,12 @@ class SecureSerializer(serializer.TroveSerializer):
             return ctxt
 
         cstr = jsonutils.dumps(ctxt)
-        return {'context': cu.encode_data(cu.encrypt_data(cstr, self._key))}
+        return {'context': cu.encrypt_and_encode(cstr, self._key)}
 
     def _deserialize_context(self, ctxt):
         try:
             if self._key is not None:
-                cstr = cu.decrypt_data(cu.decode_data(ctxt['context']),
-                                       self._key)
+                cstr = cu.decode_and_decrypt(ctxt['context'], self._key)
                 ctxt = jsonutils.loads(cstr)
         except (ValueError, TypeError):
             return ctxt
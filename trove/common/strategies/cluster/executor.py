@@ -0,0 +1,86 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+from concurrent import futures
+import contextlib
+import time
+
+from oslo_log import log as logging
+
+from trove.common import cfg
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+
+class ClusterExecutor(object):
+    """Run the steps of a cluster operation on all the members at once.
+
+    An operation is a sequence of phases, run one after the other. The
+    steps of a phase run concurrently on the members, unless the phase is
+    ordered, e.g. because the first member must bootstrap the cluster
+    before the others join it. The time spent in each phase is logged at
+    the end of the operation.
+
+        with ClusterExecutor('create', cluster_id) as executor:
+            instances = executor.map('load', load_instance, instance_ids)
+            executor.map('install', install, instances[:1], ordered=True)
+            executor.map('install', install, instances[1:])
+    """
+
+    def __init__(self, operation, cluster_id, max_workers=None):
+        self.operation = operation
+        self.cluster_id = cluster_id
+        self.max_workers = (max_workers or
+                            CONF.cluster_max_parallel_operations)
+        # Seconds spent in each phase, in the order they started.
+        self.timings = collections.OrderedDict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.report()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time a phase run by the caller."""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.timings[name] = (self.timings.get(name, 0) +
+                                  time.monotonic() - start)
+
+    def map(self, name, func, items, ordered=False):
+        """Call func on each item as part of the phase name.
+
+        :returns: the results, in the order of the items.
+        :raises: the exception of the first failed item, once all the
+                 calls are over. An ordered phase stops at the first error.
+        """
+        items = list(items)
+        with self.phase(name):
+            if ordered or self.max_workers <= 1 or len(items) <= 1:
+                return [func(item) for item in items]
+
+            workers = min(self.max_workers, len(items))
+            with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                results = [pool.submit(func, item) for item in items]
+            return [result.result() for result in results]
+
+    def report(self):
+        LOG.info("Cluster %(id)s %(operation)s phases: %(timings)s.",
+                 {'id': self.cluster_id, 'operation': self.operation,
+                  'timings': ', '.join('%s %.2fs' % timing
+                                       for timing in self.timings.items())})
@@ -18,6 +18,7 @@ from oslo_log import log as logging
 
 from trove.common import cfg
 from trove.common.strategies.cluster import base
+from trove.common.strategies.cluster.executor import ClusterExecutor
 from trove.common import utils
 from trove.instance.models import DBInstance
 from trove.instance.models import Instance
@@ -54,7 +55,8 @@ class CassandraClusterTasks(task_models.ClusterTasks):
             if not self._all_instances_ready(cluster_node_ids, cluster_id):
                 return
 
-            cluster_nodes = self.load_cluster_nodes(context, cluster_node_ids)
+            cluster_nodes = self.load_cluster_nodes(context, cluster_node_ids,
+                                                    executor)
 
             LOG.debug("All nodes ready, proceeding with cluster setup.")
             seeds = self.choose_seed_nodes(cluster_nodes)
@@ -65,41 +67,49 @@ class CassandraClusterTasks(task_models.ClusterTasks):
             try:
                 LOG.debug("Selected seed nodes: %s", seeds)
 
-                for node in cluster_nodes:
+                def _configure(node):
                     LOG.debug("Configuring node: %s.", node['id'])
                     node['guest'].set_seeds(seeds)
                     node['guest'].set_auto_bootstrap(False)
 
+                def _start(node):
+                    node['guest'].restart()
+                    node['guest'].set_auto_bootstrap(True)
+
+                executor.map('configure', _configure, cluster_nodes)
+
+                # Nodes join the ring one at a time.
                 LOG.debug("Starting seed nodes.")
-                for node in cluster_nodes:
-                    if node['ip'] in seeds:
-                        node['guest'].restart()
-                        node['guest'].set_auto_bootstrap(True)
+                executor.map('start seeds', _start,
+                             [node for node in cluster_nodes
+                              if node['ip'] in seeds], ordered=True)
 
                 LOG.debug("All seeds running, starting remaining nodes.")
-                for node in cluster_nodes:
-                    if node['ip'] not in seeds:
-                        node['guest'].restart()
-                        node['guest'].set_auto_bootstrap(True)
+                executor.map('start nodes', _start,
+                             [node for node in cluster_nodes
+                              if node['ip'] not in seeds], ordered=True)
 
                 # Create the in-database user via the first node. The remaining
                 # nodes will replicate in-database changes automatically.
                 # Only update the local authentication file on the other nodes.
                 LOG.debug("Securing the cluster.")
                 key = utils.generate_random_password()
-                admin_creds = None
-                for node in cluster_nodes:
-                    if admin_creds is None:
-                        admin_creds = node['guest'].cluster_secure(key)
-                    else:
+                with executor.phase('secure'):
+                    admin_creds = cluster_nodes[0]['guest'].cluster_secure(key)
+
+                def _complete(node):
+                    if node is not cluster_nodes[0]:
                         node['guest'].store_admin_credentials(admin_creds)
                     node['guest'].cluster_complete()
 
+                executor.map('complete', _complete, cluster_nodes)
+
                 LOG.debug("Cluster configuration finished successfully.")
             except Exception:
                 LOG.exception("Error creating cluster.")
                 self.update_statuses_on_failure(cluster_id)
 
+        executor = ClusterExecutor('create', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _create_cluster()
@@ -111,6 +121,7 @@ class CassandraClusterTasks(task_models.ClusterTasks):
             self.update_statuses_on_failure(cluster_id)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End create_cluster for id: %s.", cluster_id)
 
@@ -121,9 +132,13 @@ class CassandraClusterTasks(task_models.ClusterTasks):
         return [db_instance.id for db_instance in db_instances]
 
     @classmethod
-    def load_cluster_nodes(cls, context, node_ids):
-        return [cls.build_node_info(Instance.load(context, node_id))
-                for node_id in node_ids]
+    def load_cluster_nodes(cls, context, node_ids, executor=None):
+        def _load(node_id):
+            return cls.build_node_info(Instance.load(context, node_id))
+
+        if executor:
+            return executor.map('load', _load, node_ids)
+        return [_load(node_id) for node_id in node_ids]
 
     @classmethod
     def build_node_info(cls, instance):
@@ -183,15 +198,13 @@ class CassandraClusterTasks(task_models.ClusterTasks):
             if not self._all_instances_ready(new_instance_ids, cluster_id):
                 return
 
-            new_instances = [Instance.load(context, instance_id)
-                             for instance_id in new_instance_ids]
-            added_nodes = [self.build_node_info(instance)
-                           for instance in new_instances]
-
             LOG.debug("All nodes ready, proceeding with cluster setup.")
 
             cluster_node_ids = self.find_cluster_node_ids(cluster_id)
-            cluster_nodes = self.load_cluster_nodes(context, cluster_node_ids)
+            cluster_nodes = self.load_cluster_nodes(context, cluster_node_ids,
+                                                    executor)
+            added_nodes = [node for node in cluster_nodes
+                           if node['id'] in new_instance_ids]
 
             old_nodes = [node for node in cluster_nodes
                          if node['id'] not in new_instance_ids]
@@ -210,22 +223,28 @@ class CassandraClusterTasks(task_models.ClusterTasks):
                 # Since we are adding to an existing cluster, ensure that the
                 # new nodes have auto-bootstrapping enabled.
                 # Start the added nodes.
+                # Nodes bootstrap one at a time.
                 LOG.debug("Starting new nodes.")
-                for node in added_nodes:
+
+                def _start(node):
                     node['guest'].set_auto_bootstrap(True)
                     node['guest'].set_seeds(current_seeds)
                     node['guest'].store_admin_credentials(admin_creds)
                     node['guest'].restart()
                     node['guest'].cluster_complete()
 
+                executor.map('start nodes', _start, added_nodes,
+                             ordered=True)
+
                 # Recompute the seed nodes based on the updated cluster
                 # geometry.
                 seeds = self.choose_seed_nodes(cluster_nodes)
 
                 # Configure each cluster node with the updated list of seeds.
                 LOG.debug("Updating all nodes with new seeds: %s", seeds)
-                for node in cluster_nodes:
-                    node['guest'].set_seeds(seeds)
+                executor.map('set seeds',
+                             lambda node: node['guest'].set_seeds(seeds),
+                             cluster_nodes)
 
                 # Run nodetool cleanup on each of the previously existing nodes
                 # to remove the keys that no longer belong to those nodes.
@@ -248,6 +267,7 @@ class CassandraClusterTasks(task_models.ClusterTasks):
                 self.update_statuses_on_failure(
                     cluster_id, status=inst_tasks.InstanceTasks.GROWING_ERROR)
 
+        executor = ClusterExecutor('grow', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _grow_cluster()
@@ -260,6 +280,7 @@ class CassandraClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.GROWING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End grow_cluster for id: %s.", cluster_id)
 
@@ -268,10 +289,8 @@ class CassandraClusterTasks(task_models.ClusterTasks):
 
         def _shrink_cluster():
             cluster_node_ids = self.find_cluster_node_ids(cluster_id)
-            cluster_nodes = self.load_cluster_nodes(context, cluster_node_ids)
-
             removed_nodes = CassandraClusterTasks.load_cluster_nodes(
-                context, removal_ids)
+                context, removal_ids, executor)
 
             LOG.debug("All nodes ready, proceeding with cluster setup.")
 
@@ -296,16 +315,14 @@ class CassandraClusterTasks(task_models.ClusterTasks):
                 # geometry if any of the existing seed nodes was removed.
                 if update_seeds:
                     LOG.debug("Updating seeds on the remaining nodes.")
-                    cluster_nodes = self.load_cluster_nodes(
-                        context, cluster_node_ids)
-
-                    remaining_nodes = [node for node in cluster_nodes
-                                       if node['id'] not in removal_ids]
+                    remaining_nodes = self.load_cluster_nodes(
+                        context, [node_id for node_id in cluster_node_ids
+                                  if node_id not in removal_ids], executor)
                     seeds = self.choose_seed_nodes(remaining_nodes)
                     LOG.debug("Selected seed nodes: %s", seeds)
-                    for node in remaining_nodes:
-                        LOG.debug("Configuring node: %s.", node['id'])
-                        node['guest'].set_seeds(seeds)
+                    executor.map('set seeds',
+                                 lambda node: node['guest'].set_seeds(seeds),
+                                 remaining_nodes)
 
                 # Wait for the removed nodes to go SHUTDOWN.
                 LOG.debug("Waiting for all decommissioned nodes to shutdown.")
@@ -327,6 +344,7 @@ class CassandraClusterTasks(task_models.ClusterTasks):
                     cluster_id,
                     status=inst_tasks.InstanceTasks.SHRINKING_ERROR)
 
+        executor = ClusterExecutor('shrink', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _shrink_cluster()
@@ -339,6 +357,7 @@ class CassandraClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.SHRINKING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End shrink_cluster for id: %s.", cluster_id)
 
@@ -21,6 +21,7 @@ from trove.common.exception import PollTimeOut
 from trove.common.exception import TroveError
 from trove.common.i18n import _
 from trove.common.strategies.cluster import base as cluster_base
+from trove.common.strategies.cluster.executor import ClusterExecutor
 from trove.common.template import ClusterConfigTemplate
 from trove.common import utils
 from trove.extensions.common import models as ext_models
@@ -67,6 +68,22 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
         )
         return config_rendered
 
+    def _write_cluster_configuration(self, executor, context, instances,
+                                     cluster_ips, cluster_context):
+        def _write(instance):
+            guest = self.get_guest(instance)
+            # render the conf.d/cluster.cnf configuration
+            cluster_configuration = self._render_cluster_config(
+                context,
+                instance,
+                ",".join(cluster_ips),
+                cluster_context['cluster_name'],
+                cluster_context['replication_user'])
+            guest.write_cluster_configuration_overrides(
+                cluster_configuration)
+
+        executor.map('configure', _write, instances)
+
     def create_cluster(self, context, cluster_id):
         LOG.debug("Begin create_cluster for id: %s.", cluster_id)
 
@@ -82,11 +99,14 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
                                    "ACTIVE"))
 
             LOG.debug("All members ready, proceeding for cluster setup.")
-            instances = [Instance.load(context, instance_id) for instance_id
-                         in instance_ids]
+            instances = executor.map(
+                'load', lambda instance_id: Instance.load(context,
+                                                          instance_id),
+                instance_ids)
 
             cluster_ips = [self.get_ip(instance) for instance in instances]
-            instance_guests = []
+            instance_guests = [self.get_guest(instance)
+                               for instance in instances]
 
             # Create replication user and password for synchronizing the
             # galera cluster
@@ -107,12 +127,13 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
                 # password in the my.cnf will be wrong after the joiner
                 # instances syncs with the donor instance.
                 admin_password = str(utils.generate_random_password())
+                executor.map('reset_admin_password',
+                             lambda guest: guest.reset_admin_password(
+                                 admin_password),
+                             instance_guests)
 
-                bootstrap = True
-                for instance in instances:
-                    guest = self.get_guest(instance)
-                    instance_guests.append(guest)
-                    guest.reset_admin_password(admin_password)
+                def _install_cluster(member, bootstrap=False):
+                    instance, guest = member
                     # render the conf.d/cluster.cnf configuration
                     cluster_configuration = self._render_cluster_config(
                         context,
@@ -125,15 +146,26 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
                     guest.install_cluster(replication_user,
                                           cluster_configuration,
                                           bootstrap)
-                    bootstrap = False
+
+                # The first instance bootstraps the cluster before the
+                # others can join it. A donor serves one state transfer at
+                # a time, so the others join one after the other.
+                members = list(zip(instances, instance_guests))
+                executor.map('bootstrap',
+                             lambda member: _install_cluster(member, True),
+                             members[:1], ordered=True)
+                executor.map('join', _install_cluster, members[1:],
+                             ordered=True)
 
                 LOG.debug("Finalizing cluster configuration.")
-                for guest in instance_guests:
-                    guest.cluster_complete()
+                executor.map('complete',
+                             lambda guest: guest.cluster_complete(),
+                             instance_guests)
             except Exception:
                 LOG.exception("Error creating cluster.")
                 self.update_statuses_on_failure(cluster_id)
 
+        executor = ClusterExecutor('create', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _create_cluster()
@@ -148,6 +180,7 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
             self.update_statuses_on_failure(cluster_id)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End create_cluster for id: %s.", cluster_id)
 
@@ -165,11 +198,14 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
 
         def _grow_cluster():
 
+            def _load(instance_id):
+                return Instance.load(context, instance_id)
+
             db_instances = DBInstance.find_all(
                 cluster_id=cluster_id, deleted=False).all()
-            existing_instances = [Instance.load(context, db_inst.id)
-                                  for db_inst in db_instances
-                                  if db_inst.id not in new_instance_ids]
+            existing_instances = executor.map(
+                'load', _load, [db_inst.id for db_inst in db_instances
+                                if db_inst.id not in new_instance_ids])
             if not existing_instances:
                 raise TroveError(_("Unable to determine existing cluster "
                                    "member(s)"))
@@ -191,14 +227,18 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
             LOG.debug("All members ready, proceeding for cluster setup.")
 
             # Get the new instances to join the cluster
-            new_instances = [Instance.load(context, instance_id)
-                             for instance_id in new_instance_ids]
+            new_instances = executor.map('load', _load, new_instance_ids)
             new_cluster_ips = [self.get_ip(instance) for instance in
                                new_instances]
-            for instance in new_instances:
-                guest = self.get_guest(instance)
 
-                guest.reset_admin_password(cluster_context['admin_password'])
+            executor.map('reset_admin_password',
+                         lambda instance: self.get_guest(
+                             instance).reset_admin_password(
+                                 cluster_context['admin_password']),
+                         new_instances)
+
+            def _join_cluster(instance):
+                guest = self.get_guest(instance)
 
                 # render the conf.d/cluster.cnf configuration
                 cluster_configuration = self._render_cluster_config(
@@ -214,27 +254,25 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
                                       cluster_configuration,
                                       bootstrap)
 
+            # A donor serves one state transfer at a time, the new
+            # instances join one after the other.
+            executor.map('join', _join_cluster, new_instances, ordered=True)
+
             self._check_cluster_for_root(context,
                                          existing_instances,
                                          new_instances)
 
             # apply the new config to all instances
-            for instance in existing_instances + new_instances:
-                guest = self.get_guest(instance)
-                # render the conf.d/cluster.cnf configuration
-                cluster_configuration = self._render_cluster_config(
-                    context,
-                    instance,
-                    ",".join(existing_cluster_ips + new_cluster_ips),
-                    cluster_context['cluster_name'],
-                    cluster_context['replication_user'])
-                guest.write_cluster_configuration_overrides(
-                    cluster_configuration)
+            self._write_cluster_configuration(
+                executor, context, existing_instances + new_instances,
+                existing_cluster_ips + new_cluster_ips, cluster_context)
 
-            for instance in new_instances:
-                guest = self.get_guest(instance)
-                guest.cluster_complete()
+            executor.map('complete',
+                         lambda instance: self.get_guest(
+                             instance).cluster_complete(),
+                         new_instances)
 
+        executor = ClusterExecutor('grow', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _grow_cluster()
@@ -251,6 +289,7 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.GROWING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End grow_cluster for id: %s.", cluster_id)
 
@@ -284,9 +323,11 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
 
             db_instances = DBInstance.find_all(
                 cluster_id=cluster_id, deleted=False).all()
-            leftover_instances = [Instance.load(context, db_inst.id)
-                                  for db_inst in db_instances
-                                  if db_inst.id not in removal_instance_ids]
+            leftover_instances = executor.map(
+                'load',
+                lambda instance_id: Instance.load(context, instance_id),
+                [db_inst.id for db_inst in db_instances
+                 if db_inst.id not in removal_instance_ids])
             leftover_cluster_ips = [self.get_ip(instance) for instance in
                                     leftover_instances]
 
@@ -295,18 +336,11 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
             cluster_context = rnd_cluster_guest.get_cluster_context()
 
             # apply the new config to all leftover instances
-            for instance in leftover_instances:
-                guest = self.get_guest(instance)
-                # render the conf.d/cluster.cnf configuration
-                cluster_configuration = self._render_cluster_config(
-                    context,
-                    instance,
-                    ",".join(leftover_cluster_ips),
-                    cluster_context['cluster_name'],
-                    cluster_context['replication_user'])
-                guest.write_cluster_configuration_overrides(
-                    cluster_configuration)
+            self._write_cluster_configuration(
+                executor, context, leftover_instances, leftover_cluster_ips,
+                cluster_context)
 
+        executor = ClusterExecutor('shrink', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _shrink_cluster()
@@ -323,6 +357,7 @@ class GaleraCommonClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.SHRINKING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End shrink_cluster for id: %s.", cluster_id)
 
@@ -19,6 +19,7 @@ from oslo_log import log as logging
 from trove.common import cfg
 from trove.common.exception import PollTimeOut
 from trove.common.strategies.cluster import base
+from trove.common.strategies.cluster.executor import ClusterExecutor
 from trove.common import utils
 from trove.instance import models
 from trove.instance.models import DBInstance
@@ -75,8 +76,7 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
 
             LOG.debug("all instances in cluster %s ready.", cluster_id)
 
-            instances = [Instance.load(context, instance_id) for instance_id
-                         in instance_ids]
+            instances = executor.map('load', load_instance, instance_ids)
 
             # filter query routers in instances into a new list: query_routers
             query_routers = [instance for instance in instances if
@@ -109,9 +109,12 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
                 return
 
             # call to start checking status
-            for instance in instances:
-                self.get_guest(instance).cluster_complete()
+            executor.map('complete', self._cluster_complete, instances)
 
+        def load_instance(instance_id):
+            return Instance.load(context, instance_id)
+
+        executor = ClusterExecutor('create', cluster_id)
         cluster_usage_timeout = CONF.cluster_usage_timeout
         timeout = Timeout(cluster_usage_timeout)
         try:
@@ -124,6 +127,7 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
             self.update_statuses_on_failure(cluster_id)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("end create_cluster for id: %s", cluster_id)
 
@@ -146,21 +150,24 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
                                              shard_id):
                 return
 
-            members = [Instance.load(context, instance_id)
-                       for instance_id in instance_ids]
+            members = executor.map('load', load_instance, instance_ids)
 
             db_query_routers = DBInstance.find_all(cluster_id=cluster_id,
                                                    type='query_router',
                                                    deleted=False).all()
-            query_routers = [Instance.load(context, db_query_router.id)
-                             for db_query_router in db_query_routers]
+            query_routers = executor.map(
+                'load', load_instance,
+                [db_query_router.id for db_query_router in db_query_routers])
 
             if not self._create_shard(query_routers[0], members):
                 return
 
-            for member in members:
-                self.get_guest(member).cluster_complete()
+            executor.map('complete', self._cluster_complete, members)
+
+        def load_instance(instance_id):
+            return Instance.load(context, instance_id)
 
+        executor = ClusterExecutor('add shard', cluster_id)
         cluster_usage_timeout = CONF.cluster_usage_timeout
         timeout = Timeout(cluster_usage_timeout)
         try:
@@ -173,6 +180,7 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
             self.update_statuses_on_failure(cluster_id, shard_id)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("end add_shard_cluster for cluster %(cluster_id)s "
                   "shard %(shard_id)s", {'cluster_id': cluster_id,
@@ -206,8 +214,7 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
                         member_ids, cluster_id, shard_id
                     ):
                         return
-                    members = [Instance.load(context, member_id)
-                               for member_id in member_ids]
+                    members = executor.map('load', load_instance, member_ids)
                     query_router = Instance.load(context, query_router_id)
                     if not self._create_shard(query_router, members):
                         return
@@ -226,11 +233,11 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
                     query_router_ids, cluster_id
                 ):
                     return
-                query_routers = [Instance.load(context, instance_id)
-                                 for instance_id in query_router_ids]
+                query_routers = executor.map('load', load_instance,
+                                             query_router_ids)
                 config_servers_ips = [
-                    self.get_ip(Instance.load(context, config_server_id))
-                    for config_server_id in config_servers_ids
+                    self.get_ip(config_server) for config_server in
+                    executor.map('load', load_instance, config_servers_ids)
                 ]
                 if not self._add_query_routers(
                         query_routers, config_servers_ips,
@@ -238,9 +245,12 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
                 ):
                     return
                 instances.extend(query_routers)
-            for instance in instances:
-                self.get_guest(instance).cluster_complete()
+            executor.map('complete', self._cluster_complete, instances)
 
+        def load_instance(instance_id):
+            return Instance.load(context, instance_id)
+
+        executor = ClusterExecutor('grow', cluster_id)
         cluster_usage_timeout = CONF.cluster_usage_timeout
         timeout = Timeout(cluster_usage_timeout)
         try:
@@ -254,6 +264,7 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.GROWING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("end grow_cluster for MongoDB cluster %s", self.id)
 
@@ -300,16 +311,21 @@ class MongoDbClusterTasks(task_models.ClusterTasks):
         instance = Instance.load(context, self._get_running_query_router_id())
         return self.get_guest(instance).get_admin_password()
 
+    def _cluster_complete(self, instance):
+        self.get_guest(instance).cluster_complete()
+
     def _init_replica_set(self, primary_member, other_members):
         """Initialize the replica set by calling the primary member guest's
         add_members.
         """
         LOG.debug('initializing replica set on %s', primary_member.id)
-        other_members_ips = []
         try:
-            for member in other_members:
-                other_members_ips.append(self.get_ip(member))
-                self.get_guest(member).restart()
+            other_members_ips = [self.get_ip(member)
+                                 for member in other_members]
+            with ClusterExecutor('init replica set', self.id) as executor:
+                executor.map('restart',
+                             lambda member: self.get_guest(member).restart(),
+                             other_members)
             self.get_guest(primary_member).prep_primary()
             self.get_guest(primary_member).add_members(other_members_ips)
         except Exception:
@@ -18,6 +18,7 @@ from trove.common import cfg
 from trove.common.exception import TroveError
 from trove.common.i18n import _
 from trove.common.strategies.cluster import base
+from trove.common.strategies.cluster.executor import ClusterExecutor
 from trove.instance.models import DBInstance
 from trove.instance.models import Instance
 from trove.instance import tasks as inst_tasks
@@ -56,8 +57,10 @@ class RedisClusterTasks(task_models.ClusterTasks):
                 return
 
             LOG.debug("All members ready, proceeding for cluster setup.")
-            instances = [Instance.load(context, instance_id) for instance_id
-                         in instance_ids]
+            instances = executor.map(
+                'load', lambda instance_id: Instance.load(context,
+                                                          instance_id),
+                instance_ids)
 
             # Connect nodes to the first node
             guests = [self.get_guest(instance) for instance in instances]
@@ -65,29 +68,37 @@ class RedisClusterTasks(task_models.ClusterTasks):
                 cluster_head = instances[0]
                 cluster_head_port = '6379'
                 cluster_head_ip = self.get_ip(cluster_head)
-                for guest in guests[1:]:
-                    guest.cluster_meet(cluster_head_ip, cluster_head_port)
+                executor.map('meet',
+                             lambda guest: guest.cluster_meet(
+                                 cluster_head_ip, cluster_head_port),
+                             guests[1:])
 
                 num_nodes = len(instances)
                 total_slots = 16384
                 slots_per_node = total_slots / num_nodes
                 leftover_slots = total_slots % num_nodes
                 first_slot = 0
+                slot_ranges = []
                 for guest in guests:
                     last_slot = first_slot + slots_per_node
                     if leftover_slots > 0:
                         leftover_slots -= 1
                     else:
                         last_slot -= 1
-                    guest.cluster_addslots(first_slot, last_slot)
+                    slot_ranges.append((guest, first_slot, last_slot))
                     first_slot = last_slot + 1
+                executor.map('addslots',
+                             lambda slots: slots[0].cluster_addslots(
+                                 *slots[1:]),
+                             slot_ranges)
 
-                for guest in guests:
-                    guest.cluster_complete()
+                executor.map('complete',
+                             lambda guest: guest.cluster_complete(), guests)
             except Exception:
                 LOG.exception("Error creating cluster.")
                 self.update_statuses_on_failure(cluster_id)
 
+        executor = ClusterExecutor('create', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _create_cluster()
@@ -99,6 +110,7 @@ class RedisClusterTasks(task_models.ClusterTasks):
             self.update_statuses_on_failure(cluster_id)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End create_cluster for id: %s.", cluster_id)
 
@@ -124,17 +136,22 @@ class RedisClusterTasks(task_models.ClusterTasks):
                 return
 
             LOG.debug("All members ready, proceeding for cluster setup.")
-            new_insts = [Instance.load(context, instance_id)
-                         for instance_id in new_instance_ids]
-            new_guests = map(self.get_guest, new_insts)
+            new_insts = executor.map(
+                'load', lambda instance_id: Instance.load(context,
+                                                          instance_id),
+                new_instance_ids)
+            new_guests = [self.get_guest(instance) for instance in new_insts]
 
             # Connect nodes to the cluster head
-            for guest in new_guests:
-                guest.cluster_meet(cluster_head_ip, cluster_head_port)
+            executor.map('meet',
+                         lambda guest: guest.cluster_meet(cluster_head_ip,
+                                                          cluster_head_port),
+                         new_guests)
 
-            for guest in new_guests:
-                guest.cluster_complete()
+            executor.map('complete', lambda guest: guest.cluster_complete(),
+                         new_guests)
 
+        executor = ClusterExecutor('grow', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _grow_cluster()
@@ -151,6 +168,7 @@ class RedisClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.GROWING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End grow_cluster for id: %s.", cluster_id)
 
@@ -17,6 +17,7 @@ from oslo_log import log as logging
 from trove.common import cfg
 from trove.common.i18n import _
 from trove.common.strategies.cluster import base
+from trove.common.strategies.cluster.executor import ClusterExecutor
 from trove.common.strategies.cluster.experimental.vertica.api import \
     VerticaCluster
 from trove.instance.models import DBInstance
@@ -43,6 +44,23 @@ class VerticaTaskManagerStrategy(base.BaseTaskManagerStrategy):
 
 class VerticaClusterTasks(task_models.ClusterTasks):
 
+    # Users to be configured for password-less SSH.
+    AUTHORIZED_USERS_WITHOUT_PASSWORD = ['root', 'dbadmin']
+
+    def _configure_ssh(self, executor, guests):
+        """Get the public keys of the users on all the guests, combine them
+        and push them back to all the guests, which add them to the
+        authorized keys.
+        """
+        for user in self.AUTHORIZED_USERS_WITHOUT_PASSWORD:
+            pub_key = executor.map(
+                'get public keys',
+                lambda guest: guest.get_public_keys(user), guests)
+            executor.map(
+                'authorize public keys',
+                lambda guest: guest.authorize_public_keys(user, pub_key),
+                guests)
+
     def create_cluster(self, context, cluster_id):
         LOG.debug("Begin create_cluster for id: %s.", cluster_id)
 
@@ -58,43 +76,37 @@ class VerticaClusterTasks(task_models.ClusterTasks):
                 return
 
             LOG.debug("All members ready, proceeding for cluster setup.")
-            instances = [Instance.load(context, instance_id) for instance_id
-                         in instance_ids]
+            instances = executor.map(
+                'load', lambda instance_id: Instance.load(context,
+                                                          instance_id),
+                instance_ids)
 
             member_ips = [self.get_ip(instance) for instance in instances]
             guests = [self.get_guest(instance) for instance in instances]
 
-            # Users to be configured for password-less SSH.
-            authorized_users_without_password = ['root', 'dbadmin']
-
             # Configuring password-less SSH for cluster members.
-            # Strategy for setting up SSH:
-            # get public keys for user from member-instances in cluster,
-            # combine them, finally push it back to all instances,
-            # and member instances add them to authorized keys.
             LOG.debug("Configuring password-less SSH on cluster members.")
             try:
-                for user in authorized_users_without_password:
-                    pub_key = [guest.get_public_keys(user) for guest in guests]
-                    for guest in guests:
-                        guest.authorize_public_keys(user, pub_key)
+                self._configure_ssh(executor, guests)
 
                 LOG.debug("Installing cluster with members: %s.", member_ips)
                 for db_instance in db_instances:
                     if db_instance['type'] == 'master':
                         master_instance = Instance.load(context,
                                                         db_instance.id)
-                        self.get_guest(master_instance).install_cluster(
-                            member_ips)
+                        with executor.phase('install'):
+                            self.get_guest(master_instance).install_cluster(
+                                member_ips)
                         break
 
                 LOG.debug("Finalizing cluster configuration.")
-                for guest in guests:
-                    guest.cluster_complete()
+                executor.map('complete',
+                             lambda guest: guest.cluster_complete(), guests)
             except Exception:
                 LOG.exception("Error creating cluster.")
                 self.update_statuses_on_failure(cluster_id)
 
+        executor = ClusterExecutor('create', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _create_cluster()
@@ -106,6 +118,7 @@ class VerticaClusterTasks(task_models.ClusterTasks):
             self.update_statuses_on_failure(cluster_id)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("End create_cluster for id: %s.", cluster_id)
 
@@ -123,37 +136,37 @@ class VerticaClusterTasks(task_models.ClusterTasks):
             if not self._all_instances_ready(new_instance_ids, cluster_id):
                 return
 
-            new_insts = [Instance.load(context, instance_id)
-                         for instance_id in new_instance_ids]
+            def load_instance(instance_id):
+                return Instance.load(context, instance_id)
 
-            existing_instances = [Instance.load(context, instance_id)
-                                  for instance_id
-                                  in instance_ids
-                                  if instance_id not in new_instance_ids]
+            new_insts = executor.map('load', load_instance, new_instance_ids)
+
+            existing_instances = executor.map(
+                'load', load_instance,
+                [instance_id for instance_id in instance_ids
+                 if instance_id not in new_instance_ids])
 
             existing_guests = [self.get_guest(i) for i in existing_instances]
             new_guests = [self.get_guest(i) for i in new_insts]
             all_guests = new_guests + existing_guests
 
-            authorized_users_without_password = ['root', 'dbadmin']
             new_ips = [self.get_ip(instance) for instance in new_insts]
 
-            for user in authorized_users_without_password:
-                pub_key = [guest.get_public_keys(user) for guest in all_guests]
-                for guest in all_guests:
-                    guest.authorize_public_keys(user, pub_key)
+            self._configure_ssh(executor, all_guests)
 
             for db_instance in db_instances:
                 if db_instance['type'] == 'master':
                     LOG.debug("Found 'master' instance, calling grow on guest")
                     master_instance = Instance.load(context,
                                                     db_instance.id)
-                    self.get_guest(master_instance).grow_cluster(new_ips)
+                    with executor.phase('grow'):
+                        self.get_guest(master_instance).grow_cluster(new_ips)
                     break
 
-            for guest in new_guests:
-                guest.cluster_complete()
+            executor.map('complete', lambda guest: guest.cluster_complete(),
+                         new_guests)
 
+        executor = ClusterExecutor('grow', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
 
         try:
@@ -171,6 +184,7 @@ class VerticaClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.GROWING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
     def shrink_cluster(self, context, cluster_id, instance_ids):
         def _shrink_cluster():
@@ -179,18 +193,20 @@ class VerticaClusterTasks(task_models.ClusterTasks):
 
             all_instance_ids = [db_instance.id for db_instance in db_instances]
 
-            remove_instances = [Instance.load(context, instance_id)
-                                for instance_id in instance_ids]
+            def load_instance(instance_id):
+                return Instance.load(context, instance_id)
+
+            remove_instances = executor.map('load', load_instance,
+                                            instance_ids)
 
-            left_instances = [Instance.load(context, instance_id)
-                              for instance_id
-                              in all_instance_ids
-                              if instance_id not in instance_ids]
+            left_instance_count = len([instance_id for instance_id
+                                       in all_instance_ids
+                                       if instance_id not in instance_ids])
 
             remove_member_ips = [self.get_ip(instance)
                                  for instance in remove_instances]
 
-            k = VerticaCluster.k_safety(len(left_instances))
+            k = VerticaCluster.k_safety(left_instance_count)
 
             for db_instance in db_instances:
                 if db_instance['type'] == 'master':
@@ -207,6 +223,7 @@ class VerticaClusterTasks(task_models.ClusterTasks):
             for r in remove_instances:
                 Instance.delete(r)
 
+        executor = ClusterExecutor('shrink', cluster_id)
         timeout = Timeout(CONF.cluster_usage_timeout)
         try:
             _shrink_cluster()
@@ -219,6 +236,7 @@ class VerticaClusterTasks(task_models.ClusterTasks):
                 cluster_id, status=inst_tasks.InstanceTasks.SHRINKING_ERROR)
         finally:
             timeout.cancel()
+            executor.report()
 
         LOG.debug("end shrink_cluster for Vertica cluster id %s", self.id)
 
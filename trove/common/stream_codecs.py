@@ -17,8 +17,10 @@ import abc
 import ast
 import configparser
 import csv
+import functools
 import io
 import re
+import zlib
 
 import xmltodict
 import yaml
@@ -30,6 +32,42 @@ from oslo_utils import strutils
 from trove.common import utils as trove_utils
 
 
+QUOTED_STRING_PATTERN = re.compile("^'(.*)'|\"(.*)\"$")
+
+# Types of literals that can be safely shared between parsed documents.
+IMMUTABLE_LITERAL_TYPES = (str, bytes, int, float, complex, bool, type(None))
+_MUTABLE_LITERAL = object()
+
+
+@functools.lru_cache(maxsize=4096)
+def _eval_immutable_literal(value):
+    try:
+        result = ast.literal_eval(value)
+    except Exception:
+        return value
+
+    if isinstance(result, IMMUTABLE_LITERAL_TYPES):
+        return result
+
+    return _MUTABLE_LITERAL
+
+
+def eval_literal(value):
+    """Evaluate a Python literal or return the value itself if it does not
+    represent one. Results of immutable literals are memoized since
+    configuration files repeat the same values over and over.
+    """
+    if isinstance(value, str):
+        result = _eval_immutable_literal(value)
+        if result is not _MUTABLE_LITERAL:
+            return result
+
+    try:
+        return ast.literal_eval(value)
+    except Exception:
+        return value
+
+
 class StringConverter(object):
     """A passthrough string-to-object converter.
     """
@@ -40,6 +78,11 @@ class StringConverter(object):
         :type object_mappings:   dict
         """
         self._object_mappings = object_mappings
+        # Reverse (object-to-string) index. Objects are matched by identity
+        # and the first mapping of a given object takes precedence.
+        self._string_mappings = {}
+        for k, v in object_mappings.items():
+            self._string_mappings.setdefault(id(v), k)
 
     def to_strings(self, items):
         """Recursively convert collection items to strings.
@@ -62,9 +105,9 @@ class StringConverter(object):
         return self._to_object(items)
 
     def _to_string(self, value):
-        for k, v in self._object_mappings.items():
-            if v is value:
-                return k
+        key = id(value)
+        if key in self._string_mappings:
+            return self._string_mappings[key]
 
         return str(value)
 
@@ -73,13 +116,10 @@ class StringConverter(object):
         if value in self._object_mappings:
             return self._object_mappings[value]
         elif (isinstance(value, str) and
-              re.match("^'(.*)'|\"(.*)\"$", value)):
+              QUOTED_STRING_PATTERN.match(value)):
             return value
 
-        try:
-            return ast.literal_eval(value)
-        except Exception:
-            return value
+        return eval_literal(value)
 
 
 class StreamCodec(object, metaclass=abc.ABCMeta):
@@ -187,6 +227,14 @@ class IniCodec(StreamCodec):
     }
     """
 
+    # Patterns matching section headers and options the same way
+    # ConfigParser does.
+    SECTION_PATTERN = re.compile(r'\[(?P<header>.+)\]')
+    OPTION_PATTERN = re.compile(
+        r'(?P<option>.*?)\s*(?:(?P<vi>=|:)\s*(?P<value>.*))?$')
+    # Comment prefixes recognized by ConfigParser.
+    PARSER_COMMENT_MARKERS = ('#', ';')
+
     def __init__(self, default_value=None, comment_markers=('#', ';')):
         """
         :param default_value:  Default value for keys with no value.
@@ -196,22 +244,103 @@ class IniCodec(StreamCodec):
         """
         self._default_value = default_value
         self._comment_markers = comment_markers
+        self._object_converter = StringConverter({None: default_value})
+        self._string_converter = StringConverter({default_value: None})
 
     def serialize(self, dict_data):
-        parser = self._init_config_parser(dict_data)
-        output = io.StringIO()
-        parser.write(output)
+        output = self._write_sections(dict_data)
+        if output is None:
+            parser = self._init_config_parser(dict_data)
+            output = io.StringIO()
+            parser.write(output)
+            output = output.getvalue()
 
-        return output.getvalue()
+        return output
 
     def deserialize(self, stream):
-        parser = self._init_config_parser()
-        parser.read_file(self._pre_parse(stream))
+        sections = self._read_sections(stream)
+        if sections is None:
+            parser = self._init_config_parser()
+            parser.read_file(self._pre_parse(stream))
+            sections = {s: dict(parser.items(s, raw=True))
+                        for s in parser.sections()}
+
+        return {s: {k: self._object_converter.to_objects(v)
+                    for k, v in options.items()}
+                for s, options in sections.items()}
+
+    def _read_sections(self, stream):
+        """Parse the stream in a single pass without going through
+        ConfigParser. The results are identical to parsing the pre-parsed
+        stream with ConfigParser.
+
+        :returns:   Raw string values by section or None if the stream
+                    requires ConfigParser (e.g. it is malformed or contains
+                    the special DEFAULT section).
+        """
+        sections = {}
+        options = None
+        for line in stream.split('\n'):
+            if line.startswith(self._comment_markers):
+                continue
+            line = line.strip()
+            if not line or line.startswith(self.PARSER_COMMENT_MARKERS):
+                continue
 
-        return {s: {k:
-                    StringConverter({None: self._default_value}).to_objects(v)
-                    for k, v in parser.items(s, raw=True)}
-                for s in parser.sections()}
+            match = self.SECTION_PATTERN.match(line)
+            if match:
+                name = match.group('header')
+                if name in sections or name == configparser.DEFAULTSECT:
+                    return None
+                options = sections[name] = {}
+            elif options is None:
+                return None
+            else:
+                name, value = self.OPTION_PATTERN.match(line).group(
+                    'option', 'value')
+                if not name:
+                    return None
+                name = name.rstrip().lower()
+                if name in options:
+                    return None
+                options[name] = value.strip() if value is not None else None
+
+        return sections
+
+    def _write_sections(self, dict_data):
+        """Serialize sections the same way ConfigParser would.
+
+        :returns:   Serialized stream or None if the data requires
+                    ConfigParser (e.g. for validation of its contents).
+        """
+        lines = []
+        for section, options in (dict_data or {}).items():
+            if (not isinstance(section, str) or
+                    section == configparser.DEFAULTSECT):
+                return None
+
+            items = {}
+            for key, value in options.items():
+                if not isinstance(key, str):
+                    return None
+                str_val = self._string_converter.to_strings(value)
+                if str_val is not None:
+                    str_val = str(str_val)
+                    if '%' in str_val:
+                        # Let the parser validate interpolation syntax.
+                        return None
+                items[key.lower()] = str_val
+
+            lines.append('[%s]\n' % section)
+            for key, value in items.items():
+                if value is None:
+                    lines.append('%s\n' % key)
+                else:
+                    lines.append('%s = %s\n'
+                                 % (key, value.replace('\n', '\n\t')))
+            lines.append('\n')
+
+        return ''.join(lines)
 
     def _pre_parse(self, stream):
         buf = io.StringIO()
@@ -233,8 +362,7 @@ class IniCodec(StreamCodec):
             for section in sections:
                 parser.add_section(section)
                 for key, value in sections[section].items():
-                    str_val = StringConverter(
-                        {self._default_value: None}).to_strings(value)
+                    str_val = self._string_converter.to_strings(value)
                     parser.set(section, key,
                                str(str_val) if str_val is not None
                                else str_val)
@@ -349,7 +477,7 @@ class PropertiesCodec(StreamCodec):
     def _strip_comments(self, value):
         # Strip in-line comments.
         for marker in self._comment_markers:
-            value = value.split(marker)[0]
+            value = value.partition(marker)[0]
         return value.strip()
 
     def _to_rows(self, header, items):
@@ -509,7 +637,7 @@ class JsonCodec(StreamCodec):
 
     def deserialize(self, stream):
         if isinstance(stream, str):
-            return jsonutils.load(io.StringIO(stream))
+            return jsonutils.loads(stream)
         if isinstance(stream, bytes):
             return jsonutils.load(io.BytesIO(stream))
 
@@ -531,6 +659,21 @@ class Base64Codec(StreamCodec):
         return base64.decode_as_bytes(stream)
 
 
+class ZlibBase64Codec(Base64Codec):
+    """Compress data with zlib before encoding it with base64, e.g. to send
+    binary data over RPC.
+    """
+
+    def serialize(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return super(ZlibBase64Codec, self).serialize(zlib.compress(data))
+
+    def deserialize(self, stream):
+        return zlib.decompress(
+            super(ZlibBase64Codec, self).deserialize(stream))
+
+
 class XmlCodec(StreamCodec):
 
     def __init__(self, encoding='utf-8'):
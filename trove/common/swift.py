@@ -12,6 +12,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import json
+from urllib import parse
+
 
 def parse_location(location):
     storage_url = "/".join(location.split('/')[:-2])
@@ -40,3 +43,49 @@ def get_metadata(client, location, extra_attrs=[]):
         meta[key] = headers.get(key)
 
     return meta
+
+
+def get_segments(client, container, name):
+    """Get the segments of an object, as container/object paths.
+
+    An object that is not a static large object has no segments.
+    """
+    headers = client.head_object(container, name)
+    if 'x-static-large-object' not in headers:
+        return []
+    _, body = client.get_object(container, name,
+                                query_string='multipart-manifest=get')
+    return [segment['name'].lstrip('/') for segment in json.loads(body)]
+
+
+def bulk_delete_limit(client):
+    """Get the number of objects Swift deletes in a bulk-delete request.
+
+    Returns 0 when the bulk middleware is not enabled.
+    """
+    try:
+        capabilities = client.get_capabilities()
+    except Exception:
+        return 0
+    bulk_delete = capabilities.get('bulk_delete') or {}
+    return bulk_delete.get('max_deletes_per_request', 0)
+
+
+def bulk_delete(client, paths):
+    """Delete container/object paths with a single bulk-delete request.
+
+    :returns: the paths that could not be deleted. Objects already gone
+              are not errors.
+    """
+    headers = {'Accept': 'application/json', 'Content-Type': 'text/plain'}
+    data = b''.join(parse.quote('/' + path).encode('utf-8') + b'\n'
+                    for path in paths)
+    _, body = client.post_account(headers=headers, data=data,
+                                  query_string='bulk-delete')
+    result = json.loads(body) if body else {}
+    failed = [parse.unquote(path).lstrip('/')
+              for path, status in result.get('Errors', [])]
+    if not failed and not result.get('Response Status', '').startswith('2'):
+        # The request failed as a whole, e.g. without the bulk middleware.
+        return list(paths)
+    return failed
@@ -27,8 +27,6 @@ from trove.common import utils
 CONF = cfg.CONF
 LOG = logging.getLogger(__name__)
 
-ENV = utils.ENV
-
 SERVICE_PARSERS = {
     'mongodb': configurations.MongoDBConfParser,
     'mysql': configurations.MySQLConfParser,
@@ -43,6 +41,12 @@ SERVICE_PARSERS = {
 }
 
 
+def __getattr__(name):
+    if name == 'ENV':
+        return utils.get_jinja_environment()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
 class SingleInstanceConfigTemplate(object):
     """This class selects a single configuration file by database type for
         rendering on the guest
@@ -86,7 +90,7 @@ class SingleInstanceConfigTemplate(object):
         context['major'] = str(context['semantic_version'].major)
         context['minor'] = str(context['semantic_version'].minor)
         names = [name.format(**context) for name in patterns]
-        return ENV.select_template(names)
+        return utils.get_jinja_environment().select_template(names)
 
     def render(self, **kwargs):
         """Renders the jinja template
@@ -18,8 +18,7 @@ from oslo_utils.importutils import import_class
 from trove.common import cfg
 from trove.common.clients import get_endpoint
 from trove.common.clients import normalize_url
-
-from troveclient.v1 import client as TroveClient
+from trove.common.clients import pooled_client
 
 CONF = cfg.CONF
 
@@ -32,7 +31,10 @@ so the imports here would fail.
 """
 
 
+@pooled_client('trove')
 def trove_client(context, region_name=None):
+    from troveclient.v1 import client as TroveClient
+
     if CONF.trove_url:
         url = '%(url)s%(tenant)s' % {
             'url': normalize_url(CONF.trove_url),
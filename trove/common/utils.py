@@ -23,7 +23,6 @@ import subprocess
 import urllib.parse as urlparse
 import uuid
 
-import jinja2
 from oslo_concurrency import processutils
 from oslo_log import log as logging
 from oslo_service import loopingcall
@@ -35,6 +34,7 @@ from trove.common import cfg
 from trove.common import crypto_utils
 from trove.common import exception
 from trove.common.i18n import _
+from trove.common import polling
 
 
 CONF = cfg.CONF
@@ -47,6 +47,8 @@ execute = processutils.execute
 
 
 def build_jinja_environment():
+    import jinja2
+
     env = jinja2.Environment(
         autoescape=True,
         loader=jinja2.ChoiceLoader([
@@ -59,7 +61,26 @@ def build_jinja_environment():
     return env
 
 
-ENV = build_jinja_environment()
+_ENV = None
+
+
+def get_jinja_environment():
+    """Return the shared jinja2 environment, building it on first use.
+
+    Building it when the module is imported slowed down the start of every
+    service, most of which never render a template, and read
+    template_path before the configuration files were parsed.
+    """
+    global _ENV
+    if _ENV is None:
+        _ENV = build_jinja_environment()
+    return _ENV
+
+
+def __getattr__(name):
+    if name == 'ENV':
+        return get_jinja_environment()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def pagination_limit(limit, default_limit):
@@ -211,17 +232,22 @@ def wait_for_task(polling_task):
 
 
 def poll_until(retriever, condition=lambda value: value,
-               sleep_time=3, time_out=0, initial_delay=0):
+               sleep_time=3, time_out=0, initial_delay=0, key=None,
+               name=None):
     """Retrieves object until it passes condition, then returns it.
 
     If time_out_limit is passed in, PollTimeOut will be raised once that
-    amount of time is eclipsed.
+    amount of time is eclipsed. The wait is also bounded by the enclosing
+    polling.deadline(), if any.
 
+    The interval grows exponentially with jitter from sleep_time up to 30
+    seconds. Concurrent calls with the same key share one polling loop, see
+    polling.poll().
     """
-    task = build_polling_task(retriever, condition=condition,
-                              sleep_time=sleep_time, time_out=time_out,
-                              initial_delay=initial_delay)
-    return wait_for_task(task)
+    return polling.poll(retriever, condition=condition,
+                        sleep_time=sleep_time, time_out=time_out,
+                        initial_delay=initial_delay, key=key,
+                        name=name or polling.call_site(1))
 
 
 # Copied from nova.api.openstack.common in the old code.
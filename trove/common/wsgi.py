@@ -14,6 +14,7 @@
 #    under the License.
 """Wsgi helper utilities for trove"""
 
+import itertools
 import math
 import re
 import time
@@ -53,6 +54,9 @@ eventlet.patcher.monkey_patch(all=False, socket=True)
 
 LOG = logging.getLogger('trove.common.wsgi')
 
+# Validators of the (static) API schemas, keyed by the id of the schema.
+_SCHEMA_VALIDATORS = {}
+
 
 def versioned_urlmap(*args, **kwargs):
     urlmap = paste.urlmap.urlmap_factory(*args, **kwargs)
@@ -228,6 +232,40 @@ class Result(object):
         return self._data
 
 
+class StreamingResult(Result):
+    """A listing whose items are serialized one at a time.
+
+    items is an iterable of the dicts of the listed objects, e.g. the
+    items() generator of a list view. It is consumed while the response
+    body is written, so the memory used by the response does not grow
+    with the size of the listing.
+    """
+
+    def __init__(self, collection_type, items, links=None, status=200):
+        super(StreamingResult, self).__init__(None, status)
+        self.collection_type = collection_type
+        self.items = items
+        self.links = links
+
+    def extra(self):
+        return {'links': self.links} if self.links else {}
+
+    def data(self, serialization_type):
+        data = {self.collection_type: list(self.items)}
+        data.update(self.extra())
+        return data
+
+
+def _log_stream_errors(chunks):
+    try:
+        for chunk in chunks:
+            yield chunk
+    except Exception:
+        # The status is already sent, the client gets a truncated body.
+        LOG.exception("Failed to write a streamed response.")
+        raise
+
+
 class Resource(base_wsgi.Resource):
     def __init__(self, controller, deserializer, serializer,
                  exception_map=None):
@@ -400,19 +438,52 @@ class Controller(object):
         error_msg = "; ".join(messages)
         return "Validation error: %s" % error_msg
 
+    @staticmethod
+    def get_validator(schema):
+        """Return the validator of a schema, building it on first use."""
+        cached = _SCHEMA_VALIDATORS.get(id(schema))
+        # The schema is kept alongside its validator so that its id cannot
+        # be reused by another object.
+        if cached is None or cached[0] is not schema:
+            cached = (schema, jsonschema.Draft4Validator(schema))
+            _SCHEMA_VALIDATORS[id(schema)] = cached
+        return cached[1]
+
+    @classmethod
+    def compile_validators(cls):
+        """Build the validators of all the schemas of the controller.
+
+        Actions like 'action' or 'update_all' map to a nested dict of
+        schemas, keyed by the type of the request.
+        """
+        def _iter_schemas(schemas):
+            for schema in schemas.values():
+                if not isinstance(schema, dict):
+                    continue
+                if 'type' in schema:
+                    yield schema
+                else:
+                    yield from _iter_schemas(schema)
+
+        count = 0
+        for schema in _iter_schemas(cls.schemas or {}):
+            cls.get_validator(schema)
+            count += 1
+        return count
+
     def validate_request(self, action, action_args):
         body = action_args.get('body', {})
         schema = self.get_schema(action, body)
         if schema:
-            validator = jsonschema.Draft4Validator(schema)
-            if not validator.is_valid(body):
-                errors = sorted(validator.iter_errors(body),
-                                key=lambda e: e.path)
+            errors = list(self.get_validator(schema).iter_errors(body))
+            if errors:
+                errors.sort(key=lambda e: e.path)
                 error_msg = self.format_validation_msg(errors)
                 LOG.info(error_msg)
                 raise exception.BadRequest(message=error_msg)
 
     def create_resource(self):
+        self.compile_validators()
         return Resource(
             self,
             RequestDeserializer(),
@@ -432,7 +503,24 @@ class TroveResponseSerializer(base_wsgi.ResponseSerializer):
         method is called and *that* is passed to the superclass implementation
         instead of the actual data.
 
+        A StreamingResult is written incrementally through the response
+        iterable when the body serializer supports it.
+
         """
+        if isinstance(data, StreamingResult):
+            serializer = self.get_body_serializer(content_type)
+            if hasattr(serializer, 'serialize_items'):
+                response.headers['Content-Type'] = content_type
+                chunks = serializer.serialize_items(
+                    data.collection_type, data.items, data.extra())
+                # Errors raised while loading the first items still make
+                # an error response.
+                first = next(chunks)
+                response.app_iter = itertools.chain(
+                    [first], _log_stream_errors(chunks))
+                response.content_length = None
+                return
+
         if isinstance(data, Result):
             data = data.data(content_type)
         super(TroveResponseSerializer, self).serialize_body(
@@ -540,6 +628,9 @@ class ContextMiddleware(base_wsgi.Middleware):
         auth_token = request.headers["X-Auth-Token"]
         user_id = request.headers.get('X-User-ID', None)
         roles = request.headers.get('X-Role', '').split(',')
+        # Set by keystonemiddleware along with the X-* headers.
+        token_info = request.environ.get('keystone.token_info') or {}
+        auth_token_expires = token_info.get('token', {}).get('expires_at')
         is_admin = False
         limits = self._extract_limits(request.params)
         context = rd_context.TroveContext(auth_token=auth_token,
@@ -549,7 +640,9 @@ class ContextMiddleware(base_wsgi.Middleware):
                                           limit=limits.get('limit'),
                                           marker=limits.get('marker'),
                                           service_catalog=service_catalog,
-                                          roles=roles)
+                                          roles=roles,
+                                          auth_token_expires=(
+                                              auth_token_expires))
         if self.admin_roles:
             for role in roles:
                 if role.lower() in self.admin_roles:
@@ -36,6 +36,13 @@ class Manager(periodic_task.PeriodicTasks):
 
     def __init__(self):
         super(Manager, self).__init__(CONF)
+        if (CONF.enable_secure_rpc_messaging and
+                CONF.instance_rpc_encr_key_cache_warm_up):
+            try:
+                inst_models.warm_instance_encryption_key_cache()
+            except Exception:
+                LOG.exception("Failed to warm up the instance encryption "
+                              "key cache.")
 
     def _message_too_old(self, instance_id, method_name, sent):
         fields = {
@@ -15,6 +15,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
+import threading
+import time
+
 from oslo_log import log as logging
 from oslo_utils import uuidutils
 
@@ -45,25 +49,50 @@ def persisted_models():
     }
 
 
-class DBDatastore(dbmodels.DatabaseModelBase):
+class CatalogModelBase(dbmodels.DatabaseModelBase):
+    """Base of the models held in the datastore catalog.
+
+    Writing any of them invalidates the catalog of this process.
+    """
+
+    def save(self):
+        try:
+            return super(CatalogModelBase, self).save()
+        finally:
+            catalog.invalidate()
+
+    def delete(self):
+        try:
+            return super(CatalogModelBase, self).delete()
+        finally:
+            catalog.invalidate()
+
+    def update(self, **values):
+        try:
+            return super(CatalogModelBase, self).update(**values)
+        finally:
+            catalog.invalidate()
+
+
+class DBDatastore(CatalogModelBase):
 
     _data_fields = ['name', 'default_version_id']
     _table_name = 'datastores'
 
 
-class DBCapabilities(dbmodels.DatabaseModelBase):
+class DBCapabilities(CatalogModelBase):
 
     _data_fields = ['name', 'description', 'enabled']
     _table_name = 'capabilities'
 
 
-class DBCapabilityOverrides(dbmodels.DatabaseModelBase):
+class DBCapabilityOverrides(CatalogModelBase):
 
     _data_fields = ['capability_id', 'datastore_version_id', 'enabled']
     _table_name = 'capability_overrides'
 
 
-class DBDatastoreVersion(dbmodels.DatabaseModelBase):
+class DBDatastoreVersion(CatalogModelBase):
     _data_fields = ['datastore_id', 'name', 'image_id', 'image_tags',
                     'packages', 'active', 'manager', 'version',
                     'registry_ext', 'repl_strategy']
@@ -77,14 +106,153 @@ class DBDatastoreVersionMetadata(dbmodels.DatabaseModelBase):
     _table_name = 'datastore_version_metadata'
 
 
+class _CatalogSnapshot(object):
+    """All the datastores, versions and capabilities, indexed."""
+
+    def __init__(self, generation, datastores, versions, capabilities,
+                 overrides):
+        self.generation = generation
+        self.loaded_at = time.monotonic()
+        self.datastores_by_id = {ds.id: ds for ds in datastores}
+        self.datastores_by_name = {ds.name: ds for ds in datastores}
+        self.versions_by_id = {dsv.id: dsv for dsv in versions}
+        # Version names are only unique along with the version number.
+        self.versions_by_name = collections.defaultdict(list)
+        self.versions_by_number = {}
+        for dsv in versions:
+            self.versions_by_name[(dsv.datastore_id, dsv.name)].append(dsv)
+            self.versions_by_number[
+                (dsv.datastore_id, dsv.name, dsv.version)] = dsv
+        self.capabilities = list(capabilities)
+        self.overrides = collections.defaultdict(dict)
+        for override in overrides:
+            self.overrides[override.datastore_version_id][
+                override.capability_id] = override
+
+
+class DatastoreCatalog(object):
+    """In-process cache of the datastores, versions and capabilities.
+
+    These tables are read by almost every API call and change rarely. The
+    catalog loads them whole and serves the lookups from dict indexes
+    until it is invalidated, when one of them is written by this process,
+    or for datastore_cache_ttl seconds. A lookup missing from the catalog
+    returns None and the caller falls back to the database, so the rows
+    added by another process are found right away.
+    """
+
+    def __init__(self):
+        self._snapshot = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+
+    @property
+    def enabled(self):
+        return CONF.datastore_cache_ttl > 0
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+
+    def stats(self):
+        lookups = self._hits + self._misses
+        return {'hits': self._hits, 'misses': self._misses,
+                'loads': self._loads, 'generation': self._generation,
+                'hit_rate': self._hits / float(lookups) if lookups else 0.0}
+
+    def _is_fresh(self, snapshot):
+        return (snapshot is not None and
+                snapshot.generation == self._generation and
+                time.monotonic() - snapshot.loaded_at <
+                CONF.datastore_cache_ttl)
+
+    def _get(self):
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        with self._lock:
+            if not self._is_fresh(self._snapshot):
+                generation = self._generation
+                self._snapshot = _CatalogSnapshot(
+                    generation,
+                    DBDatastore.find_all().all(),
+                    DBDatastoreVersion.find_all().all(),
+                    DBCapabilities.find_all().all(),
+                    DBCapabilityOverrides.find_all().all())
+                self._loads += 1
+                LOG.debug("Loaded the datastore catalog (generation "
+                          "%(generation)s), cache stats: %(stats)s",
+                          {'generation': generation, 'stats': self.stats()})
+            return self._snapshot
+
+    def _lookup(self, find):
+        if not self.enabled:
+            return None
+        value = find(self._get())
+        if value:
+            self._hits += 1
+        else:
+            self._misses += 1
+        return value
+
+    def find_datastore(self, id_or_name):
+        """Return the DBDatastore by id or name, or None."""
+        return self._lookup(
+            lambda snapshot: (snapshot.datastores_by_id.get(id_or_name) or
+                              snapshot.datastores_by_name.get(id_or_name)))
+
+    def find_version(self, datastore_id, id_or_name, version=None):
+        """Return the DBDatastoreVersion by id, name or name and number.
+
+        :returns: the version, or None if there isn't exactly one match.
+        """
+        def find(snapshot):
+            if uuidutils.is_uuid_like(id_or_name):
+                db_version = snapshot.versions_by_id.get(id_or_name)
+                if db_version and db_version.datastore_id == datastore_id:
+                    return db_version
+                return None
+            if version:
+                return snapshot.versions_by_number.get(
+                    (datastore_id, id_or_name, version))
+            versions = snapshot.versions_by_name.get(
+                (datastore_id, id_or_name), [])
+            return versions[0] if len(versions) == 1 else None
+
+        return self._lookup(find)
+
+    def find_version_by_uuid(self, uuid):
+        return self._lookup(
+            lambda snapshot: snapshot.versions_by_id.get(uuid))
+
+    def capabilities(self, datastore_version_id=None):
+        """Return the DBCapabilities and the overrides of a version.
+
+        :returns: the list of capabilities and a dict of the overrides by
+                  capability id, or None.
+        """
+        return self._lookup(
+            lambda snapshot: (snapshot.capabilities,
+                              snapshot.overrides.get(datastore_version_id,
+                                                     {})))
+
+
+catalog = DatastoreCatalog()
+
+
 class Capabilities(object):
 
     def __init__(self, datastore_version_id=None):
         self.capabilities = []
         self.datastore_version_id = datastore_version_id
+        self._names = set()
 
     def __contains__(self, item):
-        return item in [capability.name for capability in self.capabilities]
+        return item in self._names
 
     def __len__(self):
         return len(self.capabilities)
@@ -112,6 +280,17 @@ class Capabilities(object):
         Bulk load and override default capabilities with configured
         datastore version specific settings.
         """
+        cached = catalog.capabilities(self.datastore_version_id)
+        if cached:
+            db_capabilities, db_overrides = cached
+            self.capabilities = [
+                CapabilityOverride(db_overrides[db_info.id],
+                                   parent_capability=Capability(db_info))
+                if db_info.id in db_overrides else Capability(db_info)
+                for db_info in db_capabilities]
+            self._names = {cap.name for cap in self.capabilities}
+            return
+
         capability_defaults = [Capability(c)
                                for c in DBCapabilities.find_all()]
 
@@ -140,6 +319,7 @@ class Capabilities(object):
             return cap
 
         self.capabilities = [override(obj) for obj in capability_defaults]
+        self._names = {cap.name for cap in self.capabilities}
 
         LOG.debug('Capabilities for datastore %(ds_id)s: %(capabilities)s',
                   {'ds_id': self.datastore_version_id,
@@ -215,11 +395,12 @@ class CapabilityOverride(BaseCapability):
     base capability's entry for Trove.
     """
 
-    def __init__(self, db_info):
+    def __init__(self, db_info, parent_capability=None):
         super(CapabilityOverride, self).__init__(db_info)
         # This *may* be better solved with a join in the SQLAlchemy model but
         # I was unable to get our query object to work properly for this.
-        parent_capability = Capability.load(db_info.capability_id)
+        if parent_capability is None:
+            parent_capability = Capability.load(db_info.capability_id)
         if parent_capability:
             self.parent_name = parent_capability.name
             self.parent_description = parent_capability.description
@@ -350,6 +531,9 @@ class Datastore(object):
 
     @classmethod
     def load(cls, id_or_name):
+        db_info = catalog.find_datastore(id_or_name)
+        if db_info:
+            return cls(db_info)
         try:
             return cls(DBDatastore.find_by(id=id_or_name))
         except exception.ModelNotFoundError:
@@ -404,6 +588,11 @@ class DatastoreVersion(object):
 
     @classmethod
     def load(cls, datastore, id_or_name, version=None):
+        db_version = catalog.find_version(datastore.id, id_or_name,
+                                          version=version)
+        if db_version:
+            return cls(db_version)
+
         if uuidutils.is_uuid_like(id_or_name):
             return cls(DBDatastoreVersion.find_by(datastore_id=datastore.id,
                                                   id=id_or_name))
@@ -430,6 +619,9 @@ class DatastoreVersion(object):
 
     @classmethod
     def load_by_uuid(cls, uuid):
+        db_version = catalog.find_version_by_uuid(uuid)
+        if db_version:
+            return cls(db_version)
         try:
             return cls(DBDatastoreVersion.find_by(id=uuid))
         except exception.ModelNotFoundError:
@@ -608,6 +800,7 @@ def update_datastore(name, default_version):
         datastore.default_version_id = None
 
     db_api.save(datastore)
+    catalog.invalidate()
 
 
 def update_datastore_version(datastore, name, manager, image_id, image_tags,
@@ -646,6 +839,7 @@ def update_datastore_version(datastore, name, manager, image_id, image_tags,
     ds_version.repl_strategy = repl_strategy
 
     db_api.save(ds_version)
+    catalog.invalidate()
 
 
 class DatastoreVersionMetadata(object):
@@ -0,0 +1,45 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from oslo_log import log as logging
+
+from trove.backup.models import Backup
+from trove.common import apischema
+from trove.common.auth import admin_context
+from trove.common import wsgi
+
+LOG = logging.getLogger(__name__)
+
+
+class MgmtBackupController(wsgi.Controller):
+    """Controller for the bulk operations on backups."""
+    schemas = apischema.mgmt_backup
+
+    @admin_context
+    def action(self, req, body, tenant_id):
+        """Delete all the backups of a project, or of one of its instances.
+
+        The backups are deleted by the taskmanager in the background.
+        """
+        context = req.environ[wsgi.CONTEXT_KEY]
+        data = body['delete']
+        project_id = data['project_id']
+        instance_id = data.get('instance_id')
+        LOG.info("Deleting the backups of project %(project)s, instance "
+                 "%(instance)s.", {'project': project_id,
+                                   'instance': instance_id})
+
+        backup_ids = Backup.delete_all(context, project_id,
+                                       instance_id=instance_id)
+        LOG.info("Deleting %(count)d backups of project %(project)s.",
+                 {'count': len(backup_ids), 'project': project_id})
+        return wsgi.Result(None, 202)
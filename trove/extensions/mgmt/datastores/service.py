@@ -97,11 +97,12 @@ class DatastoreVersionController(wsgi.Controller):
     def index(self, req, tenant_id):
         """Lists all datastore-versions for given datastore."""
         db_ds_versions = models.DatastoreVersions.load_all(only_active=False)
-        datastore_versions = [models.DatastoreVersion.load_by_uuid(
-            ds_version.id) for ds_version in db_ds_versions]
+        datastore_versions = (models.DatastoreVersion(ds_version)
+                              for ds_version in db_ds_versions)
 
-        return wsgi.Result(
-            views.DatastoreVersionsView(datastore_versions).data(), 200)
+        return wsgi.StreamingResult(
+            'versions',
+            views.DatastoreVersionsView(datastore_versions).items())
 
     @admin_context
     def show(self, req, tenant_id, id):
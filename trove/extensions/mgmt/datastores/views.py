@@ -44,10 +44,9 @@ class DatastoreVersionsView(object):
     def __init__(self, datastore_versions):
         self.datastore_versions = datastore_versions
 
-    def data(self):
-        data = []
+    def items(self):
         for datastore_version in self.datastore_versions:
-            data.append(
-                DatastoreVersionView(datastore_version).data()['version'])
+            yield DatastoreVersionView(datastore_version).data()['version']
 
-        return {'versions': data}
+    def data(self):
+        return {'versions': list(self.items())}
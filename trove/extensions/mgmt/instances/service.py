@@ -74,7 +74,8 @@ class MgmtInstanceController(InstanceController):
         view_cls = views.MgmtInstancesView(instances, req=req)
         paged = pagination.SimplePaginatedDataView(req.url, 'instances',
                                                    view_cls, marker)
-        return wsgi.Result(paged.data(), 200)
+        return wsgi.StreamingResult('instances', view_cls.items(),
+                                    paged.links())
 
     @admin_context
     def show(self, req, tenant_id, id):
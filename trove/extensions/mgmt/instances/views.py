@@ -104,13 +104,14 @@ class MgmtInstancesView(object):
         self.instances = instances
         self.req = req
 
-    def data(self):
-        data = []
+    def items(self):
         # Return instances in the order of 'created'
         for instance in sorted(self.instances, key=lambda ins: ins.created,
                                reverse=True):
-            data.append(self.data_for_instance(instance))
-        return {'instances': data}
+            yield self.data_for_instance(instance)
+
+    def data(self):
+        return {'instances': list(self.items())}
 
     def data_for_instance(self, instance):
         view = MgmtInstanceView(instance, req=self.req)
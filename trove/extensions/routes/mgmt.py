@@ -14,6 +14,7 @@
 #    under the License.
 
 from trove.common import extensions
+from trove.extensions.mgmt.backups.service import MgmtBackupController
 from trove.extensions.mgmt.clusters.service import MgmtClusterController
 from trove.extensions.mgmt.configuration import service as conf_service
 from trove.extensions.mgmt.datastores.service import DatastoreVersionController
@@ -82,4 +83,10 @@ class Mgmt(extensions.ExtensionDescriptor):
             member_actions={})
         resources.append(datastore_version)
 
+        backups = extensions.ResourceExtension(
+            '{tenant_id}/mgmt/backups',
+            MgmtBackupController(),
+            collection_actions={'action': 'POST'})
+        resources.append(backups)
+
         return resources
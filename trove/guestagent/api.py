@@ -17,13 +17,17 @@
 Handles all request to the Platform or Guest VM
 """
 
+import time
+
 from oslo_log import log as logging
 import oslo_messaging as messaging
 from oslo_messaging.rpc.client import RemoteError
 
 from trove.common import cfg
+from trove.common import clients
 from trove.common import exception
 from trove.common.notification import NotificationCastWrapper
+from trove.common import stream_codecs
 from trove import rpc
 
 CONF = cfg.CONF
@@ -39,13 +43,15 @@ class API(object):
                 start_db_with_conf_changes
               - Remove do_not_start_on_reboot from stop_db
               - Added online argument to resize_fs
+        * 1.4 - Added module_missing, module_apply accepts modules without
+                contents, compressed or stored in Swift
 
     When updating this API, also update API_LATEST_VERSION
     """
 
     # API_LATEST_VERSION should bump the minor number each time
     # a method signature is added or changed
-    API_LATEST_VERSION = '1.3'
+    API_LATEST_VERSION = '1.4'
 
     # API_BASE_VERSION should only change on major version upgrade
     API_BASE_VERSION = '1.0'
@@ -711,11 +717,68 @@ class API(object):
 
     def module_apply(self, modules):
         LOG.debug("Applying modules to %s.", self.id)
-        version = self.API_BASE_VERSION
+        version = '1.4'
+        if self.client.can_send_version(version):
+            modules = self._pack_modules(modules, version)
+        else:
+            version = self.API_BASE_VERSION
 
         return self._call("module_apply", self.agent_high_timeout,
                           version=version, modules=modules)
 
+    def _pack_modules(self, modules, version):
+        """Only send the contents of the modules the guest does not have,
+        compressed or through Swift.
+        """
+        md5s = [data['module']['md5'] for data in modules
+                if data['module'].get('md5')]
+        missing = set(self._call("module_missing", self.agent_low_timeout,
+                                 version=version, md5s=md5s))
+        packed = []
+        for data in modules:
+            module = dict(data['module'])
+            contents = module.pop('contents', None)
+            if contents and (module.get('md5') in missing or
+                             not module.get('md5')):
+                if (CONF.module_swift_threshold and
+                        not module.get('is_admin') and
+                        len(contents) >= CONF.module_swift_threshold):
+                    module['contents_location'] = self._upload_module(
+                        contents, module['md5'])
+                else:
+                    module['contents'] = (
+                        stream_codecs.ZlibBase64Codec().serialize(contents))
+                    module['contents_encoding'] = 'zlib'
+            packed.append({'module': module})
+        return packed
+
+    def _upload_module(self, contents, md5):
+        """Upload the contents of a module to Swift, once per md5 sum.
+
+        The guests keep the contents they downloaded, so the objects expire
+        module_swift_object_ttl seconds after their upload. An object that
+        could expire before the guest downloads it is uploaded again.
+        """
+        from swiftclient.client import ClientException
+
+        container = CONF.module_swift_container
+        location = {'container': container, 'object': md5}
+        ttl = CONF.module_swift_object_ttl
+        swift = clients.create_swift_client(self.context)
+        try:
+            headers = swift.head_object(container, md5)
+            delete_at = int(headers.get('x-delete-at', 0))
+            if not ttl or (delete_at and delete_at - time.time() >
+                           self.agent_high_timeout):
+                return location
+        except ClientException as e:
+            if e.http_status != 404:
+                raise
+            swift.put_container(container)
+        swift.put_object(container, md5, contents,
+                         headers={'X-Delete-After': str(ttl)} if ttl else None)
+        return location
+
     def module_remove(self, module):
         LOG.debug("Removing modules from %s.", self.id)
         version = self.API_BASE_VERSION
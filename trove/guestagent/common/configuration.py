@@ -14,6 +14,7 @@
 #    under the License.
 
 import abc
+import copy
 import os
 import re
 
@@ -26,6 +27,19 @@ from trove.guestagent.common.operating_system import FileMode
 LOG = logging.getLogger(__name__)
 
 
+def get_file_signature(path):
+    """Return a value identifying the current revision of a given file
+    (or directory) or None if it cannot be determined, e.g. when the path
+    does not exist or is not accessible to the current user.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
 class ConfigurationManager(object):
     """
     ConfigurationManager is responsible for management of
@@ -90,6 +104,8 @@ class ConfigurationManager(object):
         self._codec = codec
         self._requires_root = requires_root
         self._value_cache = None
+        self._value_cache_signature = None
+        self._base_options_cache = None
 
         if not override_strategy:
             # Use OneFile strategy by default. Store the revisions in a
@@ -107,7 +123,7 @@ class ConfigurationManager(object):
     def get_value(self, key, section=None, default=None):
         """Return the current value at a given key or 'default'.
         """
-        if self._value_cache is None:
+        if self._value_cache is None or self._is_cache_stale():
             self.refresh_cache()
 
         if section:
@@ -122,19 +138,62 @@ class ConfigurationManager(object):
         :returns:        Configuration file as a Python dict.
         """
 
+        base_options = self._read_base_configuration()
+        if base_options is None:
+            return None
+
+        updates = self._override_strategy.parse_updates()
+        guestagent_utils.update_dict(updates, base_options)
+
+        return base_options
+
+    def _read_base_configuration(self):
+        """Return a parsed copy of the base configuration file.
+        The file is re-parsed only if it changed since the last read.
+        """
+        signature = get_file_signature(self._base_config_path)
+        if (signature is not None and self._base_options_cache and
+                self._base_options_cache[0] == signature):
+            return copy.deepcopy(self._base_options_cache[1])
+
         try:
             base_options = operating_system.read_file(
                 self._base_config_path, codec=self._codec,
                 as_root=self._requires_root)
         except Exception:
             LOG.warning('File %s not found', self._base_config_path)
+            self._base_options_cache = None
             return None
 
-        updates = self._override_strategy.parse_updates()
-        guestagent_utils.update_dict(updates, base_options)
+        if signature is not None:
+            self._base_options_cache = (signature,
+                                        copy.deepcopy(base_options))
+        else:
+            self._base_options_cache = None
 
         return base_options
 
+    def _get_cache_signature(self):
+        """Return a signature of all files the configuration is built
+        from or None if any of them cannot be inspected.
+        """
+        base_signature = get_file_signature(self._base_config_path)
+        override_signature = self._override_strategy.get_signature()
+        if base_signature is None or override_signature is None:
+            return None
+
+        return (base_signature, override_signature)
+
+    def _is_cache_stale(self):
+        """Return whether the configuration files changed since the value
+        cache was last refreshed. The cache is trusted as-is if
+        the files cannot be inspected without superuser privileges.
+        """
+        if self._value_cache_signature is None:
+            return False
+
+        return self._get_cache_signature() != self._value_cache_signature
+
     def reset_configuration(self, options, remove_overrides=False):
         """Write given contents to the base configuration file.
 
@@ -226,6 +285,7 @@ class ConfigurationManager(object):
         self.refresh_cache()
 
     def refresh_cache(self):
+        self._value_cache_signature = self._get_cache_signature()
         self._value_cache = self.parse_configuration()
 
 
@@ -294,6 +354,12 @@ class ConfigurationOverrideStrategy(object, metaclass=abc.ABCMeta):
         """
         return {}
 
+    def get_signature(self):
+        """Return a value that changes whenever the updates returned by
+        'parse_updates' may have changed, or None if it cannot be determined.
+        """
+        return ()
+
 
 class ImportOverrideStrategy(ConfigurationOverrideStrategy):
     """Import strategy keeps overrides in separate files that get imported
@@ -324,6 +390,10 @@ class ImportOverrideStrategy(ConfigurationOverrideStrategy):
         """
         self._revision_dir = revision_dir
         self._revision_ext = revision_ext
+        # Parsed revision files keyed by path: {path: (signature, options)}
+        self._parsed_revisions = {}
+        # Merged view of all revisions: (revision signatures, options)
+        self._merged_updates = None
 
     def configure(self, base_config_path, owner, group, codec, requires_root):
         """
@@ -414,15 +484,54 @@ class ImportOverrideStrategy(ConfigurationOverrideStrategy):
                                           as_root=self._requires_root)
 
     def parse_updates(self):
-        parsed_options = {}
+        """Only revision files that changed since the last call get
+        re-parsed. The merged result is reused if none of them changed.
+        """
+        parsed_revisions = {}
+        revisions = []
         for path in self._collect_revision_files():
-            options = operating_system.read_file(path, codec=self._codec,
-                                                 as_root=self._requires_root)
-            guestagent_utils.update_dict(options, parsed_options)
-
+            signature = get_file_signature(path)
+            cached = self._parsed_revisions.get(path)
+            if signature is not None and cached and cached[0] == signature:
+                options = cached[1]
+            else:
+                options = operating_system.read_file(
+                    path, codec=self._codec, as_root=self._requires_root)
+            if signature is not None:
+                parsed_revisions[path] = (signature, options)
+            revisions.append((path, signature, options))
+        self._parsed_revisions = parsed_revisions
+
+        merged_key = tuple((path, signature)
+                           for path, signature, _ in revisions)
+        if (len(parsed_revisions) != len(revisions) or
+                self._merged_updates is None or
+                self._merged_updates[0] != merged_key):
+            parsed_options = {}
+            for _, _, options in revisions:
+                guestagent_utils.update_dict(options, parsed_options)
+            self._merged_updates = (merged_key, parsed_options)
+
+        parsed_options = copy.deepcopy(self._merged_updates[1])
         LOG.debug(f"Parsed overrides options: {parsed_options}")
         return parsed_options
 
+    def get_signature(self):
+        dir_signature = get_file_signature(self._revision_dir)
+        if dir_signature is None:
+            return None
+
+        # Directory signature only changes when revision files get added,
+        # removed or replaced. Check the known files for in-place updates.
+        signatures = [dir_signature]
+        for path in sorted(self._parsed_revisions):
+            signature = get_file_signature(path)
+            if signature is None:
+                return None
+            signatures.append(signature)
+
+        return tuple(signatures)
+
     @property
     def has_revisions(self):
         """Return True if there currently are any revision files.
@@ -118,7 +118,8 @@ class Grant(object):
                    ]
 
     def __init__(self, permissions=None, database=None, table=None, user=None,
-                 host=None, clear=None, hashed=None, grant_option=False):
+                 host=None, clear=None, hashed=None, grant_option=False,
+                 grantees=None):
         self.permissions = permissions or []
         self.database = database
         self.table = table
@@ -127,6 +128,8 @@ class Grant(object):
         self.clear = clear
         self.hashed = hashed
         self.grant_option = grant_option
+        # Additional (user, host) pairs to grant the same permissions to.
+        self.grantees = grantees or []
 
     def __repr__(self):
         return str(self)
@@ -179,7 +182,11 @@ class Grant(object):
 
     @property
     def _whom(self):
-        return f"TO {self._user_host}"
+        user_hosts = ["`%s`@`%s`" % (user or "", host or "%")
+                      for user, host in self.grantees]
+        if self.user or not user_hosts:
+            user_hosts.insert(0, self._user_host)
+        return "TO %s" % ", ".join(user_hosts)
 
     @property
     def _with(self):
@@ -328,6 +335,35 @@ class CreateUser(object):
         return " ".join(query) + ";"
 
 
+class CreateUsers(object):
+    """Create multiple users in a single statement."""
+
+    def __init__(self, users):
+        """
+        :param users:   Users to be created.
+        :type users:    list of CreateUser
+        """
+        self.users = users
+
+    def __repr__(self):
+        return str(self)
+
+    @property
+    def keyArgs(self):
+        args = {}
+        for index, user in enumerate(self.users):
+            args['user%d' % index] = user.user
+            args['host%d' % index] = user._host
+        return args
+
+    def __str__(self):
+        specs = []
+        for index, user in enumerate(self.users):
+            spec = [":user%d@:host%d" % (index, index), user._identity]
+            specs.append(" ".join([q for q in spec if q]))
+        return "CREATE USER %s;" % ", ".join(specs)
+
+
 class RenameUser(object):
 
     def __init__(self, user, host=None, new_user=None,
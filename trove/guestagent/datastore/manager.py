@@ -90,6 +90,7 @@ class Manager(periodic_task.PeriodicTasks, SSLManager):
         self._guest_log_loaded_context = None
         self._guest_log_cache = None
         self._guest_log_defs = None
+        self._guest_log_state = None
 
         # Module
         self.module_driver_manager = driver_manager.ModuleDriverManager()
@@ -484,6 +485,13 @@ class Manager(periodic_task.PeriodicTasks, SSLManager):
             self._guest_log_defs.update(self.guestagent_log_defs)
         return self._guest_log_defs
 
+    @property
+    def guest_log_state(self):
+        """The persisted state of the guest logs, see LogStateIndex."""
+        if self._guest_log_state is None:
+            self._guest_log_state = guest_log.LogStateIndex()
+        return self._guest_log_state
+
     def get_guest_log_cache(self):
         """Make sure the guest_log_cache is loaded and return it."""
         self._refresh_guest_log_cache()
@@ -518,11 +526,17 @@ class Manager(periodic_task.PeriodicTasks, SSLManager):
                         gl_def[self.GUEST_LOG_TYPE_LABEL],
                         gl_def[self.GUEST_LOG_USER_LABEL],
                         gl_def[self.GUEST_LOG_FILE_LABEL],
-                        exposed)
+                        exposed, state_index=self.guest_log_state)
 
                     if (gl_def[self.GUEST_LOG_TYPE_LABEL] ==
                             guest_log.LogType.USER):
+                        # The datastore configuration decides, keep the
+                        # index in line with it, e.g. after overrides.
                         guestlog.enabled = self.is_log_enabled(log_name)
+                        if (self.guest_log_state.get(log_name).get(
+                                'enabled') != guestlog.enabled):
+                            self.guest_log_state.update(
+                                log_name, enabled=guestlog.enabled)
                         guestlog.status = (guest_log.LogStatus.Enabled
                                            if guestlog.enabled
                                            else guest_log.LogStatus.Disabled)
@@ -579,6 +593,7 @@ class Manager(periodic_task.PeriodicTasks, SSLManager):
                 if requires_change:
                     self.guest_log_enable(context, log_name, disable)
                     gl_cache[log_name].enabled = enable
+                    self.guest_log_state.update(log_name, enabled=enable)
                     gl_cache[log_name].status = (
                         guest_log.LogStatus.Enabled
                         if enable
@@ -732,7 +747,8 @@ class Manager(periodic_task.PeriodicTasks, SSLManager):
             datastore = module.get('datastore', self.MODULE_APPLY_TO_ALL)
             ds_version = module.get('datastore_version',
                                     self.MODULE_APPLY_TO_ALL)
-            contents = module.get('contents', None)
+            contents = module_manager.ModuleManager.unpack_contents(
+                context, module)
             md5 = module.get('md5', None)
             auto_apply = module.get('auto_apply', True)
             visible = module.get('visible', True)
@@ -760,9 +776,15 @@ class Manager(periodic_task.PeriodicTasks, SSLManager):
                 driver, module_type, name, tenant, datastore, ds_version,
                 contents, id, md5, auto_apply, visible, is_admin)
             results.append(result)
+        # The contents of the modules updated since are not needed anymore.
+        module_manager.ModuleManager.prune_store()
         LOG.info("Returning list of modules: %s", results)
         return results
 
+    def module_missing(self, context, md5s=None):
+        LOG.debug("Checking for the contents of modules %s.", md5s)
+        return module_manager.ModuleManager.missing_contents(md5s or [])
+
     def module_remove(self, context, module=None):
         LOG.info("Removing module.")
         module = module['module']
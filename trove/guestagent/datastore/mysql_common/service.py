@@ -13,6 +13,7 @@
 #    limitations under the License.
 
 import abc
+from collections import OrderedDict
 import os
 import re
 
@@ -65,27 +66,39 @@ BACKUP_LOG = re.compile(r'.*Backup successfully, checksum: (?P<checksum>.*), '
 class BaseMySqlAdmin(object, metaclass=abc.ABCMeta):
     """Handles administrative tasks on the MySQL database."""
 
+    # Maximum number of users created or granted access per statement.
+    MAX_BATCH_SIZE = 100
+
     def __init__(self, mysql_root_access, mysql_app):
         self.mysql_root_access = mysql_root_access
         self.mysql_app = mysql_app
 
-    def _associate_dbs(self, user):
-        """Internal. Given a MySQLUser, populate its databases attribute."""
-        LOG.debug("Associating dbs to user %(name)s at %(host)s.",
-                  {'name': user.name, 'host': user.host})
+    def _associate_dbs(self, users):
+        """Internal. Given a list of MySQLUsers, populate their databases
+        attribute.
+        """
+        if not users:
+            return
+
+        grantees = {"'%s'@'%s'" % (user.name, user.host): user
+                    for user in users}
+        LOG.debug("Associating dbs to users %s.", list(grantees))
         with mysql_util.SqlClient(
                 self.mysql_app.get_engine(), use_flush=True) as client:
             q = sql_query.Query()
             q.columns = ["grantee", "table_schema"]
             q.tables = ["information_schema.SCHEMA_PRIVILEGES"]
             q.group = ["grantee", "table_schema"]
-            q.where = ["privilege_type != 'USAGE'"]
-            t = text(str(q))
-            db_result = client.execute(t)
+            q.where = ["privilege_type != 'USAGE'",
+                       "grantee IN :grantees"]
+            t = text(str(q)).bindparams(
+                sqlalchemy.bindparam('grantees', expanding=True))
+            db_result = client.execute(t, grantees=list(grantees))
             for db in db_result:
                 LOG.debug("\t db: %s.", db)
-                if db._mapping['grantee'] == "'%s'@'%s'" % (user.name,
-                                                            user.host):
+                # The comparison in the query is not case sensitive.
+                user = grantees.get(db._mapping['grantee'])
+                if user is not None:
                     user.databases = db._mapping['table_schema']
 
     def change_passwords(self, users):
@@ -136,11 +149,14 @@ class BaseMySqlAdmin(object, metaclass=abc.ABCMeta):
 
     def create_databases(self, databases):
         """Create the list of specified databases."""
+        # Validate all the databases before creating any of them.
+        mydbs = [models.MySQLSchema.deserialize(item) for item in databases]
+        for mydb in mydbs:
+            mydb.check_create()
+
         with mysql_util.SqlClient(
                 self.mysql_app.get_engine(), use_flush=True) as client:
-            for item in databases:
-                mydb = models.MySQLSchema.deserialize(item)
-                mydb.check_create()
+            for mydb in mydbs:
                 cd = sql_query.CreateDatabase(mydb.name,
                                               mydb.character_set,
                                               mydb.collate)
@@ -151,25 +167,115 @@ class BaseMySqlAdmin(object, metaclass=abc.ABCMeta):
     def create_users(self, users):
         """Create users and grant them privileges for the
            specified databases.
+
+        Users are created in batches of up to MAX_BATCH_SIZE users per
+        statement. Access is granted with a single statement per database.
+        When a batch statement fails, it is run again for each of its users
+        so the users that failed are known; the others are still created.
+        A failed CREATE USER is not atomic on MariaDB and MySQL 5.7, the
+        accounts it created anyway are not created again. The failures are
+        raised at the end.
+        """
+        # Validate all the users before creating any of them.
+        mysql_users = [models.MySQLUser.deserialize(item) for item in users]
+        grants = {}
+        for user in mysql_users:
+            user.check_create()
+            for database in user.databases:
+                mydb = models.MySQLSchema.deserialize(database)
+                grants.setdefault(mydb.name, []).append((user.name,
+                                                         user.host))
+
+        failures = OrderedDict()
+        for batch in self._batches(mysql_users):
+            queries = [(user.name,
+                        sql_query.CreateUser(user.name, host=user.host,
+                                             clear=user.password))
+                       for user in batch]
+            LOG.debug('Creating users: %s',
+                      ', '.join(user.name for user in batch))
+            existing = self._existing_users(batch)
+            self._execute_batch(
+                sql_query.CreateUsers([cu for _, cu in queries]),
+                queries, 'create user', failures,
+                applied=lambda: {
+                    name for name, _ in
+                    self._existing_users(batch) - existing})
+
+        for database, grantees in grants.items():
+            grantees = [(name, host) for name, host in grantees
+                        if name not in failures]
+            for batch in self._batches(grantees):
+                g = sql_query.Grant(permissions='ALL', database=database,
+                                    grantees=batch)
+                LOG.debug('Creating user, command: %s', str(g))
+                self._execute_batch(
+                    g, [(name, sql_query.Grant(permissions='ALL',
+                                               database=database,
+                                               user=name, host=host))
+                        for name, host in batch],
+                    'grant access on %s to' % database, failures)
+
+        if failures:
+            raise exception.UserCreationError(failures=failures)
+
+    def _execute_batch(self, batch_query, item_queries, action, failures,
+                       applied=None):
+        """Execute the statement of a batch, or of each item if it fails.
+
+        :param item_queries: the (name, query) of each item of the batch.
+        :param failures: the errors of the failed items are added to it, by
+                         name.
+        :param applied: called if the batch statement fails, returns the
+                        names of the items it applied anyway.
         """
+        try:
+            self._execute_query(batch_query)
+            return
+        except exc.DBAPIError as err:
+            LOG.warning('Failed to %(action)s %(names)s in one statement, '
+                        'running one statement each: %(err)s',
+                        {'action': action, 'err': err.orig,
+                         'names': ', '.join(name for name, _ in item_queries)})
+
+        done = applied() if applied else set()
+        for name, item_query in item_queries:
+            if name in done:
+                LOG.debug('%(action)s %(name)s: done by the batch',
+                          {'action': action, 'name': name})
+                continue
+            try:
+                self._execute_query(item_query)
+            except exc.DBAPIError as err:
+                LOG.error('Failed to %(action)s %(name)s: %(err)s',
+                          {'action': action, 'name': name, 'err': err.orig})
+                failures.setdefault(name, []).append(str(err.orig))
+            else:
+                LOG.debug('%(action)s %(name)s: done',
+                          {'action': action, 'name': name})
+
+    def _existing_users(self, users):
+        """Return the (name, host) of the accounts of the users that exist."""
+        q = sql_query.Query()
+        q.columns = ['User', 'Host']
+        q.tables = ['mysql.user']
+        q.where = ["User IN (%s)" % ', '.join("'%s'" % user.name
+                                              for user in users)]
         with mysql_util.SqlClient(
                 self.mysql_app.get_engine(), use_flush=True) as client:
-            for item in users:
-                user = models.MySQLUser.deserialize(item)
-                user.check_create()
+            result = client.execute(text(str(q))).fetchall()
+        accounts = {(row._mapping['User'], row._mapping['Host'])
+                    for row in result}
+        return {(user.name, user.host) for user in users} & accounts
 
-                cu = sql_query.CreateUser(user.name, host=user.host,
-                                          clear=user.password)
-                t = text(str(cu))
-                client.execute(t, **cu.keyArgs)
+    def _execute_query(self, q):
+        with mysql_util.SqlClient(
+                self.mysql_app.get_engine(), use_flush=True) as client:
+            client.execute(text(str(q)), **getattr(q, 'keyArgs', {}))
 
-                for database in user.databases:
-                    mydb = models.MySQLSchema.deserialize(database)
-                    g = sql_query.Grant(permissions='ALL', database=mydb.name,
-                                        user=user.name, host=user.host)
-                    t = text(str(g))
-                    LOG.debug('Creating user, command: %s', str(g))
-                    client.execute(t)
+    def _batches(self, items):
+        for index in range(0, len(items), self.MAX_BATCH_SIZE):
+            yield items[index:index + self.MAX_BATCH_SIZE]
 
     def delete_database(self, database):
         """Delete the specified database."""
@@ -229,7 +335,7 @@ class BaseMySqlAdmin(object, metaclass=abc.ABCMeta):
                 return None
             found_user = result[0]
             user.host = found_user._mapping['Host']
-            self._associate_dbs(user)
+            self._associate_dbs([user])
             return user
 
     def grant_access(self, username, hostname, databases):
@@ -339,7 +445,7 @@ class BaseMySqlAdmin(object, metaclass=abc.ABCMeta):
         ignored_user_names = "'%s'" % "', '".join(cfg.get_ignored_users())
         LOG.debug("The following user names are on ignore list and will "
                   "be omitted from the listing: %s", ignored_user_names)
-        users = []
+        mysql_users = []
         with mysql_util.SqlClient(
                 self.mysql_app.get_engine(), use_flush=True) as client:
             iq = sql_query.Query()  # Inner query.
@@ -371,11 +477,14 @@ class BaseMySqlAdmin(object, metaclass=abc.ABCMeta):
                 mysql_user = models.MySQLUser(name=row._mapping['User'],
                                               host=row._mapping['Host'])
                 mysql_user.check_reserved()
-                self._associate_dbs(mysql_user)
                 next_marker = row._mapping['Marker']
-                users.append(mysql_user.serialize())
+                mysql_users.append(mysql_user)
         if limit is not None and result.rowcount <= limit:
             next_marker = None
+
+        # Look up the databases of all listed users at once.
+        self._associate_dbs(mysql_users)
+        users = [mysql_user.serialize() for mysql_user in mysql_users]
         LOG.info("users = %s", str(users))
 
         return users, next_marker
@@ -753,6 +862,18 @@ class BaseMySqlApp(service.BaseDbApp):
             command = (f"{command} "
                        f"--backup-encryption-key={CONF.backup_aes_cbc_key}")
 
+        if CONF.backup_restore_cache_dir:
+            cache_dir = CONF.backup_restore_cache_dir
+            volumes[cache_dir] = {'bind': cache_dir, 'mode': 'rw'}
+            command = (
+                f"{command} --restore-cache-dir={cache_dir} "
+                f"--restore-cache-entries={CONF.backup_restore_cache_entries}"
+            )
+
+        if CONF.backup_restore_prefetch_size:
+            command = (f"{command} --restore-prefetch-size="
+                       f"{CONF.backup_restore_prefetch_size}")
+
         LOG.debug('Stop the database and clean up the data before restore '
                   'from %s', backup_id)
         self.stop_db()
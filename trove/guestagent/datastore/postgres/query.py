@@ -153,6 +153,18 @@ class AccessQuery(object):
         """Query to grant user access to a schema."""
         return f'GRANT USAGE, CREATE ON SCHEMA "{schema}" TO "{user}"'
 
+    @classmethod
+    def grant_users(cls, users, database):
+        """Query to grant multiple users access to a database."""
+        roles = ', '.join(f'"{user}"' for user in users)
+        return f'GRANT ALL ON DATABASE "{database}" TO {roles}'
+
+    @classmethod
+    def grant_schema_users(cls, users, schema):
+        """Query to grant multiple users access to a schema."""
+        roles = ', '.join(f'"{user}"' for user in users)
+        return f'GRANT USAGE, CREATE ON SCHEMA "{schema}" TO {roles}'
+
     @classmethod
     def revoke(cls, user, database):
         """Query to revoke user access to a database."""
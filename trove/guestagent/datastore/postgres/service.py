@@ -11,10 +11,14 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+import contextlib
 import os
+import threading
+import time
 
 from oslo_log import log as logging
 import psycopg2
+from psycopg2 import extensions as psycopg2_extensions
 
 from collections import OrderedDict
 from trove.common import cfg
@@ -292,6 +296,18 @@ class PgSqlApp(service.BaseDbApp):
             command = (f"{command} "
                        f"--backup-encryption-key={CONF.backup_aes_cbc_key}")
 
+        if CONF.backup_restore_cache_dir:
+            cache_dir = CONF.backup_restore_cache_dir
+            volumes[cache_dir] = {'bind': cache_dir, 'mode': 'rw'}
+            command = (
+                f"{command} --restore-cache-dir={cache_dir} "
+                f"--restore-cache-entries={CONF.backup_restore_cache_entries}"
+            )
+
+        if CONF.backup_restore_prefetch_size:
+            command = (f"{command} --restore-prefetch-size="
+                       f"{CONF.backup_restore_prefetch_size}")
+
         LOG.debug('Stop the database and clean up the data before restore '
                   'from %s', backup_id)
         self.stop_db()
@@ -566,6 +582,9 @@ class PgSqlAdmin(object):
         """Create the list of specified databases.
 
         The databases parameter is a list of serialized Postgres databases.
+
+        CREATE DATABASE cannot be executed inside a transaction block so
+        the databases are created one at a time on a pooled connection.
         """
         for database in databases:
             self.create_database(models.PostgreSQLSchema.deserialize(database))
@@ -603,6 +622,9 @@ class PgSqlAdmin(object):
         :type database:           PostgreSQLSchema
         """
         LOG.info(f"Dropping database {database.name}")
+        # An idle pooled connection to the database would make the drop
+        # fail.
+        reset_connection_pools(database=database.name)
         self.psql(query.DatabaseQuery.drop(name=database.name))
 
     def list_databases(self, limit=None, marker=None, include_marker=False):
@@ -629,9 +651,70 @@ class PgSqlAdmin(object):
         """Create users and grant privileges for the specified databases.
 
         The users parameter is a list of serialized Postgres users.
+
+        All users are created in a single transaction. The privileges are
+        then granted in one transaction per database. When a transaction
+        fails, it is run again for each of its users so the users that
+        failed are known; the others are still created. The failures are
+        raised at the end.
         """
+        users = [models.PostgreSQLUser.deserialize(user) for user in users]
+
+        grants = OrderedDict()
         for user in users:
-            self.create_user(models.PostgreSQLUser.deserialize(user), None)
+            for db in user.databases:
+                database = models.PostgreSQLSchema.deserialize(db).name
+                grants.setdefault(database, []).append(user.name)
+        for database in grants:
+            if not self._database_exists(database):
+                raise exception.DatabaseNotFound(database=database)
+
+        statements = OrderedDict()
+        for user in users:
+            LOG.info(f"Creating user {user.name}")
+            statements[user.name] = query.UserQuery.create(
+                user.name, user.password, None)
+        failures = OrderedDict()
+        self._execute_batch(
+            lambda names: self.connection.execute_transaction(
+                [statements[name] for name in names]),
+            list(statements), 'create user', failures)
+
+        for database, usernames in grants.items():
+            self._execute_batch(
+                lambda names: self._grant_access_bulk(database, names),
+                [name for name in usernames if name not in failures],
+                f'grant access on {database} to', failures)
+
+        if failures:
+            raise exception.UserCreationError(failures=failures)
+
+    def _execute_batch(self, execute, names, action, failures):
+        """Execute the statements of a batch of users, or of each user if
+        they fail.
+
+        :param execute: called with the names of the users to run the
+                        statements for.
+        :param failures: the errors of the failed users are added to it, by
+                         name.
+        """
+        if not names:
+            return
+        try:
+            execute(names)
+            return
+        except psycopg2.Error as err:
+            LOG.warning(f"Failed to {action} {', '.join(names)} in one "
+                        f"transaction, running one transaction each: {err}")
+
+        for name in names:
+            try:
+                execute([name])
+            except psycopg2.Error as err:
+                LOG.error(f"Failed to {action} {name}: {err}")
+                failures.setdefault(name, []).append(str(err).strip())
+            else:
+                LOG.debug(f"{action} {name}: done")
 
     def create_user(self, user, encrypt_password=None, *options):
         """Create a user and grant privileges for the specified databases.
@@ -676,6 +759,26 @@ class PgSqlAdmin(object):
             [db.name for db in databases],
         )
 
+    def _grant_access_bulk(self, database, usernames):
+        """Give several users permission to use a given existing database
+        in a single transaction.
+        """
+        LOG.info(f"Granting users {', '.join(usernames)} access to "
+                 f"database {database} and schema public")
+        statements = [
+            query.AccessQuery.grant_users(users=usernames,
+                                          database=database),
+            query.AccessQuery.grant_schema_users(users=usernames,
+                                                 schema='public'),
+        ]
+
+        self.use_database(database)
+        try:
+            self.connection.execute_transaction(statements)
+        finally:
+            # Restore connection back to the superuser db
+            self.use_database(SUPER_USER_NAME)
+
     def list_users(self, limit=None, marker=None, include_marker=False):
         """List all users on the instance along with their access permissions.
         Return a paginated list of serialized Postgres users.
@@ -690,8 +793,11 @@ class PgSqlAdmin(object):
             query.UserQuery.list(ignore=self.ignore_users)
         )
 
-        names = set([row[0].strip() for row in results])
-        return [self._build_user(name, results) for name in names]
+        # Group the access rows by user to build each user in one pass.
+        acls = OrderedDict()
+        for row in results:
+            acls.setdefault(row[0].strip(), []).append(row)
+        return [self._build_user(name, acl) for name, acl in acls.items()]
 
     def _build_user(self, username, acl=None):
         """Build a model representation of a Postgres user.
@@ -795,6 +901,10 @@ class PgSqlAdmin(object):
                 *options)
         )
 
+        if user.name == self.connection.user:
+            # Do not reuse connections authenticated with old credentials.
+            reset_connection_pools(user.name)
+
     def update_attributes(self, username, hostname, user_attrs):
         """Change the attributes of one existing user.
 
@@ -892,6 +1002,11 @@ class PostgresConnection(object):
         self.connect_str = (f"user='{self.user}' password='{self.password}' "
                             f"host='{self.host}' port='{self.port}' "
                             f"dbname='{self.database}'")
+        # Only the connections to the maintenance database of the user are
+        # pooled. An idle connection to a user database would keep it from
+        # being dropped, and one pool per database would not scale with
+        # the number of databases.
+        self.pooled = self.database == self.user
 
         self._pconn = None
 
@@ -906,18 +1021,50 @@ class PostgresConnection(object):
         """
         return self._execute_stmt(query, identifiers, data_values, True)
 
+    def execute_transaction(self, statements):
+        """Execute non-returning statements in a single transaction.
+        """
+        with self._pooled_connection(autocommit=False) as connection:
+            with connection.cursor() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+            connection.commit()
+
     def _execute_stmt(self, statement, identifiers, data_values, fetch,
                       autocommit=False):
         cmd = self._bind(statement, identifiers)
-        connection = psycopg2.connect(self.connect_str)
-        connection.autocommit = autocommit
-        try:
+        with self._pooled_connection(autocommit) as connection:
             with connection.cursor() as cursor:
                 cursor.execute(cmd, data_values)
                 if fetch:
                     return cursor.fetchall()
+
+    @contextlib.contextmanager
+    def _pooled_connection(self, autocommit):
+        if not self.pooled:
+            connection = psycopg2.connect(self.connect_str)
+            try:
+                connection.autocommit = autocommit
+                yield connection
+            finally:
+                connection.close()
+            return
+
+        pool = get_connection_pool(self.user, self.connect_str,
+                                   self.database)
+        connection = pool.acquire()
+        try:
+            connection.autocommit = autocommit
+            yield connection
         finally:
-            connection.close()
+            if not autocommit and not connection.closed:
+                # Discard any uncommitted changes as closing the connection
+                # would.
+                try:
+                    connection.rollback()
+                except psycopg2.Error:
+                    pass
+            pool.release(connection)
 
     def _bind(self, statement, identifiers):
         if identifiers:
@@ -947,3 +1094,132 @@ class PostgresConnection(object):
         with conn.cursor() as cursor:
             cursor.execute(query)
             return cursor.fetchall()
+
+
+class PostgresConnectionPool(object):
+    """A bounded pool of idle connections sharing a connection string.
+
+    Connections are health-checked before they are reused. At most
+    'max_size' idle connections are kept open, and no more than the
+    'idle_slots' semaphore shared by all the pools allows. The others are
+    closed when released.
+    """
+
+    # Ping connections that have been idle for longer than this (seconds).
+    HEALTH_CHECK_INTERVAL = 30
+
+    def __init__(self, user, connect_str, max_size, database=None,
+                 idle_slots=None):
+        self.user = user
+        self.database = database or user
+        self._connect_str = connect_str
+        self._max_size = max_size
+        self._idle_slots = idle_slots
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                connection, released_at = self._idle.pop()
+                self._free_slot()
+            if self._is_healthy(connection, released_at):
+                return connection
+            self._close(connection)
+
+        return psycopg2.connect(self._connect_str)
+
+    def release(self, connection):
+        if (not connection.closed and
+                connection.get_transaction_status() ==
+                psycopg2_extensions.TRANSACTION_STATUS_IDLE):
+            with self._lock:
+                if len(self._idle) < self._max_size and self._take_slot():
+                    self._idle.append((connection, time.monotonic()))
+                    return
+
+        self._close(connection)
+
+    def clear(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+            for _ in idle:
+                self._free_slot()
+        for connection, _ in idle:
+            self._close(connection)
+
+    def _take_slot(self):
+        return (self._idle_slots is None or
+                self._idle_slots.acquire(blocking=False))
+
+    def _free_slot(self):
+        if self._idle_slots is not None:
+            self._idle_slots.release()
+
+    def _is_healthy(self, connection, released_at):
+        if connection.closed:
+            return False
+
+        if time.monotonic() - released_at > self.HEALTH_CHECK_INTERVAL:
+            # The server may have closed the connection in the meantime
+            # (e.g. it got restarted).
+            try:
+                connection.autocommit = True
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+            except psycopg2.Error:
+                return False
+
+        return True
+
+    def _close(self, connection):
+        try:
+            connection.close()
+        except psycopg2.Error:
+            pass
+
+
+_connection_pools = {}
+_connection_pools_lock = threading.Lock()
+# The idle connections kept open by all the pools, created with the first
+# pool.
+_idle_slots = None
+
+
+def get_connection_pool(user, connect_str, database=None):
+    """Return the connection pool for a given connection string."""
+    global _idle_slots
+
+    with _connection_pools_lock:
+        pool = _connection_pools.get(connect_str)
+        if pool is None:
+            if _idle_slots is None:
+                _idle_slots = threading.BoundedSemaphore(
+                    CONF.postgresql.connection_pool_max_connections)
+            pool = PostgresConnectionPool(
+                user, connect_str, CONF.postgresql.connection_pool_size,
+                database=database, idle_slots=_idle_slots)
+            _connection_pools[connect_str] = pool
+
+    return pool
+
+
+def reset_connection_pools(user=None, database=None):
+    """Close all pooled connections of a given user and/or to a given
+    database (all of them if neither is given).
+    """
+    global _idle_slots
+
+    pools = []
+    with _connection_pools_lock:
+        for connect_str, pool in list(_connection_pools.items()):
+            if ((user is None or pool.user == user) and
+                    (database is None or pool.database == database)):
+                pools.append(_connection_pools.pop(connect_str))
+        if not _connection_pools:
+            _idle_slots = None
+
+    for pool in pools:
+        pool.clear()
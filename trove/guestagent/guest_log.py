@@ -17,6 +17,8 @@ import hashlib
 import os
 from pathlib import Path
 from requests.exceptions import ConnectionError
+import threading
+import time
 
 from oslo_log import log as logging
 from swiftclient.client import ClientException
@@ -27,6 +29,7 @@ from trove.common import exception
 from trove.common.i18n import _
 from trove.common import stream_codecs
 from trove.common import timeutils
+from trove.guestagent.common import guestagent_utils
 from trove.guestagent.common import operating_system
 from trove.guestagent.common.operating_system import FileMode
 
@@ -78,6 +81,55 @@ class LogStatus(enum.Enum):
     Restart_Completed = 9
 
 
+class LogStateIndex(object):
+    """Published state of the guest logs, persisted on the guest.
+
+    Keeps, for each log, what was last published to Swift (size, header
+    digest, container and expiry time of the objects) and whether the log
+    is enabled, so that listing the logs needs no Swift request.
+    """
+
+    DEFAULT_FILE = guestagent_utils.build_file_path('~',
+                                                    'guest_log_state.json')
+
+    def __init__(self, state_file=None):
+        self._file = state_file or self.DEFAULT_FILE
+        self._lock = threading.Lock()
+        self._codec = stream_codecs.JsonCodec()
+        self._state = None
+
+    def _load(self):
+        if self._state is None:
+            try:
+                self._state = operating_system.read_file(
+                    self._file, codec=self._codec)
+            except Exception:
+                LOG.debug("No guest log state found in %s.", self._file)
+                self._state = {}
+        return self._state
+
+    def get(self, log_name):
+        """Return the state of a log, without the published details if the
+        published objects expired.
+        """
+        with self._lock:
+            state = dict(self._load().get(log_name, {}))
+        if state.get('expires') and state['expires'] <= time.time():
+            for key in ('header_digest', 'container', 'expires'):
+                state.pop(key, None)
+            state['published_size'] = 0
+        return state
+
+    def update(self, log_name, **details):
+        with self._lock:
+            state = dict(self._load())
+            state[log_name] = dict(state.get(log_name, {}), **details)
+            tmp_file = self._file + '.tmp'
+            operating_system.write_file(tmp_file, state, codec=self._codec)
+            os.rename(tmp_file, self._file)
+            self._state = state
+
+
 class GuestLog(object):
 
     MF_FILE_SUFFIX = '_metafile'
@@ -88,7 +140,7 @@ class GuestLog(object):
     MF_LABEL_LOG_HEADER = 'log_header_digest'
 
     def __init__(self, log_context, log_name, log_type, log_user, log_file,
-                 log_exposed):
+                 log_exposed, state_index=None):
         self._context = log_context
         self._name = log_name
         self._type = log_type
@@ -99,6 +151,7 @@ class GuestLog(object):
         self._published_size = None
         self._header_digest = 'abc'
         self._published_header_digest = None
+        self._published_expires = None
         self._status = None
         self._cached_context = None
         self._cached_swift_client = None
@@ -106,6 +159,7 @@ class GuestLog(object):
         self._file_readable = False
         self._container_name = None
         self._codec = stream_codecs.JsonCodec()
+        self._state_index = state_index
 
         self._set_status(self._type == LogType.USER,
                          LogStatus.Disabled, LogStatus.Enabled)
@@ -216,6 +270,13 @@ class GuestLog(object):
             raise exception.LogAccessForbidden(action='show', log=self._name)
 
     def _refresh_details(self):
+        if self._published_size is None and self._state_index:
+            state = self._state_index.get(self._name)
+            if 'published_size' in state:
+                self._published_size = state['published_size']
+                self._published_header_digest = state.get('header_digest')
+                self._container_name = state.get('container')
+
         if self._published_size is None:
             # Initializing, so get all the values
             try:
@@ -238,8 +299,10 @@ class GuestLog(object):
                 # This exception contains another exception that we want
                 exc = e.args[0]
                 raise exc
-
-        self._update_details()
+            self._update_details()
+            self._save_state()
+        else:
+            self._update_details()
         LOG.debug("Log size for '%(name)s' set to %(size)d "
                   "(published %(published)d)",
                   {'name': self._name, 'size': self._size,
@@ -332,6 +395,7 @@ class GuestLog(object):
         for swift_file in swift_files:
             self.swift_client.delete_object(container_name, swift_file)
         self._published_size = 0
+        self._save_state()
 
     def _publish_to_container(self, log_filename):
         log_component, log_lines = '', 0
@@ -388,6 +452,22 @@ class GuestLog(object):
                                      headers=self._get_headers())
         LOG.debug("_put_meta_details has published log size as %s",
                   self._published_size)
+        self._published_header_digest = self._header_digest
+        self._published_expires = time.time() + CONF.guest_log_expiry
+        self._save_state()
+
+    def _save_state(self):
+        if not self._state_index:
+            return
+        if self._published_size:
+            self._state_index.update(
+                self._name, published_size=self._published_size,
+                header_digest=self._published_header_digest,
+                container=self._container_name, size=self._size,
+                expires=self._published_expires)
+        else:
+            self._state_index.update(self._name, published_size=0,
+                                     size=self._size)
 
     def _metafile_name(self):
         return self._object_prefix().rstrip('/') + '_metafile'
@@ -408,4 +488,6 @@ class GuestLog(object):
         headers, metafile_details = self.swift_client.get_object(
             container_name, metafile_name)
         LOG.debug("Found meta details for '%s'", self._name)
+        if headers.get('x-delete-at'):
+            self._published_expires = int(headers['x-delete-at'])
         return self._codec.deserialize(metafile_details)
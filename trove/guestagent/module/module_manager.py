@@ -15,11 +15,14 @@
 #
 
 import datetime
+import hashlib
 import operator
 import os
+import threading
 
 from oslo_log import log as logging
 
+from trove.common import clients
 from trove.common import exception
 from trove.common.i18n import _
 from trove.common import stream_codecs
@@ -39,6 +42,16 @@ class ModuleManager(object):
     MODULE_BASE_DIR = guestagent_utils.build_file_path('~', 'modules')
     MODULE_CONTENTS_FILENAME = 'contents.dat'
     MODULE_RESULT_FILENAME = 'result.json'
+    # Results of all the modules, so that listing them does not need to
+    # walk MODULE_BASE_DIR.
+    MODULE_REGISTRY_FILENAME = 'registry.json'
+    # Contents of all the modules applied, by md5 sum, so that a module
+    # applied again or to several datastores does not need to be sent again.
+    MODULE_STORE_DIR = guestagent_utils.build_file_path(
+        MODULE_BASE_DIR, '.store')
+
+    _registry = None
+    _registry_lock = threading.Lock()
 
     @classmethod
     def get_current_timestamp(cls):
@@ -99,12 +112,93 @@ class ModuleManager(object):
 
     @classmethod
     def write_module_contents(cls, module_dir, contents, md5):
+        """Write the module contents in the module directory, unless they
+        are there already. No contents means they are in the store.
+        """
         contents_file = cls.build_contents_filename(module_dir)
+        if contents is None:
+            contents = cls.load_contents(md5)
+        elif md5:
+            cls.store_contents(contents, md5)
+
+        if md5 and operating_system.exists(contents_file):
+            current = cls.read_module_result(module_dir, {'md5': None})
+            if current.get('md5') == md5:
+                LOG.debug("Contents of module in %s are up to date.",
+                          module_dir)
+                return contents_file
         operating_system.write_file(contents_file, contents,
                                     codec=stream_codecs.Base64Codec(),
                                     encode=False)
         return contents_file
 
+    @classmethod
+    def build_store_filename(cls, md5):
+        return guestagent_utils.build_file_path(cls.MODULE_STORE_DIR, md5)
+
+    @classmethod
+    def missing_contents(cls, md5s):
+        """Return the md5 sums of the module contents not in the store."""
+        return [md5 for md5 in md5s
+                if not operating_system.exists(cls.build_store_filename(md5))]
+
+    @classmethod
+    def store_contents(cls, contents, md5):
+        if isinstance(contents, str):
+            contents = contents.encode('utf-8')
+        if hashlib.md5(contents, usedforsecurity=False).hexdigest() != md5:
+            raise exception.ModuleInvalid(
+                reason=_("Contents do not match the md5 sum %s") % md5)
+        store_file = cls.build_store_filename(md5)
+        if not operating_system.exists(store_file):
+            operating_system.ensure_directory(cls.MODULE_STORE_DIR,
+                                              force=True)
+            operating_system.write_file(store_file, contents, encode=False)
+
+    @classmethod
+    def prune_store(cls):
+        """Remove the stored contents no applied module uses anymore."""
+        if not operating_system.exists(cls.MODULE_STORE_DIR,
+                                       is_directory=True):
+            return
+        with cls._registry_lock:
+            used = {result.get('md5')
+                    for result in cls.read_registry().values()
+                    if not result.get('removed')}
+        for store_file in operating_system.list_files_in_directory(
+                cls.MODULE_STORE_DIR):
+            if os.path.basename(store_file) not in used:
+                LOG.debug("Removing unused module contents %s.", store_file)
+                operating_system.remove(store_file, force=True)
+
+    @classmethod
+    def load_contents(cls, md5):
+        store_file = cls.build_store_filename(md5)
+        if not md5 or not operating_system.exists(store_file):
+            raise exception.ModuleInvalid(
+                reason=_("Contents with md5 sum %s not found") % md5)
+        return operating_system.read_file(store_file, decode=False)
+
+    @classmethod
+    def unpack_contents(cls, context, module):
+        """Return the contents of a module sent by the taskmanager or API.
+
+        The contents are either sent as is, compressed, stored in Swift or,
+        if the guest has them already, not sent at all.
+        """
+        location = module.get('contents_location')
+        if location:
+            swift = clients.swift_client(context)
+            _headers, contents = swift.get_object(location['container'],
+                                                  location['object'])
+            return contents
+        contents = module.get('contents')
+        if contents and module.get('contents_encoding') == 'zlib':
+            return stream_codecs.ZlibBase64Codec().deserialize(contents)
+        if not contents and module.get('md5'):
+            return cls.load_contents(module['md5'])
+        return contents
+
     @classmethod
     def build_contents_filename(cls, module_dir):
         contents_file = guestagent_utils.build_file_path(
@@ -165,8 +259,73 @@ class ModuleManager(object):
     @classmethod
     def write_module_result(cls, result_file, result):
         result_file = cls.get_result_filename(result_file)
-        operating_system.write_file(
-            result_file, result, codec=stream_codecs.JsonCodec())
+        cls._write_atomic(result_file, result)
+        with cls._registry_lock:
+            registry = dict(cls.read_registry())
+            registry[cls._registry_key(result_file)] = dict(result)
+            registry_file = cls.get_registry_filename()
+            cls._write_atomic(registry_file, registry)
+            cls._registry = (registry_file, registry)
+
+    @classmethod
+    def _write_atomic(cls, path, data):
+        """Write JSON data to a file through a rename, so that a crash never
+        leaves a truncated file behind.
+        """
+        tmp_file = path + '.tmp'
+        operating_system.write_file(tmp_file, data,
+                                    codec=stream_codecs.JsonCodec())
+        os.rename(tmp_file, path)
+
+    @classmethod
+    def get_registry_filename(cls):
+        return guestagent_utils.build_file_path(
+            cls.MODULE_BASE_DIR, cls.MODULE_REGISTRY_FILENAME)
+
+    @classmethod
+    def _registry_key(cls, result_file):
+        return os.path.relpath(os.path.dirname(result_file),
+                               cls.MODULE_BASE_DIR)
+
+    @classmethod
+    def read_registry(cls):
+        """Return the results of all the modules, by module directory
+        relative to MODULE_BASE_DIR.
+
+        The registry is kept in memory and rebuilt from the result files
+        if it is missing, e.g. on guests upgraded from an older agent.
+        """
+        registry_file = cls.get_registry_filename()
+        if cls._registry is not None and cls._registry[0] == registry_file:
+            return cls._registry[1]
+
+        try:
+            registry = operating_system.read_file(
+                registry_file, codec=stream_codecs.JsonCodec())
+        except Exception:
+            registry = cls._scan_module_results()
+            if registry:
+                LOG.info("Rebuilt the module registry from %d results.",
+                         len(registry))
+                operating_system.ensure_directory(cls.MODULE_BASE_DIR,
+                                                  force=True)
+                cls._write_atomic(registry_file, registry)
+        cls._registry = (registry_file, registry)
+        return registry
+
+    @classmethod
+    def _scan_module_results(cls):
+        registry = {}
+        if not operating_system.exists(cls.MODULE_BASE_DIR,
+                                       is_directory=True):
+            return registry
+        result_files = operating_system.list_files_in_directory(
+            cls.MODULE_BASE_DIR, recursive=True,
+            pattern=cls.MODULE_RESULT_FILENAME)
+        for result_file in result_files:
+            registry[cls._registry_key(result_file)] = cls.read_module_result(
+                result_file)
+        return registry
 
     @classmethod
     def read_module_results(cls, is_admin=False, include_contents=False):
@@ -174,13 +333,12 @@ class ModuleManager(object):
         of them.
         """
         results = []
-        pattern = cls.MODULE_RESULT_FILENAME
-        result_files = operating_system.list_files_in_directory(
-            cls.MODULE_BASE_DIR, recursive=True, pattern=pattern)
-        for result_file in result_files:
-            result = cls.read_module_result(result_file)
+        with cls._registry_lock:
+            registry = cls.read_registry()
+        for key, result in registry.items():
             if (not result.get('removed') and
                     (is_admin or result.get('visible'))):
+                result = dict(result)
                 if include_contents:
                     codec = stream_codecs.Base64Codec()
                     # keep admin_only for backwards compatibility
@@ -191,7 +349,7 @@ class ModuleManager(object):
                             % result.get('name', 'Unknown'))
                         result['contents'] = codec.serialize(contents)
                     else:
-                        contents_dir = os.path.dirname(result_file)
+                        contents_dir = os.path.join(cls.MODULE_BASE_DIR, key)
                         contents_file = cls.build_contents_filename(
                             contents_dir)
                         result['contents'] = operating_system.read_file(
@@ -216,6 +374,7 @@ class ModuleManager(object):
             removed, message = driver.remove(
                 name, datastore, ds_version, contents_file)
             cls.remove_module_result(module_dir)
+            cls.prune_store()
         except Exception:
             LOG.exception("Could not remove module '%s'", name)
             raise
@@ -16,9 +16,11 @@
 
 """Model classes that form the core of instances functionality."""
 import base64
+import collections
 import json
 import os.path
 import re
+import time
 import yaml
 
 from datetime import datetime
@@ -2115,10 +2117,14 @@ class DBInstance(dbmodels.DatabaseModelBase):
 
     @property
     def key(self):
-        if self.encrypted_key is None:
+        return self.decrypt_key(self.encrypted_key)
+
+    @staticmethod
+    def decrypt_key(encrypted_key):
+        if encrypted_key is None:
             return None
 
-        return cu.decrypt_data(cu.decode_data(self.encrypted_key),
+        return cu.decrypt_data(cu.decode_data(encrypted_key),
                                CONF.inst_rpc_key_encr_key)
 
     @classmethod
@@ -2144,38 +2150,101 @@ class DBInstance(dbmodels.DatabaseModelBase):
 
 
 class instance_encryption_key_cache(object):
+    """LRU cache of the decrypted instance RPC encryption keys.
+
+    The conductor looks up the key of the sending instance for every
+    message it receives, so lookups and evictions are O(1). The capacity
+    and the time-to-live of the entries default to the values of
+    instance_rpc_encr_key_cache_size and instance_rpc_encr_key_cache_ttl.
+    """
 
-    def __init__(self, func, lru_cache_size=10):
-        self._table = {}
-        self._lru = []
+    def __init__(self, func, lru_cache_size=None, ttl=None):
+        self._table = collections.OrderedDict()
         self._lru_cache_size = lru_cache_size
+        self._ttl = ttl
         self._func = func
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
-    def get(self, instance_id):
-        if instance_id in self._table:
-            if self._lru.index(instance_id) > 0:
-                self._lru.remove(instance_id)
-                self._lru.insert(0, instance_id)
+    @property
+    def capacity(self):
+        if self._lru_cache_size is not None:
+            return self._lru_cache_size
+        return CONF.instance_rpc_encr_key_cache_size
 
-            return self._table[instance_id]
-        else:
-            val = self._func(instance_id)
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return CONF.instance_rpc_encr_key_cache_ttl
 
-            # BUG(1650518): Cleanup in the Pike release
-            if val is None:
+    def __len__(self):
+        return len(self._table)
+
+    def __contains__(self, instance_id):
+        return instance_id in self._table
+
+    def get(self, instance_id):
+        entry = self._table.get(instance_id)
+        if entry is not None:
+            val, expires = entry
+            if expires is None or expires > time.monotonic():
+                self._table.move_to_end(instance_id)
+                self.hits += 1
                 return val
+            del self._table[instance_id]
+
+        self.misses += 1
+        val = self._func(instance_id)
+
+        # BUG(1650518): Cleanup in the Pike release
+        if val is None:
+            return val
+
+        return self.put(instance_id, val)
+
+    def put(self, instance_id, val):
+        # We need string anyway
+        if isinstance(val, bytes):
+            val = encodeutils.safe_decode(val)
 
-            # We need string anyway
-            if isinstance(val, bytes):
-                val = encodeutils.safe_decode(val)
+        ttl = self.ttl
+        expires = time.monotonic() + ttl if ttl else None
+        self._table[instance_id] = (val, expires)
+        self._table.move_to_end(instance_id)
 
-            if len(self._lru) == self._lru_cache_size:
-                tail = self._lru.pop()
-                del self._table[tail]
+        capacity = self.capacity
+        while len(self._table) > capacity:
+            self._table.popitem(last=False)
+            self.evictions += 1
+        return val
 
-            self._lru.insert(0, instance_id)
-            self._table[instance_id] = val
-            return self._table[instance_id]
+    def warm(self, items):
+        """Load (instance_id, key) pairs without counting them as misses.
+
+        Only the free slots of the cache are filled, the first pairs taking
+        precedence over the later ones. Cached keys are never evicted.
+        """
+        free = self.capacity - len(self._table)
+        count = 0
+        for instance_id, val in items:
+            if count >= free:
+                break
+            if val is None or instance_id in self._table:
+                continue
+            self.put(instance_id, val)
+            self._table.move_to_end(instance_id, last=False)
+            count += 1
+        return count
+
+    def clear(self):
+        self._table.clear()
+
+    def stats(self):
+        return {'size': len(self._table), 'capacity': self.capacity,
+                'hits': self.hits, 'misses': self.misses,
+                'evictions': self.evictions}
 
     def __getitem__(self, instance_id):
         return self.get(instance_id)
@@ -2198,6 +2267,23 @@ def get_instance_encryption_key(instance_id):
     return _instance_encryption_key[instance_id]
 
 
+def warm_instance_encryption_key_cache():
+    """Load the keys of the most recently updated instances in one query."""
+    with DBInstance.query() as query:
+        query = query.filter_by(deleted=False)
+        query = query.filter(DBInstance.encrypted_key.isnot(None))
+        query = query.order_by(DBInstance.updated.desc())
+        query = query.limit(_instance_encryption_key.capacity)
+        rows = query.with_entities(DBInstance.id,
+                                   DBInstance.encrypted_key).all()
+
+    count = _instance_encryption_key.warm(
+        (instance_id, DBInstance.decrypt_key(encrypted_key))
+        for instance_id, encrypted_key in rows)
+    LOG.info("Loaded %d instance encryption keys into the cache.", count)
+    return count
+
+
 def module_instance_count(context, module_id, include_clustered=False):
     """Returns a summary of the instances that have applied a given
     module.  We use the SQLAlchemy query object directly here as there's
@@ -2345,6 +2431,29 @@ class InstanceServiceStatus(dbmodels.DatabaseModelBase):
     status = property(get_status, set_status)
 
 
+def load_instance_statuses(instance_ids):
+    """Load the service and task status of many instances in one query.
+
+    :returns: a dict of (service status, task status) by instance id,
+              instances without a service status are left out.
+    """
+    if not instance_ids:
+        return {}
+
+    with DBInstance.query() as query:
+        query = query.join(
+            InstanceServiceStatus,
+            InstanceServiceStatus.instance_id == DBInstance.id)
+        query = query.filter(DBInstance.id.in_(list(instance_ids)))
+        rows = query.with_entities(DBInstance.id,
+                                   InstanceServiceStatus.status_id,
+                                   DBInstance.task_id).all()
+
+    return {instance_id: (srvstatus.ServiceStatus.from_code(status_id),
+                          InstanceTask.from_code(task_id))
+            for instance_id, status_id, task_id in rows}
+
+
 def persisted_models():
     return {
         'instances': DBInstance,
@@ -140,3 +140,16 @@ def get_notifier(service=None, host=None, publisher_id=None):
     if not publisher_id:
         publisher_id = "%s.%s" % (service, host or CONF.host)
     return NOTIFIER.prepare(publisher_id=publisher_id)
+
+
+def get_notification_listener(targets, endpoints, pool=None):
+    assert NOTIFICATION_TRANSPORT is not None
+
+    from trove.common import debug_utils
+    debug_utils.setup()
+
+    executor = "blocking" if debug_utils.enabled() else "eventlet"
+
+    return messaging.get_notification_listener(
+        NOTIFICATION_TRANSPORT, targets, endpoints, executor=executor,
+        pool=pool)
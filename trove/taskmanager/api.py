@@ -201,6 +201,12 @@ class API(object):
 
         self._cast("delete_backup", version=version, backup_id=backup_id)
 
+    def delete_backups(self, backup_ids):
+        LOG.debug("Making async call to delete %d backups", len(backup_ids))
+        version = self.API_BASE_VERSION
+
+        self._cast("delete_backups", version=version, backup_ids=backup_ids)
+
     def create_instance(self, instance_id, name, flavor,
                         image_id, databases, users, datastore_manager,
                         packages, volume_size, backup_id=None,
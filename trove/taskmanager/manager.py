@@ -26,6 +26,7 @@ from trove.common.exception import ReplicationSlaveAttachError
 from trove.common.exception import TroveError
 from trove.common.i18n import _
 from trove.common.notification import DBaaSQuotas, EndNotification
+from trove.common import polling
 from trove.common import server_group as srv_grp
 from trove.common.strategies.cluster import strategy
 from trove.datastore.models import DatastoreVersion
@@ -34,6 +35,7 @@ from trove.instance.tasks import InstanceTasks
 from trove.taskmanager import models
 from trove.taskmanager.models import FreshInstanceTasks, BuiltInstanceTasks
 from trove.quota.quota import QUOTAS
+from trove.taskmanager import resource_watcher
 
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
@@ -51,6 +53,9 @@ class Manager(periodic_task.PeriodicTasks):
             self.exists_transformer = importutils.import_object(
                 CONF.exists_notification_transformer,
                 context=self.admin_context)
+        if (CONF.resource_watcher_enabled and
+                CONF.resource_watcher_notifications):
+            resource_watcher.start_notification_listener()
 
     def resize_volume(self, context, instance_id, new_size):
         with EndNotification(context):
@@ -309,6 +314,9 @@ class Manager(periodic_task.PeriodicTasks):
         with EndNotification(context):
             models.BackupTasks.delete_backup(context, backup_id)
 
+    def delete_backups(self, context, backup_ids):
+        models.BackupTasks.delete_backups(context, backup_ids)
+
     def create_backup(self, context, backup_info, instance_id):
         with EndNotification(context, backup_id=backup_info['id']):
             instance_tasks = models.BuiltInstanceTasks.load(context,
@@ -364,24 +372,27 @@ class Manager(periodic_task.PeriodicTasks):
         # Create replicas using the master backup
         replica_backup_id = snapshot['dataset']['snapshot_id']
         try:
-            for replica_index in range(0, len(ids)):
-                replica_number += 1
-                LOG.info(f"Creating replica {replica_number} "
-                         f"({ids[replica_index]}) of {len(ids)}.")
-
-                instance_tasks = FreshInstanceTasks.load(
-                    context, ids[replica_index])
-                instance_tasks.create_instance(
-                    flavor, image_id, databases, users, datastore_manager,
-                    packages, volume_size, replica_backup_id,
-                    availability_zone, root_passwords[replica_index],
-                    nics, overrides, None, snapshot, volume_type,
-                    modules, scheduler_hints, access=access,
-                    ds_version=ds_version)
-                replicas.append(instance_tasks)
-
-            for replica in replicas:
-                replica.wait_for_instance(CONF.restore_usage_timeout, flavor)
+            with polling.deadline(CONF.instance_build_timeout):
+                for replica_index in range(0, len(ids)):
+                    replica_number += 1
+                    LOG.info(f"Creating replica {replica_number} "
+                             f"({ids[replica_index]}) of {len(ids)}.")
+
+                    instance_tasks = FreshInstanceTasks.load(
+                        context, ids[replica_index])
+                    instance_tasks.create_instance(
+                        flavor, image_id, databases, users,
+                        datastore_manager, packages, volume_size,
+                        replica_backup_id, availability_zone,
+                        root_passwords[replica_index], nics, overrides,
+                        None, snapshot, volume_type, modules,
+                        scheduler_hints, access=access,
+                        ds_version=ds_version)
+                    replicas.append(instance_tasks)
+
+                for replica in replicas:
+                    replica.wait_for_instance(CONF.restore_usage_timeout,
+                                              flavor)
         except Exception as err:
             LOG.error('Failed to create replica from %s, error: %s',
                       slave_of_id, str(err))
@@ -416,20 +427,20 @@ class Manager(periodic_task.PeriodicTasks):
             LOG.debug("Using scheduler hints %s for creating instance %s",
                       scheduler_hints, instance_id)
 
-            instance_tasks = FreshInstanceTasks.load(context, instance_id)
-            instance_tasks.create_instance(
-                flavor, image_id, databases, users,
-                datastore_manager, packages,
-                volume_size, backup_id,
-                availability_zone, root_password,
-                nics, overrides, cluster_config,
-                None, volume_type, modules,
-                scheduler_hints, access=access, ds_version=ds_version
-            )
-
             timeout = (CONF.restore_usage_timeout if backup_id
                        else CONF.usage_timeout)
-            instance_tasks.wait_for_instance(timeout, flavor)
+            instance_tasks = FreshInstanceTasks.load(context, instance_id)
+            with polling.deadline(CONF.instance_build_timeout):
+                instance_tasks.create_instance(
+                    flavor, image_id, databases, users,
+                    datastore_manager, packages,
+                    volume_size, backup_id,
+                    availability_zone, root_password,
+                    nics, overrides, cluster_config,
+                    None, volume_type, modules,
+                    scheduler_hints, access=access, ds_version=ds_version
+                )
+                instance_tasks.wait_for_instance(timeout, flavor)
 
     def create_instance(self, context, instance_id, name, flavor,
                         image_id, databases, users, datastore_manager,
@@ -526,6 +537,13 @@ class Manager(periodic_task.PeriodicTasks):
                     usage = QUOTAS.get_quota_usage(quota)
                     DBaaSQuotas(self.admin_context, quota, usage).notify()
 
+    if CONF.polling_stats_interval:
+        @periodic_task.periodic_task(spacing=CONF.polling_stats_interval)
+        def log_polling_stats(self, context):
+            for site, stats in sorted(polling.get_stats().items()):
+                LOG.info("Polling statistics of %(site)s: %(stats)s",
+                         {'site': site, 'stats': stats})
+
     def __getattr__(self, name):
         """
         We should only get here if Python couldn't find a "real" method.
@@ -12,8 +12,11 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
 import copy
+import itertools
 import semantic_version
+import threading
 import time
 import traceback
 
@@ -49,6 +52,7 @@ from trove.common.notification import StartNotification
 from trove.common.notification import TroveInstanceCreate
 from trove.common.notification import TroveInstanceModifyFlavor
 from trove.common.strategies.cluster import strategy
+from trove.common import swift as swift_utils
 from trove.common import template
 from trove.common import timeutils
 from trove.common import utils
@@ -69,6 +73,7 @@ from trove.module import models as module_models
 from trove.module import views as module_views
 from trove.quota.quota import run_with_quotas
 from trove import rpc
+from trove.taskmanager import resource_watcher
 
 LOG = logging.getLogger(__name__)
 CONF = cfg.CONF
@@ -249,14 +254,13 @@ class ClusterTasks(Cluster):
                     ((status == fast_fail_statuses) or
                      (status in fast_fail_statuses)))
 
-        def _all_have_status(ids):
-            for instance_id in ids:
-                status = InstanceServiceStatus.find_by(
-                    instance_id=instance_id).get_status()
-                task_status = DBInstance.find_by(
-                    id=instance_id).get_task_status()
-                if (_is_fast_fail_status(status) or
-                        (task_status == InstanceTasks.BUILDING_ERROR_SERVER)):
+        def _has_failed(status, task_status):
+            return (_is_fast_fail_status(status) or
+                    (task_status == InstanceTasks.BUILDING_ERROR_SERVER))
+
+        def _all_have_status(statuses):
+            for instance_id, (status, task_status) in statuses.items():
+                if _has_failed(status, task_status):
                     # if one has failed, no need to continue polling
                     LOG.debug("Instance %(id)s has acquired a fast-fail "
                               "status %(status)s and"
@@ -264,6 +268,9 @@ class ClusterTasks(Cluster):
                               {'id': instance_id, 'status': status,
                                'task_status': task_status})
                     return True
+
+            for instance_id in instance_ids:
+                status = statuses.get(instance_id, (None, None))[0]
                 if status != expected_status:
                     # if one is not in the expected state, continue polling
                     LOG.debug("Instance %(id)s was %(status)s.",
@@ -272,34 +279,26 @@ class ClusterTasks(Cluster):
 
             return True
 
-        def _instance_ids_with_failures(ids):
-            LOG.debug("Checking for service failures on instances: %s", ids)
-            failed_instance_ids = []
-            for instance_id in ids:
-                status = InstanceServiceStatus.find_by(
-                    instance_id=instance_id).get_status()
-                task_status = DBInstance.find_by(
-                    id=instance_id).get_task_status()
-                if (_is_fast_fail_status(status) or
-                        (task_status == InstanceTasks.BUILDING_ERROR_SERVER)):
-                    failed_instance_ids.append(instance_id)
-            return failed_instance_ids
-
         LOG.debug("Polling until all instances acquire %(expected)s "
                   "status: %(ids)s",
                   {'expected': expected_status, 'ids': instance_ids})
         try:
-            utils.poll_until(lambda: instance_ids,
-                             lambda ids: _all_have_status(ids),
-                             sleep_time=CONF.usage_sleep_time,
-                             time_out=CONF.usage_timeout)
+            # The statuses of all the instances are fetched with a single
+            # query per poll and the last ones tell which instances failed.
+            statuses = utils.poll_until(
+                lambda: inst_models.load_instance_statuses(instance_ids),
+                _all_have_status,
+                sleep_time=CONF.usage_sleep_time,
+                time_out=CONF.usage_timeout)
         except PollTimeOut:
             LOG.exception("Timed out while waiting for all instances "
                           "to become %s.", expected_status)
             self.update_statuses_on_failure(cluster_id, shard_id)
             return False
 
-        failed_ids = _instance_ids_with_failures(instance_ids)
+        failed_ids = [instance_id for instance_id in instance_ids
+                      if instance_id in statuses and
+                      _has_failed(*statuses[instance_id])]
         if failed_ids:
             LOG.error("Some instances failed: %s", failed_ids)
             self.update_statuses_on_failure(cluster_id, shard_id)
@@ -447,9 +446,13 @@ class FreshInstanceTasks(FreshInstance, NotifyMixin, ConfigurationMixin):
         try:
             LOG.info("Waiting for instance %s up and running with "
                      "timeout %ss", self.id, timeout)
-            utils.poll_until(self._service_is_active,
-                             sleep_time=CONF.usage_sleep_time,
-                             time_out=timeout)
+            if CONF.resource_watcher_enabled:
+                self._wait_for_service_with_watcher(timeout)
+            else:
+                utils.poll_until(self._service_is_active,
+                                 sleep_time=CONF.usage_sleep_time,
+                                 time_out=timeout,
+                                 key=('instance', self.id, 'active'))
 
             LOG.info("Created instance %s successfully.", self.id)
             if not self.db_info.task_status.is_error:
@@ -805,7 +808,29 @@ class FreshInstanceTasks(FreshInstance, NotifyMixin, ConfigurationMixin):
                 InstanceTasks.BUILDING_ERROR_TIMEOUT_GA.db_text
             )
 
-    def _service_is_active(self):
+    def _wait_for_service_with_watcher(self, timeout):
+        c_id = self.db_info.compute_instance_id
+        try:
+            resource_watcher.get_watcher().wait_for(
+                'server', self.nova_client, c_id,
+                lambda server: self._service_is_active(server=server),
+                time_out=timeout)
+        except (TroveError, PollTimeOut):
+            raise
+        except Exception as e:
+            raise self._server_error(c_id, e)
+
+    def _server_error(self, c_id, e):
+        if getattr(e, 'message', '') == 'Not found':
+            return exception.ComputeInstanceNotFound(instance_id=self.id,
+                                                     server_id=c_id)
+        return TroveError(
+            _("Failed to get server %(server)s for instance "
+              "%(instance)s, error: %(error)s"),
+            server=c_id, instance=self.id, error=str(e)
+        )
+
+    def _service_is_active(self, server=None):
         """
         Check that the database guest is active.
 
@@ -813,6 +838,9 @@ class FreshInstanceTasks(FreshInstance, NotifyMixin, ConfigurationMixin):
         the guest is alive before sending a 'create' message. This prevents
         over billing a customer for an instance that they can never use.
 
+        The server is fetched unless it is given, e.g. by the resource
+        watcher.
+
         Returns: boolean if the service is active.
         Raises: TroveError if the service is in a failure state.
         """
@@ -829,19 +857,12 @@ class FreshInstanceTasks(FreshInstance, NotifyMixin, ConfigurationMixin):
                             srvstatus.ServiceStatuses.DELETED]:
             raise TroveError(_("Service not active, status: %s") % status)
 
-        c_id = self.db_info.compute_instance_id
-        try:
-            server = self.nova_client.servers.get(c_id)
-        except Exception as e:
-            if getattr(e, 'message', '') == 'Not found':
-                raise exception.ComputeInstanceNotFound(instance_id=self.id,
-                                                        server_id=c_id)
-            else:
-                raise TroveError(
-                    _("Failed to get server %(server)s for instance "
-                      "%(instance)s, error: %(error)s"),
-                    server=c_id, instance=self.id, error=str(e)
-                )
+        if server is None:
+            c_id = self.db_info.compute_instance_id
+            try:
+                server = self.nova_client.servers.get(c_id)
+            except Exception as e:
+                raise self._server_error(c_id, e)
 
         server_status = server.status
         if server_status in [InstanceStatus.ERROR,
@@ -974,13 +995,12 @@ class FreshInstanceTasks(FreshInstance, NotifyMixin, ConfigurationMixin):
 
         volume_ref = volume_client.volumes.create(**volume_kwargs)
 
-        utils.poll_until(
-            lambda: volume_client.volumes.get(volume_ref.id),
+        v_ref = resource_watcher.wait_for(
+            'volume', volume_client, volume_ref.id,
             lambda v_ref: v_ref.status in ['available', 'error'],
             sleep_time=2,
-            time_out=CONF.volume_time_out)
-
-        v_ref = volume_client.volumes.get(volume_ref.id)
+            time_out=CONF.volume_time_out,
+            key='available-or-error')
         if v_ref.status in ['error']:
             raise VolumeCreationFailure()
 
@@ -1016,13 +1036,12 @@ class FreshInstanceTasks(FreshInstance, NotifyMixin, ConfigurationMixin):
         # Record the volume ID in case something goes wrong.
         self.update_db(volume_id=volume_ref.id)
 
-        utils.poll_until(
-            lambda: volume_client.volumes.get(volume_ref.id),
+        v_ref = resource_watcher.wait_for(
+            'volume', volume_client, volume_ref.id,
             lambda v_ref: v_ref.status in ['available', 'error'],
             sleep_time=2,
-            time_out=CONF.volume_time_out)
-
-        v_ref = volume_client.volumes.get(volume_ref.id)
+            time_out=CONF.volume_time_out,
+            key='available-or-error')
         if v_ref.status in ['error']:
             raise VolumeCreationFailure()
         LOG.debug("End _create_volume for id: %s", self.id)
@@ -1622,6 +1641,201 @@ class BackupTasks(object):
             _delete(backup)
         LOG.info("Deleted backup %s successfully.", backup_id)
 
+    @classmethod
+    def delete_backups(cls, context, backup_ids):
+        """Delete many backups from the storage and the database."""
+        LOG.info("Deleting %d backups.", len(backup_ids))
+        stats = BulkBackupDelete(context).run(backup_ids)
+        if stats['failed']:
+            LOG.error("Failed to delete the objects of %(failed)d of "
+                      "%(backups)d backups, they are left in state "
+                      "DELETE_FAILED.", stats)
+        return stats
+
+
+class BulkBackupDelete(object):
+    """Delete many backups, a batch at a time.
+
+    For each batch, the objects of the backups stored in Swift are looked
+    up first: the segments and the manifest of static large objects, or
+    the single object. A pool of workers then deletes the segments and,
+    once they are gone, the manifests, with bulk-delete requests when
+    Swift has the bulk middleware and one request per object otherwise.
+    The database is updated with one statement for the backups deleted
+    and one for those that failed, and the progress is logged.
+    """
+
+    def __init__(self, context, max_workers=None, batch_size=None):
+        self.context = context
+        self.max_workers = max_workers or CONF.backup_delete_workers
+        self.batch_size = batch_size or CONF.backup_delete_batch_size
+        self.deleted = 0
+        self.failed = 0
+        self.objects = 0
+        self.start = None
+        self._bulk_limit = None
+        self._local = threading.local()
+        self._pool = None
+
+    @property
+    def swift(self):
+        # Swift connections must not be shared between threads.
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = clients.create_swift_client(self.context)
+            self._local.client = client
+        return client
+
+    @property
+    def bulk_limit(self):
+        if self._bulk_limit is None:
+            self._bulk_limit = swift_utils.bulk_delete_limit(self.swift)
+        return self._bulk_limit
+
+    def run(self, backup_ids):
+        self.start = time.monotonic()
+        with futures.ThreadPoolExecutor(
+                max_workers=self.max_workers) as self._pool:
+            for index in range(0, len(backup_ids), self.batch_size):
+                batch = backup_ids[index:index + self.batch_size]
+                with DBBackup.query() as query:
+                    backups = query.filter(DBBackup.id.in_(batch)).filter_by(
+                        deleted=False).all()
+                failed = self._delete_batch(backups)
+                self._update_db(backups, failed)
+                self.deleted += len(backups) - len(failed)
+                self.failed += len(failed)
+                self.report(len(backup_ids))
+        return self.stats()
+
+    def stats(self):
+        elapsed = time.monotonic() - self.start
+        return {'backups': self.deleted + self.failed,
+                'deleted': self.deleted,
+                'failed': self.failed,
+                'objects': self.objects,
+                'seconds': elapsed,
+                'objects_per_second': self.objects / elapsed if elapsed else 0}
+
+    def report(self, total):
+        LOG.info("Deleted %(deleted)d of %(total)d backups, %(failed)d "
+                 "failed, %(objects)d objects in %(seconds).1fs "
+                 "(%(objects_per_second).1f objects/s).",
+                 dict(self.stats(), total=total))
+
+    def _map(self, func, items):
+        items = list(items)
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._pool.map(func, items))
+
+    def _delete_batch(self, backups):
+        """Delete the objects of the backups.
+
+        :returns: the ids of the backups whose objects were not all deleted.
+        """
+        swift_backups = []
+        snapshots = []
+        for backup in backups:
+            # Do not remove the object if the backup was restored from
+            # remote location.
+            if not backup.filename or backup.state == BackupState.RESTORED:
+                continue
+            if backup.storage_driver in ["cinder"]:
+                snapshots.append(backup.location.split("/")[-1])
+            else:
+                swift_backups.append(backup)
+
+        self._map(lambda snapshot_id: BackupTasks.delete_snapshot_from_cinder(
+            self.context, snapshot_id), snapshots)
+
+        failed = set()
+        segments = {}
+        manifests = {}
+        for backup, paths in zip(swift_backups,
+                                 self._map(self._list_objects, swift_backups)):
+            if paths is None:
+                failed.add(backup.id)
+            elif paths:
+                segments.update(dict.fromkeys(paths[:-1], backup.id))
+                manifests[paths[-1]] = backup.id
+
+        failed.update(segments[path]
+                      for path in self._delete_objects(list(segments)))
+        manifests = {path: backup_id for path, backup_id in manifests.items()
+                     if backup_id not in failed}
+        failed.update(manifests[path]
+                      for path in self._delete_objects(list(manifests)))
+        return failed
+
+    def _list_objects(self, backup):
+        """Get the paths of the objects of a backup, the manifest last.
+
+        Returns None when they cannot be listed.
+        """
+        container = backup.container_name or CONF.backup_swift_container
+        try:
+            paths = swift_utils.get_segments(self.swift, container,
+                                             backup.filename)
+        except Exception as e:
+            if getattr(e, 'http_status', None) == 404:
+                LOG.warning("The object of backup %s is already deleted.",
+                            backup.id)
+                return []
+            LOG.error("Failed to get the objects of backup %(id)s: %(err)s",
+                      {'id': backup.id, 'err': e})
+            return None
+        return paths + ['%s/%s' % (container, backup.filename)]
+
+    def _delete_objects(self, paths):
+        """Delete objects, returning the paths of those not deleted."""
+        if not paths:
+            return []
+        if self.bulk_limit:
+            limit = self.bulk_limit
+            failed = self._map(self._bulk_delete,
+                               [paths[index:index + limit]
+                                for index in range(0, len(paths), limit)])
+        else:
+            failed = self._map(self._delete_object, paths)
+        failed = list(itertools.chain.from_iterable(failed))
+        self.objects += len(paths) - len(failed)
+        return failed
+
+    def _bulk_delete(self, paths):
+        try:
+            return swift_utils.bulk_delete(self.swift, paths)
+        except Exception as e:
+            LOG.error("Failed to delete %(count)d objects: %(err)s",
+                      {'count': len(paths), 'err': e})
+            return paths
+
+    def _delete_object(self, path):
+        container, name = path.split('/', 1)
+        try:
+            self.swift.delete_object(container, name)
+        except Exception as e:
+            if getattr(e, 'http_status', None) != 404:
+                LOG.error("Failed to delete object %(path)s: %(err)s",
+                          {'path': path, 'err': e})
+                return [path]
+        return []
+
+    def _update_db(self, backups, failed):
+        now = timeutils.utcnow()
+        # Set datastore_version_id to None to remove dependency.
+        values = {'deleted': True, 'deleted_at': now, 'updated': now,
+                  'datastore_version_id': None}
+        deleted = [backup.id for backup in backups if backup.id not in failed]
+        with DBBackup.query() as query:
+            if deleted:
+                query.filter(DBBackup.id.in_(deleted)).update(
+                    values, synchronize_session=False)
+            if failed:
+                values['state'] = BackupState.DELETE_FAILED
+                query.filter(DBBackup.id.in_(list(failed))).update(
+                    values, synchronize_session=False)
+
 
 class SnapshotTasks(object):
     """Performs volume snapshot action"""
@@ -1647,10 +1861,6 @@ class SnapshotTasks(object):
         }
         self.name = "trove-%s-backup" % self.backup_id
 
-    def _wait_snapshot_available(self):
-        snap = self.cinder.volume_snapshots.get(self.snapshot_id)
-        return snap.status == "available"
-
     def _create_snapshot(self):
         backup_state = {
             'backup_id': self.backup_id,
@@ -1675,9 +1885,12 @@ class SnapshotTasks(object):
 
             self.snapshot_id = snap.id
 
-            utils.poll_until(self._wait_snapshot_available,
-                             sleep_time=2,
-                             time_out=CONF.volume_time_out)
+            resource_watcher.wait_for(
+                'snapshot', self.cinder, self.snapshot_id,
+                lambda snap: snap.status == "available",
+                sleep_time=2,
+                time_out=CONF.volume_time_out,
+                key='available')
 
             backup_state.update({
                 'checksum': None,
@@ -1858,14 +2071,12 @@ class ResizeVolumeAction(VolumeUnmountActionBase):
         self.instance.nova_client.volumes.delete_server_volume(
             self.instance.server.id, self.instance.volume_id)
 
-        def volume_available():
-            volume = self.instance.volume_client.volumes.get(
-                self.instance.volume_id)
-            return volume.status == 'available'
-
-        utils.poll_until(volume_available,
-                         sleep_time=2,
-                         time_out=CONF.volume_time_out)
+        resource_watcher.wait_for(
+            'volume', self.instance.volume_client, self.instance.volume_id,
+            lambda volume: volume.status == 'available',
+            sleep_time=2,
+            time_out=CONF.volume_time_out,
+            key='available')
 
         LOG.debug("Successfully detached volume %(vol_id)s from instance "
                   "%(id)s", {'vol_id': self.instance.volume_id,
@@ -1880,14 +2091,12 @@ class ResizeVolumeAction(VolumeUnmountActionBase):
         self.instance.nova_client.volumes.create_server_volume(
             self.instance.server.id, self.instance.volume_id, device_path)
 
-        def volume_in_use():
-            volume = self.instance.volume_client.volumes.get(
-                self.instance.volume_id)
-            return volume.status == 'in-use'
-
-        utils.poll_until(volume_in_use,
-                         sleep_time=2,
-                         time_out=CONF.volume_time_out)
+        resource_watcher.wait_for(
+            'volume', self.instance.volume_client, self.instance.volume_id,
+            lambda volume: volume.status == 'in-use',
+            sleep_time=2,
+            time_out=CONF.volume_time_out,
+            key='in-use')
 
         LOG.debug("Successfully attached volume %(vol_id)s to instance "
                   "%(id)s", {'vol_id': self.instance.volume_id,
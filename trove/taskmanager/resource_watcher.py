@@ -0,0 +1,262 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Shared waits for Nova servers and Cinder volumes and snapshots.
+
+Every instance being provisioned used to poll its own server and volumes.
+The watcher instead keeps the list of all the resources being waited for
+and checks them together, with one list call per resource type and client
+at each interval, and wakes the waiters up through futures.
+"""
+
+import collections
+from concurrent import futures
+import threading
+import time
+
+from oslo_log import log as logging
+import oslo_messaging as messaging
+
+from trove.common import cfg
+from trove.common import exception
+from trove.common import polling
+from trove.common import utils
+
+CONF = cfg.CONF
+LOG = logging.getLogger(__name__)
+
+# How to get one or all the resources of a type with the matching client.
+RESOURCE_TYPES = {
+    'server': (lambda client, id: client.servers.get(id),
+               lambda client: client.servers.list()),
+    'volume': (lambda client, id: client.volumes.get(id),
+               lambda client: client.volumes.list()),
+    'snapshot': (lambda client, id: client.volume_snapshots.get(id),
+                 lambda client: client.volume_snapshots.list()),
+}
+
+
+class _Waiter(object):
+
+    def __init__(self, kind, client, resource_id, condition, time_out):
+        self.kind = kind
+        self.client = client
+        self.resource_id = resource_id
+        self.condition = condition
+        self.deadline = time.monotonic() + time_out if time_out else None
+        outer = polling.current_deadline()
+        if outer is not None:
+            self.deadline = (outer if self.deadline is None
+                             else min(self.deadline, outer))
+        self.future = futures.Future()
+
+
+class ResourceWatcher(object):
+    """Wait for many resources with one status query per type and interval.
+
+    A resource type with a single waiter is fetched with a get call, and
+    with a list call otherwise. Resources missing from the list, e.g. not
+    yet visible or already deleted, are fetched one by one.
+    """
+
+    def __init__(self, interval=None):
+        self._interval = interval
+        self._waiters = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        # Number of API calls made, by (resource type, 'get' or 'list').
+        self.api_calls = collections.Counter()
+
+    @property
+    def interval(self):
+        return self._interval or CONF.resource_watcher_interval
+
+    def watch(self, kind, client, resource_id, condition, time_out=0):
+        """Start waiting for a resource.
+
+        :returns: a future, done once condition(resource) is true, or with
+                  the exception raised while fetching the resource or
+                  checking the condition, or PollTimeOut after time_out
+                  seconds.
+        """
+        if kind not in RESOURCE_TYPES:
+            raise exception.TroveError(
+                "Unknown resource type %s." % kind)
+
+        waiter = _Waiter(kind, client, resource_id, condition, time_out)
+        with self._lock:
+            self._waiters.append(waiter)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='trove-resource-watcher',
+                    daemon=True)
+                self._thread.start()
+        return waiter.future
+
+    def wait_for(self, kind, client, resource_id, condition, time_out=0):
+        """Wait for a resource and return it once condition is true."""
+        return self.watch(kind, client, resource_id, condition,
+                          time_out=time_out).result()
+
+    def notify(self, kind, resource_id):
+        """Check the resources right away if resource_id is waited for."""
+        with self._lock:
+            watched = any(waiter.kind == kind and
+                          waiter.resource_id == resource_id
+                          for waiter in self._waiters)
+        if watched:
+            LOG.debug("Resource watcher notified about %(kind)s %(id)s.",
+                      {'kind': kind, 'id': resource_id})
+            self._wakeup.set()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    return
+            try:
+                self.poll()
+            except Exception:
+                LOG.exception("Resource watcher failed to check the "
+                              "resources.")
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    def poll(self):
+        """Check all the resources being waited for once."""
+        with self._lock:
+            waiters = list(self._waiters)
+
+        groups = collections.OrderedDict()
+        for waiter in waiters:
+            groups.setdefault((waiter.kind, id(waiter.client)),
+                              []).append(waiter)
+
+        for (kind, _), group in groups.items():
+            resources = self._fetch(kind, group[0].client,
+                                    {waiter.resource_id for waiter in group})
+            now = time.monotonic()
+            for waiter in group:
+                self._check(waiter, resources[waiter.resource_id], now)
+
+        with self._lock:
+            self._waiters = [waiter for waiter in self._waiters
+                             if not waiter.future.done()]
+
+    def _fetch(self, kind, client, resource_ids):
+        """Return the resource (or the exception raised) for each id."""
+        get_one, list_all = RESOURCE_TYPES[kind]
+        resources = {}
+        if len(resource_ids) > 1:
+            try:
+                self.api_calls[(kind, 'list')] += 1
+                resources = {resource.id: resource
+                             for resource in list_all(client)
+                             if resource.id in resource_ids}
+            except Exception as e:
+                LOG.warning("Failed to list %(kind)ss, checking them one by "
+                            "one: %(error)s", {'kind': kind, 'error': e})
+
+        for resource_id in resource_ids - set(resources):
+            try:
+                self.api_calls[(kind, 'get')] += 1
+                resources[resource_id] = get_one(client, resource_id)
+            except Exception as e:
+                resources[resource_id] = e
+        return resources
+
+    @staticmethod
+    def _check(waiter, resource, now):
+        try:
+            if isinstance(resource, Exception):
+                raise resource
+            if waiter.condition(resource):
+                waiter.future.set_result(resource)
+                return
+        except Exception as e:
+            waiter.future.set_exception(e)
+            return
+
+        if waiter.deadline is not None and now >= waiter.deadline:
+            waiter.future.set_exception(exception.PollTimeOut())
+
+
+class NotificationEndpoint(object):
+    """Notification endpoint waking the watcher up on resource changes."""
+
+    # Event type prefix and the payload key holding the resource id.
+    EVENT_TYPES = (
+        ('compute.instance.', 'server', 'instance_id'),
+        ('instance.', 'server', 'uuid'),
+        ('volume.', 'volume', 'volume_id'),
+        ('snapshot.', 'snapshot', 'snapshot_id'),
+    )
+
+    filter_rule = messaging.NotificationFilter(
+        event_type=r'^(compute\.instance|instance|volume|snapshot)\.')
+
+    def __init__(self, watcher):
+        self._watcher = watcher
+
+    def info(self, ctxt, publisher_id, event_type, payload, metadata):
+        # Versioned notifications wrap the payload in an object.
+        payload = payload.get('nova_object.data', payload)
+        for prefix, kind, key in self.EVENT_TYPES:
+            if event_type.startswith(prefix) and payload.get(key):
+                self._watcher.notify(kind, payload[key])
+                break
+
+    error = info
+
+
+_watcher = None
+
+
+def get_watcher():
+    global _watcher
+    if _watcher is None:
+        _watcher = ResourceWatcher()
+    return _watcher
+
+
+def start_notification_listener():
+    """Listen to the Nova and Cinder notifications for the shared watcher."""
+    from trove import rpc
+
+    target = messaging.Target(
+        topic=CONF.resource_watcher_notification_topic)
+    listener = rpc.get_notification_listener(
+        [target], [NotificationEndpoint(get_watcher())],
+        pool='trove-resource-watcher')
+    listener.start()
+    return listener
+
+
+def wait_for(kind, client, resource_id, condition, sleep_time=2,
+             time_out=0, key=None):
+    """Wait for a resource, with the shared watcher if it is enabled.
+
+    Falls back to polling the resource with utils.poll_until otherwise,
+    concurrent waits for the same resource and key then share one polling
+    loop. Both are bounded by the enclosing polling.deadline(), if any.
+    """
+    if CONF.resource_watcher_enabled:
+        return get_watcher().wait_for(kind, client, resource_id, condition,
+                                      time_out=time_out)
+
+    get_one = RESOURCE_TYPES[kind][0]
+    return utils.poll_until(lambda: get_one(client, resource_id), condition,
+                            sleep_time=sleep_time, time_out=time_out,
+                            key=(kind, resource_id, key) if key else None,
+                            name=polling.call_site(1))
@@ -21,6 +21,9 @@ import os
 import socket
 import swiftclient
 import swiftclient.client as swift_client
+import threading
+import time
+from urllib import parse
 import uuid
 
 from oslo_log import log as logging
@@ -215,6 +218,88 @@ class FakeSwiftConnection(object):
         pass
 
 
+class FakeSwiftStore(object):
+    """An object store behaving like Swift for the requests deleting
+    backups, including static large objects and bulk-delete.
+
+    :param bulk_delete: the max_deletes_per_request of the bulk
+                        middleware, 0 when it is not enabled.
+    :param latency: seconds each request takes.
+    :param fail: paths of the objects that cannot be deleted.
+    """
+
+    def __init__(self, bulk_delete=0, latency=0, fail=()):
+        self.bulk_delete = bulk_delete
+        self.latency = latency
+        self.fail = set(fail)
+        self.objects = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def add_object(self, container, name, segments=()):
+        """Add an object, a static large object if it has segments."""
+        for segment in segments:
+            self.objects[segment] = None
+        self.objects['%s/%s' % (container, name)] = (list(segments) or
+                                                     None)
+
+    def _request(self, path=None):
+        with self.lock:
+            self.requests += 1
+        time.sleep(self.latency)
+        if path is not None and path not in self.objects:
+            raise swift.ClientException('Object not found', http_status=404)
+
+    def head_object(self, container, name):
+        path = '%s/%s' % (container, name)
+        self._request(path)
+        if self.objects[path]:
+            return {'x-static-large-object': 'True'}
+        return {}
+
+    def get_object(self, container, name, query_string=None, **kwargs):
+        path = '%s/%s' % (container, name)
+        self._request(path)
+        manifest = [{'name': '/' + segment}
+                    for segment in self.objects[path] or []]
+        return {}, json.dumps(manifest).encode('utf-8')
+
+    def delete_object(self, container, name, query_string=None):
+        path = '%s/%s' % (container, name)
+        self._request(path)
+        if path in self.fail:
+            raise swift.ClientException('Object DELETE failed',
+                                        http_status=503)
+        segments = self.objects.pop(path)
+        if query_string == 'multipart-manifest=delete':
+            for segment in segments or []:
+                self.objects.pop(segment, None)
+
+    def get_capabilities(self):
+        self._request()
+        if self.bulk_delete:
+            return {'bulk_delete': {
+                'max_deletes_per_request': self.bulk_delete}}
+        return {}
+
+    def post_account(self, headers, data=None, query_string=None, **kwargs):
+        self._request()
+        if query_string != 'bulk-delete' or not self.bulk_delete:
+            return {}, b''
+        paths = [parse.unquote(line).lstrip('/')
+                 for line in data.decode('utf-8').splitlines()]
+        errors = []
+        for path in paths[:self.bulk_delete]:
+            if path in self.fail:
+                errors.append([parse.quote('/' + path),
+                               '503 Service Unavailable'])
+            else:
+                self.objects.pop(path, None)
+        body = {'Response Status': '400 Bad Request' if errors else '200 OK',
+                'Errors': errors}
+        return {}, json.dumps(body).encode('utf-8')
+
+
 class Patcher(object):
     """Objects that need to mock global symbols throughout their existence
     should extend this base class.
@@ -13,6 +13,7 @@
 
 
 import datetime
+from unittest import mock
 from unittest.mock import DEFAULT
 from unittest.mock import MagicMock
 from unittest.mock import patch
@@ -283,6 +284,64 @@ class BackupDeleteTest(trove_testtools.TestCase):
                                   self.context, 'backup_id')
 
 
+class BackupDeleteAllTest(trove_testtools.TestCase):
+    def setUp(self):
+        super(BackupDeleteAllTest, self).setUp()
+        util.init_db()
+        self.context, self.instance_id = _prep_conf(timeutils.utcnow())
+        self.project_id = self.context.project_id
+
+    def _create_backup(self, **kwargs):
+        values = dict(tenant_id=self.project_id, name=BACKUP_NAME,
+                      state=BACKUP_STATE_COMPLETED,
+                      instance_id=self.instance_id, deleted=False,
+                      location=BACKUP_LOCATION, storage_driver='swift')
+        values.update(kwargs)
+        return models.DBBackup.create(**values)
+
+    @patch('trove.backup.models.run_with_quotas')
+    @patch('trove.taskmanager.api.API')
+    @patch.object(models.Backup, 'verify_swift_auth_token')
+    def test_delete_all(self, mock_verify, mock_api, mock_quotas):
+        mock_quotas.side_effect = lambda tenant, deltas, f: f()
+        backups = [self._create_backup(),
+                   self._create_backup(instance_id='other-instance')]
+        self._create_backup(state=BACKUP_STATE)
+        self._create_backup(deleted=True)
+        self._create_backup(tenant_id='other-project')
+
+        backup_ids = models.Backup.delete_all(self.context, self.project_id)
+
+        self.assertEqual(sorted(backup.id for backup in backups),
+                         sorted(backup_ids))
+        mock_quotas.assert_called_once_with(
+            self.project_id, {'backups': -2}, mock.ANY)
+        mock_verify.assert_called_once_with(self.context)
+        mock_api.return_value.delete_backups.assert_called_once_with(
+            backup_ids)
+
+    @patch('trove.taskmanager.api.API')
+    def test_delete_all_of_instance(self, mock_api):
+        backup = self._create_backup(storage_driver='cinder')
+        self._create_backup(instance_id='other-instance',
+                            storage_driver='cinder')
+
+        backup_ids = models.Backup.delete_all(
+            self.context, self.project_id, instance_id=self.instance_id)
+
+        self.assertEqual([backup.id], backup_ids)
+        mock_api.return_value.delete_backups.assert_called_once_with(
+            [backup.id])
+
+    @patch('trove.taskmanager.api.API')
+    def test_delete_all_nothing_to_delete(self, mock_api):
+        self._create_backup(state=BACKUP_STATE)
+
+        self.assertEqual(
+            [], models.Backup.delete_all(self.context, self.project_id))
+        self.assertFalse(mock_api.return_value.delete_backups.called)
+
+
 class BackupORMTest(trove_testtools.TestCase):
     def setUp(self):
         super(BackupORMTest, self).setUp()
@@ -0,0 +1,187 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+import shutil
+import tempfile
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from pyroute2.netlink.exceptions import NetlinkError
+
+from trove.cmd import network_driver
+from trove.tests.unittests import trove_testtools
+
+
+class FakeLink(dict):
+
+    def __init__(self, index, ifname, mac):
+        super(FakeLink, self).__init__(index=index)
+        self.attrs = {'IFLA_IFNAME': ifname, 'IFLA_ADDRESS': mac}
+
+    def get_attr(self, name):
+        return self.attrs[name]
+
+
+class TestHostnicConfig(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestHostnicConfig, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.config_file = os.path.join(self.tmpdir, 'hostnic.json')
+        self.config = network_driver.hostnic_config(self.config_file)
+        self.addCleanup(self.config.flush)
+
+    def _read(self):
+        with open(self.config_file) as f:
+            return json.load(f)
+
+    def test_write_behind(self):
+        self.config.write_config('net-1', {'mac_address': 'fa:16:3e:1'})
+        self.config.write_config('net-2', {'mac_address': 'fa:16:3e:2'})
+        self.config.delete_config('net-1')
+
+        self.assertEqual({'mac_address': 'fa:16:3e:2'},
+                         self.config.get_config('net-2'))
+        self.assertEqual('', self.config.get_config('net-1'))
+        self.assertFalse(os.path.exists(self.config_file))
+
+        self.config.flush()
+
+        self.assertEqual({'net-2': {'mac_address': 'fa:16:3e:2'}},
+                         self._read())
+        self.assertEqual(['hostnic.json'], os.listdir(self.tmpdir))
+
+    def test_load(self):
+        with open(self.config_file, 'w') as f:
+            json.dump({'net-1': {'mac_address': 'fa:16:3e:1'}}, f)
+
+        self.assertEqual({'net-1': {'mac_address': 'fa:16:3e:1'}},
+                         self.config.get_data())
+
+        # Nothing changed, nothing to write.
+        with patch.object(network_driver.os, 'replace') as mock_replace:
+            self.config.flush()
+        mock_replace.assert_not_called()
+
+    def test_timer(self):
+        self.config.WRITE_DELAY = 0
+        self.config.write_config('net-1', {'mac_address': 'fa:16:3e:1'})
+        self.config._timer.join()
+
+        self.assertEqual({'net-1': {'mac_address': 'fa:16:3e:1'}},
+                         self._read())
+
+
+class TestHostnicLinks(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestHostnicLinks, self).setUp()
+        self.ipr = MagicMock()
+        self.links = network_driver.hostnic_links()
+        self.links._ipr = self.ipr
+
+    def test_get_ifname(self):
+        link = FakeLink(3, 'ens4', 'fa:16:3e:aa:bb:cc')
+        self.ipr.get_links.return_value = [link]
+        self.ipr.link.return_value = [link]
+
+        for _ in range(3):
+            self.assertEqual('ens4',
+                             self.links.get_ifname('FA:16:3E:AA:BB:CC'))
+
+        self.ipr.get_links.assert_called_once_with(
+            address='fa:16:3e:aa:bb:cc')
+        self.assertEqual(2, self.ipr.link.call_count)
+        self.ipr.link.assert_called_with('get', index=3)
+
+    def test_get_ifname_changed(self):
+        self.links._indexes['fa:16:3e:aa:bb:cc'] = 3
+        self.ipr.get_links.return_value = [
+            FakeLink(4, 'ens5', 'fa:16:3e:aa:bb:cc')]
+
+        # The nic now has another index, then the index is gone.
+        self.ipr.link.return_value = [FakeLink(3, 'ens4', 'fa:16:3e:dd')]
+        self.assertEqual('ens5', self.links.get_ifname('fa:16:3e:aa:bb:cc'))
+        self.ipr.link.side_effect = NetlinkError(19)
+        self.links._indexes['fa:16:3e:aa:bb:cc'] = 3
+        self.assertEqual('ens5', self.links.get_ifname('fa:16:3e:aa:bb:cc'))
+
+        self.assertEqual(2, self.ipr.get_links.call_count)
+        self.assertEqual(4, self.links._indexes['fa:16:3e:aa:bb:cc'])
+
+    def test_broken_socket(self):
+        self.ipr.get_links.side_effect = OSError('Broken pipe')
+
+        self.assertRaises(OSError, self.links.get_ifname, 'fa:16:3e:aa')
+
+        self.ipr.close.assert_called_once_with()
+        self.assertIsNone(self.links._ipr)
+
+
+class TestNetworkDriverJoin(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestNetworkDriverJoin, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        config = network_driver.hostnic_config(
+            os.path.join(self.tmpdir, 'hostnic.json'))
+        config.write_config('a' * 64, {'mac_address': 'fa:16:3e:aa:bb:cc'})
+        self.addCleanup(config.flush)
+        self.eth1_file = os.path.join(self.tmpdir, 'eth1.json')
+        self._write_eth1({'ipv4_gateway': '10.0.0.1'})
+        links = MagicMock()
+        links.get_ifname.return_value = 'ens4'
+        for name, value in (
+                ('driver_config', config), ('hostnic_nics', links),
+                ('eth1_config_file', network_driver.json_file(
+                    self.eth1_file))):
+            patcher = patch.object(network_driver, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = network_driver.app.test_client()
+
+    def _write_eth1(self, data):
+        with open(self.eth1_file, 'w') as f:
+            json.dump(data, f)
+
+    def _join(self):
+        return self.client.post('/NetworkDriver.Join', json={
+            'NetworkID': 'a' * 64, 'EndpointID': 'b' * 64,
+            'SandboxKey': '/var/run/docker/netns/1234567890ab'}).get_json()
+
+    def test_join(self):
+        self.assertEqual({'InterfaceName': {'SrcName': 'ens4',
+                                            'DstPrefix': 'eth'},
+                          'Gateway': '10.0.0.1'}, self._join())
+
+        # The eth1 config is read again once changed.
+        self._write_eth1({'ipv4_gateway': '10.0.0.254',
+                          'ipv4_host_routes': [{'destination': '10.1.0.0/16',
+                                                'nexthop': '10.0.0.2'}]})
+        response = self._join()
+
+        self.assertEqual('10.0.0.254', response['Gateway'])
+        self.assertEqual([{'Destination': '10.1.0.0/16',
+                           'NextHop': '10.0.0.2'}],
+                         response['StaticRoutes'])
+
+    def test_join_invalid(self):
+        response = self.client.post('/NetworkDriver.Join',
+                                    json={'NetworkID': 'a' * 64})
+
+        self.assertEqual(400, response.status_code)
+        self.assertIn("'EndpointID' is a required property",
+                      response.get_json()['Err'])
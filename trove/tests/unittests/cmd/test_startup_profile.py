@@ -0,0 +1,47 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest.mock import patch
+
+from trove.cmd import startup_profile
+from trove.tests.unittests import trove_testtools
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:        80 |        200 | io
+import time:       500 |        500 |     jinja2.utils
+import time:      1000 |       1500 |   jinja2
+import time:       300 |       1800 | trove.common.utils
+"""
+
+
+class TestStartupProfile(trove_testtools.TestCase):
+
+    def test_parse_importtime(self):
+        costs = startup_profile.parse_importtime(IMPORTTIME_OUTPUT)
+
+        self.assertEqual(
+            [('_io', 120, 120, 1), ('io', 80, 200, 0),
+             ('jinja2.utils', 500, 500, 2), ('jinja2', 1000, 1500, 1),
+             ('trove.common.utils', 300, 1800, 0)],
+            costs)
+
+    @patch.object(startup_profile.subprocess, 'run')
+    def test_profile_imports(self, mock_run):
+        mock_run.return_value.stderr = IMPORTTIME_OUTPUT
+
+        total, costs = startup_profile.profile_imports(['trove.common.utils'])
+
+        self.assertEqual(2000, total)
+        self.assertEqual(5, len(costs))
+        self.assertIn("'trove.common.utils'", mock_run.call_args[0][0][-1])
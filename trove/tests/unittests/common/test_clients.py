@@ -0,0 +1,167 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+import threading
+from unittest import mock
+
+from oslo_utils import timeutils
+
+from trove.common import clients
+from trove.common import clients_admin
+from trove.common import context
+from trove.tests.unittests import trove_testtools
+
+
+class TestClientPool(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestClientPool, self).setUp()
+        self.patch_conf_property('neutron_url', 'http://neutron/')
+        self.pool = clients.CLIENT_POOL
+        self.pool.clear()
+        self.context = self._context('token-1')
+
+    def _context(self, token, project_id='project-1', expires=None):
+        return context.TroveContext(project_id=project_id, auth_token=token,
+                                    auth_token_expires=expires)
+
+    def test_reuse(self):
+        client = clients.neutron_client(self.context)
+
+        self.assertIs(client, clients.neutron_client(self._context('token-1')))
+        self.assertEqual('token-1', client.httpclient.session.get_token())
+        self.assertEqual(1, self.pool.created['neutron'])
+        self.assertEqual(1, self.pool.hits)
+
+    def test_keys(self):
+        client = clients.neutron_client(self.context)
+
+        other_token = clients.neutron_client(self._context('token-2'))
+        other_project = clients.neutron_client(
+            self._context('token-1', project_id='project-2'))
+        other_region = clients.neutron_client(self.context,
+                                              region_name='RegionTwo')
+
+        self.assertEqual(4, len({id(client), id(other_token),
+                                 id(other_project), id(other_region)}))
+        self.assertEqual('token-2',
+                         other_token.httpclient.session.get_token())
+        self.assertEqual({'size': 4, 'hits': 0, 'misses': 4, 'evictions': 0,
+                          'created': {'neutron': 4}}, self.pool.stats())
+        for key in self.pool._clients:
+            self.assertNotIn('token-1', key)
+
+    def test_disabled(self):
+        self.patch_conf_property('client_pool_ttl', 0)
+
+        client = clients.neutron_client(self.context)
+
+        self.assertIsNot(client, clients.neutron_client(self.context))
+        self.assertEqual(2, self.pool.created['neutron'])
+        self.assertEqual(0, len(self.pool))
+
+    @mock.patch.object(clients.time, 'monotonic')
+    def test_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        client = clients.neutron_client(self.context)
+
+        mock_monotonic.return_value = 1299
+        self.assertIs(client, clients.neutron_client(self.context))
+        mock_monotonic.return_value = 1300
+        self.assertIsNot(client, clients.neutron_client(self.context))
+
+    def test_token_ttl(self):
+        timeutils.set_time_override(datetime.datetime(2026, 10, 19, 12))
+        self.addCleanup(timeutils.clear_time_override)
+
+        self.assertEqual(300, clients.token_ttl(self.context))
+        self.assertEqual(240, clients.token_ttl(self._context(
+            'token', expires='2026-10-19T12:05:00.000000Z')))
+        self.assertEqual(300, clients.token_ttl(self._context(
+            'token', expires='2026-10-19T13:00:00+00:00')))
+        self.assertEqual(0, clients.token_ttl(self._context(
+            'token', expires='2026-10-19T12:00:30Z')))
+
+    def test_token_about_to_expire(self):
+        ctx = self._context('token-1', expires=timeutils.utcnow().strftime(
+            '%Y-%m-%dT%H:%M:%SZ'))
+
+        self.assertIsNot(clients.neutron_client(ctx),
+                         clients.neutron_client(ctx))
+        self.assertEqual(0, len(self.pool))
+
+    def test_eviction(self):
+        self.patch_conf_property('client_pool_size', 2)
+
+        first = clients.neutron_client(self._context('token-1'))
+        clients.neutron_client(self._context('token-2'))
+        clients.neutron_client(self._context('token-1'))
+        clients.neutron_client(self._context('token-3'))
+
+        self.assertIs(first, clients.neutron_client(self._context('token-1')))
+        self.assertEqual(1, self.pool.evictions)
+        self.assertEqual(2, len(self.pool))
+
+    def test_shared_http_session(self):
+        self.patch_conf_property('cinder_url', 'http://cinder/v3/')
+
+        neutron = clients.neutron_client(self.context)
+        cinder = clients.cinder_client(self._context('token-2'))
+
+        http_session = clients.get_http_session()
+        self.assertIs(http_session, neutron.httpclient.session.session)
+        self.assertIs(http_session, cinder.client.session.session)
+        self.assertEqual('token-1',
+                         neutron.httpclient.session.get_token())
+        self.assertEqual('http://cinder/v3/project-1',
+                         cinder.client.get_endpoint())
+
+    def test_swift_client_per_thread(self):
+        # A swiftclient Connection must not be used by two threads.
+        self.patch_conf_property('swift_url', 'http://swift/v1/AUTH_')
+        swift_clients = []
+        # Keep both threads alive, so that they have distinct idents.
+        barrier = threading.Barrier(2)
+
+        def create():
+            client = clients.swift_client(self.context)
+            barrier.wait(10)
+            self.assertIs(client, clients.swift_client(self.context))
+            swift_clients.append(client)
+
+        threads = [threading.Thread(target=create) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(2, len(swift_clients))
+        self.assertIsNot(swift_clients[0], swift_clients[1])
+        self.assertEqual(2, self.pool.created['swift'])
+        self.assertEqual(2, self.pool.hits)
+
+    @mock.patch.object(clients_admin, 'get_keystone_session')
+    @mock.patch('novaclient.client.Client')
+    def test_admin_client_by_region(self, mock_client, mock_session):
+        mock_client.side_effect = lambda *args, **kwargs: mock.Mock(
+            region_name=kwargs['region_name'])
+
+        client = clients_admin.nova_client_trove_admin(self.context)
+        other_region = clients_admin.nova_client_trove_admin(
+            self._context('token-2'), region_name='RegionTwo')
+
+        self.assertIs(client, clients_admin.nova_client_trove_admin(
+            self._context('token-3', project_id='project-2')))
+        self.assertEqual('RegionOne', client.region_name)
+        self.assertEqual('RegionTwo', other_region.region_name)
+        self.assertEqual(2, mock_client.call_count)
@@ -16,7 +16,10 @@
 
 from unittest import mock
 
+from oslo_serialization import jsonutils
+
 from trove.common import cfg
+from trove.common import crypto_utils
 from trove.common.rpc import conductor_guest_serializer as gsz
 from trove.common.rpc import conductor_host_serializer as hsz
 
@@ -108,3 +111,25 @@ class TestConductorSerializer(trove_testtools.TestCase):
         self.assertEqual(context.get('instance_id'), self.uuid)
         context.pop('instance_id')
         self.assertDictEqual(context, self.context)
+
+    @mock.patch('trove.common.rpc.conductor_host_serializer.'
+                'get_instance_encryption_key',
+                return_value='mo79Y86Bp3bzQDWR31ihhVGfLBmeac')
+    def test_conductor_entity_single_envelope(self, _):
+        guestsz = gsz.ConductorGuestSerializer(None, self.key)
+        encrypted_entity = guestsz.serialize_entity(self.context, self.data)
+        self.assertEqual({'entity', 'csz-instance-id'},
+                         set(encrypted_entity))
+        self.assertEqual(self.uuid, encrypted_entity['csz-instance-id'])
+
+    @mock.patch('trove.common.rpc.conductor_host_serializer.'
+                'get_instance_encryption_key',
+                return_value='mo79Y86Bp3bzQDWR31ihhVGfLBmeac')
+    def test_conductor_entity_old_format(self, _):
+        hostsz = hsz.ConductorHostSerializer(None, None)
+        value = crypto_utils.encode_data(crypto_utils.encrypt_data(
+            jsonutils.dumps(self.data), self.key))
+        encrypted_entity = jsonutils.dumps({'entity': value,
+                                            'csz-instance-id': self.uuid})
+        entity = hostsz.deserialize_entity(self.context, encrypted_entity)
+        self.assertEqual(entity, self.data)
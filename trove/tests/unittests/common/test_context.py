@@ -49,6 +49,13 @@ class TestTroveContext(trove_testtools.TestCase):
         self.assertThat(ctx_dict.get('user'), Equals('test_user_id'))
         self.assertThat(ctx_dict.get('request_id'), Equals('test_req_id'))
 
+    def test_from_dict_token_expiry(self):
+        ctx = context.TroveContext(
+            auth_token='token', auth_token_expires='2026-10-19T12:00:00Z')
+        ctx = context.TroveContext.from_dict(ctx.to_dict())
+        self.assertThat(ctx.auth_token_expires,
+                        Equals('2026-10-19T12:00:00Z'))
+
     def test_to_dict_with_notification(self):
         ctx = context.TroveContext(user_id='test_user_id',
                                    project_id='the_tenant',
@@ -108,3 +108,21 @@ class TestEncryptUtils(trove_testtools.TestCase):
             decrypted = crypto_utils.decrypt_data(decoded, key)
             final_decoded = crypto_utils.decode_data(decrypted)
             self.assertEqual(expected, final_decoded)
+
+    def test_encrypt_and_encode(self):
+        key = 'my_secure_key'
+        for data in (b'', b'a' * 16, 'Unicode:€' * 50):
+            encoded = crypto_utils.encrypt_and_encode(data, key)
+            self.assertEqual(
+                crypto_utils.encodeutils.to_utf8(data),
+                crypto_utils.decode_and_decrypt(encoded, key))
+
+    def test_derived_key_cached(self):
+        crypto_utils._derive_key.cache_clear()
+        with mock.patch.object(crypto_utils.hashlib, 'md5',
+                               wraps=crypto_utils.hashlib.md5) as mock_md5:
+            for _ in range(3):
+                crypto_utils.decrypt_data(
+                    crypto_utils.encrypt_data(b'data', 'cached_key'),
+                    'cached_key')
+        self.assertEqual(1, mock_md5.call_count)
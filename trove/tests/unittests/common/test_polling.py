@@ -0,0 +1,148 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from trove.common import exception
+from trove.common import polling
+from trove.common import utils
+from trove.tests.unittests import trove_testtools
+
+
+class FakeClock(object):
+    """time.monotonic and time.sleep advancing a fake clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestPolling(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestPolling, self).setUp()
+        self.clock = FakeClock()
+        for name in ('monotonic', 'sleep'):
+            patcher = patch.object(polling.time, name,
+                                   getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        polling.reset_stats()
+        self.addCleanup(polling.reset_stats)
+
+    def test_backoff_intervals(self):
+        rng = Mock()
+        rng.uniform.return_value = 1
+        intervals = polling.backoff_intervals(3, max_interval=30, rng=rng)
+
+        self.assertEqual([3, 6, 12, 24, 30, 30],
+                         [next(intervals) for _ in range(6)])
+        rng.uniform.assert_called_with(0.8, 1.2)
+
+    def test_poll_until(self):
+        retriever = Mock(side_effect=['BUILD'] * 3 + ['ACTIVE'])
+
+        result = utils.poll_until(retriever, lambda s: s == 'ACTIVE',
+                                  sleep_time=1, name='site')
+
+        self.assertEqual('ACTIVE', result)
+        self.assertEqual(3, len(self.clock.sleeps))
+        for nominal, slept in zip((1, 2, 4), self.clock.sleeps):
+            self.assertTrue(nominal * 0.8 <= slept <= nominal * 1.2)
+        stats = polling.get_stats()['site']
+        self.assertEqual(1, stats['count'])
+        self.assertEqual(4, stats['total_polls'])
+        self.assertEqual(1, stats['polls']['<=5'])
+
+    def test_time_out(self):
+        self.assertRaises(exception.PollTimeOut, utils.poll_until,
+                          lambda: False, sleep_time=1, time_out=10)
+
+        # The last interval is shortened to end on the time out.
+        self.assertEqual(1010.0, self.clock.now)
+        stats = list(polling.get_stats().values())[0]
+        self.assertEqual(1, stats['timeouts'])
+
+    def test_deadline(self):
+        with polling.deadline(5):
+            with polling.deadline(60):
+                self.assertRaises(exception.PollTimeOut, utils.poll_until,
+                                  lambda: False, sleep_time=1, time_out=30)
+        self.assertEqual(1005.0, self.clock.now)
+        self.assertIsNone(polling.current_deadline())
+
+    def test_no_deadline(self):
+        with polling.deadline(0):
+            self.assertIsNone(polling.current_deadline())
+            with polling.deadline(5):
+                with polling.deadline(0):
+                    self.assertEqual(1005.0, polling.current_deadline())
+
+    def test_call_site(self):
+        utils.poll_until(lambda: True)
+
+        self.assertEqual(['%s:test_call_site:%d' % (
+            __name__, self.test_call_site.__code__.co_firstlineno + 1)],
+            list(polling.get_stats()))
+
+    def test_retriever_error(self):
+        self.assertRaises(exception.NotFound, utils.poll_until,
+                          Mock(side_effect=exception.NotFound), name='site')
+        self.assertEqual(1, polling.get_stats()['site']['errors'])
+
+
+class TestSharedPolling(trove_testtools.TestCase):
+
+    def test_same_key_shares_the_loop(self):
+        release = threading.Event()
+        calls = []
+
+        def retriever():
+            calls.append(1)
+            return release.wait(1) and 'ready'
+
+        results = []
+
+        def wait():
+            results.append(utils.poll_until(retriever, sleep_time=0.01,
+                                            time_out=5,
+                                            key=('volume', 'vol-0')))
+
+        waiters = [threading.Thread(target=wait) for _ in range(3)]
+        waiters[0].start()
+        while not polling._shared:
+            release.wait(0.01)
+        for waiter in waiters[1:]:
+            waiter.start()
+        while polling._shared[('volume', 'vol-0')].waiters < 3:
+            release.wait(0.01)
+        release.set()
+        for waiter in waiters:
+            waiter.join()
+
+        self.assertEqual(['ready'] * 3, results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual({}, polling._shared)
+
+    def test_shared_error(self):
+        self.assertRaises(exception.NotFound, utils.poll_until,
+                          Mock(side_effect=exception.NotFound), key='key')
+        self.assertEqual({}, polling._shared)
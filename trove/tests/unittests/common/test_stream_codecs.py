@@ -15,6 +15,7 @@
 #
 
 import os
+from unittest import mock
 
 from trove.common import stream_codecs
 from trove.tests.unittests import trove_testtools
@@ -45,6 +46,14 @@ class TestStreamCodecs(trove_testtools.TestCase):
                 "Serialize/Deserialize failed"
             )
 
+    def test_serialize_deserialize_zlibbase64codec(self):
+        data = b'repeated data ' * 100
+
+        codec = stream_codecs.ZlibBase64Codec()
+        serialized_data = codec.serialize(data)
+        self.assertLess(len(serialized_data), len(data))
+        self.assertEqual(data, codec.deserialize(serialized_data))
+
     def test_serialize_deserialize_keyvaluecodec(self):
         data = {
             "int": 25,
@@ -76,3 +85,75 @@ class TestStreamCodecs(trove_testtools.TestCase):
         deserialized_data['int'] = int(deserialized_data['int'])
         deserialized_data['float'] = float(deserialized_data['float'])
         self.assertEqual(data, deserialized_data)
+
+    def _assert_ini_parser_compatible(self, codec, stream):
+        expected = self._parse_with_config_parser(codec, stream)
+        self.assertEqual(expected, codec.deserialize(stream))
+
+        with mock.patch.object(codec, '_write_sections', return_value=None):
+            expected = codec.serialize(expected)
+        self.assertEqual(expected, codec.serialize(codec.deserialize(stream)))
+
+    def _parse_with_config_parser(self, codec, stream):
+        with mock.patch.object(codec, '_read_sections', return_value=None):
+            return codec.deserialize(stream)
+
+    def test_inicodec_compatible_with_config_parser(self):
+        stream = (
+            "[client]\n"
+            "port = 3306\n"
+            "  socket=/var/run/mysqld/mysqld.sock  \r\n"
+            "\n"
+            "# comment\n"
+            "  ; indented comment\n"
+            "[mysqld] # section comment\n"
+            "Skip-External-Locking\n"
+            "key_buffer_size = 16M # inline\n"
+            "innodb_data_file_path = ibdata1:10M:autoextend\n"
+            "sql_mode: 'STRICT_ALL_TABLES'\n"
+            "empty =\n"
+            "none_value = None\n"
+            "float = 0.5\n"
+            "[a] b]\n"
+            "x = y = z\n"
+            "!includedir /etc/mysql/conf.d/\n")
+
+        for codec in (stream_codecs.IniCodec(),
+                      stream_codecs.IniCodec(
+                          default_value='1',
+                          comment_markers=('#', ';', '!'))):
+            self._assert_ini_parser_compatible(codec, stream)
+
+    def test_inicodec_falls_back_to_config_parser(self):
+        codec = stream_codecs.IniCodec()
+        for stream in ("[DEFAULT]\na = 1\n[s]\nb = 2\n",
+                       "[s]\na = 1\n[s]\nb = 2\n",
+                       "[s]\na = 1\nA = 2\n",
+                       "a = 1\n",
+                       "[s]\n= 1\n"):
+            try:
+                expected = self._parse_with_config_parser(codec, stream)
+            except Exception as e:
+                self.assertRaises(type(e), codec.deserialize, stream)
+            else:
+                self.assertEqual(expected, codec.deserialize(stream))
+
+        self.assertRaises(ValueError, codec.serialize, {'s': {'a': '5%'}})
+        self.assertEqual('[s]\na = 5%%\n\n',
+                         codec.serialize({'s': {'a': '5%%'}}))
+
+    def test_string_converter(self):
+        converter = stream_codecs.StringConverter(
+            {'\t': None, 'on': True, 'yes': True})
+        self.assertEqual(
+            [None, True, 1, 0.5, 'text', "'1'", [1, 2]],
+            list(converter.to_objects(
+                ['\t', 'on', '1', '0.5', 'text', "'1'", '[1, 2]'])))
+        self.assertEqual(
+            ['\t', 'on', '1', 'text'],
+            list(converter.to_strings([None, True, 1, 'text'])))
+
+        # Mutable literals must not be shared between calls.
+        first = converter.to_objects('[1, 2]')
+        first.append(3)
+        self.assertEqual([1, 2], converter.to_objects('[1, 2]'))
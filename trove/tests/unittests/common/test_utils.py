@@ -202,3 +202,9 @@ class TestUtils(trove_testtools.TestCase):
         self.assertRaises(exception.InvalidValue,
                           utils.validate_command,
                           string5)
+
+    def test_jinja_environment_built_once(self):
+        env = utils.get_jinja_environment()
+        self.assertIs(env, utils.get_jinja_environment())
+        self.assertIs(env, utils.ENV)
+        self.assertEqual(max, env.globals['max'])
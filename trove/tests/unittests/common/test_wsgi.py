@@ -14,6 +14,8 @@
 #    under the License.
 #
 from unittest.mock import Mock, patch
+
+from oslo_serialization import jsonutils
 from testtools.matchers import Equals, Is, Not
 import webob.exc
 
@@ -45,6 +47,20 @@ class TestWsgi(trove_testtools.TestCase):
         self.assertThat(ctx.user_id, Equals(user_id))
         self.assertThat(ctx.auth_token, Equals(token))
         self.assertEqual(0, len(ctx.service_catalog))
+        self.assertIsNone(ctx.auth_token_expires)
+
+    def test_process_request_token_expiry(self):
+        middleware = wsgi.ContextMiddleware("test_trove")
+        req = webob.BaseRequest({})
+        req.headers = {'X-Auth-Token': 'MI23fdf2defg123'}
+        req.environ = {'keystone.token_info': {
+            'token': {'expires_at': '2026-10-19T12:00:00.000000Z'}}}
+        # invocation
+        middleware.process_request(req)
+        # assertions
+        ctx = req.environ[wsgi.CONTEXT_KEY]
+        self.assertEqual('2026-10-19T12:00:00.000000Z',
+                         ctx.auth_token_expires)
 
 
 class TestController(trove_testtools.TestCase):
@@ -60,3 +76,110 @@ class TestController(trove_testtools.TestCase):
         result = resource.execute_action('delete', req)
         self.assertIsInstance(result.wrapped_exc,
                               webob.exc.HTTPNotFound)
+
+
+class TestControllerValidation(trove_testtools.TestCase):
+
+    class FakeController(wsgi.Controller):
+        schemas = {
+            'create': {
+                'type': 'object',
+                'required': ['instance'],
+                'properties': {
+                    'instance': {
+                        'type': 'object',
+                        'required': ['name'],
+                        'properties': {'name': {'type': 'string'},
+                                       'size': {'type': 'integer'}}}}},
+            'action': {
+                'restart': {'type': 'object'},
+                'resize': {'type': 'object', 'required': ['flavorRef']}},
+        }
+
+    def test_compile_validators(self):
+        self.assertEqual(3, self.FakeController.compile_validators())
+
+    @patch.object(wsgi.jsonschema, 'Draft4Validator',
+                  wraps=wsgi.jsonschema.Draft4Validator)
+    def test_validator_reused(self, mock_validator):
+        controller = self.FakeController()
+        for _ in range(3):
+            controller.validate_request(
+                'create', {'body': {'instance': {'name': 'name',
+                                                 'size': 1}}})
+        self.assertLessEqual(mock_validator.call_count, 1)
+
+    def test_validation_errors(self):
+        controller = self.FakeController()
+        error = self.assertRaises(
+            exception.BadRequest, controller.validate_request, 'create',
+            {'body': {'instance': {'size': 'big'}}})
+        self.assertIn("instance 'name' is a required property", str(error))
+        self.assertIn("instance['size'] 'big' is not of type 'integer'",
+                      str(error))
+
+
+class TestStreamingResult(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestStreamingResult, self).setUp()
+        self.serializer = wsgi.TroveResponseSerializer()
+        self.items = [{'id': index, 'name': 'item-%d' % index}
+                      for index in range(100)]
+        self.links = [{'rel': 'next', 'href': 'https://localhost/?marker=99'}]
+
+    def _serialize(self, result):
+        response = self.serializer.serialize(result, 'application/json')
+        return response, b''.join(response.app_iter)
+
+    def test_same_body_as_result(self):
+        expected = self.serializer.serialize(
+            wsgi.Result({'items': self.items, 'links': self.links}),
+            'application/json').body
+
+        response, body = self._serialize(
+            wsgi.StreamingResult('items', iter(self.items), self.links))
+
+        self.assertEqual(expected, body)
+        self.assertEqual(200, response.status_int)
+        self.assertIsNone(response.content_length)
+
+    @patch.object(base_wsgi.JSONDictSerializer, 'chunk_size', 100)
+    def test_chunked(self):
+        pulled = []
+
+        def items():
+            for item in self.items:
+                pulled.append(item)
+                yield item
+
+        response = self.serializer.serialize(
+            wsgi.StreamingResult('items', items()), 'application/json')
+        chunks = iter(response.app_iter)
+        first = next(chunks)
+        # Only the items of the first chunks are serialized so far.
+        self.assertLess(len(pulled), 10)
+
+        rest = list(chunks)
+        self.assertEqual(100, len(pulled))
+        self.assertGreater(len(rest), 1)
+        self.assertEqual({'items': self.items},
+                         jsonutils.loads(first + b''.join(rest)))
+
+    def test_empty(self):
+        response, body = self._serialize(wsgi.StreamingResult('items', []))
+        self.assertEqual({'items': []}, jsonutils.loads(body))
+
+    def test_data(self):
+        result = wsgi.StreamingResult('items', iter(self.items), self.links)
+        self.assertEqual({'items': self.items, 'links': self.links},
+                         result.data(None))
+
+    def test_error_before_first_chunk(self):
+        def items():
+            raise exception.TroveError("failed")
+            yield
+
+        self.assertRaises(exception.TroveError, self.serializer.serialize,
+                          wsgi.StreamingResult('items', items()),
+                          'application/json')
@@ -0,0 +1,110 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest.mock import patch
+
+from trove.datastore import models as datastore_models
+from trove.datastore.models import Capabilities
+from trove.datastore.models import CapabilityOverride
+from trove.datastore.models import Datastore
+from trove.datastore.models import DatastoreVersion
+from trove.datastore.models import DBDatastore
+from trove.datastore.models import DBDatastoreVersion
+from trove.tests.unittests.datastore.base import TestDatastoreBase
+
+
+class TestDatastoreCatalog(TestDatastoreBase):
+
+    def setUp(self):
+        super(TestDatastoreCatalog, self).setUp()
+        self.catalog = datastore_models.DatastoreCatalog()
+        patcher = patch.object(datastore_models, 'catalog', self.catalog)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lookups_served_from_catalog(self):
+        Datastore.load(self.ds_name)
+
+        with patch.object(DBDatastore, 'find_by') as mock_find_by, \
+                patch.object(DBDatastoreVersion, 'find_by') as mock_dsv_find:
+            datastore = Datastore.load(self.datastore.id)
+            version = DatastoreVersion.load(datastore, self.ds_version_name)
+            by_uuid = DatastoreVersion.load_by_uuid(self.test_id)
+            mock_find_by.assert_not_called()
+            mock_dsv_find.assert_not_called()
+
+        self.assertEqual(self.ds_name, datastore.name)
+        self.assertEqual(self.test_id, version.id)
+        self.assertEqual(self.ds_version_name, by_uuid.name)
+        stats = self.catalog.stats()
+        self.assertEqual(1, stats['loads'])
+        self.assertEqual(4, stats['hits'])
+        self.assertEqual(1.0, stats['hit_rate'])
+
+    def test_miss_falls_back_to_database(self):
+        Datastore.load(self.ds_name)
+        # Added behind the back of the catalog, e.g. by another process.
+        db_datastore = DBDatastore()
+        db_datastore.id = 'catalog-%s' % self.test_id
+        db_datastore.name = db_datastore.id
+        datastore_models.db_api.save(db_datastore)
+        self.addCleanup(datastore_models.db_api.delete, db_datastore)
+
+        self.assertEqual(db_datastore.id,
+                         Datastore.load(db_datastore.id).name)
+        self.assertEqual(1, self.catalog.stats()['misses'])
+
+    def test_invalidated_on_write(self):
+        self.assertTrue(DatastoreVersion.load_by_uuid(self.test_id).active)
+
+        datastore_models.update_datastore_version(
+            self.ds_name, self.ds_version_name, "mysql", "", "", "", False)
+        self.addCleanup(datastore_models.update_datastore_version,
+                        self.ds_name, self.ds_version_name, "mysql", "", "",
+                        "", True)
+
+        self.assertFalse(DatastoreVersion.load_by_uuid(self.test_id).active)
+        self.assertEqual(2, self.catalog.stats()['loads'])
+
+    @patch.object(datastore_models.time, 'monotonic')
+    def test_expired(self, mock_monotonic):
+        self.patch_conf_property('datastore_cache_ttl', 10)
+        mock_monotonic.return_value = 100
+        Datastore.load(self.ds_name)
+        mock_monotonic.return_value = 109
+        Datastore.load(self.ds_name)
+        self.assertEqual(1, self.catalog.stats()['loads'])
+
+        mock_monotonic.return_value = 110
+        Datastore.load(self.ds_name)
+        self.assertEqual(2, self.catalog.stats()['loads'])
+
+    def test_disabled(self):
+        self.patch_conf_property('datastore_cache_ttl', 0)
+        self.assertEqual(self.ds_name, Datastore.load(self.ds_name).name)
+        self.assertEqual(0, self.catalog.stats()['loads'])
+
+    def test_capabilities(self):
+        override = CapabilityOverride.create(self.cap3, self.test_id,
+                                             enabled=True)
+        self.addCleanup(override.delete)
+
+        capabilities = Capabilities.load(self.test_id)
+
+        self.assertIn(self.cap3.name, capabilities)
+        self.assertNotIn('non-existent', capabilities)
+        loaded = {cap.name: cap for cap in capabilities}
+        self.assertTrue(loaded[self.cap3.name].enabled)
+        self.assertIsInstance(loaded[self.cap3.name], CapabilityOverride)
+        self.assertFalse(
+            {cap.name: cap
+             for cap in Capabilities.load()}[self.cap3.name].enabled)
@@ -0,0 +1,222 @@
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+from unittest import mock
+
+import sqlalchemy
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy import pool
+from sqlalchemy.sql.expression import text
+
+from trove.common import exception
+from trove.guestagent.datastore.mysql import service
+from trove.guestagent.utils import mysql as mysql_util
+from trove.tests.unittests import trove_testtools
+
+
+def create_sqlite_engine():
+    """Create an in-memory SQLite stand-in for the MySQL system tables."""
+    engine = sqlalchemy.create_engine('sqlite://',
+                                      poolclass=pool.StaticPool)
+
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_con, con_record):
+        dbapi_con.create_function('CONCAT', -1, lambda *args: ''.join(args))
+        dbapi_con.execute("ATTACH DATABASE ':memory:' AS mysql")
+        dbapi_con.execute("ATTACH DATABASE ':memory:' AS information_schema")
+        dbapi_con.execute("CREATE TABLE mysql.user (User, Host)")
+        dbapi_con.execute(
+            "CREATE TABLE information_schema.SCHEMA_PRIVILEGES "
+            "(grantee, table_schema, privilege_type)")
+
+    return engine
+
+
+class TestMySqlAdmin(trove_testtools.TestCase):
+    def setUp(self):
+        super(TestMySqlAdmin, self).setUp()
+        self.engine = create_sqlite_engine()
+        app = mock.MagicMock()
+        app.get_engine.return_value = self.engine
+        self.admin = service.MySqlAdmin(app)
+
+        # SQLite has no FLUSH PRIVILEGES.
+        flush_patcher = mock.patch.object(mysql_util, 'FLUSH',
+                                          text('SELECT 1'))
+        self.addCleanup(flush_patcher.stop)
+        flush_patcher.start()
+
+        with self.engine.begin() as conn:
+            for index in range(20):
+                name = 'user%02d' % index
+                conn.execute(text("INSERT INTO mysql.user VALUES "
+                                  "(:name, '%')"), {'name': name})
+                for db, privilege in (('db%d' % (index % 3), 'SELECT'),
+                                      ('db%d' % (index % 3), 'INSERT'),
+                                      ('other', 'USAGE')):
+                    conn.execute(
+                        text("INSERT INTO information_schema."
+                             "SCHEMA_PRIVILEGES VALUES (:grantee, :db, "
+                             ":privilege)"),
+                        {'grantee': "'%s'@'%%'" % name, 'db': db,
+                         'privilege': privilege})
+
+    def test_list_users(self):
+        statements = []
+        event.listen(self.engine, 'before_cursor_execute',
+                     lambda *args: statements.append(args[2]))
+
+        users, _ = self.admin.list_users(limit=5)
+
+        self.assertEqual(['user%02d' % index for index in range(5)],
+                         [user['_name'] for user in users])
+        for index, user in enumerate(users):
+            self.assertEqual([{'_name': 'db%d' % (index % 3),
+                               '_character_set': None,
+                               '_collate': None}],
+                             user['_databases'])
+
+        # One query for the users and one for their schema privileges.
+        self.assertEqual(2, len([stmt for stmt in statements
+                                 if stmt.startswith('SELECT') and
+                                 stmt != 'SELECT 1']))
+
+    def test_list_users_with_marker(self):
+        users, _ = self.admin.list_users(marker="user17@%")
+
+        self.assertEqual(['user18', 'user19'],
+                         [user['_name'] for user in users])
+
+    @mock.patch.object(mysql_util, 'SqlClient')
+    def test_create_users_batched(self, mock_client):
+        client = mock_client.return_value.__enter__.return_value
+        users = [{'_name': 'user%d' % index, '_host': '%',
+                  '_password': 'password',
+                  '_databases': [{'_name': 'db%d' % (index % 2)}]}
+                 for index in range(5)]
+
+        with mock.patch.object(self.admin, 'MAX_BATCH_SIZE', 3):
+            self.admin.create_users(users)
+
+        statements = [str(call[0][0])
+                      for call in client.execute.call_args_list]
+        # The accounts of each batch are looked up before it is created.
+        self.assertEqual(
+            ["SELECT User, Host FROM mysql.user "
+             "WHERE User IN ('user0', 'user1', 'user2');",
+             "SELECT User, Host FROM mysql.user "
+             "WHERE User IN ('user3', 'user4');"],
+            [statement for statement in statements
+             if statement.startswith('SELECT')])
+        statements = [statement for statement in statements
+                      if not statement.startswith('SELECT')]
+        self.assertEqual(
+            ["CREATE USER :user0@:host0 IDENTIFIED BY 'password', "
+             ":user1@:host1 IDENTIFIED BY 'password', "
+             ":user2@:host2 IDENTIFIED BY 'password';",
+             "CREATE USER :user0@:host0 IDENTIFIED BY 'password', "
+             ":user1@:host1 IDENTIFIED BY 'password';",
+             "GRANT ALL PRIVILEGES ON `db0`.* TO "
+             "`user0`@`%`, `user2`@`%`, `user4`@`%`;",
+             "GRANT ALL PRIVILEGES ON `db1`.* TO `user1`@`%`, `user3`@`%`;"],
+            statements)
+        self.assertEqual({'user0': 'user3', 'host0': '%',
+                          'user1': 'user4', 'host1': '%'},
+                         client.execute.call_args_list[3][1])
+
+    @mock.patch.object(mysql_util, 'SqlClient')
+    def test_create_users_validated_first(self, mock_client):
+        users = [{'_name': 'user', '_host': '%', '_password': 'password',
+                  '_databases': []},
+                 {'_name': 'os_admin', '_host': '%', '_password': 'password',
+                  '_databases': []}]
+
+        self.assertRaises(ValueError, self.admin.create_users, users)
+        mock_client.assert_not_called()
+
+    @mock.patch.object(mysql_util, 'SqlClient')
+    def test_create_users_batch_with_failure(self, mock_client):
+        client = mock_client.return_value.__enter__.return_value
+
+        def execute(statement, **kwargs):
+            if 'user1' in kwargs.values() or '`user2`' in str(statement):
+                raise exc.OperationalError(
+                    str(statement), kwargs, Exception('user1 or user2'))
+            return mock.MagicMock()
+        client.execute.side_effect = execute
+        users = [{'_name': 'user%d' % index, '_host': '%',
+                  '_password': 'password', '_databases': [{'_name': 'db'}]}
+                 for index in range(4)]
+
+        error = self.assertRaises(exception.UserCreationError,
+                                  self.admin.create_users, users)
+
+        self.assertEqual(
+            'Failed to create or grant access to the following users: '
+            'user1 (user1 or user2); user2 (user1 or user2).', str(error))
+        statements = [(str(call[0][0]), call[1].get('user'))
+                      for call in client.execute.call_args_list
+                      if not str(call[0][0]).startswith('SELECT')]
+        self.assertTrue(statements[0][0].startswith(
+            "CREATE USER :user0@:host0 IDENTIFIED BY 'password', "
+            ":user1@:host1"))
+        self.assertEqual(
+            ['user0', 'user1', 'user2', 'user3'],
+            [user for statement, user in statements[1:5]])
+        self.assertEqual(
+            ["GRANT ALL PRIVILEGES ON `db`.* TO "
+             "`user0`@`%`, `user2`@`%`, `user3`@`%`;",
+             "GRANT ALL PRIVILEGES ON `db`.* TO `user0`@`%`;",
+             "GRANT ALL PRIVILEGES ON `db`.* TO `user2`@`%`;",
+             "GRANT ALL PRIVILEGES ON `db`.* TO `user3`@`%`;"],
+            [statement for statement, _ in statements[5:]])
+
+    @mock.patch.object(mysql_util, 'SqlClient')
+    def test_create_users_batch_partly_applied(self, mock_client):
+        # MariaDB creates the other accounts of a failed CREATE USER.
+        client = mock_client.return_value.__enter__.return_value
+        accounts = {('user1', '%')}
+
+        def execute(statement, **kwargs):
+            if str(statement).startswith('SELECT'):
+                return mock.Mock(fetchall=lambda: [
+                    mock.Mock(_mapping={'User': name, 'Host': host})
+                    for name, host in sorted(accounts)])
+            if str(statement).startswith('CREATE USER'):
+                names = [value for key, value in kwargs.items()
+                         if key.startswith('user')]
+                accounts.update((name, '%') for name in names
+                                if name != 'user1')
+                if 'user1' in names:
+                    raise exc.OperationalError(
+                        str(statement), kwargs,
+                        Exception('Operation CREATE USER failed'))
+        client.execute.side_effect = execute
+        users = [{'_name': 'user%d' % index, '_host': '%',
+                  '_password': 'password', '_databases': [{'_name': 'db'}]}
+                 for index in range(4)]
+
+        error = self.assertRaises(exception.UserCreationError,
+                                  self.admin.create_users, users)
+
+        self.assertEqual(
+            'Failed to create or grant access to the following users: '
+            'user1 (Operation CREATE USER failed).', str(error))
+        statements = [(str(call[0][0]), call[1].get('user'))
+                      for call in client.execute.call_args_list
+                      if not str(call[0][0]).startswith('SELECT')]
+        # Only the account that failed is created again.
+        self.assertEqual(('user1',), tuple(
+            user for statement, user in statements[1:-1]))
+        self.assertEqual(
+            "GRANT ALL PRIVILEGES ON `db`.* TO "
+            "`user0`@`%`, `user2`@`%`, `user3`@`%`;", statements[-1][0])
@@ -12,6 +12,7 @@
 
 from unittest import mock
 
+from trove.common import exception
 from trove.guestagent.datastore.postgres import service
 from trove.tests.unittests import trove_testtools
 
@@ -52,3 +53,186 @@ class TestPostgresConnection(trove_testtools.TestCase):
         connection = service.PostgresConnection(username, port=port)
         self.assertEqual(result, connection.query(statement),
                          'postgres_connection_query does not returns expected')
+
+
+class TestPostgresConnectionPool(trove_testtools.TestCase):
+    def setUp(self):
+        super(TestPostgresConnectionPool, self).setUp()
+        self.patch_datastore_manager('postgresql')
+        self.addCleanup(service.reset_connection_pools)
+        patcher = mock.patch.object(service.psycopg2, 'connect',
+                                    side_effect=self._connect)
+        self.addCleanup(patcher.stop)
+        self.mock_connect = patcher.start()
+
+        self.connections = []
+
+    def _connect(self, connect_str):
+        connection = mock.MagicMock(closed=0, connect_str=connect_str)
+        connection.get_transaction_status.return_value = (
+            service.psycopg2_extensions.TRANSACTION_STATUS_IDLE)
+        connection.close.side_effect = lambda: setattr(connection,
+                                                       'closed', 1)
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.execute.side_effect = self._execute
+        self.connections.append(connection)
+        return connection
+
+    def _execute(self, statement, *args):
+        # The server refuses to drop a database with open connections.
+        if statement.startswith('DROP DATABASE'):
+            database = statement.split('"')[1]
+            if [connection for connection in self.connections
+                    if not connection.closed and
+                    "dbname='%s'" % database in connection.connect_str]:
+                raise service.psycopg2.errors.ObjectInUse(
+                    'database "%s" is being accessed by other users'
+                    % database)
+
+    def test_connection_reused(self):
+        connection = service.PostgresConnection(username, port=port)
+        connection.execute(statement)
+        connection.query(statement)
+        connection.execute_transaction([statement, statement])
+
+        self.assertEqual(1, self.mock_connect.call_count)
+        self.assertEqual(1, len(service.get_connection_pool(
+            username, connection.connect_str)._idle))
+
+    def test_user_database_not_pooled(self):
+        service.PostgresConnection(username, port=port).query(statement)
+        connection = service.PostgresConnection(username, port=port,
+                                                database='db1')
+        connection.query(statement)
+        connection.query(statement)
+
+        self.assertEqual(3, self.mock_connect.call_count)
+        self.assertEqual(1, len(service._connection_pools))
+        self.assertTrue(all(conn.closed for conn in self.connections[1:]))
+
+    def test_drop_database_after_grant(self):
+        admin = service.PgSqlAdmin(username)
+        with mock.patch.object(admin, '_database_exists', return_value=True):
+            admin.grant_access('user1', None, ['db1'])
+        admin._grant_access_bulk('db1', ['user2', 'user3'])
+
+        admin.delete_database(
+            service.models.PostgreSQLSchema('db1').serialize())
+
+        self.assertFalse([conn for conn in self.connections
+                          if "dbname='db1'" in conn.connect_str and
+                          not conn.closed])
+
+    def test_pools_bounded(self):
+        self.patch_conf_property('connection_pool_max_connections', 2,
+                                 section='postgresql')
+        pools = [service.get_connection_pool(
+            user, service.PostgresConnection(user).connect_str)
+            for user in ('user1', 'user2', 'user3')]
+        connections = [pool.acquire() for pool in pools]
+        for pool, connection in zip(pools, connections):
+            pool.release(connection)
+
+        self.assertEqual([1, 1, 0], [len(pool._idle) for pool in pools])
+        connections[2].close.assert_called_once_with()
+
+        # A reused connection frees its slot
+        pools[2].release(pools[0].acquire())
+        self.assertEqual([0, 1, 1], [len(pool._idle) for pool in pools])
+
+    def test_broken_connection_discarded(self):
+        connection = service.PostgresConnection(username, port=port)
+        connection.query(statement)
+        pool = service.get_connection_pool(username, connection.connect_str)
+        broken = pool._idle[0][0]
+        broken.closed = 2
+
+        connection.query(statement)
+        self.assertEqual(2, self.mock_connect.call_count)
+        broken.close.assert_called_once_with()
+
+    def test_stale_connection_checked(self):
+        connection = service.PostgresConnection(username, port=port)
+        connection.query(statement)
+        pool = service.get_connection_pool(username, connection.connect_str)
+        stale, _ = pool._idle[0]
+        pool._idle[0] = (stale, 0)
+        stale.cursor.return_value.__enter__.return_value.execute.\
+            side_effect = service.psycopg2.OperationalError
+
+        connection.query(statement)
+        self.assertEqual(2, self.mock_connect.call_count)
+
+    def test_pool_bounded(self):
+        self.patch_conf_property('connection_pool_size', 1,
+                                 section='postgresql')
+        connect_str = service.PostgresConnection(username).connect_str
+        pool = service.get_connection_pool(username, connect_str)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(first)
+        pool.release(second)
+
+        self.assertEqual([first], [conn for conn, _ in pool._idle])
+        second.close.assert_called_once_with()
+
+    def test_reset_on_password_change(self):
+        admin = service.PgSqlAdmin(username)
+        admin.query(statement)
+        pool = service.get_connection_pool(username,
+                                           admin.connection.connect_str)
+        pooled, _ = pool._idle[0]
+
+        admin.alter_user(service.models.PostgreSQLUser(username, 'newpass'))
+        pooled.close.assert_called_once_with()
+
+    def test_create_users_in_transaction(self):
+        admin = service.PgSqlAdmin(username)
+        users = [service.models.PostgreSQLUser(
+            'user%d' % i, 'password', databases=['db1']).serialize()
+            for i in range(3)]
+
+        with mock.patch.object(admin, '_database_exists', return_value=True):
+            with mock.patch.object(service.PostgresConnection,
+                                   'execute_transaction') as transaction:
+                admin.create_users(users)
+
+        self.assertEqual(2, transaction.call_count)
+        self.assertEqual(3, len(transaction.call_args_list[0][0][0]))
+        self.assertEqual(
+            ['GRANT ALL ON DATABASE "db1" TO "user0", "user1", "user2"',
+             'GRANT USAGE, CREATE ON SCHEMA "public" TO '
+             '"user0", "user1", "user2"'],
+            transaction.call_args_list[1][0][0])
+
+    def test_create_users_batch_with_failure(self):
+        admin = service.PgSqlAdmin(username)
+        users = [service.models.PostgreSQLUser(
+            'user%d' % i, 'password', databases=['db1']).serialize()
+            for i in range(3)]
+        transactions = []
+
+        def execute_transaction(statements):
+            transactions.append(statements)
+            if [statement for statement in statements
+                    if '"user1"' in statement]:
+                raise service.psycopg2.errors.DuplicateObject(
+                    'role "user1" already exists')
+
+        with mock.patch.object(admin, '_database_exists', return_value=True):
+            with mock.patch.object(service.PostgresConnection,
+                                   'execute_transaction',
+                                   side_effect=execute_transaction):
+                error = self.assertRaises(exception.UserCreationError,
+                                          admin.create_users, users)
+
+        self.assertEqual(
+            'Failed to create or grant access to the following users: '
+            'user1 (role "user1" already exists).', str(error))
+        # The batch, then one transaction per user
+        self.assertEqual([3, 1, 1, 1],
+                         [len(statements) for statements in transactions[:4]])
+        self.assertEqual(
+            ['GRANT ALL ON DATABASE "db1" TO "user0", "user2"',
+             'GRANT USAGE, CREATE ON SCHEMA "public" TO "user0", "user2"'],
+            transactions[4])
+        self.assertEqual(5, len(transactions))
@@ -11,11 +11,15 @@
 #    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
+import os
+import shutil
+import tempfile
 from unittest import mock
 
 from trove.common import ssl
 from trove.guestagent.common import operating_system
 from trove.guestagent.datastore import manager as base_manager
+from trove.guestagent import guest_log
 from trove.tests.unittests import trove_testtools
 
 
@@ -61,3 +65,27 @@ class TestManager(trove_testtools.TestCase):
 
         mock_chown.assert_called_once_with(
             '/fake/test.log', user='1001', group='1001', as_root=True)
+
+    @mock.patch.object(operating_system, 'chmod')
+    def test_guest_log_enabled_from_datastore(self, mock_chmod):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        state_file = os.path.join(tmp_dir, 'state.json')
+        guest_log.LogStateIndex(state_file).update('general', enabled=True)
+        self.manager._guest_log_state = guest_log.LogStateIndex(state_file)
+        self.manager.guest_log_context = mock.MagicMock()
+        log_defs = {'general': {
+            self.manager.GUEST_LOG_TYPE_LABEL: guest_log.LogType.USER,
+            self.manager.GUEST_LOG_USER_LABEL: 'database',
+            self.manager.GUEST_LOG_FILE_LABEL: '/fake/general.log'}}
+
+        # The log was disabled since, e.g. by a configuration change.
+        with mock.patch.object(self.manager, 'get_guest_log_defs',
+                               return_value=log_defs):
+            gl_cache = self.manager.get_guest_log_cache()
+
+        self.assertFalse(gl_cache['general'].enabled)
+        self.assertEqual(guest_log.LogStatus.Disabled,
+                         gl_cache['general'].status)
+        self.assertFalse(guest_log.LogStateIndex(state_file).get(
+            'general')['enabled'])
@@ -0,0 +1,109 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from trove.common.stream_codecs import IniCodec
+from trove.guestagent.common import configuration
+from trove.guestagent.common import operating_system
+from trove.tests.unittests import trove_testtools
+
+
+class TestConfigurationManagerCache(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestConfigurationManagerCache, self).setUp()
+        self.root_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root_dir)
+
+        self.base_config_path = os.path.join(self.root_dir, 'my.cnf')
+        self.revision_dir = os.path.join(self.root_dir, 'conf.d')
+        os.mkdir(self.revision_dir)
+        with open(self.base_config_path, 'w') as fp:
+            fp.write('[mysqld]\nport = 3306\nmax_connections = 100\n')
+
+        # Ownership changes require superuser privileges.
+        for name in ('chown', 'chmod', 'ensure_directory'):
+            patcher = mock.patch.object(operating_system, name)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+
+        self.manager = configuration.ConfigurationManager(
+            self.base_config_path, 'mysql', 'mysql', IniCodec(),
+            override_strategy=configuration.ImportOverrideStrategy(
+                self.revision_dir, 'cnf'))
+
+    def test_get_value(self):
+        self.assertEqual(
+            100, self.manager.get_value('max_connections', section='mysqld'))
+
+        self.manager.apply_user_override(
+            {'mysqld': {'max_connections': 200}})
+        self.assertEqual(
+            200, self.manager.get_value('max_connections', section='mysqld'))
+
+        self.manager.apply_system_override({'mysqld': {'port': 3307}})
+        self.assertEqual(3307, self.manager.get_value('port',
+                                                      section='mysqld'))
+
+        self.manager.remove_user_override()
+        self.assertEqual(
+            100, self.manager.get_value('max_connections', section='mysqld'))
+
+    def test_parse_only_changed_revisions(self):
+        for index in range(5):
+            self.manager.apply_user_override(
+                {'mysqld': {'opt%d' % index: index}}, change_id=str(index))
+
+        with mock.patch.object(operating_system, 'read_file',
+                               wraps=operating_system.read_file) as read:
+            self.manager.apply_user_override(
+                {'mysqld': {'opt5': 5}}, change_id='5')
+
+            # Only the new revision file gets parsed.
+            read_paths = [call[0][0] for call in read.call_args_list]
+            self.assertNotIn(self.base_config_path, read_paths)
+            self.assertEqual(1, len(read_paths))
+
+        for index in range(6):
+            self.assertEqual(index, self.manager.get_value(
+                'opt%d' % index, section='mysqld'))
+
+    def test_external_change_invalidates_cache(self):
+        self.assertEqual(3306, self.manager.get_value('port',
+                                                      section='mysqld'))
+
+        with open(self.base_config_path, 'w') as fp:
+            fp.write('[mysqld]\nport = 3310\nmax_connections = 100\n')
+        self.assertEqual(3310, self.manager.get_value('port',
+                                                      section='mysqld'))
+
+        revision_path = os.path.join(self.revision_dir, '20-user-001-x.cnf')
+        with open(revision_path, 'w') as fp:
+            fp.write('[mysqld]\nport = 3311\n')
+        self.assertEqual(3311, self.manager.get_value('port',
+                                                      section='mysqld'))
+
+        os.remove(revision_path)
+        self.assertEqual(3310, self.manager.get_value('port',
+                                                      section='mysqld'))
+
+    def test_cached_values_not_shared(self):
+        self.manager.apply_user_override({'mysqld': {'max_connections': 1}})
+
+        parsed = self.manager.parse_configuration()
+        parsed['mysqld']['max_connections'] = 2
+        self.assertEqual(
+            1, self.manager.parse_configuration()['mysqld']['max_connections'])
@@ -0,0 +1,99 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from trove.guestagent import guest_log
+from trove.tests.unittests import trove_testtools
+
+
+class TestGuestLogState(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestGuestLogState, self).setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir)
+        self.state_file = os.path.join(self.tmp_dir, 'state.json')
+        self.log_file = os.path.join(self.tmp_dir, 'general.log')
+        with open(self.log_file, 'w') as log:
+            log.write('first line\nsecond line\n')
+
+        patcher = patch.object(guest_log.operating_system, 'chmod')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.swift = MagicMock()
+        patcher = patch.object(guest_log.clients, 'swift_client',
+                               return_value=self.swift)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _guest_log(self, state_index):
+        return guest_log.GuestLog(
+            MagicMock(is_admin=True), 'general', guest_log.LogType.USER,
+            'mysql', self.log_file, True, state_index=state_index)
+
+    def test_index_persisted(self):
+        index = guest_log.LogStateIndex(self.state_file)
+        index.update('general', enabled=True)
+        index.update('general', published_size=10)
+
+        self.assertEqual({'enabled': True, 'published_size': 10},
+                         guest_log.LogStateIndex(self.state_file).get(
+                             'general'))
+        self.assertEqual({}, index.get('slow_query'))
+        self.assertFalse(os.path.exists(self.state_file + '.tmp'))
+
+    def test_expired_publication(self):
+        index = guest_log.LogStateIndex(self.state_file)
+        index.update('general', published_size=10, container='logs',
+                     header_digest='digest', expires=time.time() - 1)
+
+        self.assertEqual({'published_size': 0}, index.get('general'))
+
+    def test_show_from_index(self):
+        index = guest_log.LogStateIndex(self.state_file)
+        log = self._guest_log(index)
+        log.enabled = True
+        log.status = guest_log.LogStatus.Enabled
+        log._update_log_header_digest(self.log_file)
+        log._published_size = 11
+        log._container_name = 'database_logs'
+        log._put_meta_details()
+        self.swift.reset_mock()
+
+        # A new agent lists the logs without any Swift request.
+        log = self._guest_log(guest_log.LogStateIndex(self.state_file))
+        log.status = guest_log.LogStatus.Enabled
+        details = log.show()
+
+        self.assertEqual(0, len(self.swift.mock_calls))
+        self.assertEqual(11, details['published'])
+        self.assertEqual(12, details['pending'])
+        self.assertEqual('database_logs', details['container'])
+        self.assertEqual('Partial', details['status'])
+
+    def test_show_saves_swift_details(self):
+        self.swift.get_object.return_value = (
+            {'x-delete-at': str(int(time.time()) + 60)},
+            '{"log_size": 0, "log_header_digest": "digest"}')
+        index = guest_log.LogStateIndex(self.state_file)
+
+        self._guest_log(index).show()
+        self._guest_log(index).show()
+
+        self.swift.get_object.assert_called_once()
+        self.assertEqual(0, index.get('general')['published_size'])
@@ -0,0 +1,249 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from unittest.mock import patch
+
+from oslo_serialization import base64
+from swiftclient.client import ClientException
+
+from trove.common import context
+from trove.common import exception
+from trove.common import stream_codecs
+from trove.guestagent import api as guest_api
+from trove.guestagent.module import module_manager
+from trove.tests.unittests import trove_testtools
+
+CONTENTS = base64.encode_as_bytes(b'module contents' * 100)
+MD5 = hashlib.md5(CONTENTS).hexdigest()
+
+
+class TestModuleManager(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestModuleManager, self).setUp()
+        self.base_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base_dir)
+        self.manager = module_manager.ModuleManager
+        for name, value in (
+                ('MODULE_BASE_DIR', self.base_dir),
+                ('MODULE_STORE_DIR', os.path.join(self.base_dir, '.store')),
+                ('_registry', None)):
+            patcher = patch.object(self.manager, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_contents_stored_by_md5(self):
+        self.assertEqual([MD5], self.manager.missing_contents([MD5]))
+
+        module_dir = self.manager.build_module_dir('ping', 'mod-1')
+        self.manager.write_module_contents(module_dir, CONTENTS, MD5)
+
+        self.assertEqual([], self.manager.missing_contents([MD5]))
+        # The contents are not sent again to apply the module elsewhere.
+        other_dir = self.manager.build_module_dir('ping', 'mod-2')
+        contents_file = self.manager.write_module_contents(
+            other_dir, None, MD5)
+        with open(contents_file, 'rb') as contents:
+            self.assertEqual(b'module contents' * 100, contents.read())
+
+    def test_contents_not_rewritten(self):
+        module_dir = self.manager.build_module_dir('ping', 'mod-1')
+        self.manager.write_module_result(module_dir, {'md5': MD5})
+        self.manager.write_module_contents(module_dir, CONTENTS, MD5)
+
+        with patch.object(module_manager.operating_system,
+                          'write_file') as mock_write:
+            self.manager.write_module_contents(module_dir, CONTENTS, MD5)
+        mock_write.assert_not_called()
+
+    def _apply(self, module_id, **result):
+        module_dir = self.manager.build_module_dir('ping', module_id)
+        self.manager.write_module_contents(module_dir, CONTENTS, MD5)
+        result.setdefault('updated', module_id)
+        result.setdefault('visible', True)
+        self.manager.write_module_result(module_dir, result)
+        return module_dir
+
+    def test_read_results_from_registry(self):
+        self._apply('mod-1', name='one')
+        module_dir = self._apply('mod-2', name='two')
+        self._apply('mod-3', name='hidden', visible=False)
+        self.manager.remove_module_result(module_dir)
+
+        with patch.object(module_manager.operating_system,
+                          'list_files_in_directory') as mock_list:
+            results = self.manager.read_module_results(
+                include_contents=True)
+        mock_list.assert_not_called()
+        self.assertEqual(['one'], [result['name'] for result in results])
+        self.assertEqual(CONTENTS.decode(), results[0]['contents'])
+        self.assertEqual(['hidden', 'one'], sorted(
+            result['name']
+            for result in self.manager.read_module_results(is_admin=True)))
+
+    def test_registry_rebuilt_from_results(self):
+        self._apply('mod-1', name='one')
+        self._apply('mod-2', name='two')
+        os.remove(self.manager.get_registry_filename())
+        self.manager._registry = None
+
+        results = self.manager.read_module_results()
+
+        self.assertEqual(['two', 'one'],
+                         [result['name'] for result in results])
+        self.assertTrue(os.path.exists(
+            self.manager.get_registry_filename()))
+
+    def test_registry_written_atomically(self):
+        self._apply('mod-1', name='one')
+
+        with patch.object(module_manager.os, 'rename',
+                          side_effect=OSError):
+            self.assertRaises(OSError, self._apply, 'mod-2', name='two')
+        self.manager._registry = None
+
+        self.assertEqual(['one'], [result['name'] for result in
+                                   self.manager.read_module_results()])
+
+    def test_prune_store(self):
+        self._apply('mod-1', name='one', md5=MD5)
+        other = base64.encode_as_bytes(b'other contents')
+        other_md5 = hashlib.md5(other).hexdigest()
+        module_dir = self.manager.build_module_dir('ping', 'mod-2')
+        self.manager.write_module_contents(module_dir, other, other_md5)
+        self.manager.write_module_result(module_dir, {'md5': other_md5})
+        self.manager.remove_module_result(module_dir)
+
+        self.manager.prune_store()
+
+        self.assertEqual([other_md5], self.manager.missing_contents(
+            [MD5, other_md5]))
+
+    def test_md5_mismatch(self):
+        self.assertRaises(exception.ModuleInvalid,
+                          self.manager.store_contents, CONTENTS, 'bad-md5')
+
+    def test_unpack_contents(self):
+        self.manager.store_contents(CONTENTS, MD5)
+        compressed = stream_codecs.ZlibBase64Codec().serialize(CONTENTS)
+
+        self.assertEqual(CONTENTS, self.manager.unpack_contents(
+            None, {'contents': compressed, 'contents_encoding': 'zlib'}))
+        self.assertEqual(CONTENTS, self.manager.unpack_contents(
+            None, {'md5': MD5}))
+        self.assertRaises(exception.ModuleInvalid,
+                          self.manager.unpack_contents, None,
+                          {'md5': 'unknown'})
+
+    @patch.object(module_manager.clients, 'swift_client')
+    def test_unpack_contents_from_swift(self, mock_swift):
+        mock_swift.return_value.get_object.return_value = ({}, CONTENTS)
+
+        self.assertEqual(CONTENTS, self.manager.unpack_contents(
+            'ctxt', {'contents_location': {'container': 'modules',
+                                           'object': MD5}}))
+        mock_swift.return_value.get_object.assert_called_once_with(
+            'modules', MD5)
+
+
+class TestModuleApply(trove_testtools.TestCase):
+
+    @patch.object(guest_api.API, 'get_client')
+    def setUp(self, *args):
+        super(TestModuleApply, self).setUp()
+        self.api = guest_api.API(context.TroveContext(), 'instance-id')
+        self.api.client.can_send_version.return_value = True
+        self.modules = [
+            {'module': {'name': name, 'md5': md5, 'contents': contents,
+                        'is_admin': False}}
+            for name, md5, contents in (('cached', 'md5-1', b'cached'),
+                                        ('new', MD5, CONTENTS))]
+
+    @patch.object(guest_api.API, '_call')
+    def test_only_missing_contents_sent(self, mock_call):
+        mock_call.return_value = [MD5]
+
+        self.api.module_apply(self.modules)
+
+        self.assertEqual(2, mock_call.call_count)
+        self.assertEqual(['md5-1', MD5],
+                         mock_call.call_args_list[0][1]['md5s'])
+        cached, new = [data['module']
+                       for data in mock_call.call_args[1]['modules']]
+        self.assertNotIn('contents', cached)
+        self.assertEqual('zlib', new['contents_encoding'])
+        self.assertLess(len(new['contents']), len(CONTENTS))
+        self.assertEqual(CONTENTS, stream_codecs.ZlibBase64Codec().deserialize(
+            new['contents']))
+
+    @patch.object(guest_api.clients, 'create_swift_client')
+    @patch.object(guest_api.API, '_call')
+    def test_large_contents_through_swift(self, mock_call, mock_swift):
+        self.patch_conf_property('module_swift_threshold', 100)
+        mock_call.return_value = [MD5]
+        mock_swift.return_value.head_object.side_effect = ClientException(
+            'Not Found', http_status=404)
+
+        self.api.module_apply(self.modules)
+
+        new = mock_call.call_args[1]['modules'][1]['module']
+        self.assertEqual({'container': 'database_modules', 'object': MD5},
+                         new['contents_location'])
+        self.assertNotIn('contents', new)
+        mock_swift.return_value.put_object.assert_called_once_with(
+            'database_modules', MD5, CONTENTS,
+            headers={'X-Delete-After': '86400'})
+
+    @patch.object(guest_api.clients, 'create_swift_client')
+    @patch.object(guest_api.API, '_call')
+    def test_contents_in_swift_reused(self, mock_call, mock_swift):
+        self.patch_conf_property('module_swift_threshold', 100)
+        mock_call.return_value = [MD5]
+        swift = mock_swift.return_value
+        swift.head_object.return_value = {
+            'x-delete-at': str(int(time.time()) + 3600)}
+
+        self.api.module_apply(self.modules)
+        swift.put_object.assert_not_called()
+
+        # Uploaded again if it could expire before the guest downloads it.
+        swift.head_object.return_value = {
+            'x-delete-at': str(int(time.time()) + 10)}
+        self.api.module_apply(self.modules)
+        swift.put_object.assert_called_once()
+
+    @patch.object(guest_api.clients, 'create_swift_client')
+    @patch.object(guest_api.API, '_call')
+    def test_swift_error(self, mock_call, mock_swift):
+        self.patch_conf_property('module_swift_threshold', 100)
+        mock_call.return_value = [MD5]
+        mock_swift.return_value.head_object.side_effect = ClientException(
+            'Service Unavailable', http_status=503)
+
+        self.assertRaises(ClientException, self.api.module_apply,
+                          self.modules)
+        mock_swift.return_value.put_object.assert_not_called()
+
+    @patch.object(guest_api.API, '_call')
+    def test_old_guest(self, mock_call):
+        self.api.client.can_send_version.return_value = False
+
+        self.api.module_apply(self.modules)
+
+        mock_call.assert_called_once_with(
+            'module_apply', self.api.agent_high_timeout, version='1.0',
+            modules=self.modules)
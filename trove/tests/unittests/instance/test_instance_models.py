@@ -18,6 +18,8 @@ from unittest.mock import Mock
 from unittest.mock import patch
 from unittest.mock import PropertyMock
 
+from oslo_utils import encodeutils
+
 from trove.backup import models as backup_models
 from trove.common import cfg
 from trove.common import clients
@@ -528,6 +530,106 @@ class TestInstanceKeyCaching(trove_testtools.TestCase):
         self.assertIsNone(keycache[30])
         self.assertEqual(keyfn.call_count, 2)
 
+    def test_lru_order(self):
+        keyfn = Mock(side_effect=trivial_key_function)
+        keycache = instance_encryption_key_cache(keyfn, 3)
+        for key in (1, 2, 3, 1, 4):
+            keycache.get(key)
+
+        self.assertIn(1, keycache)
+        self.assertNotIn(2, keycache)
+        self.assertEqual(3, len(keycache))
+        self.assertEqual({'size': 3, 'capacity': 3, 'hits': 1,
+                          'misses': 4, 'evictions': 1}, keycache.stats())
+
+    @patch('trove.instance.models.time.monotonic')
+    def test_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        keyfn = Mock(return_value=b'key')
+        keycache = instance_encryption_key_cache(keyfn, 5, ttl=10)
+        self.assertEqual('key', keycache[1])
+        mock_monotonic.return_value = 109
+        self.assertEqual('key', keycache[1])
+        self.assertEqual(1, keyfn.call_count)
+        mock_monotonic.return_value = 110
+        self.assertEqual('key', keycache[1])
+        self.assertEqual(2, keyfn.call_count)
+
+    def test_configured_capacity(self):
+        self.patch_conf_property('instance_rpc_encr_key_cache_size', 2)
+        keycache = instance_encryption_key_cache(trivial_key_function)
+        for key in range(5):
+            keycache.get(key)
+        self.assertEqual(2, len(keycache))
+
+    def test_warm(self):
+        keyfn = Mock(return_value='fetched')
+        keycache = instance_encryption_key_cache(keyfn, 3)
+        keycache.get('existing')
+
+        self.assertEqual(2, keycache.warm([('a', 'key-a'), ('b', None),
+                                           ('c', 'key-c'), ('existing', 'x'),
+                                           ('d', 'key-d'), ('e', 'key-e')]))
+        self.assertEqual('key-a', keycache['a'])
+        self.assertEqual('fetched', keycache['existing'])
+        self.assertEqual(1, keyfn.call_count)
+        self.assertEqual(0, keycache.stats()['evictions'])
+
+        # Warmed keys are the first candidates for eviction.
+        keycache.get('f')
+        self.assertNotIn('c', keycache)
+
+    def test_warm_from_database(self):
+        self.patch_conf_property('enable_secure_rpc_messaging', True)
+        instances = [DBInstance.create(name='key-cache-%d' % index,
+                                       flavor_id=1, tenant_id='tenant',
+                                       task_status=InstanceTasks.NONE)
+                     for index in range(2)]
+        deleted = DBInstance.create(name='key-cache-deleted', flavor_id=1,
+                                    tenant_id='tenant',
+                                    task_status=InstanceTasks.NONE)
+        deleted.update(deleted=True)
+
+        keycache = instance_encryption_key_cache(Mock())
+        with patch.object(models, '_instance_encryption_key', keycache):
+            models.warm_instance_encryption_key_cache()
+
+        for instance in instances:
+            self.assertEqual(encodeutils.safe_decode(instance.key),
+                             keycache[instance.id])
+        self.assertNotIn(deleted.id, keycache)
+
+
+class TestLoadInstanceStatuses(trove_testtools.TestCase):
+
+    def test_load_instance_statuses(self):
+        ready = DBInstance.create(name='statuses-ready', flavor_id=1,
+                                  tenant_id='tenant',
+                                  task_status=InstanceTasks.NONE)
+        InstanceServiceStatus.create(instance_id=ready.id,
+                                     status=ServiceStatuses.INSTANCE_READY)
+        failed = DBInstance.create(
+            name='statuses-failed', flavor_id=1, tenant_id='tenant',
+            task_status=InstanceTasks.BUILDING_ERROR_SERVER)
+        InstanceServiceStatus.create(instance_id=failed.id,
+                                     status=ServiceStatuses.NEW)
+        # Not reported any status yet.
+        new = DBInstance.create(name='statuses-new', flavor_id=1,
+                                tenant_id='tenant',
+                                task_status=InstanceTasks.BUILDING)
+
+        statuses = models.load_instance_statuses(
+            [ready.id, failed.id, new.id])
+
+        self.assertEqual(
+            {ready.id: (ServiceStatuses.INSTANCE_READY, InstanceTasks.NONE),
+             failed.id: (ServiceStatuses.NEW,
+                         InstanceTasks.BUILDING_ERROR_SERVER)},
+            statuses)
+
+    def test_load_no_instance_statuses(self):
+        self.assertEqual({}, models.load_instance_statuses([]))
+
 
 class TestDetailInstance(trove_testtools.TestCase):
     def setUp(self):
@@ -0,0 +1,78 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+import time
+
+from trove.common import exception
+from trove.common.strategies.cluster.executor import ClusterExecutor
+from trove.tests.unittests import trove_testtools
+
+
+class TestClusterExecutor(trove_testtools.TestCase):
+
+    def test_results_in_item_order(self):
+        def slow_square(item):
+            # The first items finish last.
+            time.sleep(0.01 * (5 - item))
+            return item * item
+
+        executor = ClusterExecutor('create', 'cluster', max_workers=5)
+        self.assertEqual([0, 1, 4, 9, 16],
+                         executor.map('load', slow_square, range(5)))
+        self.assertEqual(['load'], list(executor.timings))
+
+    def test_parallel(self):
+        barrier = threading.Barrier(3, timeout=5)
+        executor = ClusterExecutor('create', 'cluster', max_workers=3)
+
+        # Deadlocks (and breaks the barrier) unless the calls overlap.
+        executor.map('join', lambda item: barrier.wait(), range(3))
+
+    def test_ordered(self):
+        running = []
+        calls = []
+
+        def step(item):
+            running.append(item)
+            calls.append(len(running))
+            running.remove(item)
+
+        executor = ClusterExecutor('create', 'cluster', max_workers=3)
+        executor.map('bootstrap', step, range(3), ordered=True)
+
+        self.assertEqual([1, 1, 1], calls)
+
+    def test_error(self):
+        calls = []
+
+        def step(item):
+            calls.append(item)
+            if item == 1:
+                raise exception.TroveError("failed")
+
+        executor = ClusterExecutor('grow', 'cluster', max_workers=3)
+        self.assertRaises(exception.TroveError, executor.map, 'complete',
+                          step, range(3))
+        # The other members are not abandoned half way.
+        self.assertEqual([0, 1, 2], sorted(calls))
+        self.assertIn('complete', executor.timings)
+
+    def test_phase_timings(self):
+        self.patch_conf_property('cluster_max_parallel_operations', 1)
+        with ClusterExecutor('shrink', 'cluster') as executor:
+            with executor.phase('remove'):
+                pass
+            executor.map('complete', str, [1, 2])
+            executor.map('remove', str, [3])
+
+        self.assertEqual(['remove', 'complete'], list(executor.timings))
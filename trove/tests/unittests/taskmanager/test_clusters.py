@@ -76,13 +76,10 @@ class CassandraClusterTasksTest(trove_testtools.TestCase):
                                          datastore=mock_ds1,
                                          datastore_version=mock_dv1)
 
-    @patch.object(DBInstance, 'find_by')
-    @patch.object(InstanceServiceStatus, 'find_by')
-    def test_all_instances_healthy(self, mock_find, mock_db_find):
-        (mock_find.return_value.
-         get_status.return_value) = ServiceStatuses.HEALTHY
-        (mock_db_find.return_value.
-         get_task_status.return_value) = InstanceTasks.NONE
+    @patch('trove.instance.models.load_instance_statuses')
+    def test_all_instances_healthy(self, mock_statuses):
+        mock_statuses.side_effect = lambda ids: dict.fromkeys(
+            ids, (ServiceStatuses.HEALTHY, InstanceTasks.NONE))
         ret_val = self.clustertasks._all_instances_healthy(["1", "2"],
                                                            self.cluster_id)
         self.assertTrue(ret_val)
@@ -150,48 +147,69 @@ class MongoDbClusterTasksTest(trove_testtools.TestCase):
                                          datastore_version=mock_dv1)
 
     @patch.object(ClusterTasks, 'update_statuses_on_failure')
-    @patch.object(DBInstance, 'find_by')
-    @patch.object(InstanceServiceStatus, 'find_by')
+    @patch('trove.instance.models.load_instance_statuses')
     @patch('trove.taskmanager.models.LOG')
     def test_all_instances_ready_with_server_error(self,
-                                                   mock_logging, mock_find,
-                                                   mock_db_find, mock_update):
-        (mock_find.return_value.
-         get_status.return_value) = ServiceStatuses.NEW
-        (mock_db_find.return_value.
-         get_task_status.return_value) = InstanceTasks.BUILDING_ERROR_SERVER
+                                                   mock_logging, mock_statuses,
+                                                   mock_update):
+        mock_statuses.side_effect = lambda ids: dict.fromkeys(
+            ids, (ServiceStatuses.NEW, InstanceTasks.BUILDING_ERROR_SERVER))
         ret_val = self.clustertasks._all_instances_ready(["1", "2", "3", "4"],
                                                          self.cluster_id)
         mock_update.assert_called_with(self.cluster_id, None)
         self.assertFalse(ret_val)
 
     @patch.object(ClusterTasks, 'update_statuses_on_failure')
-    @patch.object(DBInstance, 'find_by')
-    @patch.object(InstanceServiceStatus, 'find_by')
+    @patch('trove.instance.models.load_instance_statuses')
     @patch('trove.taskmanager.models.LOG')
     def test_all_instances_ready_bad_status(self, mock_logging,
-                                            mock_find, mock_db_find,
+                                            mock_statuses,
                                             mock_update):
-        (mock_find.return_value.
-         get_status.return_value) = ServiceStatuses.FAILED
-        (mock_db_find.return_value.
-         get_task_status.return_value) = InstanceTasks.NONE
+        mock_statuses.side_effect = lambda ids: dict.fromkeys(
+            ids, (ServiceStatuses.FAILED, InstanceTasks.NONE))
         ret_val = self.clustertasks._all_instances_ready(["1", "2", "3", "4"],
                                                          self.cluster_id)
         mock_update.assert_called_with(self.cluster_id, None)
         self.assertFalse(ret_val)
 
-    @patch.object(DBInstance, 'find_by')
-    @patch.object(InstanceServiceStatus, 'find_by')
-    def test_all_instances_ready(self, mock_find, mock_db_find):
-        (mock_find.return_value.
-         get_status.return_value) = ServiceStatuses.INSTANCE_READY
-        (mock_db_find.return_value.
-         get_task_status.return_value) = InstanceTasks.NONE
+    @patch('trove.instance.models.load_instance_statuses')
+    def test_all_instances_ready(self, mock_statuses):
+        mock_statuses.side_effect = lambda ids: dict.fromkeys(
+            ids, (ServiceStatuses.INSTANCE_READY, InstanceTasks.NONE))
         ret_val = self.clustertasks._all_instances_ready(["1", "2", "3", "4"],
                                                          self.cluster_id)
         self.assertTrue(ret_val)
 
+    @patch.object(ClusterTasks, 'update_statuses_on_failure')
+    @patch('trove.instance.models.load_instance_statuses')
+    @patch('trove.taskmanager.models.LOG')
+    def test_all_instances_ready_fast_fail(self, mock_logging,
+                                           mock_statuses, mock_update):
+        # The last member failed while the first one is still building.
+        mock_statuses.return_value = {
+            "1": (ServiceStatuses.NEW, InstanceTasks.BUILDING),
+            "2": (ServiceStatuses.INSTANCE_READY, InstanceTasks.NONE),
+            "3": (ServiceStatuses.FAILED, InstanceTasks.NONE)}
+        ret_val = self.clustertasks._all_instances_ready(["1", "2", "3"],
+                                                         self.cluster_id)
+        self.assertFalse(ret_val)
+        mock_statuses.assert_called_once_with(["1", "2", "3"])
+        mock_update.assert_called_with(self.cluster_id, None)
+
+    @patch.object(utils, 'poll_until')
+    @patch('trove.instance.models.load_instance_statuses')
+    def test_all_instances_ready_single_query(self, mock_statuses,
+                                              mock_poll_until):
+        mock_statuses.return_value = {
+            "1": (ServiceStatuses.INSTANCE_READY, InstanceTasks.NONE)}
+        mock_poll_until.side_effect = (
+            lambda retriever, condition, **kwargs: retriever())
+        ret_val = self.clustertasks._all_instances_ready(["1"],
+                                                         self.cluster_id)
+        self.assertTrue(ret_val)
+        # The failure check reuses the statuses of the last poll.
+        mock_statuses.assert_called_once_with(["1"])
+
     @patch.object(ClusterTasks, 'update_statuses_on_failure')
     @patch.object(ClusterTasks, 'get_guest')
     @patch.object(ClusterTasks, 'get_ip')
@@ -12,6 +12,7 @@
 # limitations under the License.
 
 import datetime
+import time
 
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -89,44 +90,35 @@ class GaleraClusterTasksTest(trove_testtools.TestCase):
         }
 
     @patch.object(GaleraCommonClusterTasks, 'update_statuses_on_failure')
-    @patch.object(DBInstance, 'find_by')
-    @patch.object(InstanceServiceStatus, 'find_by')
+    @patch('trove.instance.models.load_instance_statuses')
     @patch('trove.taskmanager.models.LOG')
     def test_all_instances_ready_with_server_error(self,
-                                                   mock_logging, mock_find,
-                                                   mock_db_find, mock_update):
-        (mock_find.return_value.
-         get_status.return_value) = ServiceStatuses.NEW
-        (mock_db_find.return_value.
-         get_task_status.return_value) = InstanceTasks.BUILDING_ERROR_SERVER
+                                                   mock_logging, mock_statuses,
+                                                   mock_update):
+        mock_statuses.side_effect = lambda ids: dict.fromkeys(
+            ids, (ServiceStatuses.NEW, InstanceTasks.BUILDING_ERROR_SERVER))
         ret_val = self.clustertasks._all_instances_ready(["1", "2", "3", "4"],
                                                          self.cluster_id)
         mock_update.assert_called_with(self.cluster_id, None)
         self.assertFalse(ret_val)
 
     @patch.object(GaleraCommonClusterTasks, 'update_statuses_on_failure')
-    @patch.object(DBInstance, 'find_by')
-    @patch.object(InstanceServiceStatus, 'find_by')
+    @patch('trove.instance.models.load_instance_statuses')
     @patch('trove.taskmanager.models.LOG')
     def test_all_instances_ready_bad_status(self, mock_logging,
-                                            mock_find, mock_db_find,
+                                            mock_statuses,
                                             mock_update):
-        (mock_find.return_value.
-         get_status.return_value) = ServiceStatuses.FAILED
-        (mock_db_find.return_value.
-         get_task_status.return_value) = InstanceTasks.NONE
+        mock_statuses.side_effect = lambda ids: dict.fromkeys(
+            ids, (ServiceStatuses.FAILED, InstanceTasks.NONE))
         ret_val = self.clustertasks._all_instances_ready(["1", "2", "3", "4"],
                                                          self.cluster_id)
         mock_update.assert_called_with(self.cluster_id, None)
         self.assertFalse(ret_val)
 
-    @patch.object(DBInstance, 'find_by')
-    @patch.object(InstanceServiceStatus, 'find_by')
-    def test_all_instances_ready(self, mock_find, mock_db_find):
-        (mock_find.return_value.
-         get_status.return_value) = ServiceStatuses.INSTANCE_READY
-        (mock_db_find.return_value.
-         get_task_status.return_value) = InstanceTasks.NONE
+    @patch('trove.instance.models.load_instance_statuses')
+    def test_all_instances_ready(self, mock_statuses):
+        mock_statuses.side_effect = lambda ids: dict.fromkeys(
+            ids, (ServiceStatuses.INSTANCE_READY, InstanceTasks.NONE))
         ret_val = self.clustertasks._all_instances_ready(["1", "2", "3", "4"],
                                                          self.cluster_id)
         self.assertTrue(ret_val)
@@ -219,6 +211,45 @@ class GaleraClusterTasksTest(trove_testtools.TestCase):
                                        new_instances)
         mock_reset_task.assert_called_with()
 
+    @patch.object(GaleraCommonClusterTasks, '_check_cluster_for_root')
+    @patch.object(GaleraCommonClusterTasks, 'reset_task')
+    @patch.object(GaleraCommonClusterTasks, '_render_cluster_config')
+    @patch.object(GaleraCommonClusterTasks, 'get_ip')
+    @patch.object(GaleraCommonClusterTasks, 'get_guest')
+    @patch.object(GaleraCommonClusterTasks, '_all_instances_ready',
+                  return_value=True)
+    @patch.object(Instance, 'load')
+    @patch.object(DBInstance, 'find_all')
+    @patch.object(datastore_models.Datastore, 'load')
+    @patch.object(datastore_models.DatastoreVersion, 'load_by_uuid')
+    def test_grow_cluster_joins_in_order(self, mock_dv, mock_ds,
+                                         mock_find_all, mock_load,
+                                         mock_ready, mock_guest, mock_ip,
+                                         mock_render, mock_reset_task,
+                                         mock_check_root):
+        self.patch_conf_property('cluster_max_parallel_operations', 4)
+        mock_find_all.return_value.all.return_value = [self.dbinst1]
+        mock_ip.return_value = "10.0.0.2"
+        guest = mock_guest.return_value
+        guest.get_cluster_context.return_value = self.cluster_context
+        joining = []
+        overlaps = []
+
+        def install_cluster(*args):
+            # A donor serves one state transfer at a time.
+            overlaps.append(bool(joining))
+            joining.append(True)
+            time.sleep(0.01)
+            joining.pop()
+        guest.install_cluster.side_effect = install_cluster
+
+        self.clustertasks.grow_cluster(Mock(), self.cluster_id,
+                                       ['new-1', 'new-2', 'new-3'])
+
+        mock_reset_task.assert_called_with()
+        self.assertEqual([False] * 3, overlaps)
+        self.assertEqual(3, guest.reset_admin_password.call_count)
+
     @patch.object(GaleraCommonClusterTasks, 'reset_task')
     @patch.object(Instance, 'load')
     @patch.object(Instance, 'delete')
@@ -19,6 +19,7 @@ from unittest.mock import MagicMock, Mock, patch, PropertyMock
 from trove.backup.models import Backup
 from trove.common import cfg
 from trove.common.exception import TroveError, ReplicationSlaveAttachError
+from trove.common import polling
 from trove.common import server_group as srv_grp
 from trove.instance.tasks import InstanceTasks
 from trove.taskmanager.manager import Manager
@@ -290,6 +291,45 @@ class TestManager(trove_testtools.TestCase):
             access=None, ds_version=None)
         mock_tasks.wait_for_instance.assert_called_with(3600, mock_flavor)
 
+    def test_create_instance_deadline(self):
+        self.patch_conf_property('instance_build_timeout', 7200)
+        deadlines = []
+        mock_tasks = Mock()
+        mock_tasks.create_instance.side_effect = (
+            lambda *args, **kwargs: deadlines.append(
+                polling.current_deadline()))
+        mock_tasks.wait_for_instance.side_effect = (
+            lambda *args: deadlines.append(polling.current_deadline()))
+        with patch.object(models.FreshInstanceTasks, 'load',
+                          return_value=mock_tasks):
+            self.manager.create_instance(
+                self.context, 'id1', 'inst1', Mock(), 'mysql-image-id',
+                None, None, 'mysql', 'mysql-server', 2, None, None,
+                'password', None, Mock(), None, None, None, None, None)
+
+        # The build and the wait for the instance share one deadline.
+        self.assertEqual(2, len(deadlines))
+        self.assertIsNotNone(deadlines[0])
+        self.assertEqual(deadlines[0], deadlines[1])
+        self.assertIsNone(polling.current_deadline())
+        # The wait for the instance keeps its own timeout.
+        self.assertEqual(1800, mock_tasks.wait_for_instance.call_args[0][0])
+
+    def test_create_instance_no_deadline(self):
+        mock_tasks = Mock()
+        mock_tasks.create_instance.side_effect = (
+            lambda *args, **kwargs: self.assertIsNone(
+                polling.current_deadline()))
+        with patch.object(models.FreshInstanceTasks, 'load',
+                          return_value=mock_tasks):
+            self.manager.create_instance(
+                self.context, 'id1', 'inst1', Mock(), 'mysql-image-id',
+                None, None, 'mysql', 'mysql-server', 2, None, None,
+                'password', None, Mock(), None, None, None, None, None)
+
+        mock_tasks.create_instance.assert_called_once()
+        mock_tasks.wait_for_instance.assert_called_once()
+
     def test_create_cluster(self):
         mock_tasks = Mock()
         with patch.object(models, 'load_cluster_tasks',
@@ -59,6 +59,7 @@ from trove.instance.service_status import ServiceStatuses
 from trove.instance.tasks import InstanceTasks
 from trove import rpc
 from trove.taskmanager import models as taskmanager_models
+from trove.tests.fakes import swift as fake_swift
 from trove.tests.unittests import trove_testtools
 
 INST_ID = 'dbinst-id-1'
@@ -1297,6 +1298,125 @@ class BackupTasksTest(trove_testtools.TestCase):
         self.assertEqual('', prefix)
 
 
+class BulkBackupDeleteTest(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(BulkBackupDeleteTest, self).setUp()
+        self.project_id = 'project-%s' % utils.generate_uuid()
+        self.store = fake_swift.FakeSwiftStore(bulk_delete=10)
+        swift_patcher = patch('trove.common.clients.create_swift_client',
+                              return_value=self.store)
+        swift_patcher.start()
+        self.addCleanup(swift_patcher.stop)
+
+    def _create_backup(self, segments=0, **kwargs):
+        values = dict(tenant_id=self.project_id, name='backup',
+                      deleted=False, state=state.BackupState.COMPLETED,
+                      storage_driver='swift')
+        values.update(kwargs)
+        backup = backup_models.DBBackup.create(**values)
+        if 'location' not in kwargs:
+            backup.location = 'http://swift/v1/database_backups/%s.gz' % (
+                backup.id)
+            backup.save()
+            self.store.add_object(
+                'database_backups', '%s.gz' % backup.id,
+                ['database_backups_segments/%s.gz/%03d' % (backup.id, index)
+                 for index in range(segments)])
+        return backup
+
+    def _run(self, backups, **kwargs):
+        return taskmanager_models.BulkBackupDelete(
+            mock.ANY, **kwargs).run([backup.id for backup in backups])
+
+    def _states(self, backups):
+        return [(db_backup.deleted, db_backup.state) for db_backup in
+                [backup_models.DBBackup.find_by(id=backup.id)
+                 for backup in backups]]
+
+    def test_bulk_delete(self):
+        backups = [self._create_backup(segments=index % 3)
+                   for index in range(7)]
+
+        stats = self._run(backups, batch_size=3)
+
+        self.assertEqual({}, self.store.objects)
+        self.assertEqual([(True, state.BackupState.COMPLETED)] * 7,
+                         self._states(backups))
+        self.assertEqual(7, stats['deleted'])
+        self.assertEqual(0, stats['failed'])
+        self.assertEqual(7 + 6, stats['objects'])
+
+    def test_delete_each_object(self):
+        self.store.bulk_delete = 0
+        backups = [self._create_backup(segments=2) for _ in range(3)]
+
+        stats = self._run(backups, max_workers=2)
+
+        self.assertEqual({}, self.store.objects)
+        self.assertEqual([(True, state.BackupState.COMPLETED)] * 3,
+                         self._states(backups))
+        self.assertEqual(9, stats['objects'])
+
+    def test_segment_not_deleted(self):
+        for bulk_delete in (0, 10):
+            self.store.bulk_delete = bulk_delete
+            failed, deleted = (self._create_backup(segments=2),
+                               self._create_backup(segments=2))
+            segment = 'database_backups_segments/%s.gz/001' % failed.id
+            self.store.fail = {segment}
+
+            stats = self._run([failed, deleted])
+
+            # The manifest is kept so that the deletion can be retried.
+            self.assertEqual(
+                sorted([segment, 'database_backups/%s.gz' % failed.id]),
+                sorted(self.store.objects))
+            self.assertEqual([(True, state.BackupState.DELETE_FAILED),
+                              (True, state.BackupState.COMPLETED)],
+                             self._states([failed, deleted]))
+            self.assertEqual(1, stats['failed'])
+            self.store.objects.clear()
+
+    def test_object_already_deleted(self):
+        backup = self._create_backup()
+        self.store.objects.clear()
+
+        stats = self._run([backup])
+
+        self.assertEqual([(True, state.BackupState.COMPLETED)],
+                         self._states([backup]))
+        self.assertEqual(0, stats['objects'])
+
+    def test_skip_restored_and_deleted(self):
+        restored = self._create_backup(
+            location='http://swift/v1/remote/restored.gz',
+            state=state.BackupState.RESTORED)
+        deleted = self._create_backup()
+        deleted.deleted = True
+        deleted.save()
+
+        stats = self._run([restored, deleted])
+
+        self.assertEqual(1, stats['backups'])
+        self.assertIn('database_backups/%s.gz' % deleted.id,
+                      self.store.objects)
+        self.assertEqual([(True, state.BackupState.RESTORED)],
+                         self._states([restored]))
+
+    @patch.object(taskmanager_models.BackupTasks,
+                  'delete_snapshot_from_cinder')
+    def test_delete_snapshot(self, mock_delete_snapshot):
+        backup = self._create_backup(
+            location='cinder://snapshot-id', storage_driver='cinder')
+
+        self._run([backup])
+
+        mock_delete_snapshot.assert_called_once_with(mock.ANY, 'snapshot-id')
+        self.assertEqual([(True, state.BackupState.COMPLETED)],
+                         self._states([backup]))
+
+
 class NotifyMixinTest(trove_testtools.TestCase):
 
     def test_get_service_id(self):
@@ -0,0 +1,169 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from trove.common import exception
+from trove.common import polling
+from trove.common import utils
+from trove.taskmanager import resource_watcher
+from trove.tests.unittests import trove_testtools
+
+
+def fake_volume(id, status):
+    return Mock(id=id, status=status)
+
+
+class TestResourceWatcher(trove_testtools.TestCase):
+
+    def setUp(self):
+        super(TestResourceWatcher, self).setUp()
+        self.watcher = resource_watcher.ResourceWatcher(interval=0.01)
+        # Run the checks by hand instead of in the background.
+        patcher = patch.object(self.watcher, '_run')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = Mock()
+        self.available = lambda volume: volume.status == 'available'
+
+    def test_batched_list(self):
+        self.client.volumes.list.return_value = [
+            fake_volume('vol-%d' % index, 'available' if index < 2
+                        else 'creating') for index in range(4)]
+        waits = [self.watcher.watch('volume', self.client, 'vol-%d' % index,
+                                    self.available) for index in range(3)]
+
+        self.watcher.poll()
+
+        self.assertEqual(1, self.client.volumes.list.call_count)
+        self.client.volumes.get.assert_not_called()
+        self.assertEqual('vol-0', waits[0].result(0).id)
+        self.assertEqual('vol-1', waits[1].result(0).id)
+        self.assertFalse(waits[2].done())
+
+        self.client.volumes.get.return_value = fake_volume('vol-2',
+                                                           'available')
+        self.watcher.poll()
+
+        # A single resource left is fetched on its own.
+        self.assertEqual(1, self.client.volumes.list.call_count)
+        self.client.volumes.get.assert_called_once_with('vol-2')
+        self.assertTrue(waits[2].done())
+        self.assertEqual({('volume', 'list'): 1, ('volume', 'get'): 1},
+                         self.watcher.api_calls)
+
+    def test_missing_from_list(self):
+        self.client.volumes.list.return_value = [
+            fake_volume('vol-0', 'available')]
+        self.client.volumes.get.side_effect = exception.NotFound()
+        waits = [self.watcher.watch('volume', self.client, volume_id,
+                                    self.available)
+                 for volume_id in ('vol-0', 'vol-1')]
+
+        self.watcher.poll()
+
+        self.assertEqual('vol-0', waits[0].result(0).id)
+        self.assertRaises(exception.NotFound, waits[1].result, 0)
+
+    def test_condition_error(self):
+        def condition(volume):
+            raise exception.VolumeCreationFailure()
+
+        self.client.volumes.get.return_value = fake_volume('vol-0', 'error')
+        wait = self.watcher.watch('volume', self.client, 'vol-0', condition)
+
+        self.watcher.poll()
+
+        self.assertRaises(exception.VolumeCreationFailure, wait.result, 0)
+
+    @patch.object(resource_watcher.time, 'monotonic')
+    def test_time_out(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.client.servers.get.return_value = Mock(id='server',
+                                                    status='BUILD')
+        wait = self.watcher.watch('server', self.client, 'server',
+                                  lambda server: server.status == 'ACTIVE',
+                                  time_out=10)
+
+        self.watcher.poll()
+        self.assertFalse(wait.done())
+
+        mock_monotonic.return_value = 110
+        self.watcher.poll()
+        self.assertRaises(exception.PollTimeOut, wait.result, 0)
+
+    @patch.object(resource_watcher.time, 'monotonic')
+    def test_time_out_bounded_by_deadline(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.client.servers.get.return_value = Mock(id='server',
+                                                    status='BUILD')
+        with polling.deadline(5):
+            wait = self.watcher.watch(
+                'server', self.client, 'server',
+                lambda server: server.status == 'ACTIVE', time_out=10)
+
+        mock_monotonic.return_value = 105
+        self.watcher.poll()
+        self.assertRaises(exception.PollTimeOut, wait.result, 0)
+
+    def test_unknown_resource_type(self):
+        self.assertRaises(exception.TroveError, self.watcher.watch,
+                          'network', self.client, 'id', self.available)
+
+    def test_notification_wakes_up_watcher(self):
+        endpoint = resource_watcher.NotificationEndpoint(self.watcher)
+        self.watcher.watch('volume', self.client, 'vol-0', self.available)
+
+        endpoint.info({}, 'volume.host', 'volume.create.end',
+                      {'volume_id': 'vol-1'}, {})
+        self.assertFalse(self.watcher._wakeup.is_set())
+
+        endpoint.info({}, 'volume.host', 'volume.create.end',
+                      {'volume_id': 'vol-0'}, {})
+        self.assertTrue(self.watcher._wakeup.is_set())
+
+
+class TestResourceWatcherThread(trove_testtools.TestCase):
+
+    def test_wait_for(self):
+        watcher = resource_watcher.ResourceWatcher(interval=0.01)
+        client = Mock()
+        client.volume_snapshots.get.side_effect = [
+            Mock(id='snap', status='creating'),
+            Mock(id='snap', status='available')]
+
+        snapshot = watcher.wait_for('snapshot', client, 'snap',
+                                    lambda snap: snap.status == 'available',
+                                    time_out=5)
+
+        self.assertEqual('available', snapshot.status)
+        self.assertEqual(2, client.volume_snapshots.get.call_count)
+
+    @patch.object(utils, 'poll_until')
+    def test_disabled_falls_back_to_polling(self, mock_poll_until):
+        self.patch_conf_property('resource_watcher_enabled', False)
+        client = Mock()
+
+        resource_watcher.wait_for('volume', client, 'vol-0', bool,
+                                  sleep_time=2, time_out=60,
+                                  key='available')
+
+        retriever = mock_poll_until.call_args[0][0]
+        retriever()
+        client.volumes.get.assert_called_once_with('vol-0')
+        kwargs = mock_poll_until.call_args[1]
+        self.assertEqual(2, kwargs['sleep_time'])
+        self.assertEqual(60, kwargs['time_out'])
+        self.assertEqual(('volume', 'vol-0', 'available'), kwargs['key'])
+        # The wait is recorded for the caller of wait_for.
+        self.assertIn('test_disabled_falls_back_to_polling', kwargs['name'])
@@ -20,6 +20,7 @@ from unittest import mock
 import uuid
 
 from trove.common import cfg
+from trove.common import clients
 from trove.common.context import TroveContext
 from trove.common.notification import DBaaSAPINotification
 from trove.common import policy
@@ -68,6 +69,7 @@ class TestCase(testtools.TestCase):
         super(TestCase, self).setUp()
 
         self.addCleanup(cfg.CONF.reset)
+        self.addCleanup(clients.CLIENT_POOL.clear)
 
         root_logger.DefaultRootHandler.set_info(self.id())
 